@@ -40,18 +40,9 @@ def process_directory(app: object, fragment: object, directory: str) -> int:
 			if app._load_CDML_file(f, draw=False):
 				found = False
 				for mol in app.paper.molecules:
-					gen = mol.select_matching_substructures(
-						fragment,
-						implicit_freesites=True,
-					)
-					try:
-						next(gen)
-					except StopIteration:
-						pass
-					else:
+					if mol.contains_substructure(fragment, implicit_freesites=True):
 						found = True
 						matching += 1
-						mol.clean_after_search(fragment)
 						break
 				if not found:
 					app.close_current_paper()
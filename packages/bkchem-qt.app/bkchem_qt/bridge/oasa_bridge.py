@@ -15,7 +15,7 @@ import oasa.cdml_document
 import oasa.cdml_ftext
 import oasa.cdml_molecule_summary
 import oasa.cdml_standard
-import oasa.codecs.rdkit_formats
+import oasa.identifier_service
 import oasa.render_lib.bond_ops
 import oasa.render_lib.data_types
 import oasa.render_lib.molecule_ops
@@ -136,7 +136,8 @@ def query_molecule_identifiers(
 		return response
 	result = response.value
 	try:
-		facts = oasa.codecs.rdkit_formats.identifiers_from_smiles(result.smiles)
+		service = oasa.identifier_service.shared_identifier_service()
+		facts = service.identifiers_from_smiles(result.smiles)
 	except (RuntimeError, TypeError, ValueError) as error:
 		return BackendQueryResult(
 			None, BackendQueryFailure("unavailable", str(error)),
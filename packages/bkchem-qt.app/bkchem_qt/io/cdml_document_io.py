@@ -75,8 +75,11 @@ def prepare_synchronized_projection(
 		retirement_reaper: object | None = None,
 		) -> PreparedProjection:
 	"""Prepare a scene-less projection from one exact backend snapshot."""
+	import bkchem_qt.io.projection_reconcile
 	document = hydrate_synchronized_cdml_document(projection_snapshot)
-	return _prepare_projection_from_document(document, retirement_reaper)
+	prepared = _prepare_projection_from_document(document, retirement_reaper)
+	bkchem_qt.io.projection_reconcile.attach_prepared_items(prepared)
+	return prepared
 
 
 #============================================
@@ -299,10 +302,10 @@ def decode_compatibility_cdml_string(
 
 
 #============================================
-def hydrate_synchronized_cdml_document(
+def synchronized_projection_plan(
 		projection_snapshot: oasa.cdml_document.CDMLProjectionSnapshot,
-		) -> bkchem_qt.models.document.Document:
-	"""Hydrate a Qt document from one backend plan without parsing CDML."""
+		) -> oasa.cdml_document.CDMLProjectionPlan:
+	"""Return one backend projection plan after checking it is complete."""
 	if type(projection_snapshot) is not oasa.cdml_document.CDMLProjectionSnapshot:
 		raise ValueError("synchronized hydration requires one backend projection envelope")
 	plan = projection_snapshot.plan
@@ -313,99 +316,18 @@ def hydrate_synchronized_cdml_document(
 	_require_complete_molecule_render_batches(
 		plan.molecule_core_observation, plan.molecule_render_observation,
 	)
-	return _hydrate_synchronized_projection_plan(plan)
+	return plan
 
 
 #============================================
-def _hydrate_synchronized_projection_plan(
-		plan: oasa.cdml_document.CDMLProjectionPlan,
+def hydrate_synchronized_cdml_document(
+		projection_snapshot: oasa.cdml_document.CDMLProjectionSnapshot,
 		) -> bkchem_qt.models.document.Document:
-	"""Build disposable Qt wrappers from one immutable OASA projection plan."""
-	document = bkchem_qt.models.document.Document()
-	state = {"unsupported": []}
-	presentation_by_position = {
-		record.source_position: record for record in plan.presentation_description.records
-	}
-	presentation_issues = {}
-	for issue in plan.presentation_description.issues:
-		presentation_issues.setdefault(issue.source_position, []).append(issue)
-	fragments_by_molecule = {}
-	for record in plan.fragment_metadata.records:
-		fragments_by_molecule.setdefault(record.molecule_source_position, []).append(record)
-	groups_by_molecule = {}
-	for record in plan.group_observation.records:
-		groups_by_molecule.setdefault(record.molecule_source_position, []).append(record)
-	marks_by_molecule = {}
-	for record in plan.atom_mark_observation.records:
-		marks_by_molecule.setdefault(record.molecule_source_position, []).append(record)
-	core_by_position = {
-		record.source_position: record for record in plan.molecule_core_observation.records
-	}
-	core_issues = {}
-	for issue in plan.molecule_core_observation.issues:
-		core_issues.setdefault(issue.molecule_source_position, []).append(issue)
-	render_by_molecule = {}
-	for batch in plan.molecule_render_observation.batches:
-		render_by_molecule.setdefault(batch.molecule_source_position, []).append(batch)
-
-	for root in plan.roots:
-		for issue in presentation_issues.get(root.source_position, ()):
-			state["unsupported"].append(_unsupported_from_presentation_issue(issue))
-		if root.tag == "molecule":
-			for issue in core_issues.get(root.source_position, ()):
-				state["unsupported"].append(bkchem_qt.models.document_object.UnsupportedContent(
-					issue.kind, None, "/cdml/molecule[%d]/%s[%d]" % (
-						root.source_position, issue.kind, issue.source_position,
-					), issue.reason, "",
-				))
-			core = core_by_position.get(root.source_position)
-			if core is None:
-				state["unsupported"].append(bkchem_qt.models.document_object.UnsupportedContent(
-					"molecule", root.identifier,
-					"/cdml/molecule[%d]" % root.source_position,
-					root.reason or "molecule could not be projected", "",
-				))
-				continue
-			molecule = _hydrate_molecule_core_observation(core)
-			_install_molecule_render_batches(
-				molecule, render_by_molecule.get(root.source_position, ()),
-			)
-			_hydrate_fragment_metadata(
-				molecule, fragments_by_molecule.get(root.source_position, ()),
-			)
-			_hydrate_group_observation(
-				molecule, state["unsupported"], root.source_position,
-				groups_by_molecule.get(root.source_position, ()),
-			)
-			document.add_molecule(molecule, mark_dirty=False)
-			_hydrate_atom_mark_observation(
-				document, _core_atoms_by_source_position(molecule), state["unsupported"],
-				root.source_position, marks_by_molecule.get(root.source_position, ()),
-			)
-			continue
-		if root.tag in _DRAWING_TAGS:
-			record = presentation_by_position.get(root.source_position)
-			if record is not None:
-				document.add_presentation_object(
-					_presentation_from_description(record), mark_dirty=False,
-				)
-
-	paper = bkchem_qt.models.document_object.PaperModel(
-		attributes=dict(plan.paper_layout.effective_paper_attributes),
-		viewport_attributes=dict(plan.paper_layout.viewport_attributes),
-	)
-	document.set_cdml_state(
-		bkchem_qt.models.document_object.CdmlEnvelope(), paper, state["unsupported"],
+	"""Hydrate a Qt document from one backend plan without parsing CDML."""
+	import bkchem_qt.io.projection_reconcile
+	return bkchem_qt.io.projection_reconcile.hydrate_projection_plan(
+		synchronized_projection_plan(projection_snapshot),
 	)
-	bkchem_qt.models.bracket_pair_selection.set_facts(document, tuple(
-		(
-			record.pair_id, tuple(record.member_ids), record.style,
-			record.line_width, record.line_color,
-		)
-		for record in plan.presentation_description.bracket_pairs
-	))
-	document.mark_clean()
-	return document
 
 
 #============================================
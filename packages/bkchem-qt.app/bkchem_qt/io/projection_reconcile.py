@@ -0,0 +1,348 @@
+"""Root-level hydration and reconciliation of synchronized Qt projections.
+
+A synchronized projection is hydrated one direct CDML root at a time.  Each
+root records the exact backend facts it was built from, the models it owns,
+and, once prepared, its graphics wrappers.  A later snapshot whose roots
+mostly repeat those facts reuses the unchanged roots and rebuilds only the
+changed ones; any precondition this module cannot prove falls back to the
+complete replacement in :class:`DocumentSession`.
+"""
+
+# Standard Library
+import dataclasses
+
+# local repo modules
+import oasa.cdml_document
+import bkchem_qt.canvas.document_projection
+import bkchem_qt.canvas.graphics_retirement
+import bkchem_qt.io.cdml_document_io
+import bkchem_qt.models.bracket_pair_selection
+import bkchem_qt.models.document
+import bkchem_qt.models.document_object
+
+
+_FACT_KINDS = (
+	"presentation", "presentation_issues", "core", "core_issues",
+	"render", "fragments", "groups", "marks",
+)
+
+
+#============================================
+@dataclasses.dataclass(frozen=True)
+class ProjectedRoot:
+	"""Qt state hydrated from one direct CDML root of a projection plan."""
+	fingerprint: tuple
+	objects: tuple[object, ...]
+	marks: tuple[object, ...]
+	unsupported: tuple[object, ...]
+	# Graphics are attached only after the document has been prepared.
+	items: tuple[object, ...] | None = None
+
+
+#============================================
+def _plan_facts_by_root(
+		plan: oasa.cdml_document.CDMLProjectionPlan,
+		) -> dict[int, dict[str, list]]:
+	"""Group every plan observation under the direct root it belongs to."""
+	facts = {
+		root.source_position: {kind: [] for kind in _FACT_KINDS}
+		for root in plan.roots
+	}
+	grouped = (
+		("presentation", plan.presentation_description.records, "source_position"),
+		("presentation_issues", plan.presentation_description.issues, "source_position"),
+		("core", plan.molecule_core_observation.records, "source_position"),
+		("core_issues", plan.molecule_core_observation.issues, "molecule_source_position"),
+		("render", plan.molecule_render_observation.batches, "molecule_source_position"),
+		("fragments", plan.fragment_metadata.records, "molecule_source_position"),
+		("groups", plan.group_observation.records, "molecule_source_position"),
+		("marks", plan.atom_mark_observation.records, "molecule_source_position"),
+	)
+	for kind, records, attribute in grouped:
+		for record in records:
+			root_facts = facts.get(getattr(record, attribute))
+			if root_facts is not None:
+				root_facts[kind].append(record)
+	return facts
+
+
+#============================================
+def _root_fingerprint(root: object, root_facts: dict[str, list]) -> tuple:
+	"""Return the complete backend facts that determine one root's projection."""
+	return (root,) + tuple(tuple(root_facts[kind]) for kind in _FACT_KINDS)
+
+
+#============================================
+def _hydrate_root(
+		document: bkchem_qt.models.document.Document, root: object,
+		root_facts: dict[str, list],
+		) -> ProjectedRoot:
+	"""Hydrate one direct root into ``document`` and record what it added."""
+	io = bkchem_qt.io.cdml_document_io
+	unsupported = []
+	objects = []
+	marks_before = len(document.marks)
+	for issue in root_facts["presentation_issues"]:
+		unsupported.append(io._unsupported_from_presentation_issue(issue))
+	if root.tag == "molecule":
+		for issue in root_facts["core_issues"]:
+			unsupported.append(bkchem_qt.models.document_object.UnsupportedContent(
+				issue.kind, None, "/cdml/molecule[%d]/%s[%d]" % (
+					root.source_position, issue.kind, issue.source_position,
+				), issue.reason, "",
+			))
+		if not root_facts["core"]:
+			unsupported.append(bkchem_qt.models.document_object.UnsupportedContent(
+				"molecule", root.identifier,
+				"/cdml/molecule[%d]" % root.source_position,
+				root.reason or "molecule could not be projected", "",
+			))
+		else:
+			molecule = io._hydrate_molecule_core_observation(root_facts["core"][-1])
+			io._install_molecule_render_batches(molecule, root_facts["render"])
+			io._hydrate_fragment_metadata(molecule, root_facts["fragments"])
+			io._hydrate_group_observation(
+				molecule, unsupported, root.source_position, root_facts["groups"],
+			)
+			document.add_molecule(molecule, mark_dirty=False)
+			objects.append(molecule)
+			io._hydrate_atom_mark_observation(
+				document, io._core_atoms_by_source_position(molecule), unsupported,
+				root.source_position, root_facts["marks"],
+			)
+	elif root.tag in io._DRAWING_TAGS and root_facts["presentation"]:
+		model = io._presentation_from_description(root_facts["presentation"][-1])
+		document.add_presentation_object(model, mark_dirty=False)
+		objects.append(model)
+	return ProjectedRoot(
+		_root_fingerprint(root, root_facts), tuple(objects),
+		tuple(document.marks[marks_before:]), tuple(unsupported),
+	)
+
+
+#============================================
+def hydrate_projection_plan(
+		plan: oasa.cdml_document.CDMLProjectionPlan,
+		) -> bkchem_qt.models.document.Document:
+	"""Build disposable Qt wrappers from one immutable OASA projection plan."""
+	document = bkchem_qt.models.document.Document()
+	facts = _plan_facts_by_root(plan)
+	document.set_projection_roots(tuple(
+		_hydrate_root(document, root, facts[root.source_position])
+		for root in plan.roots
+	))
+	_install_document_facts(document, plan)
+	document.mark_clean()
+	return document
+
+
+#============================================
+def _install_document_facts(
+		document: bkchem_qt.models.document.Document,
+		plan: oasa.cdml_document.CDMLProjectionPlan,
+		) -> None:
+	"""Install the paper, warnings, and bracket facts shared by every root."""
+	paper = bkchem_qt.models.document_object.PaperModel(
+		attributes=dict(plan.paper_layout.effective_paper_attributes),
+		viewport_attributes=dict(plan.paper_layout.viewport_attributes),
+	)
+	unsupported = [
+		content for root in document.projection_roots for content in root.unsupported
+	]
+	document.set_cdml_state(
+		bkchem_qt.models.document_object.CdmlEnvelope(), paper, unsupported,
+	)
+	bkchem_qt.models.bracket_pair_selection.set_facts(document, tuple(
+		(
+			record.pair_id, tuple(record.member_ids), record.style,
+			record.line_width, record.line_color,
+		)
+		for record in plan.presentation_description.bracket_pairs
+	))
+
+
+#============================================
+def attach_prepared_items(prepared: object) -> None:
+	"""Record each root's prepared graphics wrappers on its hydrated document."""
+	document = prepared.document
+	roots = document.projection_roots
+	if roots is None:
+		return
+	root_by_model = {}
+	for index, root in enumerate(roots):
+		for model in root.objects + root.marks:
+			root_by_model[id(model)] = index
+	items_by_root = [[] for _root in roots]
+	for molecule, items in prepared.molecule_projections:
+		items_by_root[root_by_model[id(molecule)]].extend(items)
+	for item in prepared.presentation_items:
+		items_by_root[root_by_model[id(item.document_object_model)]].append(item)
+	for item in prepared.mark_items:
+		items_by_root[root_by_model[id(item.atom_mark_model)]].append(item)
+	document.set_projection_roots(tuple(
+		dataclasses.replace(root, items=tuple(items))
+		for root, items in zip(roots, items_by_root)
+	))
+
+
+#============================================
+def changed_root_positions(
+		document: bkchem_qt.models.document.Document,
+		plan: oasa.cdml_document.CDMLProjectionPlan,
+		) -> tuple[int, ...] | None:
+	"""Return plan root positions whose facts differ from ``document``'s roots.
+
+	Returns ``None`` when ``document`` records no root-level hydration, so the
+	caller must rebuild the complete projection.
+	"""
+	previous = document.projection_roots
+	if previous is None:
+		return None
+	facts = _plan_facts_by_root(plan)
+	changed = []
+	for index, root in enumerate(plan.roots):
+		fingerprint = _root_fingerprint(root, facts[root.source_position])
+		if index >= len(previous) or previous[index].fingerprint != fingerprint:
+			changed.append(root.source_position)
+	return tuple(changed)
+
+
+#============================================
+@dataclasses.dataclass(frozen=True)
+class RootReconciliation:
+	"""Changed roots staged and prepared away from the live projection."""
+	plan: oasa.cdml_document.CDMLProjectionPlan
+	previous: tuple[ProjectedRoot, ...]
+	retired: tuple[ProjectedRoot, ...]
+	staged: tuple[ProjectedRoot, ...]
+	roots: tuple[ProjectedRoot, ...]
+	staging: bkchem_qt.models.document.Document
+	prepared: object
+
+
+#============================================
+def prepare_root_reconciliation(
+		document: bkchem_qt.models.document.Document,
+		projection_snapshot: oasa.cdml_document.CDMLProjectionSnapshot,
+		retirement_reaper: object | None = None,
+		) -> RootReconciliation | None:
+	"""Stage the roots of ``projection_snapshot`` that differ from ``document``.
+
+	Nothing live is touched.  Returns ``None`` when ``document`` records no
+	prepared root hydration, its models no longer match that record, or too many
+	roots changed for reuse to pay off; the caller then prepares a complete
+	replacement.  Plan, hydration, and preparation errors propagate exactly as
+	they do from complete preparation.
+	"""
+	previous = document.projection_roots
+	if previous is None or any(root.items is None for root in previous):
+		return None
+	owned = set(document.objects) | set(document.marks)
+	if any(model not in owned for root in previous for model in root.objects + root.marks):
+		return None
+	plan = bkchem_qt.io.cdml_document_io.synchronized_projection_plan(projection_snapshot)
+	changed = changed_root_positions(document, plan)
+	# Reuse pays off only while most roots are unchanged.
+	retired_count = len(changed) + max(0, len(previous) - len(plan.roots))
+	if 2 * retired_count >= len(plan.roots):
+		return None
+	changed_indexes = {position - 1 for position in changed}
+	retired = tuple(
+		root for index, root in enumerate(previous)
+		if index in changed_indexes or index >= len(plan.roots)
+	)
+	staging = bkchem_qt.models.document.Document()
+	facts = _plan_facts_by_root(plan)
+	prepared = None
+	try:
+		staging.set_projection_roots(tuple(
+			_hydrate_root(staging, plan.roots[index], facts[plan.roots[index].source_position])
+			for index in sorted(changed_indexes)
+		))
+		prepared = bkchem_qt.io.cdml_document_io._prepare_projection_from_document(
+			staging, retirement_reaper,
+		)
+	finally:
+		if prepared is None:
+			staging.clear()
+			staging.deleteLater()
+	attach_prepared_items(prepared)
+	staged = dict(zip(sorted(changed_indexes), staging.projection_roots))
+	roots = tuple(
+		staged[index] if index in staged else previous[index]
+		for index in range(len(plan.roots))
+	)
+	return RootReconciliation(
+		plan, previous, retired, staging.projection_roots, roots, staging, prepared,
+	)
+
+
+#============================================
+def apply_root_reconciliation(
+		document: bkchem_qt.models.document.Document,
+		scene: object, reconciliation: RootReconciliation,
+		retirement_reaper: object | None = None,
+		) -> tuple[BaseException, ...]:
+	"""Swap staged roots into ``document`` and ``scene``.
+
+	``reconciliation`` must come from :func:`prepare_root_reconciliation` for
+	this document's current roots, which has already validated everything the
+	swap relies on.  Returns the retirement callback errors; the retired
+	wrappers are detached either way.
+	"""
+	staging = reconciliation.staging
+	prepared = reconciliation.prepared
+	# A swap that stops partway must never be trusted as a reuse record.
+	document.set_projection_roots(None)
+	# Keep every live wrapper owned until retirement has detached the old ones.
+	document.register_current_projection_items(tuple(
+		item for root in reconciliation.previous + reconciliation.staged
+		for item in root.items
+	))
+	coordinator = bkchem_qt.canvas.graphics_retirement.GraphicsRetirementCoordinator()
+	report = coordinator.retire_scene_projection_items(
+		scene, [item for root in reconciliation.retired for item in root.items],
+		reaper=retirement_reaper,
+	)
+	for root in reconciliation.retired:
+		for mark in root.marks:
+			document.remove_mark(mark, mark_dirty=False)
+		for model in root.objects:
+			if isinstance(model, bkchem_qt.models.document_object.PresentationObject):
+				document.remove_presentation_object(model, mark_dirty=False)
+			else:
+				document.remove_molecule(model, mark_dirty=False)
+	for root in reconciliation.staged:
+		for model in root.objects:
+			if isinstance(model, bkchem_qt.models.document_object.PresentationObject):
+				staging.remove_presentation_object(model, mark_dirty=False)
+				document.add_presentation_object(model, mark_dirty=False)
+			else:
+				staging.remove_molecule(model, mark_dirty=False)
+				document.add_molecule(model, mark_dirty=False)
+		for mark in root.marks:
+			staging.remove_mark(mark, mark_dirty=False)
+			document.add_mark(mark, mark_dirty=False)
+	staging.deleteLater()
+	for _molecule, items in prepared.molecule_projections:
+		for item in items:
+			scene.addItem(item)
+	for item in prepared.presentation_items:
+		scene.addItem(item)
+	roots = reconciliation.roots
+	document.register_current_projection_items(tuple(
+		item for root in roots for item in root.items
+	))
+	# Keep the per-kind model lists in plan order, as complete hydration does.
+	document.replace_projection_order(
+		[model for root in roots for model in root.objects],
+		[mark for root in roots for mark in root.marks],
+	)
+	document.set_projection_roots(roots)
+	_install_document_facts(document, reconciliation.plan)
+	if hasattr(scene, "apply_paper_model"):
+		scene.apply_paper_model(document.paper)
+	bkchem_qt.canvas.document_projection.synchronize_document_stack_z_order(
+		document, scene,
+	)
+	return tuple(report.callback_errors)
@@ -118,6 +118,9 @@ class Document(PySide6.QtCore.QObject):
 		# PySide does not promise it owns their Python wrappers.  Keep those
 		# wrappers alive until the retirement coordinator has detached them.
 		self._projection_item_refs = {}
+		# Per-root hydration record of a synchronized projection; None when the
+		# projection was not hydrated root by root or may no longer match it.
+		self._projection_roots = None
 		self._marks = []
 		self._paper = bkchem_qt.models.document_object.PaperModel()
 		self._cdml_envelope = bkchem_qt.models.document_object.CdmlEnvelope()
@@ -167,6 +170,17 @@ class Document(PySide6.QtCore.QObject):
 		"""Return atom-attached CDML mark models."""
 		return list(self._marks)
 
+	#============================================
+	@property
+	def projection_roots(self) -> tuple | None:
+		"""Return the per-root hydration record of a synchronized projection."""
+		return self._projection_roots
+
+	#============================================
+	def set_projection_roots(self, roots: tuple | None) -> None:
+		"""Record the roots this projection was hydrated from, or forget them."""
+		self._projection_roots = roots
+
 	#============================================
 	@property
 	def paper(self) -> bkchem_qt.models.document_object.PaperModel:
@@ -1032,6 +1046,22 @@ class Document(PySide6.QtCore.QObject):
 		if mark_dirty:
 			self.mark_dirty()
 
+	#============================================
+	def replace_projection_order(self, objects: list, marks: list) -> None:
+		"""Order the stack and every per-kind model list as a projection plan does.
+
+		Raises:
+			ValueError: If ``objects`` or ``marks`` is not exactly this document's.
+		"""
+		mark_position = {mark: index for index, mark in enumerate(marks)}
+		if len(mark_position) != len(marks) or set(mark_position) != set(self._marks):
+			raise ValueError("Mark order must contain each document mark once")
+		self.replace_object_order(objects, mark_dirty=False)
+		position = {model: index for index, model in enumerate(objects)}
+		self._molecules.sort(key=position.__getitem__)
+		self._presentation_objects.sort(key=position.__getitem__)
+		self._marks.sort(key=mark_position.__getitem__)
+
 	#============================================
 	def _normalized_insert_index(self, index: int | None) -> int:
 		"""Return a Python-list insertion index for a top-level object."""
@@ -1204,6 +1234,7 @@ class Document(PySide6.QtCore.QObject):
 		self._object_stack.clear()
 		self._presentation_objects.clear()
 		self._marks.clear()
+		self._projection_roots = None
 		self._paper = bkchem_qt.models.document_object.PaperModel()
 		self._cdml_envelope = bkchem_qt.models.document_object.CdmlEnvelope()
 		self._unsupported_content.clear()
@@ -3974,13 +3974,21 @@ class DocumentSession(PySide6.QtCore.QObject):
 				bkchem_qt.models.projection_lifecycle.ProjectionLifecyclePhase.SESSION,
 			)
 		from bkchem_qt.io import cdml_document_io
+		from bkchem_qt.io import projection_reconcile
+		reconciliation = None
 		try:
 			projection_snapshot = self._backend_session.projection_snapshot()
 			if projection_snapshot.snapshot != snapshot:
 				raise ValueError("backend projection envelope does not match the requested snapshot")
-			candidate = cdml_document_io.prepare_synchronized_projection(
-				projection_snapshot, self._projection_retirement_reaper,
-			)
+			# Rebuild only changed direct roots when most of the scene is reusable.
+			if self._projection_reconcilable():
+				reconciliation = projection_reconcile.prepare_root_reconciliation(
+					self._document, projection_snapshot, self._projection_retirement_reaper,
+				)
+			if reconciliation is None:
+				candidate = cdml_document_io.prepare_synchronized_projection(
+					projection_snapshot, self._projection_retirement_reaper,
+				)
 		except Exception as exc:
 			self._backend_projection_synchronized = False
 			self._projection_error = ProjectionReplacementError(
@@ -3993,6 +4001,8 @@ class DocumentSession(PySide6.QtCore.QObject):
 				bkchem_qt.models.projection_lifecycle.ProjectionLifecyclePhase.PREPARATION,
 				self._projection_error,
 			)
+		if reconciliation is not None:
+			return self._install_root_reconciliation(reconciliation, snapshot)
 
 		self._projection_replacing = True
 		retirement_started = False
@@ -4063,6 +4073,69 @@ class DocumentSession(PySide6.QtCore.QObject):
 			self._projection_replacing = False
 		return result
 
+	#============================================
+	def _projection_reconcilable(self) -> bool:
+		"""Return whether only backend snapshots have shaped the live projection."""
+		document = self._document
+		return not (
+			document is None
+			or self._projected_backend_snapshot is None
+			or self._legacy_isolated
+			or not self._document_modified_connected
+			or not self._document_persistent_mutation_connected
+			or document.persistent_generation != self._projected_persistent_generation
+			or document.undo_stack.count()
+			or not bkchem_qt.canvas.graphics_retirement.is_valid_native_wrapper(self._scene)
+			or not document.is_current_projection_scene(self._scene)
+		)
+
+	#============================================
+	def _install_root_reconciliation(
+			self, reconciliation: object, snapshot: oasa.cdml_document.CDMLSnapshot,
+			) -> bkchem_qt.models.projection_lifecycle.ProjectionLifecycleResult:
+		"""Swap prepared changed roots into the live projection of ``snapshot``."""
+		from bkchem_qt.io import projection_reconcile
+		document = self._document
+		selected_keys = self._accepted_selection_keys_for_snapshot(snapshot)
+		if selected_keys is None:
+			selected_keys = frozenset(
+				key for key in (
+					bkchem_qt.canvas.document_projection.persistent_selection_key(item)
+					for item in self._scene.selectedItems()
+				) if key is not None
+			)
+		self._scene.clearSelection()
+		self._projection_replacing = True
+		# Backend-derived state changes below must not isolate the session.
+		document.modified_changed.disconnect(self._on_modified_changed)
+		document.persistent_mutated.disconnect(self._on_persistent_mutated)
+		try:
+			callback_errors = projection_reconcile.apply_root_reconciliation(
+				document, self._scene, reconciliation, self._projection_retirement_reaper,
+			)
+			bkchem_qt.canvas.document_projection.select_projected_persistent_keys(
+				self._scene, selected_keys,
+			)
+			if snapshot.is_dirty:
+				document.mark_dirty()
+			else:
+				document.mark_clean()
+		finally:
+			document.modified_changed.connect(self._on_modified_changed)
+			document.persistent_mutated.connect(self._on_persistent_mutated)
+			self._projection_replacing = False
+		# The retired wrappers are detached already; keep their callback failures.
+		self._teardown_diagnostics.extend(callback_errors)
+		self._projected_backend_snapshot = snapshot
+		self._projected_persistent_generation = document.persistent_generation
+		self._backend_projection_synchronized = True
+		self._projection_error = None
+		self.title_changed.emit(self.title)
+		return bkchem_qt.models.projection_lifecycle.ProjectionLifecycleResult(
+			bkchem_qt.models.projection_lifecycle.ProjectionLifecycleStatus.INSTALLED,
+			bkchem_qt.models.projection_lifecycle.ProjectionLifecyclePhase.COMPLETE,
+		)
+
 	#============================================
 	def _accepted_selection_keys_for_snapshot(
 			self, snapshot: oasa.cdml_document.CDMLSnapshot,
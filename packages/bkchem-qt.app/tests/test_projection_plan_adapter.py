@@ -1,11 +1,33 @@
 """Fixture-free behavior checks for OASA-to-Qt projection-plan adaptation."""
 
+# PIP3 modules
+import PySide6.QtCore
+import PySide6.QtWidgets
+
 # local repo modules
+import bkchem_qt.canvas.graphics_retirement
+import bkchem_qt.config.preferences
 import bkchem_qt.io.cdml_document_io
+import bkchem_qt.io.projection_reconcile
+import bkchem_qt.models.document_session
+import bkchem_qt.models.projection_lifecycle
+import bkchem_qt.themes.theme_manager
 import oasa.cdml_document
 import oasa.cdml_presentation_properties
 
 
+_INSTALLED = bkchem_qt.models.projection_lifecycle.ProjectionLifecycleStatus.INSTALLED
+
+
+#============================================
+class _DefaultPreferences:
+	"""Read-only preference stand-in that never touches stored QSettings."""
+
+	def value(self, key: str, default: object = None) -> object:
+		"""Return the shipped default for ``key``."""
+		return bkchem_qt.config.preferences.Preferences.DEFAULTS.get(key, default)
+
+
 #============================================
 def _hydrate(session: object) -> object:
 	"""Hydrate one disposable Qt document from the current immutable OASA plan."""
@@ -43,3 +65,157 @@ def test_projection_replacement_preserves_durable_identity_with_fresh_wrapper()
 	second = _hydrate(session).presentation_objects[0]
 	assert first is not second and first.object_id == second.object_id == "arrow1"
 	assert second.effective_line_width == 3.0
+
+
+#============================================
+def test_projection_reconciliation_reports_only_the_changed_root() -> None:
+	"""A patched arrow changes its own root while sibling molecules stay reusable."""
+	cdml = (
+		'<cdml><molecule id="m1"><atom id="a1" name="C"><point x="1cm" y="1cm"/>'
+		'</atom></molecule><arrow id="arrow1" width="2"><point x="0cm" y="0cm"/>'
+		'<point x="1cm" y="0cm"/></arrow><molecule id="m2"><atom id="a2" name="O">'
+		'<point x="3cm" y="1cm"/></atom></molecule></cdml>'
+	)
+	session = oasa.cdml_document.CDMLDocumentSession.load(cdml)
+	document = _hydrate(session)
+	assert bkchem_qt.io.projection_reconcile.changed_root_positions(
+		document, session.projection_snapshot().plan,
+	) == ()
+	patch = oasa.cdml_presentation_properties.CDMLArrowPropertiesPatch(
+		session.revision, "arrow1", (("line_width", 3.0),),
+	)
+	oasa.cdml_presentation_properties.patch_arrow_properties(session, patch)
+	assert bkchem_qt.io.projection_reconcile.changed_root_positions(
+		document, session.projection_snapshot().plan,
+	) == (2,)
+
+
+#============================================
+def _molecules_cdml(count: int) -> str:
+	"""Return CDML with ``count`` two-atom molecules and one trailing arrow."""
+	molecules = "".join(
+		'<molecule id="m%d"><atom id="a%d" name="C"><point x="%dcm" y="1cm"/></atom>'
+		'<atom id="b%d" name="O"><point x="%dcm" y="2cm"/></atom>'
+		'<bond type="n1" start="a%d" end="b%d"/></molecule>'
+		% (index, index, index, index, index, index, index)
+		for index in range(1, count + 1)
+	)
+	return (
+		'<cdml>' + molecules + '<arrow id="arrow1" width="2"><point x="0cm" y="0cm"/>'
+		'<point x="1cm" y="0cm"/></arrow></cdml>'
+	)
+
+
+#============================================
+def _live_session(cdml: str) -> object:
+	"""Open ``cdml`` in a live session whose projection records prepared roots."""
+	app = PySide6.QtWidgets.QApplication.instance() or PySide6.QtWidgets.QApplication([])
+	host = PySide6.QtWidgets.QMainWindow()
+	session = bkchem_qt.models.document_session.DocumentSession(
+		host, bkchem_qt.themes.theme_manager.ThemeManager(app), _DefaultPreferences(),
+		host,
+		prepared_native_cdml=(
+			bkchem_qt.models.document_session.DocumentSession.prepare_native_cdml(cdml)
+		),
+	)
+	# Complete replacement attaches each root's prepared graphics items.
+	session.replace_projection_from_backend_snapshot(session.backend_snapshot)
+	return session
+
+
+#============================================
+def _close_session(session: object) -> None:
+	"""Dispose ``session`` and deliver its queued native deletions now."""
+	host = session.parent()
+	session.dispose()
+	session.take_retained_graphics_records()
+	session.release_python_references()
+	host.deleteLater()
+	PySide6.QtCore.QCoreApplication.sendPostedEvents(
+		None, PySide6.QtCore.QEvent.Type.DeferredDelete,
+	)
+
+
+#============================================
+def _rename_molecule(session: object, molecule_id: str) -> None:
+	"""Commit one molecule-name edit to the session's backend authority."""
+	backend = session._backend_session
+	backend.set_molecule_name(oasa.cdml_document.CDMLMoleculeNameEditRequest(
+		backend.revision, molecule_id, "renamed",
+	))
+
+
+#============================================
+def _reproject(session: object) -> object:
+	"""Project the backend's current snapshot into ``session`` and return the result."""
+	return session.replace_projection_from_backend_snapshot(session.backend_snapshot)
+
+
+#============================================
+def test_session_reconciliation_keeps_untouched_root_items() -> None:
+	"""A one-molecule edit keeps every other root's atom and bond items."""
+	session = _live_session(_molecules_cdml(3))
+	document = session.document
+	before = [root.items for root in document.projection_roots]
+	_rename_molecule(session, "m2")
+	result = _reproject(session)
+	after = [root.items for root in session.document.projection_roots]
+	kept = [after[index] is before[index] for index in (0, 2, 3)]
+	same_document = session.document is document
+	_close_session(session)
+	assert result.status is _INSTALLED
+	assert same_document and kept == [True, True, True]
+
+
+#============================================
+def test_session_reconciliation_retires_changed_root_items() -> None:
+	"""The edited molecule's previous atom and bond items are retired."""
+	session = _live_session(_molecules_cdml(3))
+	changed = session.document.projection_roots[1].items
+	kinds = sorted(type(item).__name__ for item in changed)
+	_rename_molecule(session, "m2")
+	_reproject(session)
+	live = [
+		bkchem_qt.canvas.graphics_retirement.is_valid_native_wrapper(item)
+		and item.scene() is not None
+		for item in changed
+	]
+	_close_session(session)
+	assert kinds == ["AtomItem", "AtomItem", "BondItem"]
+	assert not any(live)
+
+
+#============================================
+def test_session_reconciliation_keeps_plan_model_order() -> None:
+	"""A reconciled molecule keeps its plan position among the document molecules."""
+	session = _live_session(_molecules_cdml(3))
+	_rename_molecule(session, "m2")
+	_reproject(session)
+	names = [molecule.name for molecule in session.document.molecules]
+	_close_session(session)
+	assert names[1] == "renamed"
+
+
+#============================================
+def test_root_reconciliation_defers_when_half_the_roots_change() -> None:
+	"""Changing half of the roots stages nothing so the caller rebuilds everything."""
+	session = _live_session(_molecules_cdml(1))
+	_rename_molecule(session, "m1")
+	reconciliation = bkchem_qt.io.projection_reconcile.prepare_root_reconciliation(
+		session.document, session._backend_session.projection_snapshot(),
+	)
+	_close_session(session)
+	assert reconciliation is None
+
+
+#============================================
+def test_session_rebuilds_when_half_the_roots_change() -> None:
+	"""A complete replacement installs a new document when reuse would not pay off."""
+	session = _live_session(_molecules_cdml(1))
+	document = session.document
+	_rename_molecule(session, "m1")
+	result = _reproject(session)
+	replaced = session.document is not document
+	_close_session(session)
+	assert result.status is _INSTALLED
+	assert replaced
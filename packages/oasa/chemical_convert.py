@@ -29,6 +29,7 @@ if REPO_DIR not in sys.path:
 	sys.path.insert(0, REPO_DIR)
 
 # local repo modules
+import oasa.batch_convert
 import oasa.codec_registry
 
 
@@ -87,6 +88,7 @@ def parse_args() -> argparse.Namespace:
 		f"{script_name} -c sm -i input.smi -o output.mol",
 		f"{script_name} -c is -i input.inchi -o output.smi",
 		f"{script_name} -c ms -i input.mol -o output.smi",
+		f"{script_name} -c si -b -i input.smi -o output.inchi -e errors.log",
 	]
 	parser = argparse.ArgumentParser(
 		description="Convert between SMILES, InChI, molfile, and CDML.",
@@ -108,14 +110,45 @@ def parse_args() -> argparse.Namespace:
 	parser.add_argument(
 		'-i', '--input',
 		dest='input_file',
-		help="Input file path. Omit for interactive mode.",
+		help="Input file path. Omit for interactive mode, or stdin in batch mode.",
 	)
 	parser.add_argument(
 		'-o', '--output',
 		dest='output_file',
 		help="Output file path. Defaults to stdout.",
 	)
+	parser.add_argument(
+		'-b', '--batch',
+		dest='batch',
+		action='store_true',
+		help="Convert record by record in worker processes (SMILES, InChI, and molfile/SDF).",
+	)
+	parser.add_argument(
+		'-j', '--jobs',
+		dest='jobs',
+		type=int,
+		default=None,
+		help="Batch worker processes (default: one per CPU, 1 converts in this process).",
+	)
+	parser.add_argument(
+		'--chunk-size',
+		dest='chunk_size',
+		type=int,
+		default=256,
+		help="Records sent to a worker at a time in batch mode (default: 256).",
+	)
+	parser.add_argument(
+		'-e', '--error-log',
+		dest='error_log',
+		help="File for per-record batch failures. Defaults to stderr.",
+	)
 	args = parser.parse_args()
+	if args.batch:
+		for mode in args.conversion:
+			if CODEC_CODES[mode] not in oasa.batch_convert.BATCH_CODECS:
+				parser.error("Batch mode supports SMILES, InChI, and molfile records only.")
+		if args.chunk_size < 1:
+			parser.error("Chunk size must be positive.")
 	return args
 
 
@@ -163,6 +196,24 @@ def convert_interactive(in_codec: object, out_codec: object, outfile: object, pr
 		sys.stderr.write(f"processing time {elapsed_ms:.2f} ms\n")
 
 
+#============================================
+def convert_batch(args: argparse.Namespace, infile: object, outfile: object) -> None:
+	"""Run a batch conversion and report throughput on stderr."""
+	inmode, outmode = args.conversion
+	if args.error_log:
+		with open(args.error_log, 'w', encoding='utf-8') as error_log:
+			stats = oasa.batch_convert.convert_batch(
+				CODEC_CODES[inmode], CODEC_CODES[outmode], infile, outfile,
+				error_log, jobs=args.jobs, chunk_size=args.chunk_size,
+			)
+	else:
+		stats = oasa.batch_convert.convert_batch(
+			CODEC_CODES[inmode], CODEC_CODES[outmode], infile, outfile,
+			sys.stderr, jobs=args.jobs, chunk_size=args.chunk_size,
+		)
+	sys.stderr.write(stats.summary() + "\n")
+
+
 #============================================
 def main() -> None:
 	"""Run the conversion utility."""
@@ -171,6 +222,19 @@ def main() -> None:
 	in_codec = oasa.codec_registry.get_codec(CODEC_CODES[inmode])
 	out_codec = oasa.codec_registry.get_codec(CODEC_CODES[outmode])
 
+	if args.batch:
+		infile = open(args.input_file, 'r', encoding='utf-8') if args.input_file else sys.stdin
+		try:
+			if args.output_file:
+				with open(args.output_file, 'w', encoding='utf-8') as outfile:
+					convert_batch(args, infile, outfile)
+			else:
+				convert_batch(args, infile, sys.stdout)
+		finally:
+			if infile is not sys.stdin:
+				infile.close()
+		return
+
 	if args.input_file:
 		with open(args.input_file, 'r', encoding='utf-8') as infile:
 			if args.output_file:
@@ -23,6 +23,7 @@ from operator import itemgetter
 from oasa import periodic_table as PT
 from oasa.chem_vertex import ChemVertex as chem_vertex
 from oasa.common import is_uniquely_sorted
+from oasa.graph.revision import next_revision
 from oasa.oasa_exceptions import oasa_invalid_atom_symbol, oasa_invalid_value
 
 
@@ -30,6 +31,7 @@ from oasa.oasa_exceptions import oasa_invalid_atom_symbol, oasa_invalid_value
 class Atom(chem_vertex):
   ## ("value","charge","x","y","z","multiplicity","valency","charge","free_sites")
   attrs_to_copy = chem_vertex.attrs_to_copy + ("symbol", "isotope","explicit_hydrogens")
+  __slots__ = ("_symbol", "symbol_number", "_isotope", "explicit_hydrogens")
 
   def __init__( self, symbol: str='C', charge: int=0, coords: object=None) -> None:
     chem_vertex.__init__( self, coords=coords)
@@ -61,6 +63,7 @@ class Atom(chem_vertex):
   @symbol.setter
   def symbol(self, symbol: str) -> None:
     self._clean_cache()
+    self._revision = next_revision()
     try:
       self.valency = PT.periodic_table[ symbol]['valency'][0]
       self.symbol_number = PT.periodic_table[ symbol]['ord']
@@ -170,6 +173,7 @@ class Atom(chem_vertex):
     if isotope is not None and not isinstance(isotope, int):
       # isotope must be a number or None
       raise oasa_invalid_value( "isotope", isotope)
+    self._revision = next_revision()
     self._isotope = isotope
 
 
@@ -315,7 +319,7 @@ class Atom(chem_vertex):
     """
     yield self
     yield None
-    neighs = self.neighbors
+    neighs = list(self.neighbors)
     if came_from:
       assert came_from in neighs
       neighs.remove( came_from)
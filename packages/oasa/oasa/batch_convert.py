@@ -0,0 +1,254 @@
+#--------------------------------------------------------------------------
+#     This file is part of OASA - a free chemical python library
+#     Copyright (C) 2003-2008 Beda Kosata <beda@zirael.org>
+
+#     This program is free software; you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation; either version 2 of the License, or
+#     (at your option) any later version.
+
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+
+#     Complete text of GNU GPL can be found in the file LICENSE in the
+#     main directory of the program
+
+#--------------------------------------------------------------------------
+
+"""Record-by-record batch conversion between line and molfile formats.
+
+Input is read as a stream of records: one per non-empty line for SMILES and
+InChI, one per ``$$$$``-terminated block for molfiles (SDF layout).  Records
+are grouped into chunks and converted in a process pool; at most a few
+chunks per worker are in flight, so memory stays bounded for inputs of any
+length.  Results are written in input order.  A record that fails to
+convert is reported to the error log with its 1-based number and the run
+goes on.
+"""
+
+# Standard Library
+import os
+import time
+import collections
+import dataclasses
+import concurrent.futures
+
+# PIP3 modules
+import rdkit.rdBase
+import rdkit.RDLogger
+
+# local repo modules
+import oasa.codec_registry
+
+
+# codecs whose records can be split out of a stream and joined back
+BATCH_CODECS = ("smiles", "inchi", "molfile")
+
+# chunks in flight per worker
+_PREFETCH = 2
+
+
+#============================================
+@dataclasses.dataclass
+class BatchStats:
+	"""Counts and per-stage timings of one batch run, in milliseconds.
+
+	``read_ms`` and ``output_ms`` are spent in the calling process;
+	``parse_ms`` and ``format_ms`` are summed over all workers, so with a
+	pool they can exceed ``wall_ms``.
+	"""
+
+	records: int = 0
+	failures: int = 0
+	read_ms: float = 0.0
+	parse_ms: float = 0.0
+	format_ms: float = 0.0
+	output_ms: float = 0.0
+	wall_ms: float = 0.0
+
+	#============================================
+	@property
+	def records_per_second(self) -> float:
+		"""Return the overall throughput."""
+		if self.wall_ms <= 0.0:
+			return 0.0
+		return self.records / (self.wall_ms / 1000.0)
+
+	#============================================
+	def summary(self) -> str:
+		"""Return a one-line report of the run."""
+		return (
+			f"{self.records} records, {self.failures} failed, "
+			f"{self.records_per_second:.1f} records/s; "
+			f"read {self.read_ms:.1f} ms, parse {self.parse_ms:.1f} ms, "
+			f"format {self.format_ms:.1f} ms, write {self.output_ms:.1f} ms, "
+			f"wall {self.wall_ms:.1f} ms"
+		)
+
+
+#============================================
+def iter_records(infile: object, codec_name: str) -> object:
+	"""Yield the text of each record of ``infile`` in the ``codec_name`` layout.
+
+	Raises:
+		ValueError: If the codec has no record layout.
+	"""
+	if codec_name in ("smiles", "inchi"):
+		for line in infile:
+			text = line.strip()
+			if text:
+				yield text
+		return
+	if codec_name != "molfile":
+		raise ValueError(f"Codec '{codec_name}' cannot be split into records.")
+	lines = []
+	for line in infile:
+		if line.strip() == "$$$$":
+			yield "".join(lines)
+			lines = []
+		else:
+			lines.append(line)
+	# the last record may lack its terminator
+	if any(line.strip() for line in lines):
+		yield "".join(lines)
+
+
+#============================================
+def format_record(text: str, codec_name: str) -> str:
+	"""Return converted record text terminated for the ``codec_name`` layout."""
+	if codec_name == "molfile":
+		if not text.endswith("\n"):
+			text += "\n"
+		return text + "$$$$\n"
+	return text.strip() + "\n"
+
+
+#============================================
+def _chunks(records: object, chunk_size: int) -> object:
+	"""Yield lists of at most ``chunk_size`` records."""
+	chunk = []
+	for record in records:
+		chunk.append(record)
+		if len(chunk) == chunk_size:
+			yield chunk
+			chunk = []
+	if chunk:
+		yield chunk
+
+
+#============================================
+def _error_text(exc: Exception) -> str:
+	"""Return a one-line description of a conversion error."""
+	message = " ".join(str(exc).split())
+	return f"{type(exc).__name__}: {message}"
+
+
+#============================================
+def convert_chunk(in_name: str, out_name: str, chunk: list) -> tuple:
+	"""Convert a list of record texts.
+
+	Returns:
+		tuple: (results, parse_ms, format_ms); each result is
+		(True, output text) or (False, error message).
+	"""
+	in_codec = oasa.codec_registry.get_codec(in_name)
+	out_codec = oasa.codec_registry.get_codec(out_name)
+	results = []
+	parse_s = 0.0
+	format_s = 0.0
+	for text in chunk:
+		start = time.perf_counter()
+		try:
+			mol = in_codec.read_text(text)
+		except Exception as exc:
+			parse_s += time.perf_counter() - start
+			results.append((False, _error_text(exc)))
+			continue
+		middle = time.perf_counter()
+		parse_s += middle - start
+		try:
+			output = format_record(out_codec.write_text(mol), out_name)
+		except Exception as exc:
+			results.append((False, _error_text(exc)))
+		else:
+			results.append((True, output))
+		format_s += time.perf_counter() - middle
+	return results, parse_s * 1000.0, format_s * 1000.0
+
+
+#============================================
+def _start_worker() -> None:
+	"""Silence RDKit parse messages in a pool worker; failures go to the error log."""
+	rdkit.RDLogger.DisableLog("rdApp.*")
+
+
+#============================================
+def convert_batch(
+		in_name: str, out_name: str, infile: object, outfile: object,
+		error_log: object, jobs: int | None = None, chunk_size: int = 256,
+		) -> BatchStats:
+	"""Convert every record of ``infile`` and write the results to ``outfile``.
+
+	``jobs`` worker processes (default: one per CPU) convert chunks of
+	``chunk_size`` records; with one job everything runs in this process.
+	Each failed record writes one ``<number>\\t<error>`` line to
+	``error_log`` and is left out of the output.
+
+	Raises:
+		ValueError: If either codec is not one of ``BATCH_CODECS`` or
+			``chunk_size`` is not positive.
+	"""
+	for name in (in_name, out_name):
+		if name not in BATCH_CODECS:
+			raise ValueError(f"Codec '{name}' is not supported in batch mode.")
+	if chunk_size < 1:
+		raise ValueError("Chunk size must be positive.")
+	stats = BatchStats()
+	wall_start = time.perf_counter()
+	chunks = _chunks(iter_records(infile, in_name), chunk_size)
+
+	def next_chunk() -> list | None:
+		"""Return the next chunk of records, or None at the end of the input."""
+		start = time.perf_counter()
+		chunk = next(chunks, None)
+		stats.read_ms += (time.perf_counter() - start) * 1000.0
+		return chunk
+
+	def emit(converted: tuple) -> None:
+		"""Write one converted chunk and its failures in record order."""
+		results, parse_ms, format_ms = converted
+		stats.parse_ms += parse_ms
+		stats.format_ms += format_ms
+		start = time.perf_counter()
+		for ok, text in results:
+			stats.records += 1
+			if ok:
+				outfile.write(text)
+			else:
+				stats.failures += 1
+				error_log.write(f"{stats.records}\t{text}\n")
+		stats.output_ms += (time.perf_counter() - start) * 1000.0
+
+	workers = jobs or os.cpu_count() or 1
+	if workers < 2:
+		with rdkit.rdBase.BlockLogs():
+			chunk = next_chunk()
+			while chunk is not None:
+				emit(convert_chunk(in_name, out_name, chunk))
+				chunk = next_chunk()
+	else:
+		with concurrent.futures.ProcessPoolExecutor(
+			max_workers=workers, initializer=_start_worker,
+		) as pool:
+			pending = collections.deque()
+			chunk = next_chunk()
+			while chunk is not None or pending:
+				# keep the pool busy without reading the whole input ahead
+				while chunk is not None and len(pending) < workers * _PREFETCH:
+					pending.append(pool.submit(convert_chunk, in_name, out_name, chunk))
+					chunk = next_chunk()
+				emit(pending.popleft().result())
+	stats.wall_ms = (time.perf_counter() - wall_start) * 1000.0
+	return stats
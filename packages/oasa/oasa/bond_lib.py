@@ -28,6 +28,7 @@
 import math
 
 from oasa.graph.edge_lib import Edge as edge
+from oasa.graph.revision import next_revision
 
 
 
@@ -48,6 +49,7 @@ class Bond(edge, object):
   """
   attrs_to_copy = edge.attrs_to_copy + ("order","aromatic","type",
                                         "line_color","wavy_style")
+  __slots__ = ("aromatic", "_order", "type", "stereochemistry", "line_color", "wavy_style", "center")
 
   def __init__( self, vs: list | None=None, order: int=1, type: str='n') -> None:
     edge.__init__( self, vs=vs)
@@ -55,7 +57,6 @@ class Bond(edge, object):
     self.aromatic = None  # None means it was not set
     self.order = order
     self.type = type
-    self.properties_ = {}
     self.stereochemistry = None
     self.line_color = None
     self.wavy_style = None
@@ -116,6 +117,7 @@ class Bond(edge, object):
   @order.setter
   def order(self, order: int) -> None:
     [a.bond_order_changed() for a in self.vertices]
+    self._revision = next_revision()
     if order == 4:
       self._order = None
       self.aromatic = 1
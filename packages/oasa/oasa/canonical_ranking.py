@@ -0,0 +1,329 @@
+#--------------------------------------------------------------------------
+#     This file is part of OASA - a free chemical python library
+#     Copyright (C) 2003-2008 Beda Kosata <beda@zirael.org>
+
+#     This program is free software; you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation; either version 2 of the License, or
+#     (at your option) any later version.
+
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+
+#     Complete text of GNU GPL can be found in the file LICENSE in the
+#     main directory of the program
+
+#--------------------------------------------------------------------------
+
+"""Canonical atom ranking and symmetry classes by individualization-refinement.
+
+Atoms start in classes of equal invariants (``atom_invariant`` by default)
+and are refined Morgan-style: each round splits a class by the sorted
+(bond, neighbor class) pairs of its members, keeping the order of the old
+classes.  Refinement stops when a round splits nothing.
+
+Atoms left in one class after refinement need not be interchangeable (in
+regular graphs such as cuneane every atom looks alike), so ties are not
+broken by picking one atom.  Instead each atom of the lowest tied class is
+moved ahead of its class in turn and the classes are refined again, giving
+a search tree whose leaves rank every atom distinctly.  The canonical ranks
+are those of the leaf with the smallest canonical key, so the key is the
+same for every atom order of a molecule and equal keys mean isomorphic
+molecules.  Two leaves with equal keys give an automorphism of the
+molecule; automorphisms that fix the atoms chosen so far prune branches
+that would only repeat a known subtree, and their orbits are the symmetry
+classes.
+
+Each refinement round sorts the atoms once, so a round costs about
+O(m log m).  For typical molecules refinement leaves few ties and the
+pruned search visits only a handful of leaves.
+"""
+
+# Standard Library
+import hashlib
+
+# local repo modules
+import oasa.atom_lib
+
+
+#============================================
+def atom_invariant(atom: object) -> tuple:
+	"""Return the default refinement invariant of one atom.
+
+	Symbol, isotope, charge, hydrogen count and multiplicity.  Only
+	``Atom`` carries an isotope; query atoms count as isotope 0.
+	"""
+	isotope = atom.isotope if isinstance(atom, oasa.atom_lib.Atom) else None
+	return (
+		atom.symbol,
+		isotope or 0,
+		atom.charge or 0,
+		atom.get_hydrogen_count(),
+		atom.multiplicity or 1,
+	)
+
+
+#============================================
+def bond_invariant(bond: object) -> int:
+	"""Return the default refinement invariant of one bond: its order, 4 when aromatic.
+
+	Kekule structures only compare equal when their rings were marked
+	aromatic first, for example with ``Molecule.mark_aromatic_bonds``.
+	"""
+	if bond.aromatic:
+		return 4
+	return bond.order or 0
+
+
+#============================================
+def connectivity_invariant(atom: object) -> tuple:
+	"""Return symbol and hydrogen count only, for bare-connectivity comparisons."""
+	return (atom.symbol, atom.get_hydrogen_count())
+
+
+#============================================
+def _no_bond_invariant(bond: object) -> int:
+	"""Treat every bond alike."""
+	return 0
+
+
+#============================================
+def _relabel(keys: list) -> tuple:
+	"""Return dense class indices ordered by ``keys`` and the number of classes."""
+	distinct = sorted(set(keys))
+	index = {key: i for i, key in enumerate(distinct)}
+	return [index[key] for key in keys], len(distinct)
+
+
+#============================================
+class _Graph:
+	"""Index-based copy of a molecule's atoms, bonds and invariants."""
+
+	#============================================
+	def __init__(self, mol: object, atom_key: object, bond_key: object) -> None:
+		"""Read atom and bond invariants and neighbor lists in vertex order."""
+		self.vertices = list(mol.vertices)
+		positions = {v: i for i, v in enumerate(self.vertices)}
+		self.neighbors = [[] for _ in self.vertices]
+		self.bonds = []
+		for e in mol.edges:
+			v1, v2 = e.vertices
+			i, j = positions[v1], positions[v2]
+			label = bond_key(e)
+			self.neighbors[i].append((label, j))
+			self.neighbors[j].append((label, i))
+			self.bonds.append((i, j, label))
+		self.atoms = [atom_key(v) for v in self.vertices]
+
+	#============================================
+	def refine(self, classes: list, count: int) -> tuple:
+		"""Split ``classes`` until stable; return the new classes and their number."""
+		neighbors = self.neighbors
+		while count < len(classes):
+			keys = [
+				(classes[i], tuple(sorted((label, classes[j]) for label, j in neighbors[i])))
+				for i in range(len(classes))
+			]
+			classes, new_count = _relabel(keys)
+			if new_count == count:
+				break
+			count = new_count
+		return classes, count
+
+	#============================================
+	def refined_classes(self) -> tuple:
+		"""Return the refined classes of the atom invariants and their number."""
+		classes, count = _relabel(self.atoms)
+		return self.refine(classes, count)
+
+	#============================================
+	def individualize(self, classes: list, chosen: int) -> tuple:
+		"""Move atom ``chosen`` ahead of its class and refine again."""
+		keys = [(c, i != chosen) for i, c in enumerate(classes)]
+		classes, count = _relabel(keys)
+		return self.refine(classes, count)
+
+	#============================================
+	def search(self) -> tuple:
+		"""Return the canonical ranks and the symmetry class of each atom."""
+		classes, count = self.refined_classes()
+		if count == len(classes):
+			return classes, classes
+		search = _Search(self)
+		search.explore(classes, count, [])
+		ranks = search.best[1]
+		# Index each orbit by its lowest canonical rank to keep classes canonical.
+		roots = _orbit_roots(len(ranks), search.automorphisms)
+		lowest = {}
+		for i, root in enumerate(roots):
+			lowest[root] = min(lowest.get(root, ranks[i]), ranks[i])
+		orbits, _count = _relabel([lowest[root] for root in roots])
+		return ranks, orbits
+
+	#============================================
+	def ranks(self) -> list:
+		"""Return distinct canonical ranks 0..n-1 in vertex order."""
+		ranks, _orbits = self.search()
+		return ranks
+
+	#============================================
+	def key(self, ranks: list | None = None) -> tuple:
+		"""Return the canonical key: atoms in rank order and rank-ordered bonds."""
+		if ranks is None:
+			ranks = self.ranks()
+		atoms = [None] * len(ranks)
+		for i, rank in enumerate(ranks):
+			atoms[rank] = self.atoms[i]
+		bonds = sorted(
+			(min(ranks[i], ranks[j]), max(ranks[i], ranks[j]), label)
+			for i, j, label in self.bonds
+		)
+		return (tuple(atoms), tuple(bonds))
+
+
+#============================================
+def _orbit_roots(count: int, permutations: list, fixed: list = ()) -> list:
+	"""Return an orbit representative of each atom under ``permutations``.
+
+	Only permutations that fix every atom in ``fixed`` take part.
+	"""
+	parent = list(range(count))
+
+	def find(i: int) -> int:
+		"""Return the representative of atom ``i``, halving paths on the way."""
+		while parent[i] != i:
+			parent[i] = parent[parent[i]]
+			i = parent[i]
+		return i
+
+	for permutation in permutations:
+		if any(permutation[i] != i for i in fixed):
+			continue
+		for i, j in enumerate(permutation):
+			root_i, root_j = find(i), find(j)
+			if root_i != root_j:
+				parent[max(root_i, root_j)] = min(root_i, root_j)
+	return [find(i) for i in range(count)]
+
+
+#============================================
+class _Search:
+	"""Individualization-refinement search for the smallest canonical key.
+
+	The first leaf and the best leaf are kept.  A later leaf with the same key
+	as either gives an automorphism; one matching the first leaf also ends the
+	search below the current branch of the first path, whose leaves all repeat
+	known ones.  Together the automorphisms found generate the whole
+	automorphism group.
+	"""
+
+	#============================================
+	def __init__(self, graph: _Graph) -> None:
+		"""Start an empty search over ``graph``."""
+		self.graph = graph
+		self.first = None
+		self.best = None
+		self.automorphisms = []
+
+	#============================================
+	def explore(self, classes: list, count: int, path: list) -> bool:
+		"""Search below one node; return True to return to the first path."""
+		if count == len(classes):
+			return self.leaf(classes)
+		on_first_path = self.first is None
+		members = {}
+		for i, c in enumerate(classes):
+			members.setdefault(c, []).append(i)
+		tied = min(c for c, atoms in members.items() if len(atoms) > 1)
+		explored = []
+		roots = None
+		known = 0
+		for chosen in members[tied]:
+			if explored:
+				# Orbits only change when a new automorphism has been found.
+				if known != len(self.automorphisms):
+					known = len(self.automorphisms)
+					roots = _orbit_roots(len(classes), self.automorphisms, path)
+				if roots is not None and roots[chosen] in {roots[i] for i in explored}:
+					continue
+			explored.append(chosen)
+			child_classes, child_count = self.graph.individualize(classes, chosen)
+			if self.explore(child_classes, child_count, path + [chosen]) and not on_first_path:
+				return True
+		return False
+
+	#============================================
+	def leaf(self, ranks: list) -> bool:
+		"""Record one leaf; return True when it repeats the first leaf."""
+		key = self.graph.key(ranks)
+		if self.first is None:
+			self.first = self.best = (key, ranks)
+			return False
+		for known_key, known_ranks in (self.first, self.best):
+			if key == known_key:
+				by_rank = [0] * len(ranks)
+				for i, rank in enumerate(ranks):
+					by_rank[rank] = i
+				self.automorphisms.append([by_rank[rank] for rank in known_ranks])
+				return known_ranks is self.first[1]
+		if key < self.best[0]:
+			self.best = (key, ranks)
+		return False
+
+
+#============================================
+def _graph(mol: object, atom_key: object, bond_key: object) -> _Graph:
+	"""Return the index graph with default invariants filled in."""
+	if atom_key is None:
+		atom_key = atom_invariant
+	if bond_key is None:
+		bond_key = bond_invariant
+	elif bond_key is False:
+		bond_key = _no_bond_invariant
+	return _Graph(mol, atom_key, bond_key)
+
+
+#============================================
+def symmetry_classes(mol: object, atom_key: object = None, bond_key: object = None) -> list:
+	"""Return the symmetry class index of each atom of ``mol``, in vertex order.
+
+	Atoms in one class are mapped onto each other by an automorphism that
+	keeps every atom and bond invariant.  Class indices are canonical: they
+	only depend on the molecule, not on the atom order.  ``atom_key`` and ``bond_key`` replace
+	the default invariants; ``bond_key=False`` ignores bonds.
+	"""
+	_ranks, classes = _graph(mol, atom_key, bond_key).search()
+	return classes
+
+
+#============================================
+def canonical_ranks(mol: object, atom_key: object = None, bond_key: object = None) -> list:
+	"""Return a distinct canonical rank 0..n-1 for each atom of ``mol``, in vertex order."""
+	return _graph(mol, atom_key, bond_key).ranks()
+
+
+#============================================
+def canonical_key(mol: object, atom_key: object = None, bond_key: object = None) -> tuple:
+	"""Return a hashable description of ``mol`` that is equal for isomorphic molecules.
+
+	The key lists the atom invariants in canonical rank order and the bonds
+	as (rank, rank, bond invariant) triples; it holds no atom objects.
+	"""
+	return _graph(mol, atom_key, bond_key).key()
+
+
+#============================================
+def canonical_key_and_ranks(mol: object, atom_key: object = None, bond_key: object = None) -> tuple:
+	"""Return ``(canonical_key, canonical_ranks)`` from one refinement of ``mol``."""
+	graph = _graph(mol, atom_key, bond_key)
+	ranks = graph.ranks()
+	return graph.key(ranks), ranks
+
+
+#============================================
+def canonical_hash(mol: object, atom_key: object = None, bond_key: object = None) -> str:
+	"""Return the SHA-1 hex digest of ``canonical_key``, a compact duplicate-detection key."""
+	key = canonical_key(mol, atom_key, bond_key)
+	return hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
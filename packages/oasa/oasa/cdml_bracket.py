@@ -11,7 +11,6 @@ import oasa.cdml_document
 import oasa.cdml_bracket_pair
 import oasa.cdml_standard
 import oasa.cdml_writer
-import oasa.cdml_xml
 
 
 class CDMLBracketInsertError(oasa.cdml_document.CDMLValidationError):
@@ -189,26 +188,26 @@ def _point_sets(
 def insert_brackets(
 		session: object, request: CDMLBracketInsertRequest,
 		) -> CDMLBracketInsertResult:
-	"""Append one backend-allocated bracket pair as an atomic complete document."""
+	"""Append one backend-allocated bracket pair in one session transaction."""
 	if type(session) is not oasa.cdml_document.CDMLDocumentSession:
 		raise CDMLBracketInsertError("Bracket insertion requires an exact session")
 	style, bounds = _validate_request(request)
-	snapshot = session.snapshot()
-	if snapshot.revision != request.expected_revision:
+	if session.revision != request.expected_revision:
 		raise oasa.cdml_document.CDMLRevisionConflictError(
 			"Bracket expected revision does not match current revision",
 		)
 	standard = session.drawing_standard(
-		oasa.cdml_standard.CDMLDrawingStandardQuery(snapshot.revision),
+		oasa.cdml_standard.CDMLDrawingStandardQuery(request.expected_revision),
 	)
-	# Keep every complete-CDML read behind the lxml authorization policy before
-	# the established defused-DOM compatibility representation is constructed.
-	document = oasa.cdml_xml.parse_cdml_dom(snapshot.cdml.encode("utf-8"))
+	# New elements come from the authoritative document; they join its tree
+	# only inside the transaction below, which rolls back on any failure.
+	document = session._document._dom_document
 	root = document.documentElement
 	provisional_ids = tuple(
-		f"__bkchem_new__bracket-r{snapshot.revision}-{side}"
+		f"__bkchem_new__bracket-r{request.expected_revision}-{side}"
 		for side in ("left", "right")
 	)
+	polylines = []
 	for side, provisional_id, points in zip(
 			("left", "right"), provisional_ids, _point_sets(style, bounds),
 		):
@@ -224,10 +223,11 @@ def insert_brackets(
 			point.setAttribute("x", _cm_text(x_coordinate))
 			point.setAttribute("y", _cm_text(y_coordinate))
 			polyline.appendChild(point)
-		root.appendChild(polyline)
-	commit = session.commit(
-		expected_revision=request.expected_revision, complete_cdml=document.toxml(),
-	)
+		polylines.append(polyline)
+	with session._edit() as transaction:
+		for polyline in polylines:
+			transaction.root.appendChild(polyline)
+		commit = session._commit_transaction(transaction, request.expected_revision)
 	left_id, right_id = tuple(commit.id_map[identifier] for identifier in provisional_ids)
 	return CDMLBracketInsertResult(
 		commit.snapshot, True, commit, left_id, left_id, right_id,
@@ -251,9 +251,8 @@ def _local_name(element: object) -> str:
 
 
 #============================================
-def _pair_members(document: object, pair_id: str) -> tuple[object, object]:
-	"""Resolve exactly one complete direct-core bracket pair in a candidate DOM."""
-	root = document.documentElement
+def _pair_members(root: object, pair_id: str) -> tuple[object, object]:
+	"""Resolve exactly one complete direct-core bracket pair below one document root."""
 	for left, right in oasa.cdml_bracket_pair.valid_bracket_members(
 		tuple(child for child in root.childNodes if child.nodeType == child.ELEMENT_NODE),
 		_is_core_polyline, _local_name,
@@ -297,41 +296,32 @@ def patch_bracket_properties(
 			"Bracket appearance requires an exact CDML document session",
 		)
 	pair_id, changes = _validate_patch(request)
-	snapshot = session.snapshot()
-	if snapshot.revision != request.expected_revision:
+	if session.revision != request.expected_revision:
 		raise oasa.cdml_document.CDMLRevisionConflictError(
 			"Bracket appearance expected revision does not match current revision",
 		)
-	# The current snapshot is complete CDML, so use the same authorization gate
-	# used by all other backend presentation operations.
-	candidate_dom = oasa.cdml_xml.parse_cdml_dom(snapshot.cdml.encode("utf-8"))
-	left, right = _pair_members(candidate_dom, pair_id)
-	member_ids = (left.getAttribute("id"), right.getAttribute("id"))
-	values = tuple(_member_values(member) for member in (left, right))
-	if not changes or all(
-		all(value[field_name] == changed_value for value in values)
-		for field_name, changed_value in changes
-		):
-		return CDMLBracketPropertiesPatchResult(
-			snapshot, False, None, pair_id, member_ids,
-		)
-	attribute_names = {"line_width": "width", "line_color": "line_color"}
-	for member in (left, right):
-		for field_name, value in changes:
-			text = f"{value:g}" if field_name == "line_width" else value
-			member.setAttribute(attribute_names[field_name], text)
-	candidate = oasa.cdml_document.CDMLDocument.parse(
-		candidate_dom.toxml(), validation="compat",
-	)
-	candidate.validate(validation="strict")
-	candidate_cdml = candidate.serialize()
-	if candidate_cdml == snapshot.cdml:
-		return CDMLBracketPropertiesPatchResult(
-			snapshot, False, None, pair_id, member_ids,
-		)
-	commit = session.commit(
-		expected_revision=request.expected_revision, complete_cdml=candidate_cdml,
-	)
+	with session._edit() as transaction:
+		left, right = _pair_members(transaction.root, pair_id)
+		member_ids = (left.getAttribute("id"), right.getAttribute("id"))
+		values = tuple(_member_values(member) for member in (left, right))
+		if not changes or all(
+			all(value[field_name] == changed_value for value in values)
+			for field_name, changed_value in changes
+			):
+			return CDMLBracketPropertiesPatchResult(
+				session.snapshot(), False, None, pair_id, member_ids,
+			)
+		attribute_names = {"line_width": "width", "line_color": "line_color"}
+		for member in (left, right):
+			member = transaction.writable(member)
+			for field_name, value in changes:
+				text = f"{value:g}" if field_name == "line_width" else value
+				member.setAttribute(attribute_names[field_name], text)
+		if transaction.is_noop():
+			return CDMLBracketPropertiesPatchResult(
+				session.snapshot(), False, None, pair_id, member_ids,
+			)
+		commit = session._commit_transaction(transaction, request.expected_revision)
 	return CDMLBracketPropertiesPatchResult(
 		commit.snapshot, True, commit, pair_id, member_ids,
 	)
@@ -20,6 +20,7 @@ import oasa.bond_semantics
 import oasa.cdml_bond_io
 import oasa.cdml_bracket_pair
 import oasa.cdml_ftext
+import oasa.cdml_history
 import oasa.cdml_molecule_summary
 import oasa.cdml_presentation_facts
 import oasa.cdml_presentation_appearance
@@ -28,7 +29,6 @@ import oasa.cdml_standard
 import oasa.cdml_writer
 import oasa.cdml_xml
 import oasa.coords_generator
-import oasa.codecs.rdkit_formats
 import oasa.group_expansion
 import oasa.molecule_lib
 import oasa.periodic_table
@@ -1348,14 +1348,21 @@ def _durable_prefix(local_name: str) -> str:
 
 
 #============================================
-def _next_durable_id(local_name: str, used_ids: set[str]) -> str:
-	"""Allocate one collision-free backend durable ID without mutating callers."""
+def _next_durable_id(local_name: str, used_ids: collections.abc.Set) -> str:
+	"""Allocate the lowest free backend durable ID without claiming it.
+
+	An indexed ``DurableIdSet`` starts probing at its per-prefix serial floor
+	instead of at 1.
+	"""
 	prefix = _durable_prefix(local_name)
-	serial = 1
+	indexed = hasattr(used_ids, "serial_floor")
+	serial = used_ids.serial_floor(prefix) if indexed else 1
 	identifier = f"{prefix}{serial}"
 	while identifier in used_ids:
 		serial += 1
 		identifier = f"{prefix}{serial}"
+	if indexed:
+		used_ids.raise_floor(prefix, serial)
 	return identifier
 
 
@@ -1410,14 +1417,6 @@ def _is_id_definition(element: object) -> bool:
 	return not _fragment_member_reference(element)
 
 
-#============================================
-def _element_locations(root: object) -> tuple[tuple[int, object], ...]:
-	"""Return all persistent elements in stable depth-first preorder."""
-	elements = _descendant_elements(root)[1:]
-	locations = tuple(enumerate(elements))
-	return locations
-
-
 #============================================
 def _presentation_attributes(element: object) -> tuple[tuple[str, str], ...]:
 	"""Return stable non-namespace attributes for a public projection value."""
@@ -2311,90 +2310,34 @@ def _validated_render_primitive(primitive: CDMLRenderPrimitive) -> CDMLRenderPri
 
 
 #============================================
-def _molecule_render_observation(document: "CDMLDocument", revision: int) -> CDMLMoleculeRenderObservation:
-	"""Build atom and bond paint batches from one canonical CDML snapshot."""
-	core = _molecule_core_observation(document, revision)
+def _molecule_render_observation(
+		document: "CDMLDocument", revision: int, *, core: CDMLMoleculeCoreObservation | None = None,
+		batch_cache: "oasa.cdml_molecule_render.CDMLMoleculeBatchCache | None" = None,
+		) -> CDMLMoleculeRenderObservation:
+	"""Build atom and bond paint batches from one canonical CDML snapshot.
+
+	``batch_cache`` is the caller-owned cache of unchanged molecules' batches;
+	without one every molecule is painted.
+	"""
+	import oasa.cdml_molecule_render
+	if core is None:
+		core = _molecule_core_observation(document, revision)
+	if batch_cache is None:
+		batch_cache = oasa.cdml_molecule_render.CDMLMoleculeBatchCache()
 	batches = []
 	issues = []
 	root = document._dom_document.documentElement
 	standard = oasa.cdml_standard.observe(root, revision)
+	molecules_by_source_position = {
+		source_position: molecule
+		for source_position, molecule in enumerate(_element_children(root), 1)
+		if _local_name(molecule) == "molecule"
+	}
 	for core_record in core.records:
 		if not core_record.renderable:
 			continue
-		molecule = next((child for position, child in enumerate(_element_children(root), 1)
-			if position == core_record.source_position), None)
-		try:
-			chem_molecule, atom_by_source, bond_by_source = _decode_renderable_molecule_core(
-				molecule, core_record,
-			)
-			atom_entries = [
-				(atom_record, atom_by_source[atom_record.source_position])
-				for atom_record in core_record.atoms if atom_record.renderable
-			]
-			for atom_record, atom in atom_entries:
-				if atom_record.show is False:
-					ops = ()
-				else:
-					marks = atom.properties_.pop("marks", None)
-					color = atom_record.line_color or "__backend_foreground__"
-					ops = oasa.render_lib.molecule_ops.build_vertex_ops(
-						atom, transform_xy=None, show_hydrogens_on_hetero=bool(atom_record.show_hydrogens),
-						color_atoms=True, atom_colors={atom.symbol: color},
-						font_name=atom_record.font_family or "Arial", font_size=atom_record.font_size or 12.0,
-						background_color=standard.area_color or "__backend_document_background__",
-						show_carbon_symbol=atom_record.show is True,
-					)
-					if marks is not None:
-						atom.properties_["marks"] = marks
-				anchor = (float(atom_record.x_pt), float(atom_record.y_pt))
-				batches.append(CDMLMoleculeRenderBatch("atom", core_record.source_position, atom_record.identifier,
-					atom_record.source_position, atom_record.addressable, anchor, None,
-					tuple(_render_primitive(op, anchor) for op in ops)))
-			shown, labels, attaches = set(), {}, {}
-			for atom_record, atom in atom_entries:
-				if atom_record.show is False:
-					continue
-				entry_shown, entry_labels, entry_attaches = oasa.render_lib.molecule_ops.build_label_attach_targets(
-					[atom], show_hydrogens_on_hetero=bool(atom_record.show_hydrogens),
-					font_name=atom_record.font_family or "Arial", font_size=atom_record.font_size or 12.0,
-					show_carbon_symbol=atom_record.show is True,
-				)
-				shown.update(entry_shown); labels.update(entry_labels); attaches.update(entry_attaches)
-			bond_entries = [
-				(bond_record, bond_by_source[bond_record.source_position])
-				for bond_record in core_record.bonds if bond_record.renderable
-			]
-			for bond_record, bond in bond_entries:
-				start_atom, end_atom = bond.get_vertices()
-				start, end = (float(start_atom.x), float(start_atom.y)), (float(end_atom.x), float(end_atom.y))
-				context = oasa.render_lib.data_types.BondRenderContext(
-					None, bond_record.line_width if bond_record.line_width is not None else 2.0,
-					bond_record.bond_width if bond_record.bond_width is not None else 6.0,
-					bond_record.wedge_width if bond_record.wedge_width is not None else 9.2,
-					1.2, bond_second_line_shortening=(
-						oasa.cdml_standard.bond_second_line_shortening(bond_record.double_ratio)
-					),
-					shown_vertices=shown,
-					bond_coords={bond: (start, end)}, bond_coords_provider={bond: (start, end)}.get,
-					label_targets=labels, attach_targets=attaches,
-					attach_constraints=oasa.render_lib.data_types.make_attach_constraints(),
-				)
-				previous = oasa.cdml_standard.install_bond_render_values(
-					bond, bond_record.double_ratio, bond_record.line_color,
-				)
-				try:
-					ops = oasa.render_lib.bond_ops.build_bond_ops(bond, start, end, context)
-				finally:
-					oasa.cdml_standard.restore_bond_render_values(bond, previous)
-				batches.append(CDMLMoleculeRenderBatch("bond", core_record.source_position, bond_record.identifier,
-					bond_record.source_position, bond_record.addressable, None, (start, end),
-					tuple(_render_primitive(op) for op in ops)))
-		except CDMLMoleculeRenderObservationError:
-			raise
-		except Exception as exc:
-			raise CDMLMoleculeRenderObservationError(
-				"could not prepare molecule render observation: %s" % exc,
-			) from exc
+		molecule = molecules_by_source_position[core_record.source_position]
+		batches.extend(batch_cache.molecule_batches(molecule, core_record, standard.area_color))
 	for issue in core.issues:
 		issues.append(CDMLMoleculeRenderObservationIssue(
 			issue.molecule_source_position, issue.source_position, issue.kind, issue.reason,
@@ -2454,10 +2397,11 @@ def _decode_renderable_molecule_core(
 
 #============================================
 def _atom_chemistry_facts_observation(
-		document: "CDMLDocument", revision: int,
+		document: "CDMLDocument", revision: int, *, core: CDMLMoleculeCoreObservation | None = None,
 		) -> CDMLAtomChemistryFactsObservation:
 	"""Observe complete direct-core chemistry without retaining graph objects."""
-	core = _molecule_core_observation(document, revision)
+	if core is None:
+		core = _molecule_core_observation(document, revision)
 	records = []
 	issues = []
 	root = document._dom_document.documentElement
@@ -3301,6 +3245,10 @@ def _direct_core_child_by_id(parent: object, identifier: str, local_name: str) -
 def _direct_root_molecule(document: "CDMLDocument", identifier: str) -> object:
 	"""Return a direct-root core molecule without traversing opaque wrappers."""
 	root = document._dom_document.documentElement
+	index = document._durable_id_index
+	molecule = None if index is None else index.direct_root(identifier)
+	if molecule is not None and _is_cdml_element(molecule) and _local_name(molecule) == "molecule":
+		return molecule
 	return _direct_core_child_by_id(root, identifier, "molecule")
 
 
@@ -5489,16 +5437,9 @@ def _validate_paper_properties_patch(request: object) -> dict[str, object]:
 
 
 #============================================
-def _candidate_durable_ids(candidate: "CDMLDocument") -> set[str]:
+def _candidate_durable_ids(candidate: "CDMLDocument") -> "oasa.cdml_id_index.DurableIdSet":
 	"""Return every current durable identifier, including opaque reservations."""
-	used_ids = set()
-	for element in _descendant_elements(candidate._dom_document.documentElement):
-		if not _is_id_definition(element):
-			continue
-		identifier = element.getAttribute("id")
-		if identifier:
-			used_ids.add(identifier)
-	return used_ids
+	return candidate._id_index().durable_ids()
 
 
 #============================================
@@ -5537,40 +5478,146 @@ def _has_direct_bond(molecule: object, first_atom_id: str, second_atom_id: str)
 			return True
 	return False
 
-def _projection_plan(document: "CDMLDocument", revision: int) -> CDMLProjectionPlan:
-	"""Collect synchronized facts from one backend DOM revision."""
-	presentation = _presentation_description(document, revision)
-	paper = _paper_layout(document, revision)
-	fragments = _fragment_metadata(document, revision)
-	marks = _atom_mark_observation(document, revision)
-	groups = _group_observation(document, revision)
-	molecule_core = _molecule_core_observation(document, revision)
-	molecule_render = _molecule_render_observation(document, revision)
-	presentation_by_position = {record.source_position: record for record in presentation.records}
-	presentation_issues = {issue.source_position: issue for issue in presentation.issues}
-	molecules_by_position = {record.source_position: record for record in molecule_core.records}
-	roots = []
-	root = document._dom_document.documentElement
-	for source_position, element in enumerate(_element_children(root), 1):
-		tag = _local_name(element)
-		identifier = element.getAttribute("id") or None
-		record = presentation_by_position.get(source_position)
-		issue = presentation_issues.get(source_position)
-		molecule = molecules_by_position.get(source_position)
-		if record is not None:
-			roots.append(CDMLProjectionRoot(source_position, tag, identifier, record.disposition, record.reason))
-		elif molecule is not None:
-			roots.append(CDMLProjectionRoot(source_position, tag, identifier, "editable" if molecule.addressable else "display-only", molecule.reason))
-		elif tag in {"paper", "viewport", "info", "metadata", "standard"}:
-			roots.append(CDMLProjectionRoot(source_position, tag, identifier, "header", None))
+#============================================
+def _strict_issues(elements: list, outside_ids: collections.abc.Set) -> list[CDMLIssue]:
+	"""Return strict durable-ID and reference findings for ``elements``.
+
+	``outside_ids`` names definitions already accepted elsewhere in the same
+	document, so a transaction can check only the direct roots it changed.
+	"""
+	issues = []
+	seen_ids = outside_ids.copy()
+	for element in elements:
+		if not _is_id_definition(element):
+			continue
+		identifier = element.getAttribute("id")
+		if not identifier:
+			continue
+		if _is_id_declaration(element) and _has_provisional_id_prefix(identifier):
+			code = "provisional_id" if _is_provisional_id(identifier) else "malformed_provisional_id"
+			message = "provisional IDs are valid only during commit"
+			issues.append(CDMLIssue(
+				code, message, _node_path(element),
+			))
+		elif identifier in seen_ids:
+			issues.append(CDMLIssue(
+				"duplicate_id", f"duplicate CDML id: {identifier}", _node_path(element),
+			))
 		else:
-			reason = issue.reason if issue is not None else "direct root is not projected"
-			roots.append(CDMLProjectionRoot(source_position, tag, identifier, "display-only", reason))
-	plan = CDMLProjectionPlan(
-		revision, tuple(roots), presentation, paper, fragments, marks, groups,
-		molecule_core, molecule_render,
+			seen_ids.add(identifier)
+	issues.extend(_reference_issues(elements, seen_ids))
+	return issues
+
+
+#============================================
+def _reference_issues(elements: list, defined_ids: collections.abc.Container) -> list[CDMLIssue]:
+	"""Return provisional and unresolved known-reference findings for ``elements``."""
+	issues = []
+	for element in elements:
+		for attribute_name in _known_reference_attributes(element):
+			reference = element.getAttribute(attribute_name)
+			if not reference:
+				continue
+			if _has_provisional_id_prefix(reference):
+				code = "provisional_reference" if _is_provisional_id(reference) else "malformed_provisional_reference"
+				issues.append(CDMLIssue(
+					code, "provisional reference escaped commit", _node_path(element),
+				))
+			elif reference not in defined_ids:
+				issues.append(CDMLIssue(
+					"unresolved_reference",
+					f"unresolved {attribute_name} reference: {reference}", _node_path(element),
+				))
+		if _fragment_member_reference(element):
+			reference = element.getAttribute("id")
+			if _has_provisional_id_prefix(reference):
+				code = "provisional_reference" if _is_provisional_id(reference) else "malformed_provisional_reference"
+				issues.append(CDMLIssue(
+					code, "provisional reference escaped commit", _node_path(element),
+				))
+			elif reference and reference not in defined_ids:
+				issues.append(CDMLIssue(
+					"unresolved_fragment_member",
+					f"unresolved fragment member: {reference}", _node_path(element),
+				))
+	return issues
+
+
+#============================================
+def _assign_provisional_ids(roots: tuple, elements: list, outside_ids: collections.abc.Set) -> dict[str, str]:
+	"""Replace valid transaction-only IDs and known refs below ``roots``.
+
+	``outside_ids`` names durable IDs accepted elsewhere in the same document;
+	they count as used for allocation and as duplicates for new definitions.
+	"""
+	bracket_members = oasa.cdml_bracket_pair.valid_bracket_members(
+		tuple(roots), _is_cdml_element, _local_name,
 	)
-	return plan
+	used_ids = outside_ids.copy()
+	seen_source_ids = outside_ids.copy()
+	provisional_nodes = []
+	for element in elements:
+		if not _is_id_definition(element):
+			continue
+		identifier = element.getAttribute("id")
+		if not identifier:
+			continue
+		if identifier in seen_source_ids:
+			raise CDMLValidationError(f"duplicate CDML id: {identifier}")
+		seen_source_ids.add(identifier)
+		if _is_id_declaration(element) and _has_provisional_id_prefix(identifier):
+			if not _is_provisional_id(identifier):
+				raise CDMLValidationError(f"malformed provisional CDML id: {identifier}")
+			provisional_nodes.append((identifier, element))
+		else:
+			used_ids.add(identifier)
+	id_map = {}
+	for token, element in provisional_nodes:
+		if token in id_map:
+			raise CDMLValidationError(f"duplicate provisional CDML id: {token}")
+		assigned_id = _next_durable_id(_local_name(element), used_ids)
+		used_ids.add(assigned_id)
+		id_map[token] = assigned_id
+	for token, element in provisional_nodes:
+		element.setAttribute("id", id_map[token])
+	for left, right in bracket_members:
+		pair_reference = left.getAttribute("bracket_pair")
+		if pair_reference not in id_map:
+			continue
+		pair_id = id_map[pair_reference]
+		left.setAttribute("bracket_pair", pair_id)
+		right.setAttribute("bracket_pair", pair_id)
+	for element in elements:
+		for attribute_name in _known_reference_attributes(element):
+			reference = element.getAttribute(attribute_name)
+			if not _has_provisional_id_prefix(reference):
+				continue
+			if not _is_provisional_id(reference):
+				raise CDMLValidationError(
+					f"malformed provisional {attribute_name} reference: {reference}",
+				)
+			if reference not in id_map:
+				raise CDMLValidationError(
+					f"dangling provisional {attribute_name} reference: {reference}",
+				)
+			element.setAttribute(attribute_name, id_map[reference])
+		if _fragment_member_reference(element):
+			reference = element.getAttribute("id")
+			if not _has_provisional_id_prefix(reference):
+				continue
+			if not _is_provisional_id(reference):
+				raise CDMLValidationError(
+					f"malformed provisional fragment member: {reference}",
+				)
+			if reference not in id_map:
+				raise CDMLValidationError(
+					f"dangling provisional fragment member: {reference}",
+				)
+			element.setAttribute("id", id_map[reference])
+	return id_map
+
+
+#============================================
 class CDMLDocument:
 	"""A complete, DOM-backed CDML document with ordered opaque preservation."""
 
@@ -5578,6 +5625,7 @@ class CDMLDocument:
 	def __init__(self, dom_document: object) -> None:
 		"""Store a validated detached XML DOM owned solely by this document."""
 		self._dom_document = dom_document
+		self._durable_id_index = None
 
 	#============================================
 	@classmethod
@@ -5600,12 +5648,23 @@ class CDMLDocument:
 
 	#============================================
 	@classmethod
-	def projection_snapshot(cls, snapshot: CDMLSnapshot) -> CDMLProjectionSnapshot:
-		"""Derive one complete projection envelope from an immutable snapshot."""
+	def projection_snapshot(
+			cls, snapshot: CDMLSnapshot,
+			plans: "oasa.cdml_observation_memo.CDMLSnapshotPlanCache | None" = None,
+			) -> CDMLProjectionSnapshot:
+		"""Derive one complete projection envelope from an immutable snapshot.
+
+		Callers that project the same snapshots repeatedly pass the
+		``CDMLSnapshotPlanCache`` they own as ``plans``; without one the snapshot
+		text is parsed on every call.
+		"""
 		if type(snapshot) is not CDMLSnapshot:
 			raise CDMLValidationError("projection snapshot requires an exact backend snapshot")
-		document = cls.parse(snapshot.cdml, validation="compat")
-		plan = _projection_plan(document, snapshot.revision)
+		import oasa.cdml_observation_memo
+		if plans is None:
+			plan = oasa.cdml_observation_memo.snapshot_projection_plan(snapshot)
+		else:
+			plan = plans.plan(snapshot)
 		return CDMLProjectionSnapshot(snapshot, plan)
 
 	#============================================
@@ -5681,12 +5740,10 @@ class CDMLDocument:
 		The ``position`` and ``path`` metadata use full-document preorder so they
 		remain comparable with the broader definition lookup in ``find_by_id``.
 		"""
-		records = []
-		root = self._dom_document.documentElement
-		for position, element in _element_locations(self._dom_document.documentElement):
-			if element.parentNode is root:
-				records.append(_record_for_element(position, element))
-		return tuple(records)
+		return tuple(
+			_record_for_element(position, element)
+			for position, element in self._id_index().direct_root_positions()
+		)
 
 	#============================================
 	def find_by_id(self, identifier: str) -> CDMLObjectRecord | None:
@@ -5696,14 +5753,10 @@ class CDMLDocument:
 		definitions such as atoms and bonds; fragment member references are never
 		considered definitions.
 		"""
-		for position, element in _element_locations(self._dom_document.documentElement):
-			if not _is_id_definition(element):
-				continue
-			if element.getAttribute("id") != identifier:
-				continue
-			record = _record_for_element(position, element)
-			return record
-		return None
+		found = self._id_index().find(identifier)
+		if found is None:
+			return None
+		return _record_for_element(*found)
 
 	#============================================
 	def reaction_roles(self) -> tuple[CDMLReactionRoleRecord, ...]:
@@ -5747,54 +5800,7 @@ class CDMLDocument:
 			return ()
 		if validation != "strict":
 			raise CDMLValidationError(f"unknown CDML validation mode: {validation}")
-		issues = []
-		seen_ids = {}
-		elements = _descendant_elements(self._dom_document.documentElement)
-		for element in elements:
-			if not _is_id_definition(element):
-				continue
-			identifier = element.getAttribute("id")
-			if not identifier:
-				continue
-			if _is_id_declaration(element) and _has_provisional_id_prefix(identifier):
-				code = "provisional_id" if _is_provisional_id(identifier) else "malformed_provisional_id"
-				message = "provisional IDs are valid only during commit"
-				issues.append(CDMLIssue(
-					code, message, _node_path(element),
-				))
-			elif identifier in seen_ids:
-				issues.append(CDMLIssue(
-					"duplicate_id", f"duplicate CDML id: {identifier}", _node_path(element),
-				))
-			else:
-				seen_ids[identifier] = element
-		for element in elements:
-			for attribute_name in _known_reference_attributes(element):
-				reference = element.getAttribute(attribute_name)
-				if not reference:
-					continue
-				if _has_provisional_id_prefix(reference):
-					code = "provisional_reference" if _is_provisional_id(reference) else "malformed_provisional_reference"
-					issues.append(CDMLIssue(
-						code, "provisional reference escaped commit", _node_path(element),
-					))
-				elif reference not in seen_ids:
-					issues.append(CDMLIssue(
-						"unresolved_reference",
-						f"unresolved {attribute_name} reference: {reference}", _node_path(element),
-					))
-			if _fragment_member_reference(element):
-				reference = element.getAttribute("id")
-				if _has_provisional_id_prefix(reference):
-					code = "provisional_reference" if _is_provisional_id(reference) else "malformed_provisional_reference"
-					issues.append(CDMLIssue(
-						code, "provisional reference escaped commit", _node_path(element),
-					))
-				elif reference and reference not in seen_ids:
-					issues.append(CDMLIssue(
-						"unresolved_fragment_member",
-						f"unresolved fragment member: {reference}", _node_path(element),
-					))
+		issues = _strict_issues(self._id_index().elements(), set())
 		return tuple(issues)
 
 	#============================================
@@ -5810,73 +5816,21 @@ class CDMLDocument:
 	def _commit_candidate_ids(self) -> dict[str, str]:
 		"""Replace valid transaction-only IDs and known refs in this detached DOM."""
 		root = self._dom_document.documentElement
-		bracket_members = oasa.cdml_bracket_pair.valid_bracket_members(
-			tuple(_element_children(root)), _is_cdml_element, _local_name,
+		id_map = _assign_provisional_ids(
+			tuple(_element_children(root)), _descendant_elements(root), set(),
 		)
-		elements = _descendant_elements(root)
-		used_ids = set()
-		seen_source_ids = set()
-		provisional_nodes = []
-		for element in elements:
-			if not _is_id_definition(element):
-				continue
-			identifier = element.getAttribute("id")
-			if not identifier:
-				continue
-			if identifier in seen_source_ids:
-				raise CDMLValidationError(f"duplicate CDML id: {identifier}")
-			seen_source_ids.add(identifier)
-			if _is_id_declaration(element) and _has_provisional_id_prefix(identifier):
-				if not _is_provisional_id(identifier):
-					raise CDMLValidationError(f"malformed provisional CDML id: {identifier}")
-				provisional_nodes.append((identifier, element))
-			else:
-				used_ids.add(identifier)
-		id_map = {}
-		for token, element in provisional_nodes:
-			if token in id_map:
-				raise CDMLValidationError(f"duplicate provisional CDML id: {token}")
-			assigned_id = _next_durable_id(_local_name(element), used_ids)
-			used_ids.add(assigned_id)
-			id_map[token] = assigned_id
-		for token, element in provisional_nodes:
-			element.setAttribute("id", id_map[token])
-		for left, right in bracket_members:
-			pair_reference = left.getAttribute("bracket_pair")
-			if pair_reference not in id_map:
-				continue
-			pair_id = id_map[pair_reference]
-			left.setAttribute("bracket_pair", pair_id)
-			right.setAttribute("bracket_pair", pair_id)
-		for element in elements:
-			for attribute_name in _known_reference_attributes(element):
-				reference = element.getAttribute(attribute_name)
-				if not _has_provisional_id_prefix(reference):
-					continue
-				if not _is_provisional_id(reference):
-					raise CDMLValidationError(
-						f"malformed provisional {attribute_name} reference: {reference}",
-					)
-				if reference not in id_map:
-					raise CDMLValidationError(
-					f"dangling provisional {attribute_name} reference: {reference}",
-				)
-				element.setAttribute(attribute_name, id_map[reference])
-			if _fragment_member_reference(element):
-				reference = element.getAttribute("id")
-				if not _has_provisional_id_prefix(reference):
-					continue
-				if not _is_provisional_id(reference):
-					raise CDMLValidationError(
-						f"malformed provisional fragment member: {reference}",
-					)
-				if reference not in id_map:
-					raise CDMLValidationError(
-						f"dangling provisional fragment member: {reference}",
-					)
-				element.setAttribute("id", id_map[reference])
+		# Assignment rewrote IDs in place, so any existing index is stale.
+		self._durable_id_index = None
 		return id_map
 
+	#============================================
+	def _id_index(self) -> "oasa.cdml_id_index.CDMLIdIndex":
+		"""Return the durable-ID index of this document, building it once."""
+		import oasa.cdml_id_index
+		if self._durable_id_index is None:
+			self._durable_id_index = oasa.cdml_id_index.CDMLIdIndex(self._dom_document.documentElement)
+		return self._durable_id_index
+
 
 #============================================
 _TOP_LEVEL_TRANSFORM_MODES = frozenset({
@@ -6191,25 +6145,75 @@ def _align_top_level_geometry(
 			element.setAttribute(y_name, canonical_y)
 
 
+# Attribute characters minidom writes raw but a parser reads back as spaces.
+_REREAD_CHANGED_ATTRIBUTE = re.compile("[\t\n\r]")
+
+
+#============================================
+def _serialization_rereads_exactly(dom_document: object) -> bool:
+	"""Return whether the minidom output of ``dom_document`` reads back unchanged.
+
+	Minidom writes tabs, newlines, and carriage returns in attribute values, and
+	carriage returns in character data, as raw characters.  A parser normalizes
+	them to spaces and newlines, so only values decoded from such character
+	references change on a reread.
+	"""
+	pending = list(dom_document.childNodes)
+	while pending:
+		node = pending.pop()
+		if node.nodeType == node.ELEMENT_NODE:
+			for _name, value in node.attributes.items():
+				# An empty default-namespace declaration has no value at all.
+				if value is not None and _REREAD_CHANGED_ATTRIBUTE.search(value):
+					return False
+			pending.extend(node.childNodes)
+		elif node.nodeType != node.DOCUMENT_TYPE_NODE and "\r" in node.data:
+			return False
+	return True
+
+
 #============================================
 class CDMLDocumentSession:
 	"""Revisioned backend owner for atomic complete-document CDML commits."""
 
 	#============================================
-	def __init__(self, document: CDMLDocument, history_capacity: int) -> None:
-		"""Create a clean revision-zero backend session from one accepted document."""
+	def __init__(
+			self, document: CDMLDocument, history_capacity: int,
+			*, history_budget_bytes: int | None = None, detach: bool = True,
+			) -> None:
+		"""Create a clean revision-zero backend session from one accepted document.
+
+		``history_capacity`` bounds the retained revision count.  The optional
+		``history_budget_bytes`` also bounds compressed history memory; the current,
+		saved, and one redo revision are retained even when they exceed it.
+		"""
+		import oasa.cdml_molecule_render
 		if history_capacity < 3:
 			raise CDMLValidationError("history_capacity must be at least three")
+		if history_budget_bytes is not None and not (type(history_budget_bytes) is int and history_budget_bytes > 0):
+			raise CDMLValidationError("history_budget_bytes must be a positive int or None")
 		# Reparse into session-owned DOM state so caller-held documents cannot
-		# mutate the accepted revision outside an atomic transaction.
-		detached_document = CDMLDocument.parse(document.serialize(), validation="strict")
+		# mutate the accepted revision outside an atomic transaction.  Loaders
+		# pass ``detach=False`` for a private strict parse nobody else holds.
+		detached_document = CDMLDocument.parse(document.serialize(), validation="strict") if detach else document
 		self._history_capacity = history_capacity
+		self._history_budget_bytes = history_budget_bytes
 		self._revision = 0
 		self._document = detached_document
 		self._saved_revision = 0
 		self._saved_cdml = detached_document.serialize()
 		self._saved_digest = _content_digest(self._saved_cdml)
-		self._history = {0: detached_document}
+		self._history = oasa.cdml_history.CDMLRevisionHistory()
+		self._history.add(0, self._saved_cdml)
+		# Serialized text and digest of the installed document.  Accepting a new
+		# document clears both, so snapshots and dirty checks between commits
+		# never serialize or hash the DOM again.
+		self._current_cdml: str | None = self._saved_cdml
+		self._current_digest: str | None = self._saved_digest
+		# Read-only observations of the current revision, dropped on acceptance.
+		self._observation_memo: "oasa.cdml_observation_memo.CDMLObservationMemo | None" = None
+		# Paint batches of unchanged molecules, kept across accepted revisions.
+		self._render_batches = oasa.cdml_molecule_render.CDMLMoleculeBatchCache()
 		# Correlation tokens belong to this backend document session.  They are
 		# consumed only after a commit has become authoritative, never by a
 		# detached candidate that is later rejected.
@@ -6220,15 +6224,22 @@ class CDMLDocumentSession:
 
 	#============================================
 	@classmethod
-	def load(cls, text: str, *, history_capacity: int = 20) -> "CDMLDocumentSession":
+	def load(
+			cls, text: str, *, history_capacity: int = 20,
+			history_budget_bytes: int | None = None,
+			) -> "CDMLDocumentSession":
 		"""Load a strict, clean revision-zero complete CDML backend document."""
 		document = CDMLDocument.parse(text, validation="strict")
-		return cls(document, history_capacity)
+		if not _serialization_rereads_exactly(document._dom_document):
+			# Accept the values a saved copy reads back as, not the decoded ones.
+			document = CDMLDocument.parse(document.serialize(), validation="strict")
+		return cls(document, history_capacity, history_budget_bytes=history_budget_bytes, detach=False)
 
 	#============================================
 	@classmethod
 	def load_imported(
 			cls, text: str, *, history_capacity: int = 20,
+			history_budget_bytes: int | None = None,
 			) -> "CDMLDocumentSession":
 		"""Stage strict imported CDML against the empty-document saved baseline.
 
@@ -6236,8 +6247,7 @@ class CDMLDocumentSession:
 		Its canonical document is therefore authoritative immediately but dirty
 		until ordinary Save publishes that exact snapshot.
 		"""
-		document = CDMLDocument.parse(text, validation="strict")
-		session = cls(document, history_capacity)
+		session = cls.load(text, history_capacity=history_capacity, history_budget_bytes=history_budget_bytes)
 		empty_document = CDMLDocument.parse(_EMPTY_CDML, validation="strict")
 		session._saved_cdml = empty_document.serialize()
 		session._saved_digest = _content_digest(session._saved_cdml)
@@ -6253,13 +6263,12 @@ class CDMLDocumentSession:
 	@property
 	def is_dirty(self) -> bool:
 		"""Return content-based dirty state relative to the saved backend baseline."""
-		current_cdml = self._document.serialize()
-		return _content_digest(current_cdml) != self._saved_digest
+		return self._current_text_and_digest()[1] != self._saved_digest
 
 	#============================================
 	def snapshot(self) -> CDMLSnapshot:
 		"""Return an immutable view of the current authoritative backend state."""
-		cdml = self._document.serialize()
+		cdml = self._current_text_and_digest()[0]
 		return CDMLSnapshot(
 			revision=self._revision,
 			cdml=cdml,
@@ -6270,7 +6279,7 @@ class CDMLDocumentSession:
 	def projection_snapshot(self) -> CDMLProjectionSnapshot:
 		"""Return every projection fact atomically for the current snapshot."""
 		snapshot = self.snapshot()
-		plan = _projection_plan(self._document, self._revision)
+		plan = self._observations().projection_plan()
 		return CDMLProjectionSnapshot(snapshot, plan)
 
 	#============================================
@@ -6283,7 +6292,7 @@ class CDMLDocumentSession:
 		if type(query.expected_revision) is not int:
 			raise CDMLPresentationDescriptionError("presentation description revision must be an int")
 		self._check_expected_revision(query.expected_revision)
-		return _presentation_description(self._document, self._revision)
+		return self._observations().observe(_presentation_description)
 
 	#============================================
 	def paper_layout(self, query: CDMLPaperLayoutQuery) -> CDMLPaperLayout:
@@ -6293,7 +6302,7 @@ class CDMLDocumentSession:
 		if type(query.expected_revision) is not int:
 			raise CDMLPaperLayoutError("paper layout revision must be an int")
 		self._check_expected_revision(query.expected_revision)
-		return _paper_layout(self._document, self._revision)
+		return self._observations().observe(_paper_layout)
 
 	#============================================
 	def drawing_standard(
@@ -6312,7 +6321,7 @@ class CDMLDocumentSession:
 		if type(query.expected_revision) is not int:
 			raise CDMLFragmentMetadataError("fragment metadata revision must be an int")
 		self._check_expected_revision(query.expected_revision)
-		return _fragment_metadata(self._document, self._revision)
+		return self._observations().observe(_fragment_metadata)
 
 	#============================================
 	def atom_mark_observation(
@@ -6324,7 +6333,7 @@ class CDMLDocumentSession:
 		if type(query.expected_revision) is not int:
 			raise CDMLAtomMarkObservationError("atom-mark observation revision must be an int")
 		self._check_expected_revision(query.expected_revision)
-		return _atom_mark_observation(self._document, self._revision)
+		return self._observations().observe(_atom_mark_observation)
 
 	#============================================
 	def group_observation(self, query: CDMLGroupObservationQuery) -> CDMLGroupObservation:
@@ -6334,7 +6343,7 @@ class CDMLDocumentSession:
 		if type(query.expected_revision) is not int:
 			raise CDMLGroupObservationError("group observation revision must be an int")
 		self._check_expected_revision(query.expected_revision)
-		return _group_observation(self._document, self._revision)
+		return self._observations().observe(_group_observation)
 
 	#============================================
 	def molecule_core_observation(
@@ -6346,7 +6355,7 @@ class CDMLDocumentSession:
 		if type(query.expected_revision) is not int:
 			raise CDMLMoleculeCoreObservationError("molecule-core observation revision must be an int")
 		self._check_expected_revision(query.expected_revision)
-		return _molecule_core_observation(self._document, self._revision)
+		return self._observations().observe(_molecule_core_observation)
 
 	#============================================
 	def molecule_render_observation(
@@ -6358,7 +6367,7 @@ class CDMLDocumentSession:
 		if type(query.expected_revision) is not int:
 			raise CDMLMoleculeRenderObservationError("molecule render observation revision must be an int")
 		self._check_expected_revision(query.expected_revision)
-		return _molecule_render_observation(self._document, self._revision)
+		return self._observations().observe(_molecule_render_observation)
 
 	#============================================
 	def atom_chemistry_facts(
@@ -6370,7 +6379,7 @@ class CDMLDocumentSession:
 		if type(query.expected_revision) is not int:
 			raise CDMLAtomChemistryFactsError("atom chemistry facts revision must be an int")
 		self._check_expected_revision(query.expected_revision)
-		return _atom_chemistry_facts_observation(self._document, self._revision)
+		return self._observations().observe(_atom_chemistry_facts_observation)
 
 	#============================================
 	def paper_catalog(self) -> dict[str, list[float] | None]:
@@ -6440,17 +6449,15 @@ class CDMLDocumentSession:
 		proposal = CDMLDocument.parse(request.proposal_cdml, validation="compat")
 		molecules = _proposal_molecules(proposal)
 		provisional_root_ids = tuple(molecule.getAttribute("id") for molecule in molecules)
-		candidate = CDMLDocument.parse(self.snapshot().cdml, validation="compat")
-		candidate_root = candidate._dom_document.documentElement
-		proposal_root = proposal._dom_document.documentElement
-		for molecule in molecules:
-			imported_molecule = candidate._dom_document.importNode(molecule, deep=True)
-			_copy_proposal_namespace_declarations(proposal_root, imported_molecule)
-			candidate_root.appendChild(imported_molecule)
-		commit = self.commit(
-			expected_revision=request.expected_revision,
-			complete_cdml=candidate.serialize(),
-		)
+		with self._edit() as transaction:
+			candidate = self._document
+			candidate_root = candidate._dom_document.documentElement
+			proposal_root = proposal._dom_document.documentElement
+			for molecule in molecules:
+				imported_molecule = candidate._dom_document.importNode(molecule, deep=True)
+				_copy_proposal_namespace_declarations(proposal_root, imported_molecule)
+				candidate_root.appendChild(imported_molecule)
+			commit = self._commit_transaction(transaction, request.expected_revision)
 		import oasa.cdml_molecule_insertion
 		return oasa.cdml_molecule_insertion.CDMLMoleculeInsertionResult(
 			commit=commit,
@@ -6475,19 +6482,17 @@ class CDMLDocumentSession:
 		self._check_expected_revision(request.expected_revision)
 		template = CDMLDocument.parse(template_cdml, validation="compat")
 		_inspect_user_template_document(template)
-		candidate = CDMLDocument.parse(self._document.serialize(), validation="compat")
-		prepared_molecule = _prepare_user_template_molecule(
-			template, candidate.serialize(), self._consumed_provisional_tokens, anchor_cm,
-		)
-		imported_molecule = candidate._dom_document.importNode(prepared_molecule, deep=True)
-		_copy_proposal_namespace_declarations(
-			template._dom_document.documentElement, imported_molecule,
-		)
-		candidate._dom_document.documentElement.appendChild(imported_molecule)
-		return self.commit(
-			expected_revision=request.expected_revision,
-			complete_cdml=candidate.serialize(),
-		)
+		with self._edit() as transaction:
+			candidate = self._document
+			prepared_molecule = _prepare_user_template_molecule(
+				template, self.snapshot().cdml, self._consumed_provisional_tokens, anchor_cm,
+			)
+			imported_molecule = candidate._dom_document.importNode(prepared_molecule, deep=True)
+			_copy_proposal_namespace_declarations(
+				template._dom_document.documentElement, imported_molecule,
+			)
+			candidate._dom_document.documentElement.appendChild(imported_molecule)
+			return self._commit_transaction(transaction, request.expected_revision)
 
 	#============================================
 	def insert_top_level(self, request: CDMLTopLevelInsertionRequest) -> CDMLCommit:
@@ -6508,26 +6513,24 @@ class CDMLDocumentSession:
 		# Reject obsolete requests before parsing or building detached work.
 		self._check_expected_revision(request.expected_revision)
 		fragment = CDMLDocument.parse(request.fragment_cdml, validation="compat")
-		candidate = CDMLDocument.parse(self._document.serialize(), validation="compat")
-		roots = _prepare_top_level_fragment(
-			fragment,
-			candidate.serialize(),
-			self._consumed_provisional_tokens,
-			dx,
-			dy,
-		)
-		candidate_root = candidate._dom_document.documentElement
-		fragment_root = fragment._dom_document.documentElement
-		for root in roots:
-			imported_root = candidate._dom_document.importNode(root, deep=True)
-			_copy_proposal_namespace_declarations(fragment_root, imported_root)
-			candidate_root.appendChild(imported_root)
-		# ``commit`` repeats the revision check immediately before its final
-		# acceptance path, retaining the ordinary optimistic-transaction contract.
-		return self.commit(
-			expected_revision=request.expected_revision,
-			complete_cdml=candidate.serialize(),
-		)
+		with self._edit() as transaction:
+			candidate = self._document
+			roots = _prepare_top_level_fragment(
+				fragment,
+				self.snapshot().cdml,
+				self._consumed_provisional_tokens,
+				dx,
+				dy,
+			)
+			candidate_root = candidate._dom_document.documentElement
+			fragment_root = fragment._dom_document.documentElement
+			for root in roots:
+				imported_root = candidate._dom_document.importNode(root, deep=True)
+				_copy_proposal_namespace_declarations(fragment_root, imported_root)
+				candidate_root.appendChild(imported_root)
+			# The transaction commit repeats the revision check immediately before its
+			# final acceptance path, retaining the ordinary optimistic contract.
+			return self._commit_transaction(transaction, request.expected_revision)
 
 	#============================================
 	def edit_structure(self, request: CDMLStructuralEditRequest) -> CDMLStructuralEditResult:
@@ -6540,80 +6543,79 @@ class CDMLDocumentSession:
 		"""
 		validated = _validate_structural_request(request)
 		self._check_expected_revision(request.expected_revision)
-		candidate = CDMLDocument.parse(self._document.serialize(), validation="compat")
-		root = candidate._dom_document.documentElement
-		used_ids = _candidate_durable_ids(candidate)
-		kind = validated[0]
-		created_molecule_id = None
-		created_atom_ids: tuple[str, ...] = ()
-		created_bond_ids: tuple[str, ...] = ()
-		updated_bond_ids: tuple[str, ...] = ()
-		if kind == "create-bonded-pair":
-			(_kind, source_position, target_position, element, bond_type, bond_order, simple_double) = validated
-			created_molecule_id = _next_durable_id("molecule", used_ids)
-			used_ids.add(created_molecule_id)
-			first_atom_id = _next_durable_id("atom", used_ids)
-			used_ids.add(first_atom_id)
-			second_atom_id = _next_durable_id("atom", used_ids)
-			used_ids.add(second_atom_id)
-			bond_id = _next_durable_id("bond", used_ids)
-			molecule = _new_core_element(candidate, root, "molecule")
-			molecule.setAttribute("id", created_molecule_id)
-			root.appendChild(molecule)
-			_append_atom(candidate, molecule, first_atom_id, element, source_position)
-			_append_atom(candidate, molecule, second_atom_id, element, target_position)
-			_append_bond(
-				candidate, molecule, bond_id, first_atom_id, second_atom_id,
-				bond_type, bond_order, simple_double,
-			)
-			created_atom_ids = (first_atom_id, second_atom_id)
-			created_bond_ids = (bond_id,)
-		elif kind == "extend-atom":
-			(_kind, molecule_id, source_atom_id, target_position, element, bond_type, bond_order, simple_double) = validated
-			molecule = _direct_root_molecule(candidate, molecule_id)
-			_direct_molecule_atom(molecule, source_atom_id)
-			new_atom_id = _next_durable_id("atom", used_ids)
-			used_ids.add(new_atom_id)
-			bond_id = _next_durable_id("bond", used_ids)
-			_append_atom(candidate, molecule, new_atom_id, element, target_position)
-			_append_bond(
-				candidate, molecule, bond_id, source_atom_id, new_atom_id,
-				bond_type, bond_order, simple_double,
-			)
-			created_atom_ids = (new_atom_id,)
-			created_bond_ids = (bond_id,)
-		elif kind == "join-atoms":
-			(_kind, molecule_id, source_atom_id, target_atom_id, bond_type, bond_order, simple_double) = validated
-			molecule = _direct_root_molecule(candidate, molecule_id)
-			_direct_molecule_atom(molecule, source_atom_id)
-			_direct_molecule_atom(molecule, target_atom_id)
-			if source_atom_id == target_atom_id:
-				raise CDMLValidationError("join-atoms requires two distinct atoms")
-			if _has_direct_bond(molecule, source_atom_id, target_atom_id):
-				raise CDMLValidationError("join-atoms rejects a duplicate direct-molecule bond")
-			bond_id = _next_durable_id("bond", used_ids)
-			_append_bond(
-				candidate, molecule, bond_id, source_atom_id, target_atom_id,
-				bond_type, bond_order, simple_double,
+		# Every kind except a new bonded pair edits one existing direct molecule.
+		target_ids = () if validated[0] == "create-bonded-pair" else (validated[1],)
+		with self._edit(target_ids) as transaction:
+			candidate = self._document
+			root = candidate._dom_document.documentElement
+			used_ids = _candidate_durable_ids(candidate)
+			kind = validated[0]
+			created_molecule_id = None
+			created_atom_ids: tuple[str, ...] = ()
+			created_bond_ids: tuple[str, ...] = ()
+			updated_bond_ids: tuple[str, ...] = ()
+			if kind == "create-bonded-pair":
+				(_kind, source_position, target_position, element, bond_type, bond_order, simple_double) = validated
+				created_molecule_id = _next_durable_id("molecule", used_ids)
+				used_ids.add(created_molecule_id)
+				first_atom_id = _next_durable_id("atom", used_ids)
+				used_ids.add(first_atom_id)
+				second_atom_id = _next_durable_id("atom", used_ids)
+				used_ids.add(second_atom_id)
+				bond_id = _next_durable_id("bond", used_ids)
+				molecule = _new_core_element(candidate, root, "molecule")
+				molecule.setAttribute("id", created_molecule_id)
+				root.appendChild(molecule)
+				_append_atom(candidate, molecule, first_atom_id, element, source_position)
+				_append_atom(candidate, molecule, second_atom_id, element, target_position)
+				_append_bond(
+					candidate, molecule, bond_id, first_atom_id, second_atom_id,
+					bond_type, bond_order, simple_double,
+				)
+				created_atom_ids = (first_atom_id, second_atom_id)
+				created_bond_ids = (bond_id,)
+			elif kind == "extend-atom":
+				(_kind, molecule_id, source_atom_id, target_position, element, bond_type, bond_order, simple_double) = validated
+				molecule = _direct_root_molecule(candidate, molecule_id)
+				_direct_molecule_atom(molecule, source_atom_id)
+				new_atom_id = _next_durable_id("atom", used_ids)
+				used_ids.add(new_atom_id)
+				bond_id = _next_durable_id("bond", used_ids)
+				_append_atom(candidate, molecule, new_atom_id, element, target_position)
+				_append_bond(
+					candidate, molecule, bond_id, source_atom_id, new_atom_id,
+					bond_type, bond_order, simple_double,
+				)
+				created_atom_ids = (new_atom_id,)
+				created_bond_ids = (bond_id,)
+			elif kind == "join-atoms":
+				(_kind, molecule_id, source_atom_id, target_atom_id, bond_type, bond_order, simple_double) = validated
+				molecule = _direct_root_molecule(candidate, molecule_id)
+				_direct_molecule_atom(molecule, source_atom_id)
+				_direct_molecule_atom(molecule, target_atom_id)
+				if source_atom_id == target_atom_id:
+					raise CDMLValidationError("join-atoms requires two distinct atoms")
+				if _has_direct_bond(molecule, source_atom_id, target_atom_id):
+					raise CDMLValidationError("join-atoms rejects a duplicate direct-molecule bond")
+				bond_id = _next_durable_id("bond", used_ids)
+				_append_bond(
+					candidate, molecule, bond_id, source_atom_id, target_atom_id,
+					bond_type, bond_order, simple_double,
+				)
+				created_bond_ids = (bond_id,)
+			else:
+				(_kind, molecule_id, bond_id, bond_type, bond_order, simple_double) = validated
+				molecule = _direct_root_molecule(candidate, molecule_id)
+				bond = _direct_molecule_bond(molecule, bond_id)
+				_require_editable_bond_endpoints(molecule, bond)
+				_apply_bond_tool_transition(bond, bond_type, bond_order, simple_double)
+				updated_bond_ids = (bond_id,)
+			import oasa.cdml_linear_form
+			oasa.cdml_linear_form.remove_invalid_generated_forms(
+				candidate,
+				(created_molecule_id,) if kind == "create-bonded-pair" else (molecule_id,),
 			)
-			created_bond_ids = (bond_id,)
-		else:
-			(_kind, molecule_id, bond_id, bond_type, bond_order, simple_double) = validated
-			molecule = _direct_root_molecule(candidate, molecule_id)
-			bond = _direct_molecule_bond(molecule, bond_id)
-			_require_editable_bond_endpoints(molecule, bond)
-			_apply_bond_tool_transition(bond, bond_type, bond_order, simple_double)
-			updated_bond_ids = (bond_id,)
-		import oasa.cdml_linear_form
-		oasa.cdml_linear_form.remove_invalid_generated_forms(
-			candidate,
-			(created_molecule_id,) if kind == "create-bonded-pair" else (molecule_id,),
-		)
-		candidate.validate(validation="strict")
-		commit = self.commit(
-			expected_revision=request.expected_revision,
-			complete_cdml=candidate.serialize(),
-		)
+			commit = self._commit_transaction(transaction, request.expected_revision)
 		return CDMLStructuralEditResult(
 			commit=commit,
 			created_molecule_id=created_molecule_id,
@@ -6632,20 +6634,17 @@ class CDMLDocumentSession:
 		"""
 		molecule_id, atom_id, element = _validate_atom_element_request(request)
 		self._check_expected_revision(request.expected_revision)
-		candidate = CDMLDocument.parse(self._document.serialize(), validation="compat")
-		molecule = _direct_root_molecule(candidate, molecule_id)
-		atom = _direct_molecule_atom(molecule, atom_id)
-		current_element = atom.getAttribute("name")
-		if current_element not in oasa.periodic_table.periodic_table:
-			raise CDMLValidationError("atom element edit target has an unsupported atom symbol")
-		if element == current_element:
-			raise CDMLValidationError("atom element edit replacement must differ from the current symbol")
-		atom.setAttribute("name", element)
-		candidate.validate(validation="strict")
-		return self.commit(
-			expected_revision=request.expected_revision,
-			complete_cdml=candidate.serialize(),
-		)
+		with self._edit((molecule_id,)) as transaction:
+			candidate = self._document
+			molecule = _direct_root_molecule(candidate, molecule_id)
+			atom = _direct_molecule_atom(molecule, atom_id)
+			current_element = atom.getAttribute("name")
+			if current_element not in oasa.periodic_table.periodic_table:
+				raise CDMLValidationError("atom element edit target has an unsupported atom symbol")
+			if element == current_element:
+				raise CDMLValidationError("atom element edit replacement must differ from the current symbol")
+			atom.setAttribute("name", element)
+			return self._commit_transaction(transaction, request.expected_revision)
 
 	#============================================
 	def patch_atom_properties(
@@ -6666,58 +6665,54 @@ class CDMLDocumentSession:
 			)
 		if not changes:
 			return CDMLAtomPropertiesPatchResult(self.snapshot(), False, None)
-		candidate = CDMLDocument.parse(self._document.serialize(), validation="compat")
-		candidate_molecule = _direct_root_molecule(candidate, molecule_id)
-		candidate_atom = _direct_molecule_atom(candidate_molecule, atom_id)
-		change_map = dict(changes)
-		for field_name, value in changes:
-			if field_name == "element":
-				candidate_atom.setAttribute("name", value)
-			elif field_name == "charge":
-				if value == 0:
-					candidate_atom.removeAttribute("charge")
-				else:
-					candidate_atom.setAttribute("charge", str(value))
-			elif field_name == "valency":
-				candidate_atom.setAttribute("valency", str(value))
-			elif field_name == "isotope":
-				if value is None:
-					candidate_atom.removeAttribute("isotope")
-				else:
-					candidate_atom.setAttribute("isotope", str(value))
-			elif field_name == "multiplicity":
-				if value == 1:
-					candidate_atom.removeAttribute("multiplicity")
-				else:
-					candidate_atom.setAttribute("multiplicity", str(value))
-			elif field_name == "show":
-				candidate_atom.setAttribute("show", "yes" if value else "no")
-			elif field_name == "show_hydrogens":
-				candidate_atom.setAttribute("hydrogens", "on" if value else "off")
-		if "font_size" in change_map or "line_color" in change_map:
-			fonts = [
-				child for child in _element_children(candidate_atom)
-				if _is_cdml_element(child) and _local_name(child) == "font"
-			]
-			if len(fonts) > 1:
-				raise CDMLAtomPropertiesPatchError(
-					"atom properties target has multiple direct core fonts",
-				)
-			font = fonts[0] if fonts else _new_core_element(candidate, candidate_atom, "font")
-			if "font_size" in change_map:
-				font.setAttribute("size", str(change_map["font_size"]))
-			if "line_color" in change_map:
-				font.setAttribute("color", change_map["line_color"])
-			if not fonts:
-				candidate_atom.appendChild(font)
-		candidate.validate(validation="strict")
-		candidate_cdml = candidate.serialize()
-		if candidate_cdml == self._document.serialize():
-			return CDMLAtomPropertiesPatchResult(self.snapshot(), False, None)
-		commit = self.commit(
-			expected_revision=request.expected_revision,
-			complete_cdml=candidate_cdml,
-		)
+		with self._edit((molecule_id,)) as transaction:
+			candidate = self._document
+			candidate_molecule = _direct_root_molecule(candidate, molecule_id)
+			candidate_atom = _direct_molecule_atom(candidate_molecule, atom_id)
+			change_map = dict(changes)
+			for field_name, value in changes:
+				if field_name == "element":
+					candidate_atom.setAttribute("name", value)
+				elif field_name == "charge":
+					if value == 0:
+						candidate_atom.removeAttribute("charge")
+					else:
+						candidate_atom.setAttribute("charge", str(value))
+				elif field_name == "valency":
+					candidate_atom.setAttribute("valency", str(value))
+				elif field_name == "isotope":
+					if value is None:
+						candidate_atom.removeAttribute("isotope")
+					else:
+						candidate_atom.setAttribute("isotope", str(value))
+				elif field_name == "multiplicity":
+					if value == 1:
+						candidate_atom.removeAttribute("multiplicity")
+					else:
+						candidate_atom.setAttribute("multiplicity", str(value))
+				elif field_name == "show":
+					candidate_atom.setAttribute("show", "yes" if value else "no")
+				elif field_name == "show_hydrogens":
+					candidate_atom.setAttribute("hydrogens", "on" if value else "off")
+			if "font_size" in change_map or "line_color" in change_map:
+				fonts = [
+					child for child in _element_children(candidate_atom)
+					if _is_cdml_element(child) and _local_name(child) == "font"
+				]
+				if len(fonts) > 1:
+					raise CDMLAtomPropertiesPatchError(
+						"atom properties target has multiple direct core fonts",
+					)
+				font = fonts[0] if fonts else _new_core_element(candidate, candidate_atom, "font")
+				if "font_size" in change_map:
+					font.setAttribute("size", str(change_map["font_size"]))
+				if "line_color" in change_map:
+					font.setAttribute("color", change_map["line_color"])
+				if not fonts:
+					candidate_atom.appendChild(font)
+			if transaction.is_noop():
+				return CDMLAtomPropertiesPatchResult(self.snapshot(), False, None)
+			commit = self._commit_transaction(transaction, request.expected_revision)
 		return CDMLAtomPropertiesPatchResult(commit.snapshot, True, commit)
 
 	#============================================
@@ -6741,49 +6736,45 @@ class CDMLDocumentSession:
 			del change_map["background_color"]
 		if not change_map:
 			return CDMLTextPropertiesPatchResult(self.snapshot(), False, None)
-		candidate = CDMLDocument.parse(self._document.serialize(), validation="compat")
-		candidate_text = _direct_root_text(candidate, text_id)
-		font, ftext = _editable_text_children(candidate_text)
-		if "text" in change_map:
-			text_nodes = tuple(
-				child for child in ftext.childNodes
-				if child.nodeType in (child.TEXT_NODE, child.CDATA_SECTION_NODE)
-			)
-			insertion_reference = None
-			if text_nodes:
-				following = text_nodes[0].nextSibling
-				while following is not None and following in text_nodes:
-					following = following.nextSibling
-				insertion_reference = following
-			for child in text_nodes:
-				ftext.removeChild(child)
-			plain_text = candidate._dom_document.createTextNode(change_map["text"])
-			if insertion_reference is None:
-				ftext.appendChild(plain_text)
-			else:
-				ftext.insertBefore(plain_text, insertion_reference)
-		if any(name in change_map for name in ("font_family", "font_size", "font_color")):
-			if font is None:
-				font = _new_core_element(candidate, candidate_text, "font")
-				candidate_text.insertBefore(font, ftext)
-			if "font_family" in change_map:
-				font.setAttribute("family", change_map["font_family"])
-			if "font_size" in change_map:
-				font.setAttribute("size", str(change_map["font_size"]))
-			if "font_color" in change_map:
-				font.setAttribute("color", change_map["font_color"])
-		if "background_color" in change_map:
-			candidate_text.setAttribute(
-				"background-color", change_map["background_color"] or "",
-			)
-		candidate.validate(validation="strict")
-		candidate_cdml = candidate.serialize()
-		if candidate_cdml == self._document.serialize():
-			return CDMLTextPropertiesPatchResult(self.snapshot(), False, None)
-		commit = self.commit(
-			expected_revision=request.expected_revision,
-			complete_cdml=candidate_cdml,
-		)
+		with self._edit((text_id,)) as transaction:
+			candidate = self._document
+			candidate_text = _direct_root_text(candidate, text_id)
+			font, ftext = _editable_text_children(candidate_text)
+			if "text" in change_map:
+				text_nodes = tuple(
+					child for child in ftext.childNodes
+					if child.nodeType in (child.TEXT_NODE, child.CDATA_SECTION_NODE)
+				)
+				insertion_reference = None
+				if text_nodes:
+					following = text_nodes[0].nextSibling
+					while following is not None and following in text_nodes:
+						following = following.nextSibling
+					insertion_reference = following
+				for child in text_nodes:
+					ftext.removeChild(child)
+				plain_text = candidate._dom_document.createTextNode(change_map["text"])
+				if insertion_reference is None:
+					ftext.appendChild(plain_text)
+				else:
+					ftext.insertBefore(plain_text, insertion_reference)
+			if any(name in change_map for name in ("font_family", "font_size", "font_color")):
+				if font is None:
+					font = _new_core_element(candidate, candidate_text, "font")
+					candidate_text.insertBefore(font, ftext)
+				if "font_family" in change_map:
+					font.setAttribute("family", change_map["font_family"])
+				if "font_size" in change_map:
+					font.setAttribute("size", str(change_map["font_size"]))
+				if "font_color" in change_map:
+					font.setAttribute("color", change_map["font_color"])
+			if "background_color" in change_map:
+				candidate_text.setAttribute(
+					"background-color", change_map["background_color"] or "",
+				)
+			if transaction.is_noop():
+				return CDMLTextPropertiesPatchResult(self.snapshot(), False, None)
+			commit = self._commit_transaction(transaction, request.expected_revision)
 		return CDMLTextPropertiesPatchResult(commit.snapshot, True, commit)
 
 	#============================================
@@ -6826,29 +6817,26 @@ class CDMLDocumentSession:
 			)
 		if current_runs == runs and font_unchanged:
 			return CDMLRichTextPatchResult(self.snapshot(), False, None)
-		candidate = CDMLDocument.parse(self._document.serialize(), validation="compat")
-		candidate_text = _direct_root_rich_text(candidate, text_id)
-		candidate_font, candidate_ftext = _editable_rich_text_children(candidate_text)
-		for child in tuple(candidate_ftext.childNodes):
-			candidate_ftext.removeChild(child)
-		candidate_ftext.appendChild(
-			candidate._dom_document.createTextNode(oasa.cdml_ftext.encode(runs)),
-		)
-		if changes:
-			if candidate_font is None:
-				candidate_font = _new_core_element(candidate, candidate_text, "font")
-				candidate_text.insertBefore(candidate_font, candidate_ftext)
-			if "font_family" in change_map:
-				candidate_font.setAttribute("family", change_map["font_family"])
-			if "font_size" in change_map:
-				candidate_font.setAttribute("size", str(change_map["font_size"]))
-			if "font_color" in change_map:
-				candidate_font.setAttribute("color", change_map["font_color"])
-		candidate.validate(validation="strict")
-		commit = self.commit(
-			expected_revision=request.expected_revision,
-			complete_cdml=candidate.serialize(),
-		)
+		with self._edit((text_id,)) as transaction:
+			candidate = self._document
+			candidate_text = _direct_root_rich_text(candidate, text_id)
+			candidate_font, candidate_ftext = _editable_rich_text_children(candidate_text)
+			for child in tuple(candidate_ftext.childNodes):
+				candidate_ftext.removeChild(child)
+			candidate_ftext.appendChild(
+				candidate._dom_document.createTextNode(oasa.cdml_ftext.encode(runs)),
+			)
+			if changes:
+				if candidate_font is None:
+					candidate_font = _new_core_element(candidate, candidate_text, "font")
+					candidate_text.insertBefore(candidate_font, candidate_ftext)
+				if "font_family" in change_map:
+					candidate_font.setAttribute("family", change_map["font_family"])
+				if "font_size" in change_map:
+					candidate_font.setAttribute("size", str(change_map["font_size"]))
+				if "font_color" in change_map:
+					candidate_font.setAttribute("color", change_map["font_color"])
+			commit = self._commit_transaction(transaction, request.expected_revision)
 		return CDMLRichTextPatchResult(commit.snapshot, True, commit)
 
 	#============================================
@@ -6876,30 +6864,26 @@ class CDMLDocumentSession:
 			)
 		):
 			return CDMLPlusPropertiesPatchResult(self.snapshot(), False, None)
-		candidate = CDMLDocument.parse(self._document.serialize(), validation="compat")
-		candidate_plus = _direct_root_plus(candidate, plus_id)
-		candidate_font = _editable_plus_children(candidate_plus)
-		if "font_family" in change_map:
-			if candidate_font is None:
-				candidate_font = _new_core_element(candidate, candidate_plus, "font")
-				candidate_plus.appendChild(candidate_font)
-			candidate_font.setAttribute("family", change_map["font_family"])
-		if "font_size" in change_map:
-			candidate_plus.setAttribute("font_size", str(change_map["font_size"]))
-		if "color" in change_map:
-			candidate_plus.setAttribute("color", change_map["color"])
-		if "background_color" in change_map:
-			candidate_plus.setAttribute(
-				"background-color", change_map["background_color"] or "",
-			)
-		candidate.validate(validation="strict")
-		candidate_cdml = candidate.serialize()
-		if candidate_cdml == self._document.serialize():
-			return CDMLPlusPropertiesPatchResult(self.snapshot(), False, None)
-		commit = self.commit(
-			expected_revision=request.expected_revision,
-			complete_cdml=candidate_cdml,
-		)
+		with self._edit((plus_id,)) as transaction:
+			candidate = self._document
+			candidate_plus = _direct_root_plus(candidate, plus_id)
+			candidate_font = _editable_plus_children(candidate_plus)
+			if "font_family" in change_map:
+				if candidate_font is None:
+					candidate_font = _new_core_element(candidate, candidate_plus, "font")
+					candidate_plus.appendChild(candidate_font)
+				candidate_font.setAttribute("family", change_map["font_family"])
+			if "font_size" in change_map:
+				candidate_plus.setAttribute("font_size", str(change_map["font_size"]))
+			if "color" in change_map:
+				candidate_plus.setAttribute("color", change_map["color"])
+			if "background_color" in change_map:
+				candidate_plus.setAttribute(
+					"background-color", change_map["background_color"] or "",
+				)
+			if transaction.is_noop():
+				return CDMLPlusPropertiesPatchResult(self.snapshot(), False, None)
+			commit = self._commit_transaction(transaction, request.expected_revision)
 		return CDMLPlusPropertiesPatchResult(commit.snapshot, True, commit)
 
 	#============================================
@@ -6919,21 +6903,17 @@ class CDMLDocumentSession:
 			and ("line_color" not in change_map or change_map["line_color"] == current_color)
 		):
 			return CDMLWavyPropertiesPatchResult(self.snapshot(), False, None)
-		candidate = CDMLDocument.parse(self._document.serialize(), validation="compat")
-		candidate_wavy = _direct_root_wavy(candidate, wavy_id)
-		_wavy_property_values(candidate_wavy)
-		if "width" in change_map:
-			candidate_wavy.setAttribute("width", "%g" % change_map["width"])
-		if "line_color" in change_map:
-			candidate_wavy.setAttribute("line_color", change_map["line_color"])
-		candidate.validate(validation="strict")
-		candidate_cdml = candidate.serialize()
-		if candidate_cdml == self._document.serialize():
-			return CDMLWavyPropertiesPatchResult(self.snapshot(), False, None)
-		commit = self.commit(
-			expected_revision=request.expected_revision,
-			complete_cdml=candidate_cdml,
-		)
+		with self._edit((wavy_id,)) as transaction:
+			candidate = self._document
+			candidate_wavy = _direct_root_wavy(candidate, wavy_id)
+			_wavy_property_values(candidate_wavy)
+			if "width" in change_map:
+				candidate_wavy.setAttribute("width", "%g" % change_map["width"])
+			if "line_color" in change_map:
+				candidate_wavy.setAttribute("line_color", change_map["line_color"])
+			if transaction.is_noop():
+				return CDMLWavyPropertiesPatchResult(self.snapshot(), False, None)
+			commit = self._commit_transaction(transaction, request.expected_revision)
 		return CDMLWavyPropertiesPatchResult(commit.snapshot, True, commit)
 
 	#============================================
@@ -6955,34 +6935,26 @@ class CDMLDocumentSession:
 		except CDMLValidationError as exc:
 			raise CDMLFragmentOperationError("fragment creation molecule target is invalid") from exc
 		_validate_fragment_members(molecule, atom_ids, bond_ids)
-		candidate = CDMLDocument.parse(self._document.serialize(), validation="compat")
-		candidate_molecule = _direct_root_molecule(candidate, molecule_id)
-		used_ids = {
-			element.getAttribute("id")
-			for element in _descendant_elements(candidate._dom_document.documentElement)
-			if _is_id_definition(element) and element.getAttribute("id")
-		}
-		fragment_id = _next_durable_id("fragment", used_ids)
-		fragment = _new_core_element(candidate, candidate_molecule, "fragment")
-		fragment.setAttribute("id", fragment_id)
-		fragment.setAttribute("type", fragment_type)
-		name_element = _new_core_element(candidate, fragment, "name")
-		name_element.appendChild(candidate._dom_document.createTextNode(name))
-		fragment.appendChild(name_element)
-		for bond_id in bond_ids:
-			member = _new_core_element(candidate, fragment, "bond")
-			member.setAttribute("id", bond_id)
-			fragment.appendChild(member)
-		for atom_id in atom_ids:
-			member = _new_core_element(candidate, fragment, "vertex")
-			member.setAttribute("id", atom_id)
-			fragment.appendChild(member)
-		candidate_molecule.appendChild(fragment)
-		candidate.validate(validation="strict")
-		commit = self.commit(
-			expected_revision=request.expected_revision,
-			complete_cdml=candidate.serialize(),
-		)
+		with self._edit((molecule_id,)) as transaction:
+			candidate = self._document
+			candidate_molecule = _direct_root_molecule(candidate, molecule_id)
+			fragment_id = _next_durable_id("fragment", _candidate_durable_ids(candidate))
+			fragment = _new_core_element(candidate, candidate_molecule, "fragment")
+			fragment.setAttribute("id", fragment_id)
+			fragment.setAttribute("type", fragment_type)
+			name_element = _new_core_element(candidate, fragment, "name")
+			name_element.appendChild(candidate._dom_document.createTextNode(name))
+			fragment.appendChild(name_element)
+			for bond_id in bond_ids:
+				member = _new_core_element(candidate, fragment, "bond")
+				member.setAttribute("id", bond_id)
+				fragment.appendChild(member)
+			for atom_id in atom_ids:
+				member = _new_core_element(candidate, fragment, "vertex")
+				member.setAttribute("id", atom_id)
+				fragment.appendChild(member)
+			candidate_molecule.appendChild(fragment)
+			commit = self._commit_transaction(transaction, request.expected_revision)
 		return CDMLFragmentCreateResult(commit.snapshot, commit, fragment_id)
 
 	#============================================
@@ -7012,21 +6984,18 @@ class CDMLDocumentSession:
 			raise CDMLFragmentOperationError("fragment deletion target is missing or ambiguous")
 		_fragment_id, atom_ids, bond_ids = _ordinary_fragment_members(matches[0])
 		_validate_fragment_members(molecule, atom_ids, bond_ids)
-		candidate = CDMLDocument.parse(self._document.serialize(), validation="compat")
-		candidate_molecule = _direct_root_molecule(candidate, request.molecule_id)
-		candidate_matches = [
-			child for child in _element_children(candidate_molecule)
-			if _is_cdml_element(child) and _local_name(child) == "fragment"
-			and child.getAttribute("id") == request.fragment_id
-		]
-		if len(candidate_matches) != 1:
-			raise CDMLFragmentOperationError("fragment deletion target is missing or ambiguous")
-		candidate_molecule.removeChild(candidate_matches[0])
-		candidate.validate(validation="strict")
-		commit = self.commit(
-			expected_revision=request.expected_revision,
-			complete_cdml=candidate.serialize(),
-		)
+		with self._edit((request.molecule_id,)) as transaction:
+			candidate = self._document
+			candidate_molecule = _direct_root_molecule(candidate, request.molecule_id)
+			candidate_matches = [
+				child for child in _element_children(candidate_molecule)
+				if _is_cdml_element(child) and _local_name(child) == "fragment"
+				and child.getAttribute("id") == request.fragment_id
+			]
+			if len(candidate_matches) != 1:
+				raise CDMLFragmentOperationError("fragment deletion target is missing or ambiguous")
+			candidate_molecule.removeChild(candidate_matches[0])
+			commit = self._commit_transaction(transaction, request.expected_revision)
 		return CDMLFragmentDeleteResult(commit.snapshot, commit, request.fragment_id)
 
 	#============================================
@@ -7041,20 +7010,16 @@ class CDMLDocumentSession:
 		"""
 		molecule_id, atom_ids = _validate_linear_form_convert_request(request)
 		self._check_expected_revision(request.expected_revision)
-		candidate = CDMLDocument.parse(self._document.serialize(), validation="compat")
-		import oasa.cdml_linear_form
-		details = oasa.cdml_linear_form.convert(candidate, molecule_id, atom_ids)
-		candidate.validate(validation="strict")
-		candidate_cdml = candidate.serialize()
-		if candidate_cdml == self._document.serialize():
-			return CDMLLinearFormConvertResult(
-				self.snapshot(), False, None, details.fragment_id,
-				details.atom_ids, details.bond_ids,
-			)
-		commit = self.commit(
-			expected_revision=request.expected_revision,
-			complete_cdml=candidate_cdml,
-		)
+		with self._edit((molecule_id,)) as transaction:
+			candidate = self._document
+			import oasa.cdml_linear_form
+			details = oasa.cdml_linear_form.convert(candidate, molecule_id, atom_ids)
+			if transaction.is_noop():
+				return CDMLLinearFormConvertResult(
+					self.snapshot(), False, None, details.fragment_id,
+					details.atom_ids, details.bond_ids,
+				)
+			commit = self._commit_transaction(transaction, request.expected_revision)
 		return CDMLLinearFormConvertResult(
 			commit.snapshot, True, commit, details.fragment_id,
 			details.atom_ids, details.bond_ids,
@@ -7085,32 +7050,29 @@ class CDMLDocumentSession:
 			matching_mark = matching_marks[matching_mark_index]
 		if action == "remove" and matching_mark is None:
 			return CDMLAtomMarkOperationResult(self.snapshot(), False, None, "unchanged")
-		candidate = CDMLDocument.parse(self._document.serialize(), validation="compat")
-		candidate_molecule = _direct_root_molecule(candidate, molecule_id)
-		candidate_atom = _direct_molecule_atom(candidate_molecule, atom_id)
-		if action == "add":
-			attributes = _authored_atom_mark_attributes(candidate_atom, mark_type)
-			mark = _new_core_element(candidate, candidate_atom, "mark")
-			for name, value in attributes.items():
-				mark.setAttribute(name, value)
-			candidate_atom.appendChild(mark)
-		else:
-			candidate_marks = _direct_atom_marks(candidate_atom, mark_type)
-			candidate_mark = (
-				candidate_marks[matching_mark_index]
-				if matching_mark_index is not None else (
-					candidate_marks[0] if candidate_marks else None
+		with self._edit((molecule_id,)) as transaction:
+			candidate = self._document
+			candidate_molecule = _direct_root_molecule(candidate, molecule_id)
+			candidate_atom = _direct_molecule_atom(candidate_molecule, atom_id)
+			if action == "add":
+				attributes = _authored_atom_mark_attributes(candidate_atom, mark_type)
+				mark = _new_core_element(candidate, candidate_atom, "mark")
+				for name, value in attributes.items():
+					mark.setAttribute(name, value)
+				candidate_atom.appendChild(mark)
+			else:
+				candidate_marks = _direct_atom_marks(candidate_atom, mark_type)
+				candidate_mark = (
+					candidate_marks[matching_mark_index]
+					if matching_mark_index is not None else (
+						candidate_marks[0] if candidate_marks else None
+					)
 				)
-			)
-			if candidate_mark is None:
-				raise CDMLAtomMarkOperationError("atom mark disappeared from detached candidate")
-			candidate_atom.removeChild(candidate_mark)
-		_apply_atom_mark_scalar_delta(candidate_atom, mark_type, action)
-		candidate.validate(validation="strict")
-		commit = self.commit(
-			expected_revision=request.expected_revision,
-			complete_cdml=candidate.serialize(),
-		)
+				if candidate_mark is None:
+					raise CDMLAtomMarkOperationError("atom mark disappeared from detached candidate")
+				candidate_atom.removeChild(candidate_mark)
+			_apply_atom_mark_scalar_delta(candidate_atom, mark_type, action)
+			commit = self._commit_transaction(transaction, request.expected_revision)
 		return CDMLAtomMarkOperationResult(
 			commit.snapshot, True, commit, "added" if action == "add" else "removed",
 		)
@@ -7120,29 +7082,26 @@ class CDMLDocumentSession:
 		"""Atomically assign, replace, or clear one direct core atom number."""
 		molecule_id, atom_id, number, show_number = _validate_atom_number_request(request)
 		self._check_expected_revision(request.expected_revision)
-		candidate = CDMLDocument.parse(self._document.serialize(), validation="compat")
-		molecule = _direct_root_molecule(candidate, molecule_id)
-		atom = _direct_molecule_atom(molecule, atom_id)
-		for child in _element_children(atom):
-			if (
-					_is_cdml_element(child)
-					and _local_name(child) == "mark"
-					and child.getAttribute("type") == "atom_number"
-				):
-				raise CDMLAtomNumberCompatibilityError(
-					"atom number edit target has a direct legacy atom_number mark",
-				)
-		if number is None:
-			atom.removeAttribute("number")
-			atom.removeAttribute("show_number")
-		else:
-			atom.setAttribute("number", str(number))
-			atom.setAttribute("show_number", "yes" if show_number else "no")
-		candidate.validate(validation="strict")
-		return self.commit(
-			expected_revision=request.expected_revision,
-			complete_cdml=candidate.serialize(),
-		)
+		with self._edit((molecule_id,)) as transaction:
+			candidate = self._document
+			molecule = _direct_root_molecule(candidate, molecule_id)
+			atom = _direct_molecule_atom(molecule, atom_id)
+			for child in _element_children(atom):
+				if (
+						_is_cdml_element(child)
+						and _local_name(child) == "mark"
+						and child.getAttribute("type") == "atom_number"
+					):
+					raise CDMLAtomNumberCompatibilityError(
+						"atom number edit target has a direct legacy atom_number mark",
+					)
+			if number is None:
+				atom.removeAttribute("number")
+				atom.removeAttribute("show_number")
+			else:
+				atom.setAttribute("number", str(number))
+				atom.setAttribute("show_number", "yes" if show_number else "no")
+			return self._commit_transaction(transaction, request.expected_revision)
 
 	#============================================
 	def set_molecule_name(self, request: CDMLMoleculeNameEditRequest) -> CDMLCommit:
@@ -7153,17 +7112,14 @@ class CDMLDocumentSession:
 		current_name = molecule.getAttribute("name") if molecule.hasAttribute("name") else ""
 		if current_name == name:
 			return CDMLCommit(self.snapshot(), types.MappingProxyType({}))
-		candidate = CDMLDocument.parse(self._document.serialize(), validation="compat")
-		molecule = _direct_root_molecule(candidate, molecule_id)
-		if name:
-			molecule.setAttribute("name", name)
-		else:
-			molecule.removeAttribute("name")
-		candidate.validate(validation="strict")
-		return self.commit(
-			expected_revision=request.expected_revision,
-			complete_cdml=candidate.serialize(),
-		)
+		with self._edit((molecule_id,)) as transaction:
+			candidate = self._document
+			molecule = _direct_root_molecule(candidate, molecule_id)
+			if name:
+				molecule.setAttribute("name", name)
+			else:
+				molecule.removeAttribute("name")
+			return self._commit_transaction(transaction, request.expected_revision)
 
 	#============================================
 	def patch_paper_properties(self, request: CDMLPaperPropertiesPatch) -> CDMLCommit:
@@ -7187,44 +7143,43 @@ class CDMLDocumentSession:
 			raise CDMLPaperPropertiesError(
 				"paper properties dimensions apply only to custom paper",
 			)
-		candidate = CDMLDocument.parse(self._document.serialize(), validation="compat")
-		paper = _first_direct_core_child(candidate, "paper")
-		if paper is None:
-			root = candidate._dom_document.documentElement
-			paper = _new_core_element(candidate, root, "paper")
-			default_type, default_orientation = _new_paper_defaults(candidate)
-			paper.setAttribute("type", default_type)
-			paper.setAttribute("orientation", default_orientation)
-			viewport = _first_direct_core_child(candidate, "viewport")
-			if viewport is None:
-				root.appendChild(paper)
+		with self._edit() as transaction:
+			candidate = self._document
+			paper = _first_direct_core_child(candidate, "paper")
+			if paper is not None:
+				paper = transaction.writable(paper)
 			else:
-				root.insertBefore(paper, viewport)
-		if "type" in changes:
-			paper.setAttribute("type", changes["type"])
-		if "orientation" in changes:
-			paper.setAttribute("orientation", changes["orientation"])
-		for name in ("crop_svg", "use_real_minus", "replace_minus"):
-			if name in changes:
-				paper.setAttribute(name, "1" if changes[name] else "0")
-		if "crop_margin" in changes:
-			paper.setAttribute("crop_margin", str(changes["crop_margin"]))
-		if effective_type == "custom":
-			if "dimensions" in changes:
-				dimensions = changes["dimensions"]
-				paper.setAttribute("size_x", _paper_dimension_text(dimensions[0]))
-				paper.setAttribute("size_y", _paper_dimension_text(dimensions[1]))
-		elif "type" in changes:
-			for name in ("size_x", "size_y"):
-				if paper.hasAttribute(name):
-					paper.removeAttribute(name)
-		candidate.validate(validation="strict")
-		if candidate.serialize() == self._document.serialize():
-			return CDMLCommit(self.snapshot(), types.MappingProxyType({}))
-		return self.commit(
-			expected_revision=request.expected_revision,
-			complete_cdml=candidate.serialize(),
-		)
+				root = candidate._dom_document.documentElement
+				paper = _new_core_element(candidate, root, "paper")
+				default_type, default_orientation = _new_paper_defaults(candidate)
+				paper.setAttribute("type", default_type)
+				paper.setAttribute("orientation", default_orientation)
+				viewport = _first_direct_core_child(candidate, "viewport")
+				if viewport is None:
+					root.appendChild(paper)
+				else:
+					root.insertBefore(paper, viewport)
+			if "type" in changes:
+				paper.setAttribute("type", changes["type"])
+			if "orientation" in changes:
+				paper.setAttribute("orientation", changes["orientation"])
+			for name in ("crop_svg", "use_real_minus", "replace_minus"):
+				if name in changes:
+					paper.setAttribute(name, "1" if changes[name] else "0")
+			if "crop_margin" in changes:
+				paper.setAttribute("crop_margin", str(changes["crop_margin"]))
+			if effective_type == "custom":
+				if "dimensions" in changes:
+					dimensions = changes["dimensions"]
+					paper.setAttribute("size_x", _paper_dimension_text(dimensions[0]))
+					paper.setAttribute("size_y", _paper_dimension_text(dimensions[1]))
+			elif "type" in changes:
+				for name in ("size_x", "size_y"):
+					if paper.hasAttribute(name):
+						paper.removeAttribute(name)
+			if transaction.is_noop():
+				return CDMLCommit(self.snapshot(), types.MappingProxyType({}))
+			return self._commit_transaction(transaction, request.expected_revision)
 
 	#============================================
 	def patch_drawing_standard(
@@ -7243,6 +7198,8 @@ class CDMLDocumentSession:
 			self, request: CDMLMoleculeSmilesQuery,
 			) -> CDMLMoleculeSmilesResult:
 		"""Return canonical isomeric SMILES without changing session state."""
+		# deferred: the RDKit codecs are only needed for this query
+		import oasa.identifier_service
 		molecule_id = _validate_molecule_smiles_query(request)
 		self._check_expected_revision(request.expected_revision)
 		molecule = _direct_root_molecule(self._document, molecule_id)
@@ -7252,9 +7209,8 @@ class CDMLDocumentSession:
 			)
 			if oasa_molecule is None:
 				raise ValueError("CDML molecule has no supported chemistry conversion")
-			smiles = oasa.codecs.rdkit_formats.depiction_stereo_smiles_mol_to_text(
-				oasa_molecule,
-			)
+			service = oasa.identifier_service.shared_identifier_service()
+			smiles = service.smiles(oasa_molecule)
 		except (
 				AttributeError, IndexError, KeyError, RuntimeError,
 				TypeError, ValueError,
@@ -7277,66 +7233,63 @@ class CDMLDocumentSession:
 		"""
 		molecule_id, atom_ids, bond_ids = _validate_structure_delete_request(request)
 		self._check_expected_revision(request.expected_revision)
-		candidate = CDMLDocument.parse(self._document.serialize(), validation="compat")
-		molecule = _direct_root_molecule(candidate, molecule_id)
-		_validate_structure_delete_molecule(molecule)
-		atoms, bonds = _structure_delete_direct_nodes(molecule)
-		if any(identifier not in atoms for identifier in atom_ids):
-			raise CDMLValidationError("structure deletion atom target is not a direct durable atom")
-		if any(identifier not in bonds for identifier in bond_ids):
-			raise CDMLValidationError("structure deletion bond target is not a direct durable bond")
-		removed_atom_ids, removed_bond_ids, components = _structure_delete_components(
-			atoms, bonds, atom_ids, bond_ids,
-		)
-		if any(role.target_identifier == molecule_id for role in candidate.reaction_roles()):
-			if len(components) != 1:
-				raise CDMLValidationError(
-					"structure deletion cannot remove or split a reaction-referenced molecule",
-				)
-		root = candidate._dom_document.documentElement
-		component_records = []
-		if not components:
-			root.removeChild(molecule)
-		elif len(components) == 1:
-			component_atom_ids, component_bond_ids = components[0]
-			_remove_structure_delete_children(molecule, component_atom_ids, component_bond_ids)
-			component_records.append(CDMLStructureDeleteComponent(
-				molecule_id, component_atom_ids, component_bond_ids,
-			))
-		else:
-			used_ids = _candidate_durable_ids(candidate)
-			first_atom_ids, first_bond_ids = components[0]
-			later_components = []
-			for component_atom_ids, component_bond_ids in components[1:]:
-				component_molecule_id = _next_durable_id("molecule", used_ids)
-				used_ids.add(component_molecule_id)
-				component = _structure_delete_component_root(
-					candidate, molecule, component_molecule_id,
-					component_atom_ids, component_bond_ids,
-				)
-				later_components.append((
-					component_molecule_id, component_atom_ids, component_bond_ids, component,
+		with self._edit((molecule_id,)) as transaction:
+			candidate = self._document
+			molecule = _direct_root_molecule(candidate, molecule_id)
+			_validate_structure_delete_molecule(molecule)
+			atoms, bonds = _structure_delete_direct_nodes(molecule)
+			if any(identifier not in atoms for identifier in atom_ids):
+				raise CDMLValidationError("structure deletion atom target is not a direct durable atom")
+			if any(identifier not in bonds for identifier in bond_ids):
+				raise CDMLValidationError("structure deletion bond target is not a direct durable bond")
+			removed_atom_ids, removed_bond_ids, components = _structure_delete_components(
+				atoms, bonds, atom_ids, bond_ids,
+			)
+			if any(role.target_identifier == molecule_id for role in candidate.reaction_roles()):
+				if len(components) != 1:
+					raise CDMLValidationError(
+						"structure deletion cannot remove or split a reaction-referenced molecule",
+					)
+			root = candidate._dom_document.documentElement
+			component_records = []
+			if not components:
+				root.removeChild(molecule)
+			elif len(components) == 1:
+				component_atom_ids, component_bond_ids = components[0]
+				_remove_structure_delete_children(molecule, component_atom_ids, component_bond_ids)
+				component_records.append(CDMLStructureDeleteComponent(
+					molecule_id, component_atom_ids, component_bond_ids,
 				))
-			_remove_structure_delete_children(molecule, first_atom_ids, first_bond_ids)
-			component_records.append(CDMLStructureDeleteComponent(
-				molecule_id, first_atom_ids, first_bond_ids,
-			))
-			insertion_reference = molecule.nextSibling
-			for component_molecule_id, component_atom_ids, component_bond_ids, component in later_components:
-				root.insertBefore(component, insertion_reference)
+			else:
+				used_ids = _candidate_durable_ids(candidate)
+				first_atom_ids, first_bond_ids = components[0]
+				later_components = []
+				for component_atom_ids, component_bond_ids in components[1:]:
+					component_molecule_id = _next_durable_id("molecule", used_ids)
+					used_ids.add(component_molecule_id)
+					component = _structure_delete_component_root(
+						candidate, molecule, component_molecule_id,
+						component_atom_ids, component_bond_ids,
+					)
+					later_components.append((
+						component_molecule_id, component_atom_ids, component_bond_ids, component,
+					))
+				_remove_structure_delete_children(molecule, first_atom_ids, first_bond_ids)
 				component_records.append(CDMLStructureDeleteComponent(
-					component_molecule_id, component_atom_ids, component_bond_ids,
+					molecule_id, first_atom_ids, first_bond_ids,
 				))
-		if component_records:
-			import oasa.cdml_linear_form
-			oasa.cdml_linear_form.remove_invalid_generated_forms(
-				candidate, tuple(record.molecule_id for record in component_records),
-			)
-		candidate.validate(validation="strict")
-		commit = self.commit(
-			expected_revision=request.expected_revision,
-			complete_cdml=candidate.serialize(),
-		)
+				insertion_reference = molecule.nextSibling
+				for component_molecule_id, component_atom_ids, component_bond_ids, component in later_components:
+					root.insertBefore(component, insertion_reference)
+					component_records.append(CDMLStructureDeleteComponent(
+						component_molecule_id, component_atom_ids, component_bond_ids,
+					))
+			if component_records:
+				import oasa.cdml_linear_form
+				oasa.cdml_linear_form.remove_invalid_generated_forms(
+					candidate, tuple(record.molecule_id for record in component_records),
+				)
+			commit = self._commit_transaction(transaction, request.expected_revision)
 		return CDMLStructureDeleteResult(
 			commit=commit,
 			removed_atom_ids=removed_atom_ids,
@@ -7429,33 +7382,31 @@ class CDMLDocumentSession:
 				"top-level deletion root_ids must be unique nonempty strings",
 			)
 		self._check_expected_revision(request.expected_revision)
-		candidate = CDMLDocument.parse(self._document.serialize(), validation="compat")
-		root = candidate._dom_document.documentElement
-		eligible = {}
-		for child in _element_children(root):
-			if (
-				_is_cdml_element(child)
-				and _local_name(child) in _TOP_LEVEL_DELETE_NAMES
-				and child.getAttribute("id")
-			):
-				eligible[child.getAttribute("id")] = child
-		missing = [identifier for identifier in request.root_ids if identifier not in eligible]
-		if missing:
-			raise CDMLValidationError(
-				"top-level deletion target is not a supported durable root: %s" % missing[0],
-			)
-		target_ids = frozenset(request.root_ids)
-		for role in candidate.reaction_roles():
-			if role.target_identifier in target_ids:
+		with self._edit() as transaction:
+			candidate = self._document
+			root = candidate._dom_document.documentElement
+			eligible = {}
+			for child in _element_children(root):
+				if (
+					_is_cdml_element(child)
+					and _local_name(child) in _TOP_LEVEL_DELETE_NAMES
+					and child.getAttribute("id")
+				):
+					eligible[child.getAttribute("id")] = child
+			missing = [identifier for identifier in request.root_ids if identifier not in eligible]
+			if missing:
 				raise CDMLValidationError(
-					"top-level deletion target is referenced by reaction role: %s" % role.target_identifier,
+					"top-level deletion target is not a supported durable root: %s" % missing[0],
 				)
-		for identifier in request.root_ids:
-			root.removeChild(eligible[identifier])
-		return self.commit(
-			expected_revision=request.expected_revision,
-			complete_cdml=candidate.serialize(),
-		)
+			target_ids = frozenset(request.root_ids)
+			for role in candidate.reaction_roles():
+				if role.target_identifier in target_ids:
+					raise CDMLValidationError(
+						"top-level deletion target is referenced by reaction role: %s" % role.target_identifier,
+					)
+			for identifier in request.root_ids:
+				root.removeChild(eligible[identifier])
+			return self._commit_transaction(transaction, request.expected_revision)
 
 	#============================================
 	def repair_geometry(
@@ -7490,44 +7441,41 @@ class CDMLDocumentSession:
 				"geometry repair target_spacing_pt must be a finite positive number",
 			)
 		self._check_expected_revision(request.expected_revision)
-		candidate = CDMLDocument.parse(self._document.serialize(), validation="compat")
-		try:
-			import oasa.cdml_geometry_repair
-			if request.kind == "normalize-bond-lengths":
-				oasa.cdml_geometry_repair.normalize_bond_lengths_in_document(
-					candidate, request.molecule_ids, float(request.target_spacing_pt),
-				)
-			elif request.kind == "normalize-bond-angles":
-				oasa.cdml_geometry_repair.normalize_bond_angles_in_document(
-					candidate, request.molecule_ids, float(request.target_spacing_pt),
-				)
-			elif request.kind == "straighten-bonds":
-				oasa.cdml_geometry_repair.straighten_bonds_in_document(
-					candidate, request.molecule_ids, float(request.target_spacing_pt),
-				)
-			elif request.kind == "normalize-rings":
-				oasa.cdml_geometry_repair.normalize_rings_in_document(
-					candidate, request.molecule_ids, float(request.target_spacing_pt),
-				)
-			elif request.kind == "clean-geometry":
-				oasa.cdml_geometry_repair.clean_geometry_in_document(
-					candidate, request.molecule_ids, float(request.target_spacing_pt),
-				)
-			else:
-				oasa.cdml_geometry_repair.snap_to_hex_grid_in_document(
-					candidate, request.molecule_ids, float(request.target_spacing_pt),
-				)
-		except ValueError as exc:
-			raise CDMLValidationError(str(exc)) from exc
-		import oasa.cdml_linear_form
-		oasa.cdml_linear_form.remove_invalid_generated_forms(candidate, request.molecule_ids)
-		candidate.validate(validation="strict")
-		if candidate.serialize() == self._document.serialize():
-			return CDMLGeometryRepairResult(self.snapshot(), False, None)
-		commit = self.commit(
-			expected_revision=request.expected_revision,
-			complete_cdml=candidate.serialize(),
-		)
+		with self._edit(request.molecule_ids) as transaction:
+			candidate = self._document
+			try:
+				import oasa.cdml_geometry_repair
+				if request.kind == "normalize-bond-lengths":
+					oasa.cdml_geometry_repair.normalize_bond_lengths_in_document(
+						candidate, request.molecule_ids, float(request.target_spacing_pt),
+					)
+				elif request.kind == "normalize-bond-angles":
+					oasa.cdml_geometry_repair.normalize_bond_angles_in_document(
+						candidate, request.molecule_ids, float(request.target_spacing_pt),
+					)
+				elif request.kind == "straighten-bonds":
+					oasa.cdml_geometry_repair.straighten_bonds_in_document(
+						candidate, request.molecule_ids, float(request.target_spacing_pt),
+					)
+				elif request.kind == "normalize-rings":
+					oasa.cdml_geometry_repair.normalize_rings_in_document(
+						candidate, request.molecule_ids, float(request.target_spacing_pt),
+					)
+				elif request.kind == "clean-geometry":
+					oasa.cdml_geometry_repair.clean_geometry_in_document(
+						candidate, request.molecule_ids, float(request.target_spacing_pt),
+					)
+				else:
+					oasa.cdml_geometry_repair.snap_to_hex_grid_in_document(
+						candidate, request.molecule_ids, float(request.target_spacing_pt),
+					)
+			except ValueError as exc:
+				raise CDMLValidationError(str(exc)) from exc
+			import oasa.cdml_linear_form
+			oasa.cdml_linear_form.remove_invalid_generated_forms(candidate, request.molecule_ids)
+			if transaction.is_noop():
+				return CDMLGeometryRepairResult(self.snapshot(), False, None)
+			commit = self._commit_transaction(transaction, request.expected_revision)
 		return CDMLGeometryRepairResult(commit.snapshot, True, commit)
 
 	#============================================
@@ -7550,69 +7498,66 @@ class CDMLDocumentSession:
 		if len(set(request.targets)) != len(request.targets):
 			raise CDMLValidationError("atom alignment targets must be unique")
 		self._check_expected_revision(request.expected_revision)
-		candidate = CDMLDocument.parse(self._document.serialize(), validation="compat")
-		root = candidate._dom_document.documentElement
-		molecules = {
-			child.getAttribute("id"): child
-			for child in _element_children(root)
-			if _is_cdml_element(child) and _local_name(child) == "molecule" and child.getAttribute("id")
-		}
-		points = []
-		for molecule_id, atom_id in request.targets:
-			molecule = molecules.get(molecule_id)
-			if molecule is None:
-				raise CDMLValidationError(
-					"atom alignment target is not a durable direct-root molecule: %s" % molecule_id,
-				)
-			atoms = {
+		with self._edit(molecule_id for molecule_id, _atom_id in request.targets) as transaction:
+			candidate = self._document
+			root = candidate._dom_document.documentElement
+			molecules = {
 				child.getAttribute("id"): child
-				for child in _element_children(molecule)
-				if _is_cdml_element(child) and _local_name(child) == "atom" and child.getAttribute("id")
+				for child in _element_children(root)
+				if _is_cdml_element(child) and _local_name(child) == "molecule" and child.getAttribute("id")
 			}
-			atom = atoms.get(atom_id)
-			if atom is None:
-				raise CDMLValidationError(
-					"atom alignment target is not a durable direct molecule atom: %s" % atom_id,
-				)
-			atom_points = [
-				child for child in _element_children(atom)
-				if _is_cdml_element(child) and _local_name(child) == "point"
-			]
-			if len(atom_points) != 1:
-				raise CDMLValidationError("atom alignment atom requires one direct core point")
-			point = atom_points[0]
-			if not point.hasAttribute("x") or not point.hasAttribute("y"):
-				raise CDMLValidationError("atom alignment point requires x and y")
-			# Convert through the established coordinate parser before mutation.
-			x = _insertion_coordinate(point.getAttribute("x"))
-			y = _insertion_coordinate(point.getAttribute("y"))
-			points.append((point, x, y))
-		if len(points) < 2:
-			return CDMLAtomAlignResult(self.snapshot(), False, None)
-		axis_index = 2 if request.axis == "horizontal" else 1
-		# Equal selected-axis coordinates are a semantic no-op. Decide this before
-		# calculating the mean or touching the detached DOM so compatible lexical
-		# spellings such as ``3cm`` remain byte-for-byte preserved.
-		axis_coordinates = tuple(point[axis_index] for point in points)
-		if all(coordinate == axis_coordinates[0] for coordinate in axis_coordinates[1:]):
-			return CDMLAtomAlignResult(self.snapshot(), False, None)
-		mean = sum(axis_coordinates) / len(axis_coordinates)
-		if not math.isfinite(mean):
-			raise CDMLValidationError("atom alignment mean coordinate is nonfinite")
-		attribute = "y" if request.axis == "horizontal" else "x"
-		for point, _x, _y in points:
-			point.setAttribute(attribute, f"{mean:.3f}cm")
-		import oasa.cdml_linear_form
-		oasa.cdml_linear_form.remove_invalid_generated_forms(
-			candidate, tuple(dict.fromkeys(molecule_id for molecule_id, _atom_id in request.targets)),
-		)
-		candidate.validate(validation="strict")
-		if candidate.serialize() == self._document.serialize():
-			return CDMLAtomAlignResult(self.snapshot(), False, None)
-		commit = self.commit(
-			expected_revision=request.expected_revision,
-			complete_cdml=candidate.serialize(),
-		)
+			points = []
+			for molecule_id, atom_id in request.targets:
+				molecule = molecules.get(molecule_id)
+				if molecule is None:
+					raise CDMLValidationError(
+						"atom alignment target is not a durable direct-root molecule: %s" % molecule_id,
+					)
+				atoms = {
+					child.getAttribute("id"): child
+					for child in _element_children(molecule)
+					if _is_cdml_element(child) and _local_name(child) == "atom" and child.getAttribute("id")
+				}
+				atom = atoms.get(atom_id)
+				if atom is None:
+					raise CDMLValidationError(
+						"atom alignment target is not a durable direct molecule atom: %s" % atom_id,
+					)
+				atom_points = [
+					child for child in _element_children(atom)
+					if _is_cdml_element(child) and _local_name(child) == "point"
+				]
+				if len(atom_points) != 1:
+					raise CDMLValidationError("atom alignment atom requires one direct core point")
+				point = atom_points[0]
+				if not point.hasAttribute("x") or not point.hasAttribute("y"):
+					raise CDMLValidationError("atom alignment point requires x and y")
+				# Convert through the established coordinate parser before mutation.
+				x = _insertion_coordinate(point.getAttribute("x"))
+				y = _insertion_coordinate(point.getAttribute("y"))
+				points.append((point, x, y))
+			if len(points) < 2:
+				return CDMLAtomAlignResult(self.snapshot(), False, None)
+			axis_index = 2 if request.axis == "horizontal" else 1
+			# Equal selected-axis coordinates are a semantic no-op. Decide this before
+			# calculating the mean or touching the detached DOM so compatible lexical
+			# spellings such as ``3cm`` remain byte-for-byte preserved.
+			axis_coordinates = tuple(point[axis_index] for point in points)
+			if all(coordinate == axis_coordinates[0] for coordinate in axis_coordinates[1:]):
+				return CDMLAtomAlignResult(self.snapshot(), False, None)
+			mean = sum(axis_coordinates) / len(axis_coordinates)
+			if not math.isfinite(mean):
+				raise CDMLValidationError("atom alignment mean coordinate is nonfinite")
+			attribute = "y" if request.axis == "horizontal" else "x"
+			for point, _x, _y in points:
+				point.setAttribute(attribute, f"{mean:.3f}cm")
+			import oasa.cdml_linear_form
+			oasa.cdml_linear_form.remove_invalid_generated_forms(
+				candidate, tuple(dict.fromkeys(molecule_id for molecule_id, _atom_id in request.targets)),
+			)
+			if transaction.is_noop():
+				return CDMLAtomAlignResult(self.snapshot(), False, None)
+			commit = self._commit_transaction(transaction, request.expected_revision)
 		return CDMLAtomAlignResult(commit.snapshot, True, commit)
 
 	#============================================
@@ -7674,35 +7619,31 @@ class CDMLDocumentSession:
 						raise CDMLTopLevelTransformError("top-level transform coordinate is nonfinite")
 		else:
 			_validate_top_level_affine_results(geometries, transforms)
-		candidate = CDMLDocument.parse(self._document.serialize(), validation="compat")
-		candidate_geometries = _direct_top_level_transform_roots(candidate, root_ids)
-		if mode == "translate" or mode.startswith("align-"):
-			for geometry, (dx, dy) in zip(candidate_geometries, transforms, strict=True):
-				_align_top_level_geometry(geometry, dx, dy)
-		else:
-			for geometry, (pivot_x, pivot_y, factor_x, factor_y) in zip(
-				candidate_geometries, transforms, strict=True,
-			):
-				_transform_top_level_geometry(geometry, pivot_x, pivot_y, factor_x, factor_y)
-		import oasa.cdml_linear_form
-		oasa.cdml_linear_form.remove_invalid_generated_forms(
-			candidate,
-			tuple(
-				child.getAttribute("id") for child in _element_children(
-					candidate._dom_document.documentElement,
-				)
-				if _is_cdml_element(child) and _local_name(child) == "molecule"
-				and child.getAttribute("id") in root_ids
-			),
-		)
-		candidate.validate(validation="strict")
-		candidate_cdml = candidate.serialize()
-		if candidate_cdml == self._document.serialize():
-			return CDMLTopLevelTransformResult(self.snapshot(), False, None)
-		commit = self.commit(
-			expected_revision=request.expected_revision,
-			complete_cdml=candidate_cdml,
-		)
+		with self._edit(root_ids) as transaction:
+			candidate = self._document
+			candidate_geometries = _direct_top_level_transform_roots(candidate, root_ids)
+			if mode == "translate" or mode.startswith("align-"):
+				for geometry, (dx, dy) in zip(candidate_geometries, transforms, strict=True):
+					_align_top_level_geometry(geometry, dx, dy)
+			else:
+				for geometry, (pivot_x, pivot_y, factor_x, factor_y) in zip(
+					candidate_geometries, transforms, strict=True,
+				):
+					_transform_top_level_geometry(geometry, pivot_x, pivot_y, factor_x, factor_y)
+			import oasa.cdml_linear_form
+			oasa.cdml_linear_form.remove_invalid_generated_forms(
+				candidate,
+				tuple(
+					child.getAttribute("id") for child in _element_children(
+						candidate._dom_document.documentElement,
+					)
+					if _is_cdml_element(child) and _local_name(child) == "molecule"
+					and child.getAttribute("id") in root_ids
+				),
+			)
+			if transaction.is_noop():
+				return CDMLTopLevelTransformResult(self.snapshot(), False, None)
+			commit = self._commit_transaction(transaction, request.expected_revision)
 		return CDMLTopLevelTransformResult(commit.snapshot, True, commit)
 
 	#============================================
@@ -7724,36 +7665,32 @@ class CDMLDocumentSession:
 			points.append((molecule_id, atom_id, x, y))
 		if dx_cm == 0.0 and dy_cm == 0.0:
 			return CDMLAtomTranslateResult(self.snapshot(), False, None)
-		candidate = CDMLDocument.parse(self._document.serialize(), validation="compat")
-		for molecule_id, atom_id, x, y in points:
-			molecule = _direct_root_molecule(candidate, molecule_id)
-			atom = _direct_molecule_atom(molecule, atom_id)
-			point = next(
-				child for child in _element_children(atom)
-				if _is_cdml_element(child) and _local_name(child) == "point"
-			)
-			# Preserve the untouched source attribute exactly. Compatible CDML may
-			# use unitless PostScript points that parsing would otherwise rewrite.
-			new_x, new_y = _atom_translation_result(
-				x, y, dx_cm, dy_cm,
-				error_type=CDMLValidationError, canonical_noop=False,
+		with self._edit(molecule_id for molecule_id, _atom_id in targets) as transaction:
+			candidate = self._document
+			for molecule_id, atom_id, x, y in points:
+				molecule = _direct_root_molecule(candidate, molecule_id)
+				atom = _direct_molecule_atom(molecule, atom_id)
+				point = next(
+					child for child in _element_children(atom)
+					if _is_cdml_element(child) and _local_name(child) == "point"
+				)
+				# Preserve the untouched source attribute exactly. Compatible CDML may
+				# use unitless PostScript points that parsing would otherwise rewrite.
+				new_x, new_y = _atom_translation_result(
+					x, y, dx_cm, dy_cm,
+					error_type=CDMLValidationError, canonical_noop=False,
+				)
+				if new_x is not None:
+					point.setAttribute("x", new_x)
+				if new_y is not None:
+					point.setAttribute("y", new_y)
+			import oasa.cdml_linear_form
+			oasa.cdml_linear_form.remove_invalid_generated_forms(
+				candidate, tuple(dict.fromkeys(molecule_id for molecule_id, _atom_id in targets)),
 			)
-			if new_x is not None:
-				point.setAttribute("x", new_x)
-			if new_y is not None:
-				point.setAttribute("y", new_y)
-		import oasa.cdml_linear_form
-		oasa.cdml_linear_form.remove_invalid_generated_forms(
-			candidate, tuple(dict.fromkeys(molecule_id for molecule_id, _atom_id in targets)),
-		)
-		candidate.validate(validation="strict")
-		candidate_cdml = candidate.serialize()
-		if candidate_cdml == self._document.serialize():
-			return CDMLAtomTranslateResult(self.snapshot(), False, None)
-		commit = self.commit(
-			expected_revision=request.expected_revision,
-			complete_cdml=candidate_cdml,
-		)
+			if transaction.is_noop():
+				return CDMLAtomTranslateResult(self.snapshot(), False, None)
+			commit = self._commit_transaction(transaction, request.expected_revision)
 		return CDMLAtomTranslateResult(commit.snapshot, True, commit)
 
 	#============================================
@@ -7798,32 +7735,30 @@ class CDMLDocumentSession:
 			)
 			if not presentation_changes and not atom_changes:
 				return CDMLSelectionTranslateResult(self.snapshot(), False, None)
-			candidate = CDMLDocument.parse(self._document.serialize(), validation="compat")
-			for molecule_id, atom_id, _geometry in atom_geometries:
-				molecule = _direct_root_molecule(candidate, molecule_id)
-				atom = _direct_molecule_atom(molecule, atom_id)
-				candidate_geometry = _selection_translate_atom_geometry(atom, dx_cm, dy_cm)
-				_apply_selection_translate_atom_geometry(candidate_geometry)
-			candidate_geometries = _direct_selection_translate_roots(candidate, root_ids)
-			for geometry in candidate_geometries:
-				try:
-					_align_top_level_geometry(geometry, dx_cm, dy_cm)
-				except CDMLTopLevelTransformError as error:
-					raise CDMLSelectionTranslateError(
-						"selection translation root has invalid geometry",
-					) from error
-			import oasa.cdml_linear_form
-			oasa.cdml_linear_form.remove_invalid_generated_forms(
-				candidate, tuple(dict.fromkeys(molecule_id for molecule_id, _atom_id in atom_targets)),
-			)
-			candidate.validate(validation="strict")
-			candidate_cdml = candidate.serialize()
-			if candidate_cdml == self._document.serialize():
-				return CDMLSelectionTranslateResult(self.snapshot(), False, None)
-			commit = self.commit(
-				expected_revision=request.expected_revision,
-				complete_cdml=candidate_cdml,
-			)
+			with self._edit(
+					[molecule_id for molecule_id, _atom_id in atom_targets] + list(root_ids),
+					) as transaction:
+				candidate = self._document
+				for molecule_id, atom_id, _geometry in atom_geometries:
+					molecule = _direct_root_molecule(candidate, molecule_id)
+					atom = _direct_molecule_atom(molecule, atom_id)
+					candidate_geometry = _selection_translate_atom_geometry(atom, dx_cm, dy_cm)
+					_apply_selection_translate_atom_geometry(candidate_geometry)
+				candidate_geometries = _direct_selection_translate_roots(candidate, root_ids)
+				for geometry in candidate_geometries:
+					try:
+						_align_top_level_geometry(geometry, dx_cm, dy_cm)
+					except CDMLTopLevelTransformError as error:
+						raise CDMLSelectionTranslateError(
+							"selection translation root has invalid geometry",
+						) from error
+				import oasa.cdml_linear_form
+				oasa.cdml_linear_form.remove_invalid_generated_forms(
+					candidate, tuple(dict.fromkeys(molecule_id for molecule_id, _atom_id in atom_targets)),
+				)
+				if transaction.is_noop():
+					return CDMLSelectionTranslateResult(self.snapshot(), False, None)
+				commit = self._commit_transaction(transaction, request.expected_revision)
 		except CDMLSelectionTranslateError:
 			raise
 		except CDMLValidationError as error:
@@ -7879,30 +7814,26 @@ class CDMLDocumentSession:
 				in rotations
 			):
 			return CDMLAtomRotateResult(self.snapshot(), False, None)
-		candidate = CDMLDocument.parse(self._document.serialize(), validation="compat")
-		for molecule_id, atom_id, x, y, canonical_x, canonical_y in rotations:
-			molecule = _direct_root_molecule(candidate, molecule_id)
-			atom = _direct_molecule_atom(molecule, atom_id)
-			point = next(
-				child for child in _element_children(atom)
-				if _is_cdml_element(child) and _local_name(child) == "point"
+		with self._edit(molecule_id for molecule_id, _atom_id in targets) as transaction:
+			candidate = self._document
+			for molecule_id, atom_id, x, y, canonical_x, canonical_y in rotations:
+				molecule = _direct_root_molecule(candidate, molecule_id)
+				atom = _direct_molecule_atom(molecule, atom_id)
+				point = next(
+					child for child in _element_children(atom)
+					if _is_cdml_element(child) and _local_name(child) == "point"
+				)
+				if _canonical_authored_coordinate(x) != canonical_x:
+					point.setAttribute("x", canonical_x)
+				if _canonical_authored_coordinate(y) != canonical_y:
+					point.setAttribute("y", canonical_y)
+			import oasa.cdml_linear_form
+			oasa.cdml_linear_form.remove_invalid_generated_forms(
+				candidate, tuple(dict.fromkeys(molecule_id for molecule_id, _atom_id in targets)),
 			)
-			if _canonical_authored_coordinate(x) != canonical_x:
-				point.setAttribute("x", canonical_x)
-			if _canonical_authored_coordinate(y) != canonical_y:
-				point.setAttribute("y", canonical_y)
-		import oasa.cdml_linear_form
-		oasa.cdml_linear_form.remove_invalid_generated_forms(
-			candidate, tuple(dict.fromkeys(molecule_id for molecule_id, _atom_id in targets)),
-		)
-		candidate.validate(validation="strict")
-		candidate_cdml = candidate.serialize()
-		if candidate_cdml == self._document.serialize():
-			return CDMLAtomRotateResult(self.snapshot(), False, None)
-		commit = self.commit(
-			expected_revision=request.expected_revision,
-			complete_cdml=candidate_cdml,
-		)
+			if transaction.is_noop():
+				return CDMLAtomRotateResult(self.snapshot(), False, None)
+			commit = self._commit_transaction(transaction, request.expected_revision)
 		return CDMLAtomRotateResult(commit.snapshot, True, commit)
 
 	#============================================
@@ -7969,46 +7900,43 @@ class CDMLDocumentSession:
 				) from exc
 		_align_group_graph(graph, replacement, anchor_x, anchor_y, -dx, -dy, layout_stub)
 		graph.remove_vertex(layout_stub)
-		candidate = CDMLDocument.parse(self._document.serialize(), validation="compat")
-		candidate_molecule = _direct_root_molecule(candidate, request.molecule_id)
-		candidate_group = _direct_core_child_by_id(candidate_molecule, request.group_id, "group")
-		candidate_bond = _direct_molecule_bond(candidate_molecule, exterior_bond.getAttribute("id"))
-		used_ids = _candidate_durable_ids(candidate)
-		used_ids.add(request.group_id)
-		try:
-			serialized = oasa.cdml_writer.write_cdml_molecule_element(
-				graph,
-				coord_to_text=_canonical_authored_coordinate,
-				reserved_atom_ids=used_ids,
-				reserved_bond_ids=used_ids,
-			)
-		except (ArithmeticError, KeyError, TypeError, ValueError) as exc:
-			raise CDMLImplicitGroupExpandError(
-				"implicit group replacement serialization failed: %s" % exc,
-			) from exc
-		atom_elements = [child for child in _element_children(serialized)
-			if _local_name(child) == "atom"]
-		bond_elements = [child for child in _element_children(serialized)
-			if _local_name(child) == "bond"]
-		if not atom_elements:
-			raise CDMLImplicitGroupExpandError("implicit group formula produced no atoms")
-		replacement_atom_id = atom_elements[plan.replacement_vertex_index].getAttribute("id")
-		for element in atom_elements + bond_elements:
-			candidate_molecule.insertBefore(
-				candidate._dom_document.importNode(element, deep=True), candidate_group,
-			)
-		if candidate_bond.getAttribute("start") == request.group_id:
-			candidate_bond.setAttribute("start", replacement_atom_id)
-		elif candidate_bond.getAttribute("end") == request.group_id:
-			candidate_bond.setAttribute("end", replacement_atom_id)
-		else:
-			raise CDMLImplicitGroupExpandError("implicit group exterior bond is stale")
-		candidate_molecule.removeChild(candidate_group)
-		candidate.validate(validation="strict")
-		commit = self.commit(
-			expected_revision=request.expected_revision,
-			complete_cdml=candidate.serialize(),
-		)
+		with self._edit((request.molecule_id,)) as transaction:
+			candidate = self._document
+			candidate_molecule = _direct_root_molecule(candidate, request.molecule_id)
+			candidate_group = _direct_core_child_by_id(candidate_molecule, request.group_id, "group")
+			candidate_bond = _direct_molecule_bond(candidate_molecule, exterior_bond.getAttribute("id"))
+			used_ids = _candidate_durable_ids(candidate)
+			used_ids.add(request.group_id)
+			try:
+				serialized = oasa.cdml_writer.write_cdml_molecule_element(
+					graph,
+					coord_to_text=_canonical_authored_coordinate,
+					reserved_atom_ids=used_ids,
+					reserved_bond_ids=used_ids,
+				)
+			except (ArithmeticError, KeyError, TypeError, ValueError) as exc:
+				raise CDMLImplicitGroupExpandError(
+					"implicit group replacement serialization failed: %s" % exc,
+				) from exc
+			atom_elements = [child for child in _element_children(serialized)
+				if _local_name(child) == "atom"]
+			bond_elements = [child for child in _element_children(serialized)
+				if _local_name(child) == "bond"]
+			if not atom_elements:
+				raise CDMLImplicitGroupExpandError("implicit group formula produced no atoms")
+			replacement_atom_id = atom_elements[plan.replacement_vertex_index].getAttribute("id")
+			for element in atom_elements + bond_elements:
+				candidate_molecule.insertBefore(
+					candidate._dom_document.importNode(element, deep=True), candidate_group,
+				)
+			if candidate_bond.getAttribute("start") == request.group_id:
+				candidate_bond.setAttribute("start", replacement_atom_id)
+			elif candidate_bond.getAttribute("end") == request.group_id:
+				candidate_bond.setAttribute("end", replacement_atom_id)
+			else:
+				raise CDMLImplicitGroupExpandError("implicit group exterior bond is stale")
+			candidate_molecule.removeChild(candidate_group)
+			commit = self._commit_transaction(transaction, request.expected_revision)
 		return CDMLImplicitGroupExpandResult(
 			commit, replacement_atom_id,
 			tuple(atom.getAttribute("id") for atom in atom_elements),
@@ -8036,18 +7964,14 @@ class CDMLDocumentSession:
 			raise CDMLValidationError("bond order edit Haworth bonds require order 1")
 		if current_order == requested_order:
 			return CDMLBondOrderEditResult(self.snapshot(), False, None)
-		candidate = CDMLDocument.parse(self._document.serialize(), validation="compat")
-		candidate_molecule = _direct_root_molecule(candidate, molecule_id)
-		candidate_bond = _direct_molecule_bond(candidate_molecule, bond_id)
-		candidate_bond.setAttribute("type", "%s%s" % (type_char, requested_order))
-		candidate.validate(validation="strict")
-		candidate_cdml = candidate.serialize()
-		if candidate_cdml == self._document.serialize():
-			return CDMLBondOrderEditResult(self.snapshot(), False, None)
-		commit = self.commit(
-			expected_revision=request.expected_revision,
-			complete_cdml=candidate_cdml,
-		)
+		with self._edit((molecule_id,)) as transaction:
+			candidate = self._document
+			candidate_molecule = _direct_root_molecule(candidate, molecule_id)
+			candidate_bond = _direct_molecule_bond(candidate_molecule, bond_id)
+			candidate_bond.setAttribute("type", "%s%s" % (type_char, requested_order))
+			if transaction.is_noop():
+				return CDMLBondOrderEditResult(self.snapshot(), False, None)
+			commit = self._commit_transaction(transaction, request.expected_revision)
 		return CDMLBondOrderEditResult(commit.snapshot, True, commit)
 
 	#============================================
@@ -8073,18 +7997,14 @@ class CDMLDocumentSession:
 			return CDMLBondTypeEditResult(self.snapshot(), False, None)
 		if current_type == requested_type:
 			return CDMLBondTypeEditResult(self.snapshot(), False, None)
-		candidate = CDMLDocument.parse(self._document.serialize(), validation="compat")
-		candidate_molecule = _direct_root_molecule(candidate, molecule_id)
-		candidate_bond = _direct_molecule_bond(candidate_molecule, bond_id)
-		candidate_bond.setAttribute("type", "%s%s" % (requested_type, current_order))
-		candidate.validate(validation="strict")
-		candidate_cdml = candidate.serialize()
-		if candidate_cdml == self._document.serialize():
-			return CDMLBondTypeEditResult(self.snapshot(), False, None)
-		commit = self.commit(
-			expected_revision=request.expected_revision,
-			complete_cdml=candidate_cdml,
-		)
+		with self._edit((molecule_id,)) as transaction:
+			candidate = self._document
+			candidate_molecule = _direct_root_molecule(candidate, molecule_id)
+			candidate_bond = _direct_molecule_bond(candidate_molecule, bond_id)
+			candidate_bond.setAttribute("type", "%s%s" % (requested_type, current_order))
+			if transaction.is_noop():
+				return CDMLBondTypeEditResult(self.snapshot(), False, None)
+			commit = self._commit_transaction(transaction, request.expected_revision)
 		return CDMLBondTypeEditResult(commit.snapshot, True, commit)
 
 	#============================================
@@ -8126,28 +8046,24 @@ class CDMLDocumentSession:
 				)
 		if not changes:
 			return CDMLBondPropertiesPatchResult(self.snapshot(), False, None)
-		candidate = CDMLDocument.parse(self._document.serialize(), validation="compat")
-		candidate_molecule = _direct_root_molecule(candidate, molecule_id)
-		candidate_bond = _direct_molecule_bond(candidate_molecule, bond_id)
-		if "order" in change_map or "type" in change_map:
-			candidate_bond.setAttribute("type", "%s%s" % (final_type, final_order))
-		for field_name, value in changes:
-			if field_name in ("order", "type"):
-				continue
-			if field_name == "center":
-				candidate_bond.setAttribute("center", "yes" if value else "no")
-			elif field_name in ("line_width", "bond_width", "wedge_width"):
-				candidate_bond.setAttribute(field_name, "%g" % value)
-			else:
-				candidate_bond.setAttribute("color", value)
-		candidate.validate(validation="strict")
-		candidate_cdml = candidate.serialize()
-		if candidate_cdml == self._document.serialize():
-			return CDMLBondPropertiesPatchResult(self.snapshot(), False, None)
-		commit = self.commit(
-			expected_revision=request.expected_revision,
-			complete_cdml=candidate_cdml,
-		)
+		with self._edit((molecule_id,)) as transaction:
+			candidate = self._document
+			candidate_molecule = _direct_root_molecule(candidate, molecule_id)
+			candidate_bond = _direct_molecule_bond(candidate_molecule, bond_id)
+			if "order" in change_map or "type" in change_map:
+				candidate_bond.setAttribute("type", "%s%s" % (final_type, final_order))
+			for field_name, value in changes:
+				if field_name in ("order", "type"):
+					continue
+				if field_name == "center":
+					candidate_bond.setAttribute("center", "yes" if value else "no")
+				elif field_name in ("line_width", "bond_width", "wedge_width"):
+					candidate_bond.setAttribute(field_name, "%g" % value)
+				else:
+					candidate_bond.setAttribute("color", value)
+			if transaction.is_noop():
+				return CDMLBondPropertiesPatchResult(self.snapshot(), False, None)
+			commit = self._commit_transaction(transaction, request.expected_revision)
 		return CDMLBondPropertiesPatchResult(commit.snapshot, True, commit)
 
 	#============================================
@@ -8158,22 +8074,29 @@ class CDMLDocumentSession:
 			raise CDMLRevisionUnavailableError(
 				f"CDML revision is not retained: {target_revision}",
 		)
-		target_cdml = self._history[target_revision].serialize()
+		target_cdml = self._history[target_revision]
 		restored = CDMLDocument.parse(target_cdml, validation="strict")
 		# Capture the pre-restore current revision before accepting the forward
 		# revision.  The next restore can then redo this exact content.
-		return self._accept_document(restored, {}, redo_revision=self._revision)
+		return self._accept_document(restored, {}, redo_revision=self._revision, cdml=target_cdml)
 
 	#============================================
 	def mark_saved(self, *, expected_revision: int) -> CDMLSnapshot:
 		"""Set the current authoritative content as the clean saved baseline."""
 		self._check_expected_revision(expected_revision)
-		self._saved_cdml = self._document.serialize()
-		self._saved_digest = _content_digest(self._saved_cdml)
+		self._saved_cdml, self._saved_digest = self._current_text_and_digest()
 		self._saved_revision = self._revision
 		self._prune_history()
 		return self.snapshot()
 
+	#============================================
+	def _current_text_and_digest(self) -> tuple[str, str]:
+		"""Return the installed document's text and digest, serializing once."""
+		if self._current_cdml is None:
+			self._current_cdml = self._document.serialize()
+			self._current_digest = _content_digest(self._current_cdml)
+		return self._current_cdml, self._current_digest
+
 	#============================================
 	def _check_expected_revision(self, expected_revision: int) -> None:
 		"""Require optimistic-concurrency callers to name the current revision."""
@@ -8182,6 +8105,60 @@ class CDMLDocumentSession:
 				f"expected revision {expected_revision}, current revision is {self._revision}",
 			)
 
+	#============================================
+	def _observations(self) -> "oasa.cdml_observation_memo.CDMLObservationMemo":
+		"""Return the observation memo shared by queries at the current revision."""
+		import oasa.cdml_observation_memo
+		if self._observation_memo is None or self._observation_memo.revision != self._revision:
+			self._observation_memo = oasa.cdml_observation_memo.CDMLObservationMemo(
+				self._document, self._revision, self._render_batches,
+			)
+		return self._observation_memo
+
+	#============================================
+	def _edit(
+			self, root_ids: collections.abc.Iterable[str] = (), *, every_root: bool = False,
+			) -> "oasa.cdml_transaction.CDMLTransaction":
+		"""Open a copy-on-write transaction over the authoritative document.
+
+		Direct roots named by ``root_ids`` (or every direct root) are copied up
+		front, so the unchanged by-ID lookups in an operation body resolve to the
+		private copies.  Appended or removed direct roots need no declaration.
+		"""
+		import oasa.cdml_transaction
+		root = self._document._dom_document.documentElement
+		index = self._document._id_index()
+		transaction = oasa.cdml_transaction.CDMLTransaction(root, index)
+		wanted_ids = set(root_ids)
+		children = [index.direct_root(identifier) for identifier in wanted_ids]
+		if every_root or None in children:
+			children = [
+				child for child in _element_children(root)
+				if every_root or child.getAttribute("id") in wanted_ids
+			]
+		for child in children:
+			transaction.writable(child)
+		return transaction
+
+	#============================================
+	def _commit_transaction(
+			self, transaction: "oasa.cdml_transaction.CDMLTransaction", expected_revision: int,
+			) -> CDMLCommit:
+		"""Validate only the changed direct roots and accept the edited tree."""
+		self._check_expected_revision(expected_revision)
+		import oasa.cdml_transaction
+		id_map = oasa.cdml_transaction.validated_id_map(self._document, transaction)
+		reused_tokens = set(id_map).intersection(self._consumed_provisional_tokens)
+		if reused_tokens:
+			raise CDMLValidationError(
+				f"provisional correlation token already consumed: {sorted(reused_tokens)[0]}",
+			)
+		transaction.close()
+		# Like ``commit``, an accepted edit starts a new branch and clears redo.
+		commit = self._accept_document(self._document, id_map, redo_revision=None)
+		self._consumed_provisional_tokens.update(id_map)
+		return commit
+
 	#============================================
 	def _accept_document(
 		self,
@@ -8189,15 +8166,24 @@ class CDMLDocumentSession:
 		id_map: dict[str, str],
 		*,
 		redo_revision: int | None,
+		cdml: str | None = None,
 	) -> CDMLCommit:
-		"""Install one already-valid document and retain it under a new revision."""
+		"""Install one already-valid document and retain it under a new revision.
+
+		History keeps immutable serialized text because transactions edit the
+		current DOM in place; a retained DOM would drift with later revisions.
+		"""
 		self._revision += 1
 		self._document = document
-		self._history[self._revision] = document
+		# A restore already holds the exact retained text of its parsed document.
+		self._current_cdml = cdml
+		self._current_digest = None if cdml is None else _content_digest(cdml)
+		self._observation_memo = None
 		self._redo_revision = redo_revision
-		self._prune_history()
 		immutable_id_map = types.MappingProxyType(dict(id_map))
 		commit = CDMLCommit(snapshot=self.snapshot(), id_map=immutable_id_map)
+		self._history.add(self._revision, commit.snapshot.cdml)
+		self._prune_history()
 		return commit
 
 	#============================================
@@ -8206,14 +8192,9 @@ class CDMLDocumentSession:
 		protected_revisions = {self._revision, self._saved_revision}
 		if self._redo_revision is not None:
 			protected_revisions.add(self._redo_revision)
-		while len(self._history) > self._history_capacity:
-			removable_revisions = [
-				revision for revision in sorted(self._history)
-				if revision not in protected_revisions
-			]
-			if not removable_revisions:
-				raise CDMLValidationError("history capacity cannot retain required revisions")
-			del self._history[removable_revisions[0]]
+		if not self._history.prune(
+				self._history_capacity, self._history_budget_bytes, protected_revisions):
+			raise CDMLValidationError("history capacity cannot retain required revisions")
 
 #============================================
 def _content_digest(text: str) -> str:
@@ -0,0 +1,173 @@
+"""Compact retained-revision text store for the CDML backend session.
+
+Accepted revisions are kept as canonical text, not DOM trees.  Each revision is
+either a zlib-compressed keyframe or a compressed splice against the newest
+keyframe: a shared prefix length, a shared suffix length, and the changed
+middle text.  One ordinary edit changes one direct root, so its splice is a
+small fraction of the document and history memory grows with edit size rather
+than with document size times revision count.
+
+The store is a read-only ``Mapping`` from revision number to exact text so
+callers and tests can inspect retained revisions like a plain dict.  Pruning
+policy (which revisions are protected) stays with the session.
+"""
+
+# Standard Library
+import collections.abc
+import zlib
+
+# Fixed per-entry bookkeeping cost counted against the memory budget.
+_ENTRY_OVERHEAD_BYTES = 96
+# A splice larger than this fraction of the full text starts a new keyframe.
+_KEYFRAME_RATIO = 0.5
+
+
+#============================================
+def _common_prefix_length(left: str, right: str) -> int:
+	"""Return the shared prefix length using C-speed slice comparisons."""
+	low = 0
+	high = min(len(left), len(right))
+	while low < high:
+		middle = (low + high + 1) // 2
+		if left[:middle] == right[:middle]:
+			low = middle
+		else:
+			high = middle - 1
+	return low
+
+
+#============================================
+def _common_suffix_length(left: str, right: str, limit: int) -> int:
+	"""Return the shared suffix length, never overlapping ``limit`` characters."""
+	low = 0
+	high = min(len(left), len(right)) - limit
+	while low < high:
+		middle = (low + high + 1) // 2
+		if left[len(left) - middle:] == right[len(right) - middle:]:
+			low = middle
+		else:
+			high = middle - 1
+	return low
+
+
+#============================================
+def _compress(text: str) -> bytes:
+	"""Return compressed UTF-8 bytes for one retained text piece."""
+	return zlib.compress(text.encode("utf-8"), 6)
+
+
+#============================================
+def _decompress(blob: bytes) -> str:
+	"""Return the exact text stored by ``_compress``."""
+	return zlib.decompress(blob).decode("utf-8")
+
+
+#============================================
+class CDMLRevisionHistory(collections.abc.Mapping):
+	"""Retained revision texts stored as keyframes plus prefix/suffix splices."""
+
+	#============================================
+	def __init__(self) -> None:
+		"""Create an empty history store."""
+		# revision -> (keyframe revision, prefix length, suffix length, blob)
+		self._entries: dict[int, tuple[int, int, int, bytes]] = {}
+		# keyframe revision -> compressed complete text
+		self._keyframes: dict[int, bytes] = {}
+		self._keyframe_users: dict[int, int] = {}
+		# Newest keyframe, kept decompressed so new splices need no inflate.
+		self._latest_keyframe: int | None = None
+		self._latest_keyframe_text = ""
+		self._retained_bytes = 0
+
+	#============================================
+	def __getitem__(self, revision: int) -> str:
+		"""Return the exact retained text for one revision."""
+		keyframe, prefix, suffix, blob = self._entries[revision]
+		if keyframe == self._latest_keyframe:
+			base = self._latest_keyframe_text
+		else:
+			base = _decompress(self._keyframes[keyframe])
+		if keyframe == revision:
+			return base
+		text = base[:prefix] + _decompress(blob) + base[len(base) - suffix:]
+		return text
+
+	#============================================
+	def __contains__(self, revision: object) -> bool:
+		"""Return whether one revision is retained without rebuilding its text."""
+		return revision in self._entries
+
+	#============================================
+	def __iter__(self) -> collections.abc.Iterator[int]:
+		"""Iterate retained revisions in ascending order."""
+		return iter(sorted(self._entries))
+
+	#============================================
+	def __len__(self) -> int:
+		"""Return the number of retained revisions."""
+		return len(self._entries)
+
+	#============================================
+	@property
+	def retained_bytes(self) -> int:
+		"""Return the approximate memory held by compressed history content."""
+		return self._retained_bytes
+
+	#============================================
+	def add(self, revision: int, text: str) -> None:
+		"""Retain ``text`` as ``revision``, as a splice when that is compact."""
+		if revision in self._entries:
+			raise ValueError(f"CDML history already retains revision {revision}")
+		if self._latest_keyframe is not None:
+			base = self._latest_keyframe_text
+			prefix = _common_prefix_length(base, text)
+			suffix = _common_suffix_length(base, text, prefix)
+			middle = text[prefix:len(text) - suffix]
+			if len(middle) <= _KEYFRAME_RATIO * len(text):
+				blob = _compress(middle)
+				self._entries[revision] = (self._latest_keyframe, prefix, suffix, blob)
+				self._keyframe_users[self._latest_keyframe] += 1
+				self._retained_bytes += len(blob) + _ENTRY_OVERHEAD_BYTES
+				return
+		blob = _compress(text)
+		self._entries[revision] = (revision, len(text), 0, b"")
+		self._keyframes[revision] = blob
+		self._keyframe_users[revision] = 1
+		self._latest_keyframe = revision
+		self._latest_keyframe_text = text
+		self._retained_bytes += len(blob) + _ENTRY_OVERHEAD_BYTES
+
+	#============================================
+	def discard(self, revision: int) -> None:
+		"""Forget one revision and any keyframe no remaining revision needs."""
+		keyframe, _prefix, _suffix, blob = self._entries.pop(revision)
+		self._retained_bytes -= len(blob) + _ENTRY_OVERHEAD_BYTES
+		self._keyframe_users[keyframe] -= 1
+		if self._keyframe_users[keyframe] > 0:
+			return
+		del self._keyframe_users[keyframe]
+		self._retained_bytes -= len(self._keyframes.pop(keyframe))
+		if keyframe == self._latest_keyframe:
+			self._latest_keyframe = None
+			self._latest_keyframe_text = ""
+
+	#============================================
+	def prune(
+			self, capacity: int, budget_bytes: int | None,
+			protected: collections.abc.Set,
+			) -> bool:
+		"""Drop the oldest unprotected revisions until both bounds hold.
+
+		The byte budget is best-effort: protected revisions always stay even
+		when they alone exceed it.
+
+		Returns:
+			False when protected revisions alone exceed ``capacity``.
+		"""
+		removable = [revision for revision in self if revision not in protected]
+		while len(self._entries) > capacity or (
+				budget_bytes is not None and self._retained_bytes > budget_bytes):
+			if not removable:
+				return len(self._entries) <= capacity
+			self.discard(removable.pop(0))
+		return True
@@ -0,0 +1,373 @@
+"""Durable-ID index over the direct roots of one accepted CDML document.
+
+The index records, for every accepted direct root, its elements in preorder,
+the IDs it defines, and the IDs its known references name.  Accepted roots are
+immutable: a transaction edits private copies and hands the index its retired
+and accepted roots when it closes, so an edit re-indexes only what it changed.
+Roots the index has not accepted (copies and insertions inside an open
+transaction) are scanned on demand instead of cached.
+
+Between transactions the live tree is exactly the accepted roots, so ID sets
+and lookups read the shared counts, the per-ID definer keys, and the preorder
+start of each root, which is rebuilt once after an accepted edit.  While a
+transaction is open, ID sets ask it for the roots it changed and retired.
+"""
+
+# Standard Library
+import collections
+import collections.abc
+
+# local repo modules
+import oasa.cdml_document
+
+
+#============================================
+def _serial_parts(identifier: str) -> tuple[str, int] | None:
+	"""Return the one-character prefix and serial of an allocated-style ID."""
+	digits = identifier[1:]
+	if not digits or not digits.isascii() or not digits.isdigit() or digits[0] == "0":
+		return None
+	return identifier[0], int(digits)
+
+
+#============================================
+class _RootEntry:
+	"""Preorder elements, ID definitions, and references of one direct root."""
+
+	__slots__ = ("root", "elements", "first_offsets", "definitions", "references")
+
+	#============================================
+	def __init__(self, root: object) -> None:
+		"""Scan one direct root subtree once."""
+		cdml = oasa.cdml_document
+		self.root = root
+		self.elements = tuple(cdml._descendant_elements(root))
+		self.first_offsets: dict[str, int] = {}
+		definitions = []
+		references = set()
+		for offset, element in enumerate(self.elements):
+			if cdml._fragment_member_reference(element):
+				references.add(element.getAttribute("id"))
+			else:
+				identifier = element.getAttribute("id")
+				if identifier:
+					definitions.append(identifier)
+				self.first_offsets.setdefault(identifier, offset)
+			for attribute_name in cdml._known_reference_attributes(element):
+				references.add(element.getAttribute(attribute_name))
+		references.discard("")
+		self.definitions = tuple(definitions)
+		self.references = frozenset(references)
+
+
+#============================================
+class DurableIdSet(collections.abc.Set):
+	"""Live durable IDs of one tree, plus IDs a caller claims while editing.
+
+	Membership combines the index's shared definition counts with the roots
+	hidden from or added to this view, so building one costs only the roots
+	an open transaction touched.  The size is kept as IDs are claimed.  The
+	view is valid until its index changes.
+	"""
+
+	#============================================
+	def __init__(
+			self, index: "CDMLIdIndex", hidden: collections.Counter,
+			extra: set[str], caps: dict[str, int],
+			) -> None:
+		"""Bind shared index counts to one caller-owned overlay.
+
+		``caps`` bounds each prefix's first free serial from above where a
+		hidden root released a serial the index still counts as used.
+		"""
+		self._index = index
+		self._counts = index._counts
+		self._hidden = hidden
+		# IDs whose every accepted definition sits in a hidden root.
+		self._gone = frozenset(
+			identifier for identifier, count in hidden.items()
+			if self._counts[identifier] <= count
+		)
+		self._extra = extra
+		self._caps = caps
+		self._cursors: dict[str, int] = {}
+		self._size = len(self._counts) - len(self._gone)
+		self._size += sum(1 for identifier in extra if not self._is_counted(identifier))
+
+	#============================================
+	def _is_counted(self, identifier: object) -> bool:
+		"""Return whether an accepted root outside the hidden ones defines ``identifier``."""
+		return identifier in self._counts and identifier not in self._gone
+
+	#============================================
+	def __contains__(self, identifier: object) -> bool:
+		"""Return whether ``identifier`` is defined or claimed in this view."""
+		return identifier in self._extra or self._is_counted(identifier)
+
+	#============================================
+	def __iter__(self) -> collections.abc.Iterator[str]:
+		"""Yield every ID in this view once."""
+		for identifier in self._counts:
+			if identifier not in self._gone:
+				yield identifier
+		for identifier in self._extra:
+			if not self._is_counted(identifier):
+				yield identifier
+
+	#============================================
+	def __len__(self) -> int:
+		"""Return the number of IDs in this view."""
+		return self._size
+
+	#============================================
+	@classmethod
+	def _from_iterable(cls, iterable: collections.abc.Iterable) -> frozenset:
+		"""Return plain frozensets from the inherited set operators."""
+		return frozenset(iterable)
+
+	#============================================
+	def copy(self) -> "DurableIdSet":
+		"""Return an independent overlay that shares the index counts."""
+		view = DurableIdSet(self._index, self._hidden, set(self._extra), self._caps)
+		view._cursors = dict(self._cursors)
+		return view
+
+	#============================================
+	def add(self, identifier: str) -> None:
+		"""Claim one ID in this view only."""
+		if identifier not in self:
+			self._size += 1
+		self._extra.add(identifier)
+
+	#============================================
+	def update(self, identifiers: collections.abc.Iterable[str]) -> None:
+		"""Claim several IDs in this view only."""
+		for identifier in identifiers:
+			self.add(identifier)
+
+	#============================================
+	def serial_floor(self, prefix: str) -> int:
+		"""Return a serial at or below the lowest free ``prefix`` serial."""
+		if prefix not in self._cursors:
+			floor = self._index.serial_floor(prefix)
+			self._cursors[prefix] = min(floor, self._caps.get(prefix, floor))
+		return self._cursors[prefix]
+
+	#============================================
+	def raise_floor(self, prefix: str, serial: int) -> None:
+		"""Record that every ``prefix`` serial below ``serial`` is used here."""
+		self._cursors[prefix] = serial
+
+
+#============================================
+class CDMLIdIndex:
+	"""Definitions, references, and allocation floors for accepted roots."""
+
+	#============================================
+	def __init__(self, root: object) -> None:
+		"""Index every direct root of one document that is not being edited."""
+		self._root = root
+		self._entries: dict[int, _RootEntry] = {}
+		self._counts: collections.Counter = collections.Counter()
+		self._referrers: dict[str, set[int]] = {}
+		# Map each ID (and "" for unnamed elements) to the roots holding one.
+		self._definers: dict[str, set[int]] = {}
+		self._direct_roots: dict[str, object] = {}
+		self._floors: dict[str, int] = {}
+		# Preorder start of each accepted root by key; None after a change.
+		self._starts: dict[int, int] | None = None
+		self._transaction = None
+		self.replace((), oasa.cdml_document._element_children(root))
+
+	#============================================
+	def begin(self, transaction: object) -> None:
+		"""Record the transaction now editing the indexed tree."""
+		self._transaction = transaction
+
+	#============================================
+	def end(self) -> None:
+		"""Record that the live tree holds only accepted roots again."""
+		self._transaction = None
+
+	#============================================
+	def replace(
+			self, retired: collections.abc.Iterable, accepted: collections.abc.Iterable,
+			) -> None:
+		"""Forget ``retired`` roots and index newly ``accepted`` ones."""
+		self._starts = None
+		for root in retired:
+			entry = self._entries.pop(id(root), None)
+			if entry is None:
+				continue
+			for identifier in entry.first_offsets:
+				self._definers[identifier].discard(id(root))
+			self._counts.subtract(entry.definitions)
+			for identifier in entry.definitions:
+				if self._counts[identifier] <= 0:
+					del self._counts[identifier]
+					self._lower_floor(identifier)
+			for identifier in entry.references:
+				self._referrers[identifier].discard(id(root))
+			root_id = root.getAttribute("id")
+			if self._direct_roots.get(root_id) is root:
+				del self._direct_roots[root_id]
+		for root in accepted:
+			if id(root) in self._entries:
+				continue
+			entry = _RootEntry(root)
+			self._entries[id(root)] = entry
+			self._counts.update(entry.definitions)
+			for identifier in entry.first_offsets:
+				self._definers.setdefault(identifier, set()).add(id(root))
+			for identifier in entry.references:
+				self._referrers.setdefault(identifier, set()).add(id(root))
+			root_id = root.getAttribute("id")
+			if root_id and not self._is_live_root(self._direct_roots.get(root_id), root_id):
+				self._direct_roots[root_id] = root
+
+	#============================================
+	def substitute(self, original: object, replacement: object) -> None:
+		"""Point a direct-root lookup at the node now standing in for ``original``."""
+		root_id = original.getAttribute("id")
+		if root_id and self._direct_roots.get(root_id) is original:
+			self._direct_roots[root_id] = replacement
+
+	#============================================
+	def _is_live_root(self, node: object, identifier: str) -> bool:
+		"""Return whether ``node`` is a current direct root declaring ``identifier``."""
+		return (
+			node is not None and node.parentNode is self._root
+			and node.getAttribute("id") == identifier
+		)
+
+	#============================================
+	def _lower_floor(self, identifier: str) -> None:
+		"""Let allocation reuse a serial that a retired definition released."""
+		parts = _serial_parts(identifier)
+		if parts is not None and parts[1] < self._floors.get(parts[0], 1):
+			self._floors[parts[0]] = parts[1]
+
+	#============================================
+	def serial_floor(self, prefix: str) -> int:
+		"""Return the lowest ``prefix`` serial that no accepted root defines."""
+		floor = self._floors.get(prefix, 1)
+		while f"{prefix}{floor}" in self._counts:
+			floor += 1
+		self._floors[prefix] = floor
+		return floor
+
+	#============================================
+	def _live_entries(self) -> collections.abc.Iterator[tuple[object, _RootEntry, bool]]:
+		"""Yield ``(root, entry, cached)`` for every current direct root in order."""
+		for child in oasa.cdml_document._element_children(self._root):
+			entry = self._entries.get(id(child))
+			if entry is not None and entry.root is child:
+				yield child, entry, True
+			else:
+				yield child, _RootEntry(child), False
+
+	#============================================
+	def _accepted_starts(self) -> dict[int, int]:
+		"""Return the preorder start of every accepted root, by root key."""
+		if self._starts is None:
+			self._starts = {}
+			position = 0
+			for child in oasa.cdml_document._element_children(self._root):
+				self._starts[id(child)] = position
+				position += len(self._entries[id(child)].elements)
+		return self._starts
+
+	#============================================
+	def durable_ids(self, excluded_roots: collections.abc.Iterable = ()) -> DurableIdSet:
+		"""Return the live tree's durable IDs, leaving out ``excluded_roots``."""
+		excluded_roots = tuple(excluded_roots)
+		changed_roots: tuple = ()
+		hidden_keys = set()
+		if self._transaction is not None:
+			changed_roots = self._transaction.changed_roots()
+			hidden_keys.update(id(root) for root in self._transaction.retired_roots())
+		for root in excluded_roots:
+			entry = self._entries.get(id(root))
+			if entry is not None and entry.root is root:
+				hidden_keys.add(id(root))
+		hidden = collections.Counter()
+		for key in hidden_keys:
+			hidden.update(self._entries[key].definitions)
+		excluded = {id(root) for root in excluded_roots}
+		extra = set()
+		for root in changed_roots:
+			if id(root) not in excluded:
+				extra.update(_RootEntry(root).definitions)
+		caps = {}
+		for identifier in hidden:
+			parts = _serial_parts(identifier)
+			if parts is not None and parts[1] < caps.get(parts[0], parts[1] + 1):
+				caps[parts[0]] = parts[1]
+		return DurableIdSet(self, hidden, extra, caps)
+
+	#============================================
+	def direct_root(self, identifier: str) -> object | None:
+		"""Return the live direct root uniquely defining ``identifier``, if known."""
+		root = self._direct_roots.get(identifier)
+		if self._counts[identifier] != 1 or not self._is_live_root(root, identifier):
+			return None
+		return root
+
+	#============================================
+	def find(self, identifier: str) -> tuple[int, object] | None:
+		"""Return the preorder position and element of the first definition."""
+		if self._transaction is None:
+			keys = self._definers.get(identifier)
+			if not keys:
+				return None
+			starts = self._accepted_starts()
+			key = min(keys, key=starts.__getitem__)
+			entry = self._entries[key]
+			offset = entry.first_offsets[identifier]
+			return starts[key] + offset, entry.elements[offset]
+		position = 0
+		for _child, entry, _cached in self._live_entries():
+			offset = entry.first_offsets.get(identifier)
+			if offset is not None:
+				return position + offset, entry.elements[offset]
+			position += len(entry.elements)
+		return None
+
+	#============================================
+	def direct_root_positions(self) -> list[tuple[int, object]]:
+		"""Return ``(preorder position, root)`` for every current direct root."""
+		if self._transaction is None:
+			starts = self._accepted_starts()
+			return [
+				(starts[id(child)], child)
+				for child in oasa.cdml_document._element_children(self._root)
+			]
+		positions = []
+		position = 0
+		for child, entry, _cached in self._live_entries():
+			positions.append((position, child))
+			position += len(entry.elements)
+		return positions
+
+	#============================================
+	def elements(self) -> list:
+		"""Return the document element followed by every element in preorder."""
+		elements = [self._root]
+		for _child, entry, _cached in self._live_entries():
+			elements.extend(entry.elements)
+		return elements
+
+	#============================================
+	def referring_roots(
+			self, identifiers: collections.abc.Iterable[str],
+			excluded_roots: collections.abc.Iterable = (),
+			) -> list:
+		"""Return live accepted roots that reference any of ``identifiers``."""
+		keys = set()
+		for identifier in identifiers:
+			keys.update(self._referrers.get(identifier, ()))
+		keys.difference_update(id(root) for root in excluded_roots)
+		return [
+			child for child in oasa.cdml_document._element_children(self._root)
+			if id(child) in keys and getattr(self._entries.get(id(child)), "root", None) is child
+		]
@@ -0,0 +1,139 @@
+"""Per-molecule paint batches for the CDML molecule render observation.
+
+Painting decodes one molecule and runs the vertex, label-target, and bond
+operation builders over every atom and bond.  The result depends only on the
+molecule element, its core record, and the document background color, so a
+``CDMLMoleculeBatchCache`` keeps them in a bounded LRU map keyed by exactly
+those inputs.  Each document session owns one cache, so an edit that changes
+one molecule repaints that molecule and reuses every other one.
+"""
+
+# Standard Library
+import collections
+import hashlib
+
+# local repo modules
+import oasa.cdml_document
+import oasa.cdml_standard
+import oasa.render_lib.bond_ops
+import oasa.render_lib.data_types
+import oasa.render_lib.molecule_ops
+
+# Molecules whose paint batches one CDMLMoleculeBatchCache keeps across revisions.
+_CACHE_CAPACITY = 512
+
+
+#============================================
+class CDMLMoleculeBatchCache:
+	"""Bounded LRU map from molecule paint inputs to their batches."""
+
+	#============================================
+	def __init__(self, capacity: int = _CACHE_CAPACITY) -> None:
+		"""Start with no painted molecules."""
+		self._capacity = capacity
+		self._batches: collections.OrderedDict = collections.OrderedDict()
+
+	#============================================
+	def molecule_batches(
+			self, molecule: object,
+			core_record: "oasa.cdml_document.CDMLMoleculeCoreObservationRecord", area_color: str,
+			) -> tuple["oasa.cdml_document.CDMLMoleculeRenderBatch", ...]:
+		"""Return one molecule's paint batches, reusing them while its inputs are unchanged.
+
+		The core record already carries the drawing-standard defaults resolved
+		into each atom and bond, plus durable-ID eligibility and source positions;
+		the background color is the one standard value read directly by painting.
+		"""
+		digest = hashlib.sha256(molecule.toxml().encode("utf-8")).digest()
+		key = (digest, molecule.namespaceURI, core_record, area_color)
+		cached = self._batches.get(key)
+		if cached is not None:
+			self._batches.move_to_end(key)
+			return cached
+		batches = _paint_molecule(molecule, core_record, area_color)
+		self._batches[key] = batches
+		while len(self._batches) > self._capacity:
+			self._batches.popitem(last=False)
+		return batches
+
+
+#============================================
+def _paint_molecule(
+		molecule: object, core_record: "oasa.cdml_document.CDMLMoleculeCoreObservationRecord", area_color: str,
+		) -> tuple["oasa.cdml_document.CDMLMoleculeRenderBatch", ...]:
+	"""Build atom and bond paint batches for one renderable direct molecule."""
+	cdml_document = oasa.cdml_document
+	batches = []
+	try:
+		_unused_molecule, atom_by_source, bond_by_source = cdml_document._decode_renderable_molecule_core(
+			molecule, core_record,
+		)
+		atom_entries = [
+			(atom_record, atom_by_source[atom_record.source_position])
+			for atom_record in core_record.atoms if atom_record.renderable
+		]
+		for atom_record, atom in atom_entries:
+			if atom_record.show is False:
+				ops = ()
+			else:
+				marks = atom.properties_.pop("marks", None)
+				color = atom_record.line_color or "__backend_foreground__"
+				ops = oasa.render_lib.molecule_ops.build_vertex_ops(
+					atom, transform_xy=None, show_hydrogens_on_hetero=bool(atom_record.show_hydrogens),
+					color_atoms=True, atom_colors={atom.symbol: color},
+					font_name=atom_record.font_family or "Arial", font_size=atom_record.font_size or 12.0,
+					background_color=area_color or "__backend_document_background__",
+					show_carbon_symbol=atom_record.show is True,
+				)
+				if marks is not None:
+					atom.properties_["marks"] = marks
+			anchor = (float(atom_record.x_pt), float(atom_record.y_pt))
+			batches.append(cdml_document.CDMLMoleculeRenderBatch("atom", core_record.source_position, atom_record.identifier,
+				atom_record.source_position, atom_record.addressable, anchor, None,
+				tuple(cdml_document._render_primitive(op, anchor) for op in ops)))
+		shown, labels, attaches = set(), {}, {}
+		for atom_record, atom in atom_entries:
+			if atom_record.show is False:
+				continue
+			entry_shown, entry_labels, entry_attaches = oasa.render_lib.molecule_ops.build_label_attach_targets(
+				[atom], show_hydrogens_on_hetero=bool(atom_record.show_hydrogens),
+				font_name=atom_record.font_family or "Arial", font_size=atom_record.font_size or 12.0,
+				show_carbon_symbol=atom_record.show is True,
+			)
+			shown.update(entry_shown); labels.update(entry_labels); attaches.update(entry_attaches)
+		bond_entries = [
+			(bond_record, bond_by_source[bond_record.source_position])
+			for bond_record in core_record.bonds if bond_record.renderable
+		]
+		for bond_record, bond in bond_entries:
+			start_atom, end_atom = bond.get_vertices()
+			start, end = (float(start_atom.x), float(start_atom.y)), (float(end_atom.x), float(end_atom.y))
+			context = oasa.render_lib.data_types.BondRenderContext(
+				None, bond_record.line_width if bond_record.line_width is not None else 2.0,
+				bond_record.bond_width if bond_record.bond_width is not None else 6.0,
+				bond_record.wedge_width if bond_record.wedge_width is not None else 9.2,
+				1.2, bond_second_line_shortening=(
+					oasa.cdml_standard.bond_second_line_shortening(bond_record.double_ratio)
+				),
+				shown_vertices=shown,
+				bond_coords={bond: (start, end)}, bond_coords_provider={bond: (start, end)}.get,
+				label_targets=labels, attach_targets=attaches,
+				attach_constraints=oasa.render_lib.data_types.make_attach_constraints(),
+			)
+			previous = oasa.cdml_standard.install_bond_render_values(
+				bond, bond_record.double_ratio, bond_record.line_color,
+			)
+			try:
+				ops = oasa.render_lib.bond_ops.build_bond_ops(bond, start, end, context)
+			finally:
+				oasa.cdml_standard.restore_bond_render_values(bond, previous)
+			batches.append(cdml_document.CDMLMoleculeRenderBatch("bond", core_record.source_position, bond_record.identifier,
+				bond_record.source_position, bond_record.addressable, None, (start, end),
+				tuple(cdml_document._render_primitive(op) for op in ops)))
+	except cdml_document.CDMLMoleculeRenderObservationError:
+		raise
+	except Exception as exc:
+		raise cdml_document.CDMLMoleculeRenderObservationError(
+			"could not prepare molecule render observation: %s" % exc,
+		) from exc
+	return tuple(batches)
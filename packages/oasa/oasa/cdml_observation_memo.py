@@ -0,0 +1,151 @@
+"""Revision-scoped memo of read-only observations over one CDML document.
+
+Every backend observation (presentation stack, paper layout, fragments, marks,
+groups, molecule core, render batches, chemistry facts) is a pure function of
+one accepted document revision.  A memo computes each observation at most once
+for its revision and shares the results between the projection plan and the
+individual session queries.  The molecule-core walk is reused by the render
+and chemistry observations instead of running again inside each of them.
+
+Snapshot-only callers, which hold canonical text rather than a session, may
+own a ``CDMLSnapshotPlanCache``: a small bounded map from exact snapshots to
+their projection plans, so repeating a projection of the same snapshot does
+not reparse its text.
+"""
+
+# Standard Library
+import collections
+
+# local repo modules
+import oasa.cdml_document
+import oasa.cdml_molecule_render
+import oasa.cdml_projection_plan
+
+# Exact snapshots whose projection plans one CDMLSnapshotPlanCache keeps.
+_SNAPSHOT_PLAN_CAPACITY = 4
+
+
+#============================================
+class CDMLObservationMemo:
+	"""Observations of one accepted document revision, each computed once."""
+
+	#============================================
+	def __init__(
+			self, document: object, revision: int,
+			render_batches: "oasa.cdml_molecule_render.CDMLMoleculeBatchCache | None" = None,
+			) -> None:
+		"""Bind the memo to one document that stays unchanged at ``revision``.
+
+		``render_batches`` is the owner's cache of molecule paint batches, which
+		outlives the memo so later revisions reuse unchanged molecules.
+		"""
+		self.document = document
+		self.revision = revision
+		self.render_batches = render_batches
+		self._values: dict[object, object] = {}
+		self._plan: oasa.cdml_projection_plan.CDMLProjectionPlan | None = None
+
+	#============================================
+	def observe(self, function: object) -> object:
+		"""Return ``function(document, revision)``, computing it at most once.
+
+		Observations derived from the molecule core receive the memoized core
+		observation instead of walking every molecule again, and the render
+		observation also receives the owner's paint-batch cache.
+		"""
+		if function in self._values:
+			return self._values[function]
+		cdml_document = oasa.cdml_document
+		if function is cdml_document._molecule_render_observation:
+			core = self.observe(cdml_document._molecule_core_observation)
+			value = function(self.document, self.revision, core=core, batch_cache=self.render_batches)
+		elif function is cdml_document._atom_chemistry_facts_observation:
+			core = self.observe(cdml_document._molecule_core_observation)
+			value = function(self.document, self.revision, core=core)
+		else:
+			value = function(self.document, self.revision)
+		self._values[function] = value
+		return value
+
+	#============================================
+	def projection_plan(self) -> oasa.cdml_projection_plan.CDMLProjectionPlan:
+		"""Collect synchronized facts from the memoized observations."""
+		if self._plan is not None:
+			return self._plan
+		cdml_document = oasa.cdml_document
+		presentation = self.observe(cdml_document._presentation_description)
+		paper = self.observe(cdml_document._paper_layout)
+		fragments = self.observe(cdml_document._fragment_metadata)
+		marks = self.observe(cdml_document._atom_mark_observation)
+		groups = self.observe(cdml_document._group_observation)
+		molecule_core = self.observe(cdml_document._molecule_core_observation)
+		molecule_render = self.observe(cdml_document._molecule_render_observation)
+		presentation_by_position = {record.source_position: record for record in presentation.records}
+		presentation_issues = {issue.source_position: issue for issue in presentation.issues}
+		molecules_by_position = {record.source_position: record for record in molecule_core.records}
+		roots = []
+		root = self.document._dom_document.documentElement
+		for source_position, element in enumerate(cdml_document._element_children(root), 1):
+			tag = cdml_document._local_name(element)
+			identifier = element.getAttribute("id") or None
+			record = presentation_by_position.get(source_position)
+			issue = presentation_issues.get(source_position)
+			molecule = molecules_by_position.get(source_position)
+			if record is not None:
+				disposition, reason = record.disposition, record.reason
+			elif molecule is not None:
+				disposition = "editable" if molecule.addressable else "display-only"
+				reason = molecule.reason
+			elif tag in {"paper", "viewport", "info", "metadata", "standard"}:
+				disposition, reason = "header", None
+			else:
+				disposition = "display-only"
+				reason = issue.reason if issue is not None else "direct root is not projected"
+			roots.append(oasa.cdml_projection_plan.CDMLProjectionRoot(
+				source_position, tag, identifier, disposition, reason,
+			))
+		plan = oasa.cdml_projection_plan.CDMLProjectionPlan(
+			self.revision, tuple(roots), presentation, paper, fragments, marks, groups,
+			molecule_core, molecule_render,
+		)
+		self._plan = plan
+		return plan
+
+
+#============================================
+class CDMLSnapshotPlanCache:
+	"""Bounded map from exact snapshots to their projection plans.
+
+	The key is the complete snapshot value, so equal revision numbers from
+	different sessions never share a plan unless their text also matches.
+	"""
+
+	#============================================
+	def __init__(self, capacity: int = _SNAPSHOT_PLAN_CAPACITY) -> None:
+		"""Start with no cached plans."""
+		self._capacity = capacity
+		self._plans: collections.OrderedDict = collections.OrderedDict()
+		self._render_batches = oasa.cdml_molecule_render.CDMLMoleculeBatchCache()
+
+	#============================================
+	def plan(self, snapshot: object) -> oasa.cdml_projection_plan.CDMLProjectionPlan:
+		"""Return the projection plan of ``snapshot``, parsing it only on a miss."""
+		plan = self._plans.get(snapshot)
+		if plan is not None:
+			self._plans.move_to_end(snapshot)
+			return plan
+		plan = snapshot_projection_plan(snapshot, self._render_batches)
+		self._plans[snapshot] = plan
+		while len(self._plans) > self._capacity:
+			self._plans.popitem(last=False)
+		return plan
+
+
+#============================================
+def snapshot_projection_plan(
+		snapshot: object,
+		render_batches: "oasa.cdml_molecule_render.CDMLMoleculeBatchCache | None" = None,
+		) -> oasa.cdml_projection_plan.CDMLProjectionPlan:
+	"""Parse one exact snapshot and return its projection plan."""
+	document = oasa.cdml_document.CDMLDocument.parse(snapshot.cdml, validation="compat")
+	return CDMLObservationMemo(document, snapshot.revision, render_batches).projection_plan()
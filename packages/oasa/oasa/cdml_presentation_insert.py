@@ -228,8 +228,12 @@ def _cm_text(value: float) -> str:
 #============================================
 def _document_context(
 		session: object, expected_revision: object,
-		) -> tuple[object, object, object]:
-	"""Capture one exact authoritative snapshot and detached validated DOM."""
+		) -> tuple[object, object]:
+	"""Return the authoritative DOM document and root at ``expected_revision``.
+
+	Operations edit this tree only inside a session transaction, which copies
+	what they change and rolls back on any failure.
+	"""
 	if type(session) is not oasa.cdml_document.CDMLDocumentSession:
 		raise CDMLPresentationInsertError(
 			"Presentation insertion requires an exact document session",
@@ -238,43 +242,39 @@ def _document_context(
 		raise CDMLPresentationInsertError(
 			"Presentation insertion expected_revision must be an int",
 		)
-	snapshot = session.snapshot()
-	if snapshot.revision != expected_revision:
+	if session.revision != expected_revision:
 		raise oasa.cdml_document.CDMLRevisionConflictError(
 			"Presentation insertion expected revision does not match current revision",
 		)
-	document = oasa.cdml_xml.parse_cdml_dom(snapshot.cdml.encode("utf-8"))
-	return snapshot, document, document.documentElement
+	document = session._document._dom_document
+	return document, document.documentElement
 
 
 #============================================
 def _insertion_context(
 		session: object, expected_revision: object,
-		) -> tuple[object, object, object, object]:
-	"""Capture exact document context plus its effective drawing standard."""
-	snapshot, document, root = _document_context(session, expected_revision)
+		) -> tuple[object, object, object]:
+	"""Return the authoritative document context plus its effective drawing standard."""
+	document, root = _document_context(session, expected_revision)
 	standard = session.drawing_standard(
-		oasa.cdml_standard.CDMLDrawingStandardQuery(snapshot.revision),
+		oasa.cdml_standard.CDMLDrawingStandardQuery(expected_revision),
 	)
-	return snapshot, standard, document, root
+	return standard, document, root
 
 
 #============================================
 def _commit_root(
-		session: oasa.cdml_document.CDMLDocumentSession,
-		snapshot: oasa.cdml_document.CDMLSnapshot,
-		document: object, root: object, presentation: object, token_kind: str,
+		session: oasa.cdml_document.CDMLDocumentSession, expected_revision: int,
+		presentation: object, token_kind: str,
 		) -> CDMLPresentationInsertResult:
 	"""Append and atomically accept one internally correlated presentation root."""
 	provisional_id = (
-		f"__bkchem_new__presentation-r{snapshot.revision}-{token_kind}"
+		f"__bkchem_new__presentation-r{expected_revision}-{token_kind}"
 	)
 	presentation.setAttribute("id", provisional_id)
-	root.appendChild(presentation)
-	commit = session.commit(
-		expected_revision=snapshot.revision,
-		complete_cdml=document.toxml(),
-	)
+	with session._edit() as transaction:
+		transaction.root.appendChild(presentation)
+		commit = session._commit_transaction(transaction, expected_revision)
 	return CDMLPresentationInsertResult(
 		commit.snapshot, True, commit, (commit.id_map[provisional_id],),
 	)
@@ -286,7 +286,7 @@ def insert_geometric(
 		) -> CDMLPresentationInsertResult:
 	"""Insert one styled geometric root into the authoritative document."""
 	kind, points = _validate_request(request)
-	snapshot, standard, document, root = _insertion_context(
+	standard, document, root = _insertion_context(
 		session, request.expected_revision,
 	)
 	presentation = _element(document, root, kind)
@@ -309,9 +309,7 @@ def insert_geometric(
 		presentation.setAttribute("x2", _cm_text(right))
 		presentation.setAttribute("y2", _cm_text(bottom))
 		presentation.setAttribute("area_color", standard.area_color)
-	return _commit_root(
-		session, snapshot, document, root, presentation, "geometric",
-	)
+	return _commit_root(session, request.expected_revision, presentation, "geometric")
 
 
 #============================================
@@ -350,7 +348,7 @@ def insert_arrow(
 			"Arrow insertion endpoints must be an immutable pair of scene points",
 		)
 	start, end = _endpoints(request.endpoints[0], request.endpoints[1], "Arrow")
-	snapshot, standard, document, root = _insertion_context(
+	standard, document, root = _insertion_context(
 		session, request.expected_revision,
 	)
 	arrow = _element(document, root, "arrow")
@@ -367,7 +365,7 @@ def insert_arrow(
 		point.setAttribute("x", _cm_text(x_coordinate))
 		point.setAttribute("y", _cm_text(y_coordinate))
 		arrow.appendChild(point)
-	return _commit_root(session, snapshot, document, root, arrow, "arrow")
+	return _commit_root(session, request.expected_revision, arrow, "arrow")
 
 
 #============================================
@@ -384,7 +382,7 @@ def insert_text(
 			"Text insertion content must be a nonblank stripped string",
 		)
 	position = _point(request.position, "Text position")
-	snapshot, standard, document, root = _insertion_context(
+	standard, document, root = _insertion_context(
 		session, request.expected_revision,
 	)
 	text = _element(document, root, "text")
@@ -402,7 +400,7 @@ def insert_text(
 	text.appendChild(point)
 	text.appendChild(font)
 	text.appendChild(ftext)
-	return _commit_root(session, snapshot, document, root, text, "text")
+	return _commit_root(session, request.expected_revision, text, "text")
 
 
 #============================================
@@ -415,7 +413,7 @@ def insert_plus(
 			"Plus insertion requires an exact Plus request",
 		)
 	position = _point(request.position, "Plus position")
-	snapshot, standard, document, root = _insertion_context(
+	standard, document, root = _insertion_context(
 		session, request.expected_revision,
 	)
 	plus = _element(document, root, "plus")
@@ -427,7 +425,7 @@ def insert_plus(
 	point.setAttribute("x", _cm_text(position[0]))
 	point.setAttribute("y", _cm_text(position[1]))
 	plus.appendChild(point)
-	return _commit_root(session, snapshot, document, root, plus, "plus")
+	return _commit_root(session, request.expected_revision, plus, "plus")
 
 
 #============================================
@@ -486,7 +484,7 @@ def insert_wavy(
 		raise CDMLPresentationInsertError(
 			"Wavy insertion requires two distinct scene points",
 		)
-	snapshot, standard, document, root = _insertion_context(
+	standard, document, root = _insertion_context(
 		session, request.expected_revision,
 	)
 	polyline = _element(document, root, "polyline")
@@ -499,7 +497,7 @@ def insert_wavy(
 		point.setAttribute("x", _cm_text(x_coordinate))
 		point.setAttribute("y", _cm_text(y_coordinate))
 		polyline.appendChild(point)
-	return _commit_root(session, snapshot, document, root, polyline, "wavy")
+	return _commit_root(session, request.expected_revision, polyline, "wavy")
 
 
 #============================================
@@ -562,9 +560,7 @@ def reorder_presentations(
 		) -> CDMLPresentationReorderResult:
 	"""Reorder durable direct presentation roots while preserving every node slot."""
 	mode, root_ids = _validate_reorder_request(request)
-	snapshot, document, root = _document_context(
-		session, request.expected_revision,
-	)
+	_document, root = _document_context(session, request.expected_revision)
 	if root.namespaceURI not in (None, "", oasa.cdml_xml.CDML_NAMESPACE_URI):
 		raise CDMLPresentationInsertError(
 			"Presentation reorder requires a core CDML root",
@@ -606,13 +602,11 @@ def reorder_presentations(
 		for child in children
 	]
 	if ordered == children:
-		return CDMLPresentationReorderResult(snapshot, False, None)
-	for child in children:
-		root.removeChild(child)
-	for child in ordered:
-		root.appendChild(child)
-	commit = session.commit(
-		expected_revision=snapshot.revision,
-		complete_cdml=document.toxml(),
-	)
+		return CDMLPresentationReorderResult(session.snapshot(), False, None)
+	with session._edit() as transaction:
+		for child in children:
+			root.removeChild(child)
+		for child in ordered:
+			root.appendChild(child)
+		commit = session._commit_transaction(transaction, request.expected_revision)
 	return CDMLPresentationReorderResult(commit.snapshot, True, commit)
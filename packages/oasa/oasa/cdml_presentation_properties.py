@@ -8,7 +8,6 @@ import re
 
 # local repo modules
 import oasa.cdml_document
-import oasa.cdml_xml
 
 
 class CDMLArrowPropertiesPatchError(oasa.cdml_document.CDMLValidationError):
@@ -63,21 +62,6 @@ _FILLABLE_GEOMETRIC_KINDS = frozenset({"rect", "square", "oval", "circle", "poly
 _GEOMETRIC_KINDS = _FILLABLE_GEOMETRIC_KINDS | frozenset({"polyline"})
 
 
-#============================================
-def _authorized_candidate_dom(snapshot_cdml: str, error_type: type[Exception]) -> object:
-	"""Return a detached DOM only after complete CDML authorization.
-
-	Property operations mutate a detached compatibility DOM, but their source is
-	the backend's complete persistent snapshot.  Keep that read behind the same
-	lxml-first CDML policy used by every other active presentation operation.
-	"""
-	try:
-		document = oasa.cdml_xml.parse_cdml_dom(snapshot_cdml.encode("utf-8"))
-	except (UnicodeError, oasa.cdml_xml.CDMLXMLParseError) as error:
-		raise error_type("Presentation properties current CDML cannot be safely parsed") from error
-	return document
-
-
 #============================================
 def _validate_patch(
 		request: object,
@@ -201,9 +185,8 @@ def _arrow_record(session: object, expected_revision: int, arrow_id: str) -> obj
 
 
 #============================================
-def _candidate_arrow(document: object, arrow_id: str) -> object:
-	"""Return the exact direct core Arrow element in one detached candidate."""
-	root = document.documentElement
+def _candidate_arrow(root: object, arrow_id: str) -> object:
+	"""Return the exact direct core Arrow element below one transaction root."""
 	matches = tuple(
 		child for child in root.childNodes
 		if child.nodeType == child.ELEMENT_NODE
@@ -213,7 +196,7 @@ def _candidate_arrow(document: object, arrow_id: str) -> object:
 	)
 	if len(matches) != 1:
 		raise CDMLArrowPropertiesPatchError(
-			"Arrow properties target disappeared from detached candidate",
+			"Arrow properties target disappeared from the edited document",
 		)
 	return matches[0]
 
@@ -228,40 +211,32 @@ def patch_arrow_properties(
 			"Arrow properties requires an exact CDML document session",
 		)
 	arrow_id, changes = _validate_patch(request)
-	snapshot = session.snapshot()
-	if snapshot.revision != request.expected_revision:
+	if session.revision != request.expected_revision:
 		raise oasa.cdml_document.CDMLRevisionConflictError(
 			"Arrow properties expected revision does not match current revision",
 		)
 	record = _arrow_record(session, request.expected_revision, arrow_id)
 	current = _arrow_values(record)
 	if not changes or all(current[field_name] == value for field_name, value in changes):
-		return CDMLArrowPropertiesPatchResult(snapshot, False, None)
-	candidate_dom = _authorized_candidate_dom(snapshot.cdml, CDMLArrowPropertiesPatchError)
-	arrow = _candidate_arrow(candidate_dom, arrow_id)
+		return CDMLArrowPropertiesPatchResult(session.snapshot(), False, None)
 	attribute_names = {
 		"start_head": "start", "end_head": "end", "spline": "spline",
 		"line_width": "width", "color": "color",
 	}
-	for field_name, value in changes:
-		attribute_name = attribute_names[field_name]
-		if field_name in {"start_head", "end_head", "spline"}:
-			text = "yes" if value else "no"
-		elif field_name == "line_width":
-			text = f"{value:g}"
-		else:
-			text = value
-		arrow.setAttribute(attribute_name, text)
-	candidate = oasa.cdml_document.CDMLDocument.parse(
-		candidate_dom.toxml(), validation="compat",
-	)
-	candidate.validate(validation="strict")
-	candidate_cdml = candidate.serialize()
-	if candidate_cdml == snapshot.cdml:
-		return CDMLArrowPropertiesPatchResult(snapshot, False, None)
-	commit = session.commit(
-		expected_revision=request.expected_revision, complete_cdml=candidate_cdml,
-	)
+	with session._edit((arrow_id,)) as transaction:
+		arrow = _candidate_arrow(transaction.root, arrow_id)
+		for field_name, value in changes:
+			attribute_name = attribute_names[field_name]
+			if field_name in {"start_head", "end_head", "spline"}:
+				text = "yes" if value else "no"
+			elif field_name == "line_width":
+				text = f"{value:g}"
+			else:
+				text = value
+			arrow.setAttribute(attribute_name, text)
+		if transaction.is_noop():
+			return CDMLArrowPropertiesPatchResult(session.snapshot(), False, None)
+		commit = session._commit_transaction(transaction, request.expected_revision)
 	return CDMLArrowPropertiesPatchResult(commit.snapshot, True, commit)
 
 
@@ -395,9 +370,8 @@ def _geometric_record(
 
 
 #============================================
-def _candidate_geometric(document: object, presentation_id: str, kind: str) -> object:
-	"""Return the exact direct core geometric element in one detached candidate."""
-	root = document.documentElement
+def _candidate_geometric(root: object, presentation_id: str, kind: str) -> object:
+	"""Return the exact direct core geometric element below one transaction root."""
 	matches = tuple(
 		child for child in root.childNodes
 		if child.nodeType == child.ELEMENT_NODE
@@ -407,7 +381,7 @@ def _candidate_geometric(document: object, presentation_id: str, kind: str) -> o
 	)
 	if len(matches) != 1:
 		raise CDMLGeometricPropertiesPatchError(
-			"Geometric properties target disappeared from detached candidate",
+			"Geometric properties target disappeared from the edited document",
 		)
 	return matches[0]
 
@@ -422,8 +396,7 @@ def patch_geometric_properties(
 			"Geometric properties requires an exact CDML document session",
 		)
 	presentation_id, changes = _validate_geometric_patch(request)
-	snapshot = session.snapshot()
-	if snapshot.revision != request.expected_revision:
+	if session.revision != request.expected_revision:
 		raise oasa.cdml_document.CDMLRevisionConflictError(
 			"Geometric properties expected revision does not match current revision",
 		)
@@ -434,25 +407,18 @@ def patch_geometric_properties(
 			"Geometric properties field is unsupported for this target kind",
 		)
 	if not changes or all(current[field_name] == value for field_name, value in changes):
-		return CDMLGeometricPropertiesPatchResult(snapshot, False, None)
-	candidate_dom = _authorized_candidate_dom(snapshot.cdml, CDMLGeometricPropertiesPatchError)
-	element = _candidate_geometric(candidate_dom, presentation_id, record.kind)
+		return CDMLGeometricPropertiesPatchResult(session.snapshot(), False, None)
 	attribute_names = {
 		"line_width": "width", "line_color": "line_color", "area_color": "area_color",
 	}
-	for field_name, value in changes:
-		text = "none" if field_name == "area_color" and value is None else value
-		if field_name == "line_width":
-			text = f"{value:g}"
-		element.setAttribute(attribute_names[field_name], text)
-	candidate = oasa.cdml_document.CDMLDocument.parse(
-		candidate_dom.toxml(), validation="compat",
-	)
-	candidate.validate(validation="strict")
-	candidate_cdml = candidate.serialize()
-	if candidate_cdml == snapshot.cdml:
-		return CDMLGeometricPropertiesPatchResult(snapshot, False, None)
-	commit = session.commit(
-		expected_revision=request.expected_revision, complete_cdml=candidate_cdml,
-	)
+	with session._edit((presentation_id,)) as transaction:
+		element = _candidate_geometric(transaction.root, presentation_id, record.kind)
+		for field_name, value in changes:
+			text = "none" if field_name == "area_color" and value is None else value
+			if field_name == "line_width":
+				text = f"{value:g}"
+			element.setAttribute(attribute_names[field_name], text)
+		if transaction.is_noop():
+			return CDMLGeometricPropertiesPatchResult(session.snapshot(), False, None)
+		commit = session._commit_transaction(transaction, request.expected_revision)
 	return CDMLGeometricPropertiesPatchResult(commit.snapshot, True, commit)
@@ -601,26 +601,23 @@ def apply_session(session: object, request: object, commit_type: object) -> obje
 	session._check_expected_revision(request.expected_revision)
 	if not changes and not override_fields:
 		return commit_type(session.snapshot(), types.MappingProxyType({}))
-	current_cdml = session._document.serialize()
-	candidate = session._document.__class__.parse(current_cdml, validation="compat")
-	root = candidate._dom_document.documentElement
-	apply_patch(root, changes)
-	values = observe(root, request.expected_revision)
-	if changes:
-		values = dataclasses.replace(values, **dict(changes))
-	fields = frozenset(override_fields)
-	for element in _application_roots(root, apply_scope, root_ids):
-		if _local_name(element) == "molecule":
-			_apply_molecule_overrides(element, values, fields)
-		else:
-			_apply_presentation_overrides(element, values, fields)
-	candidate.validate(validation="strict")
-	candidate_cdml = candidate.serialize()
-	if candidate_cdml == current_cdml:
-		return commit_type(session.snapshot(), types.MappingProxyType({}))
-	return session.commit(
-		expected_revision=request.expected_revision, complete_cdml=candidate_cdml,
-	)
+	with session._edit() as transaction:
+		root = transaction.root
+		_writable_standard(transaction)
+		apply_patch(root, changes)
+		values = observe(root, request.expected_revision)
+		if changes:
+			values = dataclasses.replace(values, **dict(changes))
+		fields = frozenset(override_fields)
+		for element in _application_roots(root, apply_scope, root_ids):
+			element = transaction.writable(element)
+			if _local_name(element) == "molecule":
+				_apply_molecule_overrides(element, values, fields)
+			else:
+				_apply_presentation_overrides(element, values, fields)
+		if transaction.is_noop():
+			return commit_type(session.snapshot(), types.MappingProxyType({}))
+		return session._commit_transaction(transaction, request.expected_revision)
 
 
 #============================================
@@ -632,16 +629,20 @@ def patch_session(session: object, request: object, commit_type: object) -> obje
 	session._check_expected_revision(request.expected_revision)
 	if not changes:
 		return commit_type(session.snapshot(), types.MappingProxyType({}))
-	current_cdml = session._document.serialize()
-	candidate = session._document.__class__.parse(current_cdml, validation="compat")
-	apply_patch(candidate._dom_document.documentElement, changes)
-	candidate.validate(validation="strict")
-	candidate_cdml = candidate.serialize()
-	if candidate_cdml == current_cdml:
-		return commit_type(session.snapshot(), types.MappingProxyType({}))
-	return session.commit(
-		expected_revision=request.expected_revision, complete_cdml=candidate_cdml,
-	)
+	with session._edit() as transaction:
+		_writable_standard(transaction)
+		apply_patch(transaction.root, changes)
+		if transaction.is_noop():
+			return commit_type(session.snapshot(), types.MappingProxyType({}))
+		return session._commit_transaction(transaction, request.expected_revision)
+
+
+#============================================
+def _writable_standard(transaction: object) -> None:
+	"""Copy an existing direct standard record before a transaction patches it."""
+	standard = _direct_element(transaction.root, "standard")
+	if standard is not None:
+		transaction.writable(standard)
 
 
 #============================================
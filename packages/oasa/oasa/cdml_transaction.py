@@ -0,0 +1,280 @@
+"""Copy-on-write edit transactions over one accepted complete-CDML DOM.
+
+A transaction lets a backend operation edit the authoritative tree in place
+without first serializing and re-parsing the whole document.  Each direct root
+that an operation intends to change is cloned on first write and swapped into
+the tree, so the accepted original stays detached and intact.  Rolling back
+swaps the originals back and restores the exact direct-child sequence.
+
+Acceptance checks only the changed direct roots: untouched roots were already
+strict-valid at the previous revision and contribute just their durable IDs,
+read from the document's durable-ID index.  Closing a transaction hands that
+index the retired and accepted roots.  Revision and history policy stay with
+the document session.
+"""
+
+# local repo modules
+import oasa.cdml_document
+import oasa.cdml_xml
+
+
+#============================================
+def _direct_root(root: object, node: object) -> object:
+	"""Return the direct child of ``root`` that contains ``node``."""
+	current = node
+	while current is not None and current.parentNode is not root:
+		current = current.parentNode
+	if current is None:
+		raise ValueError("transaction node is not inside the accepted document")
+	return current
+
+
+#============================================
+def _child_path(ancestor: object, node: object) -> tuple[int, ...]:
+	"""Return child-node indexes that lead from ``ancestor`` down to ``node``."""
+	indexes = []
+	current = node
+	while current is not ancestor:
+		parent = current.parentNode
+		indexes.append(parent.childNodes.index(current))
+		current = parent
+	path = tuple(reversed(indexes))
+	return path
+
+
+#============================================
+def _follow_path(ancestor: object, path: tuple[int, ...]) -> object:
+	"""Return the node reached by following child indexes from ``ancestor``."""
+	current = ancestor
+	for index in path:
+		current = current.childNodes[index]
+	return current
+
+
+#============================================
+class CDMLTransaction:
+	"""One copy-on-write edit of the direct roots below an accepted CDML root.
+
+	Use the transaction as a context manager.  Leaving the block without
+	``close()`` (an exception, a validation failure, or an early no-op return)
+	rolls the accepted tree back to its exact starting state.
+	"""
+
+	#============================================
+	def __init__(self, root: object, index: object | None = None) -> None:
+		"""Record the direct-child sequence of one accepted document root.
+
+		``index`` is the document's ``CDMLIdIndex``; it follows copied roots and
+		learns the accepted tree on ``close()``; while open, it asks this
+		transaction which roots changed.
+		"""
+		self.root = root
+		self.index = index
+		self._initial_children = tuple(root.childNodes)
+		self._initial_ids = frozenset(id(child) for child in self._initial_children)
+		# Map id(copy) -> (copy, original) for each root cloned on first write.
+		self._copies: dict[int, tuple[object, object]] = {}
+		self._originals: set[int] = set()
+		self._closed = False
+		if index is not None:
+			index.begin(self)
+
+	#============================================
+	def __enter__(self) -> "CDMLTransaction":
+		"""Return this open transaction for one edit block."""
+		return self
+
+	#============================================
+	def __exit__(self, exc_type: object, exc_value: object, traceback: object) -> bool:
+		"""Roll back any edit that was not explicitly closed as accepted."""
+		if not self._closed:
+			self.rollback()
+		return False
+
+	#============================================
+	def writable(self, node: object) -> object:
+		"""Return the private copy of ``node`` that this transaction may mutate.
+
+		The first write below an accepted direct root clones that complete root
+		subtree and installs the clone in the original root's position.  Later
+		calls for nodes below the same root, or for nodes in roots inserted by
+		this transaction, return the node itself.
+		"""
+		if self._closed:
+			raise ValueError("transaction is already closed")
+		direct_root = _direct_root(self.root, node)
+		if id(direct_root) in self._copies or id(direct_root) not in self._initial_ids:
+			return node
+		if id(direct_root) in self._originals:
+			raise ValueError("transaction node belongs to a retired original root")
+		path = _child_path(direct_root, node)
+		copy = direct_root.cloneNode(True)
+		self.root.replaceChild(copy, direct_root)
+		self._copies[id(copy)] = (copy, direct_root)
+		if self.index is not None:
+			self.index.substitute(direct_root, copy)
+		self._originals.add(id(direct_root))
+		writable_node = _follow_path(copy, path)
+		return writable_node
+
+	#============================================
+	def replace_changed(self, changed_root: object, replacement: object) -> None:
+		"""Swap one changed direct root for an equivalent replacement node."""
+		if self._closed:
+			raise ValueError("transaction is already closed")
+		entry = self._copies.pop(id(changed_root), None)
+		self.root.replaceChild(replacement, changed_root)
+		if self.index is not None:
+			self.index.substitute(changed_root, replacement)
+		if entry is not None:
+			self._copies[id(replacement)] = (replacement, entry[1])
+
+	#============================================
+	def changed_roots(self) -> tuple[object, ...]:
+		"""Return copied and newly inserted direct element roots in document order."""
+		changed = tuple(
+			child for child in self.root.childNodes
+			if child.nodeType == child.ELEMENT_NODE
+			and (id(child) in self._copies or id(child) not in self._initial_ids)
+		)
+		return changed
+
+	#============================================
+	def untouched_roots(self) -> tuple[object, ...]:
+		"""Return accepted direct element roots that this transaction left shared."""
+		untouched = tuple(
+			child for child in self.root.childNodes
+			if child.nodeType == child.ELEMENT_NODE
+			and id(child) in self._initial_ids
+		)
+		return untouched
+
+	#============================================
+	def retired_roots(self) -> tuple[object, ...]:
+		"""Return accepted originals that were copied or removed by this transaction."""
+		present = {id(child) for child in self.root.childNodes}
+		retired = tuple(
+			child for child in self._initial_children
+			if child.nodeType == child.ELEMENT_NODE
+			and (id(child) in self._originals or id(child) not in present)
+		)
+		return retired
+
+	#============================================
+	def is_noop(self) -> bool:
+		"""Return whether the edited tree serializes exactly like the accepted tree."""
+		current = tuple(self.root.childNodes)
+		if len(current) != len(self._initial_children):
+			return False
+		for child, initial in zip(current, self._initial_children):
+			if child is initial:
+				continue
+			entry = self._copies.get(id(child))
+			if entry is None or entry[1] is not initial:
+				return False
+			if child.toxml() != initial.toxml():
+				return False
+		return True
+
+	#============================================
+	def close(self) -> None:
+		"""Accept the edited tree and release the retained originals."""
+		if self.index is not None:
+			self.index.replace(self.retired_roots(), self.changed_roots())
+			self.index.end()
+		self._copies.clear()
+		self._originals.clear()
+		self._closed = True
+
+	#============================================
+	def rollback(self) -> None:
+		"""Restore the exact accepted direct-child sequence and original roots."""
+		for copy, original in tuple(self._copies.values()):
+			if copy.parentNode is self.root:
+				self.root.replaceChild(original, copy)
+			if self.index is not None:
+				self.index.substitute(copy, original)
+		self._copies.clear()
+		self._originals.clear()
+		for child in tuple(self.root.childNodes):
+			if id(child) not in self._initial_ids:
+				self.root.removeChild(child)
+		if tuple(self.root.childNodes) != self._initial_children:
+			# Removed or reordered accepted children: rebuild the exact sequence.
+			for child in tuple(self.root.childNodes):
+				self.root.removeChild(child)
+			for child in self._initial_children:
+				self.root.appendChild(child)
+		if self.index is not None:
+			self.index.end()
+		self._closed = True
+
+
+#============================================
+def _reparsed_direct_root(document: object, element: object) -> object:
+	"""Return ``element`` exactly as a fresh parse would store it below the root.
+
+	Transaction edits build DOM nodes directly, so attribute order and literal
+	whitespace can differ from what the accepted text reads back as.  Re-reading
+	only the changed root keeps history text exact without a whole-document trip.
+	"""
+	root = document._dom_document.documentElement
+	open_tag = root.cloneNode(False).toxml()[:-2] + ">"
+	try:
+		source = f"{open_tag}{element.toxml()}</{root.tagName}>".encode("utf-8")
+		parsed_root = oasa.cdml_xml.parse_cdml_dom(source).documentElement
+	except (UnicodeError, oasa.cdml_xml.CDMLXMLParseError) as error:
+		raise oasa.cdml_document.CDMLParseError(f"CDML XML parse failed: {error}") from error
+	parsed = oasa.cdml_document._element_children(parsed_root)[0]
+	return document._dom_document.importNode(parsed, True)
+
+
+#============================================
+def _definition_ids(elements: list) -> set[str]:
+	"""Return nonempty durable ID definitions found in ``elements``."""
+	identifiers = {
+		element.getAttribute("id") for element in elements
+		if oasa.cdml_document._is_id_definition(element) and element.getAttribute("id")
+	}
+	return identifiers
+
+
+#============================================
+def validated_id_map(document: object, transaction: CDMLTransaction) -> dict[str, str]:
+	"""Allocate provisional IDs and strict-check only the transaction's changes.
+
+	References held by untouched roots are rechecked only when the transaction
+	retired a durable definition that no longer exists anywhere in the tree,
+	and then only in the roots the index records as referring to it.
+
+	Returns:
+		The provisional-token to durable-ID map for this edit.
+	"""
+	descendants = oasa.cdml_document._descendant_elements
+	for changed_root in transaction.changed_roots():
+		transaction.replace_changed(changed_root, _reparsed_direct_root(document, changed_root))
+	changed_roots = transaction.changed_roots()
+	changed_elements = [element for root in changed_roots for element in descendants(root)]
+	index = transaction.index if transaction.index is not None else document._id_index()
+	outside_ids = index.durable_ids(changed_roots)
+	id_map = oasa.cdml_document._assign_provisional_ids(
+		changed_roots, changed_elements, outside_ids,
+	)
+	issues = oasa.cdml_document._strict_issues(changed_elements, outside_ids)
+	defined_ids = outside_ids.copy()
+	defined_ids.update(_definition_ids(changed_elements))
+	retired_ids = _definition_ids([
+		element for root in transaction.retired_roots() for element in descendants(root)
+	])
+	missing_ids = {identifier for identifier in retired_ids if identifier not in defined_ids}
+	if missing_ids:
+		referring_elements = [
+			element for root in index.referring_roots(missing_ids, changed_roots)
+			for element in descendants(root)
+		]
+		issues.extend(oasa.cdml_document._reference_issues(referring_elements, defined_ids))
+	if issues:
+		raise oasa.cdml_document.CDMLValidationError(
+			"; ".join(issue.message for issue in issues),
+		)
+	return id_map
@@ -288,9 +288,8 @@ def _parse_root(source: bytes) -> object:
 
 
 #============================================
-def parse_cdml_dom(source: bytes) -> object:
-	"""Authorize complete CDML then return defused minidom storage for the same bytes."""
-	_parse_root(source)
+def _authorized_dom(source: bytes) -> object:
+	"""Return defused minidom storage for bytes that ``_parse_root`` accepted."""
 	try:
 		document = oasa.safe_xml.parse_dom_from_string(source)
 	except (ValueError, xml.parsers.expat.ExpatError) as error:
@@ -298,16 +297,28 @@ def parse_cdml_dom(source: bytes) -> object:
 	return document
 
 
+#============================================
+def parse_cdml_dom(source: bytes) -> object:
+	"""Authorize complete CDML then return defused minidom storage for the same bytes."""
+	_parse_root(source)
+	document = _authorized_dom(source)
+	return document
+
+
 #============================================
 def inspect_cdml_xml(source: bytes) -> CDMLXMLInspection:
 	"""Return node-free root metadata and semantic preservation content for CDML bytes."""
 	root = _parse_root(source)
-	document = parse_cdml_dom(source)
 	namespace, local_name = _expanded_name(root.tag)
+	version = root.get("version")
+	# Authorize once and release the lxml tree before the DOM is built, so
+	# the two trees are never alive together.
+	del root
+	document = _authorized_dom(source)
 	inspection = CDMLXMLInspection(
 		local_name=local_name,
 		namespace=namespace,
-		version=root.get("version"),
+		version=version,
 		semantic_fingerprint=_document_fingerprint(document),
 	)
 	return inspection
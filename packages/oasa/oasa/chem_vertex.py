@@ -18,6 +18,7 @@
 #--------------------------------------------------------------------------
 
 from oasa.graph.vertex_lib import Vertex as vertex
+from oasa.graph.revision import next_revision
 from oasa import periodic_table as PT
 
 
@@ -31,6 +32,7 @@ class ChemVertex(vertex):
   It should not be instantiated directly, but rather inherited from.
   """
   attrs_to_copy = vertex.attrs_to_copy + ("charge","x","y","z","multiplicity","valency","charge","free_sites")
+  __slots__ = ("_charge", "_free_sites", "x", "y", "z", "_multiplicity", "_valency")
 
   def __init__( self, coords: object=None) -> None:
     vertex.__init__( self)
@@ -82,6 +84,7 @@ class ChemVertex(vertex):
   @charge.setter
   def charge(self, charge: object) -> None:
     self._clean_cache()
+    self._revision = next_revision()
     self._charge = charge
 
 
@@ -96,6 +99,7 @@ class ChemVertex(vertex):
   @multiplicity.setter
   def multiplicity(self, multiplicity: object) -> None:
     self._clean_cache()
+    self._revision = next_revision()
     self._multiplicity = multiplicity
 
 
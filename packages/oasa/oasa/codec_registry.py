@@ -19,6 +19,7 @@
 
 # Standard Library
 import io
+import importlib
 
 
 _CODECS = {}
@@ -46,6 +47,8 @@ class Codec(object):
 		file_to_document: object=None,
 		read_extensions: object=None,
 		write_extensions: object=None,
+		file_to_mols: object=None,
+		open_mol_writer: object=None,
 	) -> None:
 		self.name = _normalize_name(name)
 		if not self.name:
@@ -66,17 +69,38 @@ class Codec(object):
 				text_to_document = getattr(module, "text_to_document", None)
 			if file_to_document is None:
 				file_to_document = getattr(module, "file_to_document", None)
+			if file_to_mols is None:
+				file_to_mols = getattr(module, "file_to_mols", None)
+			if open_mol_writer is None:
+				open_mol_writer = getattr(module, "open_mol_writer", None)
 		self.text_to_mol = text_to_mol
 		self.mol_to_text = mol_to_text
 		self.file_to_mol = file_to_mol
 		self.mol_to_file = mol_to_file
 		self.text_to_document = text_to_document
 		self.file_to_document = file_to_document
-		self.reads_text = bool(self.text_to_mol)
-		self.writes_text = bool(self.mol_to_text)
-		self.reads_files = bool(self.file_to_mol or self.text_to_mol)
-		self.writes_files = bool(self.mol_to_file or self.mol_to_text)
-		self.reads_documents = bool(self.file_to_document or self.text_to_document)
+		# per-record streaming: an iterator of molecules and an incremental sink
+		self.file_to_mols = file_to_mols
+		self.open_mol_writer = open_mol_writer
+		self._set_capabilities(read_extensions, write_extensions)
+
+
+	#============================================
+	def _provides(self, field: str) -> bool:
+		"""Return True when the codec has the ``field`` callable."""
+		return bool(getattr(self, field))
+
+
+	#============================================
+	def _set_capabilities(self, read_extensions: object, write_extensions: object) -> None:
+		"""Derive the capability flags and per-direction extensions."""
+		self.reads_text = self._provides("text_to_mol")
+		self.writes_text = self._provides("mol_to_text")
+		self.reads_files = self._provides("file_to_mol") or self.reads_text
+		self.writes_files = self._provides("mol_to_file") or self.writes_text
+		self.reads_documents = self._provides("file_to_document") or self._provides("text_to_document")
+		self.reads_records = self._provides("file_to_mols")
+		self.writes_records = self._provides("open_mol_writer")
 		self.read_extensions = _normalize_extensions(
 			read_extensions if read_extensions is not None else (
 				self.extensions if self.reads_files or self.reads_documents else ()
@@ -105,6 +129,14 @@ class Codec(object):
 		return self.text_to_mol(file_obj.read(), **kwargs)
 
 
+	#============================================
+	def iter_file(self, file_obj: object, **kwargs) -> object:
+		"""Iterate over the molecules of a multi-record file one at a time."""
+		if not self.file_to_mols:
+			raise ValueError(f"Codec '{self.name}' does not support record streaming.")
+		return self.file_to_mols(file_obj, **kwargs)
+
+
 	#============================================
 	def read_document(self, text: object, **kwargs) -> str:
 		"""Read one complete persistent document as frontend-neutral text."""
@@ -130,6 +162,14 @@ class Codec(object):
 		return self.mol_to_text(mol, **kwargs)
 
 
+	#============================================
+	def open_writer(self, file_obj: object, **kwargs) -> object:
+		"""Return a sink whose ``write(mol)`` appends one record to ``file_obj``."""
+		if not self.open_mol_writer:
+			raise ValueError(f"Codec '{self.name}' does not support record streaming.")
+		return self.open_mol_writer(file_obj, **kwargs)
+
+
 	#============================================
 	def write_file(self, mol: object, file_obj: object, **kwargs) -> object:
 		if self.mol_to_file:
@@ -143,6 +183,99 @@ class Codec(object):
 			file_obj.write(text.encode("utf-8"))
 
 
+# callables a codec can provide
+_CODEC_CALLABLES = (
+	"text_to_mol",
+	"mol_to_text",
+	"file_to_mol",
+	"mol_to_file",
+	"text_to_document",
+	"file_to_document",
+	"file_to_mols",
+	"open_mol_writer",
+)
+
+# the callables of a plain module codec
+_MODULE_CALLABLES = ("text_to_mol", "mol_to_text", "file_to_mol", "mol_to_file")
+
+
+#============================================
+class LazyCodec(Codec):
+	"""Codec whose callables are imported on first use.
+
+	``callables`` maps codec fields such as ``text_to_mol`` to
+	``"package.module:attribute"`` targets. Name, extensions, description,
+	and capability flags come from the declaration alone, so listing codecs
+	and taking registry snapshots import nothing. The first access to a
+	callable or to ``module`` imports the target modules and resolves every
+	callable at once.
+	"""
+
+	def __init__(
+		self,
+		name: object,
+		callables: dict,
+		module_name: str | None = None,
+		extensions: object=None,
+		description: object=None,
+		read_extensions: object=None,
+		write_extensions: object=None,
+	) -> None:
+		self.name = _normalize_name(name)
+		if not self.name:
+			raise ValueError("Codec name is required.")
+		unknown = set(callables) - set(_CODEC_CALLABLES)
+		if unknown:
+			raise ValueError(f"Unknown codec callables: {sorted(unknown)}")
+		self.module_name = module_name
+		self.description = description or ""
+		self.extensions = _normalize_extensions(extensions)
+		self._targets = dict(callables)
+		self._set_capabilities(read_extensions, write_extensions)
+
+
+	#============================================
+	def _provides(self, field: str) -> bool:
+		return field in self._targets
+
+
+	#============================================
+	@property
+	def loaded(self) -> bool:
+		"""True once the codec modules have been imported."""
+		return "text_to_mol" in self.__dict__
+
+
+	#============================================
+	def __getattr__(self, attr: str) -> object:
+		# only reached for attributes not set yet: the lazy callables and module
+		if attr != "module" and attr not in _CODEC_CALLABLES:
+			raise AttributeError(attr)
+		if "_targets" not in self.__dict__:
+			raise AttributeError(attr)
+		self._load()
+		return self.__dict__[attr]
+
+
+	#============================================
+	def _load(self) -> None:
+		"""Import the target modules and bind every callable."""
+		for field in _CODEC_CALLABLES:
+			target = self._targets.get(field)
+			value = None
+			if target:
+				module_name, _sep, attribute = target.partition(":")
+				value = getattr(importlib.import_module(module_name), attribute)
+			setattr(self, field, value)
+		self.module = importlib.import_module(self.module_name) if self.module_name else None
+
+
+#============================================
+def _module_callables(module_name: str, fields: tuple = _MODULE_CALLABLES) -> dict:
+	"""Return lazy targets for same-named callables of one module."""
+	return {field: f"{module_name}:{field}" for field in fields}
+
+
 #============================================
 def register_codec(codec: object, aliases: object=None, replace: object=False) -> object:
 	name = _normalize_name(codec.name)
@@ -255,112 +388,102 @@ def _normalize_extensions(extensions: object) -> list:
 
 #============================================
 def _ensure_defaults_registered() -> None:
+	"""Register the built-in codecs as lazy declarations; nothing is imported."""
 	global _DEFAULTS_REGISTERED
 	if _DEFAULTS_REGISTERED:
 		return
-	from oasa import cdml
-	from oasa import cdml_writer
-	from oasa import inchi_lib as inchi
-	from oasa import molfile_lib as molfile
-	from oasa import smiles_lib as smiles
-	from oasa.codecs import cdxml
-	from oasa.codecs import cdsvg
-	from oasa.codecs import cml
-	from oasa.codecs import cml2
-	from oasa.codecs import render
-
-	register_module_codec(
-		"smiles",
-		smiles,
-		extensions=[".smi", ".smiles"],
+	register_codec(
+		LazyCodec(
+			name="smiles",
+			module_name="oasa.smiles_lib",
+			callables=_module_callables("oasa.smiles_lib"),
+			extensions=[".smi", ".smiles"],
+		),
 		aliases=["s"],
 	)
-	register_module_codec(
-		"inchi",
-		inchi,
-		extensions=[".inchi", ".txt"],
+	register_codec(
+		LazyCodec(
+			name="inchi",
+			module_name="oasa.inchi_lib",
+			callables=_module_callables("oasa.inchi_lib"),
+			extensions=[".inchi", ".txt"],
+		),
 		aliases=["i"],
 	)
-	register_module_codec(
-		"molfile",
-		molfile,
-		extensions=[".mol"],
+	register_codec(
+		LazyCodec(
+			name="molfile",
+			module_name="oasa.molfile_lib",
+			callables=_module_callables("oasa.molfile_lib"),
+			extensions=[".mol"],
+		),
 		aliases=["m"],
 	)
 	register_codec(
-		Codec(
+		LazyCodec(
 			name="cdml",
-			text_to_mol=cdml.text_to_mol,
-			mol_to_text=cdml_writer.mol_to_text,
-			file_to_mol=cdml.file_to_mol,
-			mol_to_file=cdml_writer.mol_to_file,
+			callables={
+				"text_to_mol": "oasa.cdml:text_to_mol",
+				"mol_to_text": "oasa.cdml_writer:mol_to_text",
+				"file_to_mol": "oasa.cdml:file_to_mol",
+				"mol_to_file": "oasa.cdml_writer:mol_to_file",
+			},
 			extensions=[".cdml"],
 		),
 		aliases=["c"],
 	)
 	register_codec(
-		Codec(
+		LazyCodec(
 			name="cml",
 			# Keep import-only by wiring read callables explicitly.
-			# Do not switch to register_module_codec() for legacy CML codecs.
-			text_to_mol=cml.text_to_mol,
-			file_to_mol=cml.file_to_mol,
+			# Do not switch to _module_callables() for legacy CML codecs.
+			callables={
+				"text_to_mol": "oasa.codecs.cml:text_to_mol",
+				"file_to_mol": "oasa.codecs.cml:file_to_mol",
+			},
 			extensions=[".cml", ".xml"],
 		),
 	)
 	register_codec(
-		Codec(
+		LazyCodec(
 			name="cml2",
 			# Keep import-only by wiring read callables explicitly.
-			text_to_mol=cml2.text_to_mol,
-			file_to_mol=cml2.file_to_mol,
+			callables={
+				"text_to_mol": "oasa.codecs.cml2:text_to_mol",
+				"file_to_mol": "oasa.codecs.cml2:file_to_mol",
+			},
 			extensions=[],
 		),
 		aliases=["cml-2"],
 	)
-	register_module_codec(
-		"cdxml",
-		cdxml,
-		extensions=[".cdxml"],
-	)
-	register_codec(
-		Codec(
-			name="svg",
-			mol_to_file=render.svg_mol_to_file,
-			extensions=[".svg"],
-		),
-	)
-	register_codec(
-		Codec(
-			name="pdf",
-			mol_to_file=render.pdf_mol_to_file,
-			extensions=[".pdf"],
-		),
-	)
 	register_codec(
-		Codec(
-			name="png",
-			mol_to_file=render.png_mol_to_file,
-			extensions=[".png"],
+		LazyCodec(
+			name="cdxml",
+			module_name="oasa.codecs.cdxml",
+			callables=_module_callables("oasa.codecs.cdxml"),
+			extensions=[".cdxml"],
 		),
 	)
+	for name, extension, aliases in (
+		("svg", ".svg", None),
+		("pdf", ".pdf", None),
+		("png", ".png", None),
+		("ps", ".ps", ["postscript"]),
+	):
+		register_codec(
+			LazyCodec(
+				name=name,
+				callables={"mol_to_file": f"oasa.codecs.render:{name}_mol_to_file"},
+				extensions=[extension],
+			),
+			aliases=aliases,
+		)
 	register_codec(
-		Codec(
-			name="ps",
-			mol_to_file=render.ps_mol_to_file,
-			extensions=[".ps"],
-		),
-		aliases=["postscript"],
-	)
-	register_codec(
-		Codec(
+		LazyCodec(
 			name="cdsvg",
-			text_to_mol=cdsvg.text_to_mol,
-			mol_to_text=cdsvg.mol_to_text,
-			file_to_mol=cdsvg.file_to_mol,
-			mol_to_file=cdsvg.mol_to_file,
-			text_to_document=cdsvg.text_to_document,
-			file_to_document=cdsvg.file_to_document,
+			callables=_module_callables(
+				"oasa.codecs.cdsvg", _MODULE_CALLABLES + ("text_to_document", "file_to_document"),
+			),
 			extensions=[".cdsvg"],
 			read_extensions=[".svg", ".svgz", ".cdsvg"],
 			write_extensions=[".cdsvg"],
@@ -368,45 +491,57 @@ def _ensure_defaults_registered() -> None:
 		aliases=["cd-svg"],
 	)
 	# RDKit-backed codecs
-	from oasa.codecs import rdkit_formats
+	rdkit_formats = "oasa.codecs.rdkit_formats"
 	register_codec(
-		Codec(
+		LazyCodec(
 			name="molfile_v3000",
-			text_to_mol=rdkit_formats.molfile_v3000_text_to_mol,
-			mol_to_text=rdkit_formats.molfile_v3000_mol_to_text,
-			file_to_mol=rdkit_formats.molfile_v3000_file_to_mol,
-			mol_to_file=rdkit_formats.molfile_v3000_mol_to_file,
+			callables={
+				"text_to_mol": f"{rdkit_formats}:molfile_v3000_text_to_mol",
+				"mol_to_text": f"{rdkit_formats}:molfile_v3000_mol_to_text",
+				"file_to_mol": f"{rdkit_formats}:molfile_v3000_file_to_mol",
+				"mol_to_file": f"{rdkit_formats}:molfile_v3000_mol_to_file",
+			},
 			description="Molfile V3000",
 		),
 		aliases=["mol-v3000", "v3000"],
 	)
 	register_codec(
-		Codec(
+		LazyCodec(
 			name="sdf",
-			text_to_mol=rdkit_formats.sdf_text_to_mol,
-			mol_to_text=rdkit_formats.sdf_mol_to_text,
-			file_to_mol=rdkit_formats.sdf_file_to_mol,
-			mol_to_file=rdkit_formats.sdf_mol_to_file,
+			callables={
+				"text_to_mol": f"{rdkit_formats}:sdf_text_to_mol",
+				"mol_to_text": f"{rdkit_formats}:sdf_mol_to_text",
+				"file_to_mol": f"{rdkit_formats}:sdf_file_to_mol",
+				"mol_to_file": f"{rdkit_formats}:sdf_mol_to_file",
+				"file_to_mols": f"{rdkit_formats}:sdf_iter_file",
+				"open_mol_writer": f"{rdkit_formats}:sdf_open_writer",
+			},
 			extensions=[".sdf"],
 			description="SDF (Structure Data File)",
 		),
 	)
 	register_codec(
-		Codec(
+		LazyCodec(
 			name="sdf_v3000",
-			text_to_mol=rdkit_formats.sdf_v3000_text_to_mol,
-			mol_to_text=rdkit_formats.sdf_v3000_mol_to_text,
-			file_to_mol=rdkit_formats.sdf_v3000_file_to_mol,
-			mol_to_file=rdkit_formats.sdf_v3000_mol_to_file,
+			callables={
+				"text_to_mol": f"{rdkit_formats}:sdf_v3000_text_to_mol",
+				"mol_to_text": f"{rdkit_formats}:sdf_v3000_mol_to_text",
+				"file_to_mol": f"{rdkit_formats}:sdf_v3000_file_to_mol",
+				"mol_to_file": f"{rdkit_formats}:sdf_v3000_mol_to_file",
+				"file_to_mols": f"{rdkit_formats}:sdf_iter_file",
+				"open_mol_writer": f"{rdkit_formats}:sdf_v3000_open_writer",
+			},
 			description="SDF V3000",
 		),
 		aliases=["sdf-v3000"],
 	)
 	register_codec(
-		Codec(
+		LazyCodec(
 			name="smarts",
-			mol_to_text=rdkit_formats.smarts_mol_to_text,
-			mol_to_file=rdkit_formats.smarts_mol_to_file,
+			callables={
+				"mol_to_text": f"{rdkit_formats}:smarts_mol_to_text",
+				"mol_to_file": f"{rdkit_formats}:smarts_mol_to_file",
+			},
 			extensions=[".sma"],
 			description="SMARTS (export-only)",
 		),
@@ -482,6 +617,8 @@ def get_registry_snapshot() -> dict:
 			"reads_files": codec.reads_files,
 			"writes_files": codec.writes_files,
 			"reads_documents": codec.reads_documents,
+			"reads_records": codec.reads_records,
+			"writes_records": codec.writes_records,
 			"read_extensions": list(codec.read_extensions),
 			"write_extensions": list(codec.write_extensions),
 		}
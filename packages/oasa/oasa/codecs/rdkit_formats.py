@@ -54,10 +54,8 @@ def _oasa_to_rdkit(mol: object) -> object:
 	Returns:
 		RDKit Mol object with 2D coordinates.
 	"""
-	rmol, _atom_map = rdkit_bridge.oasa_to_rdkit_mol(mol)
-	# generate 2D coords if none exist on the RDKit mol
-	if rmol.GetNumConformers() == 0:
-		rdkit.Chem.AllChem.Compute2DCoords(rmol)
+	# a copy of the cached mirror, converted and laid out once per revision
+	rmol, _atom_map = rdkit_bridge.mirror_rdkit_mol(mol, depiction=True)
 	return rmol
 
 
@@ -249,7 +247,7 @@ def sdf_text_to_mol(text: object) -> object:
 
 	Multiple records are merged into one disconnected OASA molecule.
 	The bridge layer splits disconnected subgraphs into separate
-	BKChem molecules.
+	BKChem molecules. Use ``sdf_iter_file`` to keep records apart.
 
 	Args:
 		text: SDF file content as a string.
@@ -259,35 +257,28 @@ def sdf_text_to_mol(text: object) -> object:
 	"""
 	# ForwardSDMolSupplier needs binary input
 	data = text.encode("utf-8") if isinstance(text, str) else text
-	supplier = rdkit.Chem.ForwardSDMolSupplier(
-		io.BytesIO(data), sanitize=True, removeHs=False,
-	)
+	return _merge_records(sdf_iter_file(io.BytesIO(data)))
+
+
+#============================================
+def _merge_records(mols: object) -> object:
+	"""Merge OASA molecules into the first one as disconnected components.
+
+	Args:
+		mols: Iterable of OASA molecules.
+
+	Returns:
+		OASA molecule holding the atoms and bonds of all records.
+	"""
 	merged = None
-	count = 0
-	for rmol in supplier:
-		if rmol is None:
-			continue
-		omol = _rdkit_to_oasa(rmol)
+	for omol in mols:
 		if merged is None:
 			merged = omol
 		else:
-			# merge atoms and bonds into a single disconnected molecule
-			# copy atoms first, then bonds referencing those atoms
-			from oasa.atom_lib import Atom as atom_cls
-			from oasa.bond_lib import Bond as bond_cls
-			atom_map = {}
-			for oatom in list(omol.atoms):
-				new_atom = atom_cls(symbol=oatom.symbol, charge=oatom.charge)
-				new_atom.x = oatom.x
-				new_atom.y = oatom.y
-				merged.add_vertex(new_atom)
-				atom_map[oatom] = new_atom
-			for obond in list(omol.bonds):
-				a1, a2 = obond.vertices
-				new_bond = bond_cls(order=obond.order)
-				merged.add_edge(atom_map[a1], atom_map[a2], new_bond)
-		count += 1
-	if merged is None or count == 0:
+			# the record molecule is discarded, so its atoms and bonds move over
+			merged.insert_a_graph(omol)
+			merged.stereochemistry.extend(omol.stereochemistry)
+	if merged is None:
 		raise ValueError("No valid molecules found in the SDF data.")
 	return merged
 
@@ -314,13 +305,15 @@ def sdf_mol_to_text(mol: object) -> str:
 def sdf_file_to_mol(file_obj: object) -> object:
 	"""Read an SDF file and return merged OASA molecules.
 
+	Records are read one at a time, the file is never loaded whole.
+
 	Args:
-		file_obj: Readable file object (text mode).
+		file_obj: Readable file object (text or binary mode).
 
 	Returns:
 		OASA molecule.
 	"""
-	return sdf_text_to_mol(file_obj.read())
+	return _merge_records(sdf_iter_file(file_obj))
 
 
 #============================================
@@ -338,6 +331,176 @@ def sdf_mol_to_file(mol: object, file_obj: object) -> None:
 		file_obj.write(text.encode("utf-8"))
 
 
+# characters read from a text handle per refill of the binary view
+_STREAM_CHUNK = 1 << 16
+
+
+#============================================
+class _EncodedReader(io.RawIOBase):
+	"""Binary view of a text file object, encoded to UTF-8 in chunks."""
+
+	#============================================
+	def __init__(self, file_obj: object) -> None:
+		self._file = file_obj
+		self._pending = b""
+
+	#============================================
+	def readable(self) -> bool:
+		return True
+
+	#============================================
+	def readinto(self, buffer: object) -> int:
+		"""Fill ``buffer`` from the text file; return 0 at the end."""
+		while len(self._pending) < len(buffer):
+			chunk = self._file.read(_STREAM_CHUNK)
+			if not chunk:
+				break
+			self._pending += chunk.encode("utf-8")
+		count = min(len(buffer), len(self._pending))
+		buffer[:count] = self._pending[:count]
+		self._pending = self._pending[count:]
+		return count
+
+
+#============================================
+def _binary_stream(file_obj: object) -> object:
+	"""Return a binary file object reading the same data as ``file_obj``."""
+	if isinstance(file_obj, io.TextIOBase):
+		return io.BufferedReader(_EncodedReader(file_obj))
+	return file_obj
+
+
+#============================================
+def sdf_iter_file(file_obj: object) -> object:
+	"""Yield one OASA molecule per SDF record, reading the file incrementally.
+
+	Only the current record is held in memory. Each molecule gets the
+	record title as ``name`` (when not empty) and its SD data fields as
+	``sd_tags``, a dict of field name to text. Records RDKit cannot parse
+	are skipped.
+
+	Args:
+		file_obj: Readable file object (text or binary mode).
+
+	Yields:
+		OASA molecules in file order.
+	"""
+	supplier = rdkit.Chem.ForwardSDMolSupplier(
+		_binary_stream(file_obj), sanitize=True, removeHs=False,
+	)
+	for rmol in supplier:
+		if rmol is None:
+			continue
+		tags = {name: rmol.GetProp(name) for name in rmol.GetPropNames()}
+		title = rmol.GetProp("_Name") if rmol.HasProp("_Name") else ""
+		omol = _rdkit_to_oasa(rmol)
+		if title:
+			omol.name = title
+		omol.sd_tags = tags
+		yield omol
+
+
+#============================================
+class SdfRecordWriter(object):
+	"""Incremental SDF sink writing one record per ``write`` call.
+
+	Records go through one ``rdkit.Chem.SDWriter`` and are passed on to
+	``file_obj`` as soon as they are written, so memory use does not grow
+	with the number of records. The caller owns ``file_obj``; ``close``
+	only finishes the RDKit writer. Usable as a context manager.
+	"""
+
+	#============================================
+	def __init__(self, file_obj: object, force_v3000: bool = False) -> None:
+		self._file = file_obj
+		self._text = isinstance(file_obj, io.TextIOBase)
+		self._buffer = io.StringIO()
+		self._writer = rdkit.Chem.SDWriter(self._buffer)
+		self._writer.SetForceV3000(force_v3000)
+		self.count = 0
+
+	#============================================
+	def write(self, mol: object, tags: dict | None = None) -> None:
+		"""Write ``mol`` as the next record.
+
+		The title comes from ``mol.name``. SD data fields come from
+		``mol.sd_tags`` updated with ``tags``; values are written as text.
+
+		Args:
+			mol: OASA molecule.
+			tags: Optional extra SD data fields.
+		"""
+		rmol = _oasa_to_rdkit(mol)
+		name = getattr(mol, "name", "")
+		if name:
+			rmol.SetProp("_Name", str(name))
+		fields = dict(getattr(mol, "sd_tags", None) or {})
+		if tags:
+			fields.update(tags)
+		for key, value in fields.items():
+			rmol.SetProp(str(key), str(value))
+		self._writer.write(rmol)
+		self._writer.flush()
+		self._drain()
+		self.count += 1
+
+	#============================================
+	def _drain(self) -> None:
+		"""Move the buffered record text to the target file."""
+		text = self._buffer.getvalue()
+		self._buffer.seek(0)
+		self._buffer.truncate()
+		if not text:
+			return
+		if self._text:
+			self._file.write(text)
+		else:
+			self._file.write(text.encode("utf-8"))
+
+	#============================================
+	def close(self) -> None:
+		"""Finish the RDKit writer; the target file stays open."""
+		if self._writer is None:
+			return
+		self._writer.close()
+		self._drain()
+		self._writer = None
+
+	#============================================
+	def __enter__(self) -> "SdfRecordWriter":
+		return self
+
+	#============================================
+	def __exit__(self, *exc_info: object) -> None:
+		self.close()
+
+
+#============================================
+def sdf_open_writer(file_obj: object) -> SdfRecordWriter:
+	"""Return an incremental SDF record writer on ``file_obj``.
+
+	Args:
+		file_obj: Writable file object (text or binary mode).
+
+	Returns:
+		SdfRecordWriter instance.
+	"""
+	return SdfRecordWriter(file_obj)
+
+
+#============================================
+def sdf_v3000_open_writer(file_obj: object) -> SdfRecordWriter:
+	"""Return an incremental SDF writer emitting V3000 records.
+
+	Args:
+		file_obj: Writable file object (text or binary mode).
+
+	Returns:
+		SdfRecordWriter instance.
+	"""
+	return SdfRecordWriter(file_obj, force_v3000=True)
+
+
 # ===================================================================
 # SDF V3000 codec
 # ===================================================================
@@ -380,12 +543,13 @@ def sdf_v3000_file_to_mol(file_obj: object) -> object:
 	"""Read an SDF V3000 file and return merged OASA molecules.
 
 	Args:
-		file_obj: Readable file object (text mode).
+		file_obj: Readable file object (text or binary mode).
 
 	Returns:
 		OASA molecule.
 	"""
-	return sdf_v3000_text_to_mol(file_obj.read())
+	# RDKit auto-detects V2000 vs V3000 per record
+	return sdf_file_to_mol(file_obj)
 
 
 #============================================
@@ -564,7 +728,7 @@ def depiction_stereo_smiles_mol_to_text(mol: object) -> str:
 	if not styled_bonds:
 		return smiles_mol_to_text(mol)
 
-	rmol, atom_to_index = rdkit_bridge.oasa_to_rdkit_mol(mol)
+	rmol, atom_to_index = rdkit_bridge.mirror_rdkit_mol(mol)
 	_add_depiction_stereo_conformer(rmol, atom_to_index)
 	for obond in styled_bonds:
 		start, end = obond.vertices
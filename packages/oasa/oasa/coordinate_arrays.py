@@ -0,0 +1,119 @@
+#--------------------------------------------------------------------------
+#     This file is part of OASA - a free chemical python library
+#     Copyright (C) 2003-2008 Beda Kosata <beda@zirael.org>
+#
+#     This program is free software; you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation; either version 2 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     Complete text of GNU GPL can be found in the file LICENSE in the
+#     main directory of the program
+#
+#--------------------------------------------------------------------------
+
+"""NumPy snapshots of atom coordinates and bond endpoints.
+
+Geometry passes read every atom position once into an ``(n, 3)`` array in
+atom order, work on whole columns, and write the result back in one pass.
+Unset coordinates (``None``) read as NaN and write back as ``None``.  The
+functions take plain atom and bond sequences, so they serve OASA molecules
+and any other object with the same vertex/edge interface.
+"""
+
+# PIP3 modules
+import numpy
+
+
+#============================================
+def coordinates_array(atoms: object) -> numpy.ndarray:
+	"""Return an ``(n, 3)`` float array of atom x, y, z in ``atoms`` order."""
+	coords = numpy.array([(atom.x, atom.y, atom.z) for atom in atoms], dtype=float)
+	return coords.reshape(len(atoms), 3)
+
+
+#============================================
+def set_coordinates_array(atoms: object, coords: object) -> None:
+	"""Write an ``(n, 2)`` or ``(n, 3)`` coordinate array back to ``atoms``.
+
+	Two columns leave z untouched.  NaN entries are written back as None.
+
+	Raises:
+		ValueError: If the array shape does not match ``atoms``.
+	"""
+	coords = numpy.asarray(coords, dtype=float)
+	if coords.ndim != 2 or coords.shape[0] != len(atoms) or coords.shape[1] not in (2, 3):
+		raise ValueError(f"coordinate array of shape {coords.shape} does not fit {len(atoms)} atoms")
+	# tolist() hands back Python floats, not numpy scalars
+	rows = numpy.where(numpy.isnan(coords), None, coords).tolist()
+	if coords.shape[1] == 2:
+		for atom, (x, y) in zip(atoms, rows):
+			atom.x = x
+			atom.y = y
+	else:
+		for atom, (x, y, z) in zip(atoms, rows):
+			atom.x = x
+			atom.y = y
+			atom.z = z
+
+
+#============================================
+def edge_index_array(atoms: object, edges: object) -> numpy.ndarray:
+	"""Return an ``(m, 2)`` array of atom positions for each bond of ``edges``.
+
+	Rows follow the iteration order of ``edges``.
+	"""
+	positions = {atom: index for index, atom in enumerate(atoms)}
+	pairs = [(positions[v1], positions[v2]) for v1, v2 in (e.vertices for e in edges)]
+	return numpy.array(pairs, dtype=numpy.intp).reshape(len(pairs), 2)
+
+
+#============================================
+def bounds(coords: numpy.ndarray) -> tuple[float, float, float, float]:
+	"""Return ``(min_x, min_y, max_x, max_y)`` of a non-empty coordinate array."""
+	mins = coords[:, :2].min(axis=0)
+	maxs = coords[:, :2].max(axis=0)
+	return (float(mins[0]), float(mins[1]), float(maxs[0]), float(maxs[1]))
+
+
+#============================================
+def bond_lengths(coords: numpy.ndarray, edge_index: numpy.ndarray) -> numpy.ndarray:
+	"""Return the 2D length of every bond row of ``edge_index``."""
+	start = coords[edge_index[:, 0]]
+	end = coords[edge_index[:, 1]]
+	return numpy.sqrt((start[:, 0] - end[:, 0]) ** 2 + (start[:, 1] - end[:, 1]) ** 2)
+
+
+#============================================
+def mean_bond_length(coords: numpy.ndarray, edge_index: numpy.ndarray) -> float | None:
+	"""Return the mean 2D bond length, or None when there are no bonds."""
+	if not len(edge_index):
+		return None
+	# a running sum keeps the per-bond loop order; numpy.sum pairs terms
+	total = numpy.cumsum(bond_lengths(coords, edge_index))[-1]
+	return float(total) / len(edge_index)
+
+
+#============================================
+def transform(coords: numpy.ndarray, mat: object) -> numpy.ndarray:
+	"""Apply a 4x4 ``Transform3d`` matrix to every row of an ``(n, 3)`` array.
+
+	Terms are summed in the same order as ``Transform3d.transform_xyz``.  An
+	unset (NaN) z counts as 0 for x and y and stays unset.
+	"""
+	x = coords[:, 0]
+	y = coords[:, 1]
+	z = coords[:, 2]
+	unset_z = numpy.isnan(z)
+	z_or_zero = numpy.where(unset_z, 0.0, z)
+	out = numpy.empty_like(coords)
+	for row in range(3):
+		m = mat[row]
+		out[:, row] = m[0] * x + m[1] * y + m[2] * z_or_zero + m[3] * 1
+	out[unset_z, 2] = numpy.nan
+	return out
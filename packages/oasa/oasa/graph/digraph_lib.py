@@ -55,10 +55,15 @@ class Digraph(base_graph):
   def add_edge( self, v1: object, v2: object, e: object=None) -> object:
     """adds an edge to a graph connecting vertices v1 and v2, if e argument is not given creates a new one.
     returns None if operation fails or the edge instance if successful"""
+    return self._link_edge( v1, v2, e)
+
+
+  def _link_edge( self, v1: object, v2: object, e: object=None) -> object:
+    """connects v1 to v2 by a directed edge e, returns None on failure"""
     i1 = self._get_vertex_index( v1)
     i2 = self._get_vertex_index( v2)
     if i1 == None or i2 == None:
-      warnings.warn( "Adding edge to a vertex not present in graph failed (of course)", UserWarning, 3)
+      warnings.warn( "Adding edge to a vertex not present in graph failed (of course)", UserWarning, 4)
       return None
     # to get the vertices if v1 and v2 were indexes
     v1 = self.vertices[ i1]
@@ -24,11 +24,14 @@ import copy
 class Edge(object):
 
   attrs_to_copy: tuple[str, ...] = ("disconnected",)
+  # fixed fields live in slots; __dict__ stays available for ad hoc attributes
+  # but is only allocated once one is set
+  __slots__ = ("_vertices", "_properties", "_disconnected", "_revision", "__dict__", "__weakref__")
 
   def __init__(self, vs: object=None) -> None:
     self._vertices = []
+    self._revision = 0  # see oasa.graph.revision; 0 means never edited
     self.set_vertices(vs)
-    self.properties_ = {}
     self.disconnected = False
 
 
@@ -71,6 +74,20 @@ class Edge(object):
     return out1, out2
 
 
+  @property
+  def properties_(self) -> dict:
+    try:
+      return self._properties
+    except AttributeError:
+      self._properties = {}
+      return self._properties
+
+
+  @properties_.setter
+  def properties_(self, properties: dict) -> None:
+    self._properties = properties
+
+
   @property
   def disconnected(self) -> object:
     return self._disconnected
@@ -78,4 +95,8 @@ class Edge(object):
 
   @disconnected.setter
   def disconnected(self, d: object) -> object:
+    if getattr(self, '_disconnected', d) != d:
+      # the endpoints cache their connected neighbors
+      for v in self._vertices:
+        v._clean_cache()
     self._disconnected = d
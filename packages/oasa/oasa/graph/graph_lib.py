@@ -29,7 +29,10 @@ import warnings
 
 from oasa.graph.edge_lib import Edge
 from oasa.graph.vertex_lib import Vertex
+from oasa.graph import longest_paths
+from oasa.graph import ring_perception
 from oasa.graph.rx_backend import RxBackend
+from oasa.graph.indexed_vertices import IndexedVertexList
 
 
 
@@ -44,10 +47,8 @@ class Graph(object):
 
 
   def __init__( self, vertices: object=None) -> None:
-    if vertices:
-      self.vertices = vertices
-    else:
-      self.vertices = []
+    # ordered like a list, with constant-time membership and index lookup
+    self.vertices = IndexedVertexList( vertices or ())
     self.edges = set()
     self.disconnected_edges = set()
     self._cache = {}
@@ -64,7 +65,7 @@ class Graph(object):
     """provides a really shallow copy, the vertex and edge objects will remain the same,
     only the graph itself is different"""
     c = self.create_graph()
-    c.vertices = copy.copy( self.vertices)
+    c.vertices = IndexedVertexList( self.vertices)
     for e in self.edges:
       i, j = e.get_vertices()
       c.add_edge( i, j, e)
@@ -75,15 +76,13 @@ class Graph(object):
     """provides a deep copy of the graph. The result is an isomorphic graph,
     all the used objects are different"""
     c = self.create_graph()
-    for v in self.vertices:
-      new = v.copy()
-      c.add_vertex( new)
+    old_v_to_new_v = {v: v.copy() for v in self.vertices}
+    c.add_vertices( old_v_to_new_v.values())
+    new_edges = []
     for e in self.edges:
       v1, v2 = e.get_vertices()
-      i1 = self.vertices.index( v1)
-      i2 = self.vertices.index( v2)
-      new_e = e.copy()
-      c.add_edge( c.vertices[i1], c.vertices[i2], new_e)
+      new_edges.append( (old_v_to_new_v[v1], old_v_to_new_v[v2], e.copy()))
+    c.add_edges( new_edges)
     return c
 
 
@@ -101,7 +100,8 @@ class Graph(object):
 
   def delete_vertex( self, v: object) -> object:
     self.vertices.remove( v)
-    self._flush_cache()
+    self._clean_cache()
+    self._rx_backend.vertex_removed( self, v)
 
 
   def add_vertex( self, v: object=None) -> object:
@@ -114,17 +114,55 @@ class Graph(object):
     else:
       warnings.warn( "Added vertex is already present in graph %s" % str( v), UserWarning, 2)
       return None
-    self._flush_cache()
+    self._clean_cache()
+    self._rx_backend.vertex_added( self, v)
     return v
 
 
+  def add_vertices( self, vs: object) -> object:
+    """adds all vertices from vs with a single cache flush at the end;
+    vertices already present are skipped with a warning. returns the list of added vertices"""
+    added = []
+    for v in vs:
+      if v in self.vertices:
+        warnings.warn( "Added vertex is already present in graph %s" % str( v), UserWarning, 2)
+        continue
+      self.vertices.append( v)
+      added.append( v)
+    if added:
+      self._flush_cache()
+    return added
+
+
   def add_edge( self, v1: object, v2: object, e: object=None) -> object:
     """adds an edge to a graph connecting vertices v1 and v2, if e argument is not given creates a new one.
     returns None if operation fails or the edge instance if successful"""
+    e = self._link_edge( v1, v2, e)
+    if e is not None:
+      self._clean_cache()
+      self._rx_backend.edge_added( self, e)
+    return e
+
+
+  def add_edges( self, edges: object) -> object:
+    """adds edges given as (v1, v2) or (v1, v2, e) tuples with a single cache flush at the end;
+    returns the list of edges that were added"""
+    added = []
+    for item in edges:
+      e = self._link_edge( *item)
+      if e is not None:
+        added.append( e)
+    if added:
+      self._flush_cache()
+    return added
+
+
+  def _link_edge( self, v1: object, v2: object, e: object=None) -> object:
+    """connects v1 and v2 by edge e without touching the caches, returns None on failure"""
     i1 = self._get_vertex_index( v1)
     i2 = self._get_vertex_index( v2)
     if i1 is None or i2 is None:
-      warnings.warn( "Adding edge to a vertex not present in graph failed (of course)", UserWarning, 3)
+      warnings.warn( "Adding edge to a vertex not present in graph failed (of course)", UserWarning, 4)
       return None
     # to get the vertices if v1 and v2 were indexes
     v1 = self.vertices[ i1]
@@ -135,7 +173,6 @@ class Graph(object):
     self.edges.add( e)
     v1.add_neighbor( v2, e)
     v2.add_neighbor( v1, e)
-    self._flush_cache()
     return e
 
 
@@ -154,7 +191,8 @@ class Graph(object):
         self.edges.remove( e)
         v1.remove_neighbor( v2)
         v2.remove_neighbor( v1)
-      self._flush_cache()
+        self._rx_backend.edge_removed( self, e)
+      self._clean_cache()
       return e
     else:
       return None
@@ -166,7 +204,8 @@ class Graph(object):
     v1.remove_edge_and_neighbor( e)
     if v1 is not v2:
       v2.remove_edge_and_neighbor( e)
-    self._flush_cache()
+    self._clean_cache()
+    self._rx_backend.edge_removed( self, e)
 
 
   def remove_vertex( self, v: object) -> object:
@@ -187,7 +226,8 @@ class Graph(object):
     self.edges.remove( e)
     self.disconnected_edges.add( e)
     e.disconnected = True
-    self._flush_cache()
+    self._clean_cache()
+    self._rx_backend.edge_removed( self, e)
     return e
 
 
@@ -196,7 +236,8 @@ class Graph(object):
     self.disconnected_edges.remove( e)
     self.edges.add( e)
     e.disconnected = False
-    self._flush_cache()
+    self._clean_cache()
+    self._rx_backend.edge_added( self, e)
 
 
   def reconnect_temporarily_disconnected_edges( self) -> object:
@@ -204,7 +245,8 @@ class Graph(object):
       e = self.disconnected_edges.pop()
       e.disconnected = False
       self.edges.add( e)
-    self._flush_cache()
+      self._rx_backend.edge_added( self, e)
+    self._clean_cache()
 
 
   ## PROPERTIES METHODS
@@ -279,12 +321,13 @@ class Graph(object):
   def get_induced_subgraph_from_vertices( self, vs: object) -> object:
     """it creates a new graph, however uses the old vertices and edges!"""
     g = self.create_graph()
-    for v in vs:
-      g.add_vertex( v)
+    g.add_vertices( vs)
+    edges = []
     for e in self.vertex_subgraph_to_edge_subgraph( vs):
       v1, v2 = e.get_vertices()
       if v1 in vs and v2 in vs:
-        g.add_edge( v1, v2, e)  # BUG - it should copy the edge?
+        edges.append( (v1, v2, e))  # BUG - it should copy the edge?
+    g.add_edges( edges)
     return g
 
 
@@ -297,10 +340,11 @@ class Graph(object):
     old_v_to_new_v = {}
     for v in vertices:
       new = v.copy()
-      c.add_vertex( new)
       old_v_to_new_v[v] = new
       if add_back_links:
         new.properties_['original'] = v
+    c.add_vertices( old_v_to_new_v.values())
+    new_edges = []
     for e in edges:
       v1, v2 = e.get_vertices()
       if (v1 in old_v_to_new_v) and (v2 in old_v_to_new_v):
@@ -309,7 +353,8 @@ class Graph(object):
         new_e = e.copy()
         if add_back_links:
           new_e.properties_['original'] = e
-        c.add_edge( old_v_to_new_v[v1], old_v_to_new_v[v2], new_e)
+        new_edges.append( (old_v_to_new_v[v1], old_v_to_new_v[v2], new_e))
+    c.add_edges( new_edges)
     return c
 
 
@@ -345,61 +390,25 @@ class Graph(object):
 
 
   def get_all_cycles( self) -> object:
-    """
-    implementation of:
-    A New Algorithm for Exhaustive Ring Perception in a Molecular Graph
-    Th. Hanser, Ph. Jauffret, and G. Kaufmann
-    J. Chem. Inf. Comput. Sci., 1996, 36 (6), 1146-1152 . DOI: 10.1021/ci960322f
-    """
-    pgraph = self._get_p_graph()
-    rings = set()
-    for pv in copy.copy( pgraph.vertices):
-      rings |= Graph._p_graph_remove( pv, pgraph)
-    final_rings = set()
-    for ring in rings:
-      final_ring = frozenset( [v.properties_['original'] for v in ring])
-      final_rings.add( final_ring)
-    return final_rings
-
-
-  def _get_p_graph( self) -> object:
-    """helper method for p-graph (path graph) generation"""
-    p = self.deep_copy()
-    p.temporarily_strip_bridge_edges()
-    # we count on order of vertices remaining the same
-    for i,v in enumerate( self.vertices):
-      p.vertices[i].properties_['original'] = v
-    for e in p.edges:
-      e.path_ = set( e.vertices)
-    to_remove = [v for v in p.vertices if not v.neighbors]
-    for v in to_remove:
-      p.delete_vertex( v)
-    return p
-
-
-  @staticmethod
-  def _p_graph_remove( v: object, pgraph: object) -> object:
-    rings = set()
-    neighbor_edge_vertex_pairs = list( v.get_neighbor_edge_pairs())
-    new_edges = []
-    for i,(ne1,nv1) in enumerate( neighbor_edge_vertex_pairs):
-      for ne2,nv2 in neighbor_edge_vertex_pairs[i+1:]:
-        if (nv1 is nv2 and (ne1.path_ & ne2.path_ == set( [v,nv2]))) or (ne1.path_ & ne2.path_ == set( [v])):
-          new_path = ne1.path_ | ne2.path_
-          new_edge = pgraph.create_edge()
-          new_edge.path_ = new_path
-          pgraph.add_edge( nv1, nv2, new_edge)
-          new_edges.append( new_edge)
-    for ne,nv in neighbor_edge_vertex_pairs:
-      pgraph.disconnect_edge( ne)
-    for e in new_edges:
-      end1, end2 = e.vertices
-      if end1 is end2:
-        # we have a loop here
-        rings.add( frozenset( e.path_))
-        pgraph.disconnect_edge( e)
-    pgraph.remove_vertex( v)
-    return rings
+    """returns a set of frozensets of vertices, one for every simple cycle;
+    see get_rings"""
+    return set( self.get_rings( "all"))
+
+
+  def get_rings( self, kind: object="sssr", max_size: object=None) -> object:
+    """returns a list of frozensets of vertices, ordered by ring size;
+    kind is 'sssr' (a minimum cycle basis), 'relevant' (the union of all
+    minimum cycle bases) or 'all' (every simple cycle); max_size drops larger rings.
+    Results are cached until the graph changes."""
+    cache_key = ("rings", kind, max_size)
+    rings = self._get_cache( cache_key)
+    if rings is None:
+      positions = {v: i for i, v in enumerate( self.vertices)}
+      edges = [(positions[e.vertices[0]], positions[e.vertices[1]]) for e in self.edges]
+      rings = tuple( frozenset( self.vertices[i] for i in ring_perception.bit_indices( bits))
+                     for bits in ring_perception.perceive_rings( len( self.vertices), edges, kind, max_size))
+      self._set_cache( cache_key, rings)
+    return list( rings)
 
 
   def mark_vertices_with_distance_from( self, v: object) -> object:
@@ -458,15 +467,16 @@ class Graph(object):
 
 
   def get_diameter( self) -> object:
-    """Return graph diameter using rustworkx distance matrix.
+    """Return graph diameter, the largest finite distance between two vertices.
 
-    Caches the result for repeated queries on unchanged graphs.
+    Trees take two breadth-first searches, ring systems a few more
+    (see longest_paths). Caches the result for repeated queries on
+    unchanged graphs.
     """
     d = self._get_cache( "diameter")
     if d is not None:
       return d
-    # delegate to rustworkx backend (49x faster than pure Python)
-    result = self._rx_backend.get_diameter(self)
+    result = longest_paths.diameter( self._get_index_adjacency())
     self._set_cache( "diameter", result)
     return result
 
@@ -494,16 +504,15 @@ class Graph(object):
     changed without worry about the original."""
     sub = self.create_graph()
     vertex_map = {}
-    i = 0
     for v in vertices:
-      new_v = v.copy()
-      sub.add_vertex( new_v)
-      vertex_map[v] = i
-      i += 1
+      vertex_map[v] = v.copy()
+    sub.add_vertices( vertex_map.values())
+    new_edges = []
     for e in edges:
       new_e = e.copy()
       v1, v2 = e.get_vertices()
-      sub.add_edge( vertex_map[v1], vertex_map[v2], new_e)
+      new_edges.append( (vertex_map[v1], vertex_map[v2], new_e))
+    sub.add_edges( new_edges)
     return sub
 
 
@@ -612,12 +621,28 @@ class Graph(object):
       return None
 
 
+  def _get_index_adjacency( self) -> object:
+    """returns lists of neighbor positions in the order of self.vertices"""
+    positions = {v: i for i, v in enumerate( self.vertices)}
+    adjacency = [[] for _ in self.vertices]
+    for e in self.edges:
+      i, j = (positions[v] for v in e.vertices)
+      adjacency[i].append( j)
+      adjacency[j].append( i)
+    return adjacency
+
+
   def _flush_cache( self) -> object:
     self._cache = {}
     # invalidate rustworkx backend so it rebuilds before next algorithm call
     self._rx_backend.mark_dirty()
 
 
+  def _clean_cache( self) -> object:
+    """drops cached results; callers keep the rustworkx mirror in step themselves"""
+    self._cache = {}
+
+
   def _set_cache( self, name: object, value: object) -> object:
     if self.uses_cache:
       self._cache[ name] = value
@@ -0,0 +1,143 @@
+"""Ordered vertex container with constant-time membership and index lookup.
+
+Graph code and its callers treat ``graph.vertices`` as a plain list: they
+append, slice, iterate, and ask ``v in graph.vertices`` or
+``graph.vertices.index(v)``.  IndexedVertexList keeps that list behavior and
+adds a vertex -> position map, so the last two no longer scan the list.
+Appends keep the map current; any other edit drops it and the next lookup
+rebuilds it in one pass.
+"""
+
+# Standard Library
+import sys
+
+
+#============================================
+class IndexedVertexList(list):
+	"""List of graph vertices that also maps each vertex to its first position."""
+
+	#============================================
+	def __init__(self, vertices: object = ()) -> None:
+		"""Create the list from any iterable of vertices."""
+		super().__init__(vertices)
+		self._positions = None
+
+	#============================================
+	def __reduce__(self) -> tuple:
+		"""Copy and pickle as a fresh list so copies never share the position map."""
+		return (self.__class__, (list(self),))
+
+	#============================================
+	def _position_map(self) -> dict:
+		"""Return the vertex -> first position map, rebuilding it if stale."""
+		positions = self._positions
+		if positions is None:
+			positions = {}
+			for position, vertex in enumerate(self):
+				positions.setdefault(vertex, position)
+			self._positions = positions
+		return positions
+
+	#============================================
+	def __contains__(self, vertex: object) -> bool:
+		"""Return whether ``vertex`` is stored in the list."""
+		try:
+			return vertex in self._position_map()
+		except TypeError:
+			# unhashable values can still sit in a list
+			return list.__contains__(self, vertex)
+
+	#============================================
+	def index(self, vertex: object, start: int = 0, stop: int = sys.maxsize) -> int:
+		"""Return the first position of ``vertex``; raise ValueError if absent."""
+		if start != 0 or stop != sys.maxsize:
+			return list.index(self, vertex, start, stop)
+		try:
+			position = self._position_map().get(vertex)
+		except TypeError:
+			return list.index(self, vertex)
+		if position is None:
+			raise ValueError(f"{vertex!r} is not in list")
+		return position
+
+	#============================================
+	def append(self, vertex: object) -> None:
+		"""Append one vertex, keeping a current position map current."""
+		if self._positions is not None:
+			try:
+				self._positions.setdefault(vertex, len(self))
+			except TypeError:
+				self._positions = None
+		list.append(self, vertex)
+
+	#============================================
+	def extend(self, vertices: object) -> None:
+		"""Append every vertex of an iterable."""
+		for vertex in vertices:
+			self.append(vertex)
+
+	#============================================
+	def __iadd__(self, vertices: object) -> "IndexedVertexList":
+		"""Support ``vertices += other`` through extend."""
+		self.extend(vertices)
+		return self
+
+	#============================================
+	def _forget_positions(self) -> None:
+		"""Drop the position map after an edit that can shift positions."""
+		self._positions = None
+
+	#============================================
+	def insert(self, position: int, vertex: object) -> None:
+		"""Insert one vertex before ``position``."""
+		self._forget_positions()
+		list.insert(self, position, vertex)
+
+	#============================================
+	def remove(self, vertex: object) -> None:
+		"""Remove the first occurrence of ``vertex``."""
+		self._forget_positions()
+		list.remove(self, vertex)
+
+	#============================================
+	def pop(self, position: int = -1) -> object:
+		"""Remove and return the vertex at ``position``."""
+		self._forget_positions()
+		return list.pop(self, position)
+
+	#============================================
+	def clear(self) -> None:
+		"""Remove every vertex."""
+		self._forget_positions()
+		list.clear(self)
+
+	#============================================
+	def sort(self, *, key: object = None, reverse: bool = False) -> None:
+		"""Sort the vertices in place."""
+		self._forget_positions()
+		list.sort(self, key=key, reverse=reverse)
+
+	#============================================
+	def reverse(self) -> None:
+		"""Reverse the vertex order in place."""
+		self._forget_positions()
+		list.reverse(self)
+
+	#============================================
+	def __setitem__(self, position: object, value: object) -> None:
+		"""Replace one vertex or a slice of vertices."""
+		self._forget_positions()
+		list.__setitem__(self, position, value)
+
+	#============================================
+	def __delitem__(self, position: object) -> None:
+		"""Delete one vertex or a slice of vertices."""
+		self._forget_positions()
+		list.__delitem__(self, position)
+
+	#============================================
+	def __imul__(self, count: int) -> "IndexedVertexList":
+		"""Repeat the vertices in place."""
+		self._forget_positions()
+		list.__imul__(self, count)
+		return self
@@ -0,0 +1,264 @@
+"""Diameter and longest end-to-end chain queries on integer vertex indices.
+
+Graphs are given as per-vertex neighbor index lists.  Distances are
+breadth-first, so a chain between two vertices is a shortest path between
+them, as ``Graph.find_path_between`` returns.
+
+Acyclic components need no all-pairs work: a double sweep (BFS from any
+vertex, then from the farthest vertex found) gives the diameter, and the
+eccentricity of every vertex is its larger distance to the two ends of that
+diameter.  Components with rings use the iFUB bound (Crescenzi et al.,
+Theor. Comput. Sci. 2013, 514, 84): BFS from a central vertex, then from
+the vertices of its farthest levels until the best eccentricity found
+exceeds twice the next level.  End-to-end chains in ring components fall
+back to one BFS per end atom.
+
+Weighted chains score each vertex; in trees the heaviest end-to-end path
+comes from one tree dynamic-programming pass, in ring components from a
+BFS per end that keeps the heaviest of the equally short paths.
+"""
+
+# Standard Library
+import collections
+
+
+#============================================
+def bfs(adjacency: list, source: int) -> tuple:
+	"""Return (distance, parent) lists from ``source``; unreached vertices have -1."""
+	distance = [-1] * len(adjacency)
+	parent = [-1] * len(adjacency)
+	distance[source] = 0
+	queue = collections.deque([source])
+	while queue:
+		v = queue.popleft()
+		for w in adjacency[v]:
+			if distance[w] == -1:
+				distance[w] = distance[v] + 1
+				parent[w] = v
+				queue.append(w)
+	return distance, parent
+
+
+#============================================
+def _farthest(distance: list) -> int:
+	"""Return the first vertex at the largest distance."""
+	return max(range(len(distance)), key=distance.__getitem__)
+
+
+#============================================
+def _walk_back(parent: list, v: int) -> list:
+	"""Return the path from ``v`` back to the BFS source."""
+	path = [v]
+	while parent[v] != -1:
+		v = parent[v]
+		path.append(v)
+	return path
+
+
+#============================================
+def _ends(adjacency: list) -> list:
+	"""Return the vertices with exactly one neighbor, in index order."""
+	return [v for v in range(len(adjacency)) if len(adjacency[v]) == 1]
+
+
+#============================================
+def components(adjacency: list) -> list:
+	"""Return (vertices, is_tree) for each connected component, in vertex order."""
+	seen = [False] * len(adjacency)
+	result = []
+	for start in range(len(adjacency)):
+		if seen[start]:
+			continue
+		members = [start]
+		seen[start] = True
+		degree_sum = 0
+		for v in members:
+			degree_sum += len(adjacency[v])
+			for w in adjacency[v]:
+				if not seen[w]:
+					seen[w] = True
+					members.append(w)
+		result.append((members, degree_sum // 2 == len(members) - 1))
+	return result
+
+
+#============================================
+def _component_diameter(adjacency: list, members: list, is_tree: bool) -> int:
+	"""Return the diameter of one connected component."""
+	first, _parent = bfs(adjacency, members[0])
+	a = _farthest(first)
+	from_a, parent = bfs(adjacency, a)
+	b = _farthest(from_a)
+	lower = from_a[b]
+	if is_tree:
+		return lower
+	path = _walk_back(parent, b)
+	center = path[len(path) // 2]
+	from_center, _parent = bfs(adjacency, center)
+	levels = collections.defaultdict(list)
+	for v in members:
+		levels[from_center[v]].append(v)
+	top = max(levels)
+	lower = max(lower, top)
+	for level in range(top, 0, -1):
+		# no vertex at this level or below is farther than 2 * level from another
+		if lower >= 2 * level:
+			break
+		for v in levels[level]:
+			lower = max(lower, max(bfs(adjacency, v)[0]))
+		if lower > 2 * (level - 1):
+			break
+	return lower
+
+
+#============================================
+def diameter(adjacency: list) -> int:
+	"""Return the largest finite distance in the graph; 0 without edges."""
+	best = 0
+	for members, is_tree in components(adjacency):
+		if len(members) > 1:
+			best = max(best, _component_diameter(adjacency, members, is_tree))
+	return best
+
+
+#============================================
+def farthest_end_pair(adjacency: list) -> tuple | None:
+	"""Return (e1, e2, path) for the first pair of end vertices at the largest distance.
+
+	End vertices have one neighbor.  Pairs are taken in index order, ``e1``
+	outer and ``e2`` inner, and the first pair reaching the largest distance
+	wins.  ``path`` runs from ``e2`` to ``e1`` when both lie in a tree; in
+	ring components it is None and the caller picks the shortest path.
+	Returns None when no two ends are connected.
+	"""
+	ends = _ends(adjacency)
+	parts = components(adjacency)
+	in_tree = set()
+	for members, is_tree in parts:
+		if is_tree:
+			in_tree.update(members)
+	if all(e in in_tree for e in ends):
+		# trees: eccentricity is the larger distance to the diameter ends
+		eccentricity = {}
+		for members, _is_tree in parts:
+			if len(members) < 2:
+				continue
+			first, _parent = bfs(adjacency, members[0])
+			from_a, _parent = bfs(adjacency, _farthest(first))
+			from_b, _parent = bfs(adjacency, _farthest(from_a))
+			for v in members:
+				eccentricity[v] = max(from_a[v], from_b[v])
+		reach = [eccentricity.get(e, 0) for e in ends]
+		longest = max(reach, default=0)
+		if longest == 0:
+			return None
+		e1 = ends[reach.index(longest)]
+		distance, parent = bfs(adjacency, e1)
+		e2 = next(e for e in ends if distance[e] == longest)
+		return e1, e2, _walk_back(parent, e2)
+	best = None
+	for e1 in ends:
+		distance, _parent = bfs(adjacency, e1)
+		for e2 in ends:
+			if e2 != e1 and distance[e2] > 0 and (best is None or distance[e2] > best[2]):
+				best = (e1, e2, distance[e2])
+	if best is None:
+		return None
+	return best[0], best[1], None
+
+
+#============================================
+def _heaviest_tree_path(adjacency: list, members: list, weights: list) -> tuple | None:
+	"""Return ((weight, length), path) of the heaviest leaf-to-leaf path of one tree."""
+	leaves = [v for v in members if len(adjacency[v]) == 1]
+	if len(leaves) < 2:
+		return None
+	root = leaves[0]
+	depth, parent = bfs(adjacency, root)
+	order = sorted(members, key=depth.__getitem__)
+	# best downward path from each vertex to a leaf below it: (score, next vertex)
+	down = {}
+	best = None
+	for v in reversed(order):
+		children = [w for w in adjacency[v] if w != parent[v]]
+		own = (weights[v], 1)
+		if not children:
+			down[v] = (own, -1)
+			continue
+		ranked = sorted(children, key=lambda w: down[w][0], reverse=True)
+		score = down[ranked[0]][0]
+		down[v] = ((own[0] + score[0], own[1] + score[1]), ranked[0])
+		if v == root:
+			candidate = (down[v][0], [v], ranked[0], None)
+		elif len(ranked) >= 2:
+			second = down[ranked[1]][0]
+			total = (own[0] + score[0] + second[0], own[1] + score[1] + second[1])
+			candidate = (total, [v], ranked[0], ranked[1])
+		else:
+			continue
+		if best is None or candidate[0] > best[0]:
+			best = candidate
+	score, middle, left, right = best
+	path = _follow(down, left)[::-1] + middle
+	if right is not None:
+		path += _follow(down, right)
+	return score, path
+
+
+#============================================
+def _follow(down: dict, v: int) -> list:
+	"""Return the downward path stored from ``v``."""
+	path = []
+	while v != -1:
+		path.append(v)
+		v = down[v][1]
+	return path
+
+
+#============================================
+def _heaviest_shortest_paths(adjacency: list, ends: list, weights: list) -> tuple | None:
+	"""Return ((weight, length), path) of the heaviest shortest path between two ends."""
+	best = None
+	for e1 in ends:
+		distance, _parent = bfs(adjacency, e1)
+		order = sorted((v for v in range(len(adjacency)) if distance[v] >= 0), key=distance.__getitem__)
+		heaviest = {e1: (weights[e1], -1)}
+		for v in order[1:]:
+			parents = [p for p in adjacency[v] if distance[p] == distance[v] - 1]
+			p = max(parents, key=lambda x: heaviest[x][0])
+			heaviest[v] = (heaviest[p][0] + weights[v], p)
+		for e2 in ends:
+			if e2 == e1 or distance[e2] <= 0:
+				continue
+			score = (heaviest[e2][0], distance[e2] + 1)
+			if best is None or score > best[0]:
+				path = []
+				v = e2
+				while v != -1:
+					path.append(v)
+					v = heaviest[v][1]
+				best = (score, path)
+	return best
+
+
+#============================================
+def heaviest_end_path(adjacency: list, weights: list) -> list | None:
+	"""Return the end-to-end chain with the largest total vertex weight.
+
+	Chains are shortest paths between two vertices with one neighbor each;
+	ties go to the longer chain.  Returns the vertex indices from one end to the other, or None
+	when no two ends are connected.
+	"""
+	ends = _ends(adjacency)
+	best = None
+	for members, is_tree in components(adjacency):
+		if is_tree:
+			found = _heaviest_tree_path(adjacency, members, weights)
+		else:
+			inside = set(members)
+			found = _heaviest_shortest_paths(adjacency, [e for e in ends if e in inside], weights)
+		if found is not None and (best is None or found[0] > best[0]):
+			best = found
+	if best is None:
+		return None
+	return best[1]
@@ -0,0 +1,65 @@
+"""Process-wide revision numbers for changes to atoms and bonds.
+
+Property setters that change what a structure means chemically (element,
+charge, isotope, multiplicity, bond order) stamp the object with
+``next_revision()``.  Numbers only grow, so the largest stamp over a
+molecule's atoms and bonds changes whenever any of them is edited.  Caches
+derived from a molecule record that maximum next to the graph cache, which
+topology edits already clear.
+
+``structure_revision`` keeps its answer in the graph cache together with the
+newest number handed out at the time; while no stamp has been issued since,
+the answer is returned without visiting any atom or bond.
+"""
+
+# Standard Library
+import threading
+
+
+# graph cache entry holding (latest issued revision, structure revision)
+_STRUCTURE_CACHE_KEY = "structure_revision"
+
+
+#============================================
+class _RevisionClock:
+	"""Increasing revision numbers plus the newest one handed out."""
+
+	#============================================
+	def __init__(self) -> None:
+		"""Start before revision 1; 0 marks items never edited."""
+		self.latest = 0
+		self._lock = threading.Lock()
+
+	#============================================
+	def advance(self) -> int:
+		"""Return a revision number larger than every earlier one."""
+		with self._lock:
+			self.latest += 1
+			return self.latest
+
+
+_CLOCK = _RevisionClock()
+
+
+#============================================
+def next_revision() -> int:
+	"""Return a revision number larger than every earlier one."""
+	return _CLOCK.advance()
+
+
+#============================================
+def structure_revision(graph: object) -> int:
+	"""Return the newest revision stamped on the vertices and edges of ``graph``; 0 if none."""
+	latest = _CLOCK.latest
+	cached = graph._get_cache(_STRUCTURE_CACHE_KEY)
+	if cached is not None and cached[0] == latest:
+		return cached[1]
+	newest = 0
+	for item in graph.vertices:
+		if item._revision > newest:
+			newest = item._revision
+	for item in graph.edges:
+		if item._revision > newest:
+			newest = item._revision
+	graph._set_cache(_STRUCTURE_CACHE_KEY, (latest, newest))
+	return newest
@@ -3,6 +3,11 @@
 Provides the RxBackend class that mediates all rustworkx usage for OASA,
 maintaining identity maps between OASA Vertex/Edge objects and rustworkx
 integer indices. Algorithm delegates return OASA objects, never raw indices.
+
+Single vertex and edge additions and removals made through Graph methods are
+applied to the mirror in place. Anything the mirror cannot follow step by
+step (bulk inserts, direct list edits, parallel edges) marks it dirty, and
+the next algorithm call rebuilds it from the graph.
 """
 
 # PIP3 modules
@@ -37,6 +42,15 @@ class RxBackend:
 		self.e_to_i = {}
 		self.i_to_e = {}
 		self._dirty = True
+		# vertex and edge containers the mirror was last rebuilt from
+		self._vertices_ref = None
+		self._edges_ref = None
+		# graph container sizes the mirror accounts for; parallel edges
+		# collapse in the simple rustworkx graph, so these can exceed it
+		self._vertex_total = 0
+		self._edge_total = 0
+		self._collapsed_edges = False
+		self.rebuild_count = 0
 
 	#============================================
 	def mark_dirty(self) -> object:
@@ -83,6 +97,12 @@ class RxBackend:
 			ei = self.rx.add_edge(i1, i2, e)
 			self.e_to_i[e] = ei
 			self.i_to_e[ei] = e
+		self._vertices_ref = graph.vertices
+		self._edges_ref = graph.edges
+		self._vertex_total = len(graph.vertices)
+		self._edge_total = len(graph.edges)
+		self._collapsed_edges = self.rx.num_edges() != len(graph.edges)
+		self.rebuild_count += 1
 		self._dirty = False
 
 	#============================================
@@ -90,7 +110,8 @@ class RxBackend:
 		"""Lazily rebuild the rustworkx graph if dirty.
 
 		Called automatically before any algorithm delegate. If the
-		backend is not dirty, this is a no-op.
+		backend is not dirty, this is a no-op: single edits were
+		already applied in place by the incremental update methods.
 
 		Args:
 			graph: An OASA Graph (or Molecule) instance.
@@ -98,6 +119,99 @@ class RxBackend:
 		if self._dirty:
 			self.rebuild_from_graph(graph)
 
+	#============================================
+	def _in_step(self, graph: object) -> bool:
+		"""Return whether the mirror was built from graph's current containers."""
+		return (
+			not self._dirty
+			and graph.vertices is self._vertices_ref
+			and graph.edges is self._edges_ref
+		)
+
+	# ------------------------------------------------------------------
+	# Incremental updates
+	# Each is called after the graph applied the change; any state the
+	# mirror cannot follow exactly falls back to a rebuild.
+	# ------------------------------------------------------------------
+
+	#============================================
+	def vertex_added(self, graph: object, v: object) -> object:
+		"""Mirror one vertex appended to graph.vertices.
+
+		Args:
+			graph: An OASA Graph instance.
+			v: The OASA Vertex just added.
+		"""
+		if (not self._in_step(graph) or v in self.v_to_i
+				or self._vertex_total + 1 != len(graph.vertices)):
+			self._dirty = True
+			return
+		self._vertex_total += 1
+		idx = self.rx.add_node(v)
+		self.v_to_i[v] = idx
+		self.i_to_v[idx] = v
+
+	#============================================
+	def vertex_removed(self, graph: object, v: object) -> object:
+		"""Mirror one edge-free vertex removed from graph.vertices.
+
+		Args:
+			graph: An OASA Graph instance.
+			v: The OASA Vertex just removed.
+		"""
+		idx = self.v_to_i.get(v)
+		if (not self._in_step(graph) or idx is None
+				or self._vertex_total - 1 != len(graph.vertices)
+				or self.rx.degree(idx) != 0):
+			self._dirty = True
+			return
+		self._vertex_total -= 1
+		self.rx.remove_node(idx)
+		del self.v_to_i[v]
+		del self.i_to_v[idx]
+
+	#============================================
+	def edge_added(self, graph: object, e: object) -> object:
+		"""Mirror one edge added to (or reconnected into) graph.edges.
+
+		Args:
+			graph: An OASA Graph instance.
+			e: The OASA Edge just added.
+		"""
+		if (not self._in_step(graph) or self._collapsed_edges or e in self.e_to_i
+				or self._edge_total + 1 != len(graph.edges)):
+			self._dirty = True
+			return
+		v1, v2 = e.get_vertices()[:2]
+		i1 = self.v_to_i.get(v1)
+		i2 = self.v_to_i.get(v2)
+		# the mirror is a simple graph; a parallel edge needs a rebuild
+		if i1 is None or i2 is None or self.rx.has_edge(i1, i2):
+			self._dirty = True
+			return
+		self._edge_total += 1
+		ei = self.rx.add_edge(i1, i2, e)
+		self.e_to_i[e] = ei
+		self.i_to_e[ei] = e
+
+	#============================================
+	def edge_removed(self, graph: object, e: object) -> object:
+		"""Mirror one edge removed (or temporarily disconnected) from graph.edges.
+
+		Args:
+			graph: An OASA Graph instance.
+			e: The OASA Edge just removed.
+		"""
+		ei = self.e_to_i.get(e)
+		if (not self._in_step(graph) or self._collapsed_edges or ei is None
+				or self._edge_total - 1 != len(graph.edges)):
+			self._dirty = True
+			return
+		self._edge_total -= 1
+		self.rx.remove_edge_from_index(ei)
+		del self.e_to_i[e]
+		del self.i_to_e[ei]
+
 	# ------------------------------------------------------------------
 	# Algorithm delegates
 	# Each calls ensure_synced first and returns OASA objects.
@@ -202,8 +316,9 @@ class RxBackend:
 		# empty graph has no node 0, so return early
 		if len(self.rx) == 0:
 			return []
-		# pin root=0 for deterministic cycle basis on cage molecules
-		rx_cycles = rustworkx.cycle_basis(self.rx, root=0)
+		# pin the root to the first vertex (node 0 after a rebuild) for a
+		# deterministic cycle basis on cage molecules
+		rx_cycles = rustworkx.cycle_basis(self.rx, root=self._root_index(graph))
 		result = []
 		for index_list in rx_cycles:
 			vertex_set = set()
@@ -212,6 +327,12 @@ class RxBackend:
 			result.append(vertex_set)
 		return result
 
+	#============================================
+	def _root_index(self, graph: object) -> int:
+		"""Return the mirror index of graph's first vertex."""
+		first = next(iter(graph.vertices))
+		return self.v_to_i[first]
+
 	#============================================
 	def bridges(self, graph: object) -> set:
 		"""Return all bridge edges as a set of OASA Edge objects.
@@ -33,10 +33,13 @@ class Vertex(object):
   Vertex has a value attribute used to store arbitrary objects.
   """
   attrs_to_copy: tuple[str, ...] = ("value",)
+  # fixed fields live in slots; __dict__ stays available for ad hoc attributes
+  # but is only allocated once one is set
+  __slots__ = ("value", "_neighbors", "_properties", "_cache_store", "_revision", "__dict__", "__weakref__")
 
   def __init__(self) -> None:
-    self.properties_ = {} # used to store intermediate properties such as distances etc.
     self.value = None  # used to store any object associated with the vertex
+    self._revision = 0  # see oasa.graph.revision; 0 means never edited
     self._neighbors = {} # set of all neighbors
     self._clean_cache()
 
@@ -45,8 +48,41 @@ class Vertex(object):
     return ("vertex, value=%s, degree=%d, " % (str(self.value), self.degree)) + str(self.properties_)
 
 
+  @property
+  def properties_(self) -> dict:
+    """Intermediate properties such as distances etc., created on first use.
+
+    """
+    try:
+      return self._properties
+    except AttributeError:
+      self._properties = {}
+      return self._properties
+
+
+  @properties_.setter
+  def properties_(self, properties: dict) -> None:
+    self._properties = properties
+
+
+  @property
+  def _cache(self) -> dict:
+    """Cached derived values, created on first use and dropped by _clean_cache.
+
+    """
+    cache = self._cache_store
+    if cache is None:
+      cache = self._cache_store = {}
+    return cache
+
+
+  @_cache.setter
+  def _cache(self, cache: dict) -> None:
+    self._cache_store = cache
+
+
   def _clean_cache(self) -> object:
-    self._cache = {}
+    self._cache_store = None
 
 
   def copy(self) -> object:
@@ -83,13 +119,28 @@ class Vertex(object):
       raise Exception("Cannot remove non-existing edge", e)
 
 
+  def _adjacency(self) -> object:
+    """returns cached (edges, neighbors) tuples over connected edges;
+    add_neighbor, remove_neighbor and edge disconnected toggles drop the cache"""
+    cache = self._cache_store
+    if cache is None:
+      cache = self._cache_store = {}
+    else:
+      adjacency = cache.get('adjacency')
+      if adjacency is not None:
+        return adjacency
+    pairs = [(e, v) for (e, v) in self._neighbors.items() if not e.disconnected]
+    adjacency = (tuple(e for e, _v in pairs), tuple(v for _e, v in pairs))
+    cache['adjacency'] = adjacency
+    return adjacency
+
+
   @property
   def neighbors(self) -> object:
-    """Neighboring vertices.
+    """Neighboring vertices, as a tuple.
 
     """
-    return [v for (e,v) in list(self._neighbors.items())
-                  if not e.disconnected]
+    return self._adjacency()[1]
 
 
   def get_neighbor_connected_via( self, e: object) -> object:
@@ -97,10 +148,14 @@ class Vertex(object):
 
 
   def get_edge_leading_to(self, a: object) -> object:
-    for b, at in list(self._neighbors.items()):
-      if a == at:
-        return b
-    return None
+    try:
+      edges_to = self._cache['edges_to']
+    except KeyError:
+      edges_to = {}
+      for b, at in self._neighbors.items():
+        edges_to.setdefault(at, b)
+      self._cache['edges_to'] = edges_to
+    return edges_to.get(a)
 
 
   @property
@@ -108,7 +163,7 @@ class Vertex(object):
     """Degree of the vertex.
 
     """
-    return len(self.neighbors)
+    return len(self._adjacency()[0])
 
 
   def get_neighbors_with_distance( self, d: object) -> object:
@@ -120,15 +175,13 @@ class Vertex(object):
 
 
   def get_neighbor_edge_pairs(self) -> object:
-    for e, v in list(self._neighbors.items()):
-      if not e.disconnected:
-        yield e,v
+    edges, neighbors = self._adjacency()
+    return zip(edges, neighbors)
 
 
   @property
   def neighbor_edges(self) -> object:
-    """Neighboring edges.
+    """Neighboring edges, as a tuple.
 
     """
-    return [e for e in list(self._neighbors.keys())
-                if not e.disconnected]
+    return self._adjacency()[0]
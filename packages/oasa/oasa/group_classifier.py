@@ -0,0 +1,253 @@
+#--------------------------------------------------------------------------
+#     This file is part of OASA - a free chemical python library
+#     Copyright (C) 2003-2008 Beda Kosata <beda@zirael.org>
+
+#     This program is free software; you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation; either version 2 of the License, or
+#     (at your option) any later version.
+
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+
+#     Complete text of GNU GPL can be found in the file LICENSE in the
+#     main directory of the program
+
+#--------------------------------------------------------------------------
+
+"""Functional-group and ring classification over ``oasa.subsearch_data``.
+
+``GroupClassifier`` reads every pattern once with the built-in SMILES
+parser and keeps it as a compiled VF2 query.  Classifying a molecule
+prepares its search graphs once, skips group patterns that need more atoms
+of some element than the molecule has, and tests ring patterns only when
+one of the molecule's relevant rings has the same size and elements.  A
+ring pattern must cover exactly such a ring.  Relevant rings are the union
+of all minimum cycle bases, so bridged systems such as bicyclo[2.2.2]octane
+report every smallest ring and not the two an SSSR happens to pick.
+
+Group patterns use implicit free sites.  The free-site positions listed in
+``subsearch_data.structures`` mark the skeleton atoms a group hangs on;
+they are reported apart from the group atoms.  The SHA-1 keys of the ring
+table are not used.
+"""
+
+# Standard Library
+import os
+import dataclasses
+import collections
+import concurrent.futures
+
+# local repo modules
+import oasa.smiles_lib
+import oasa.subsearch_data
+import oasa.substructure_search
+
+
+# batches smaller than this are classified in the calling process
+_POOL_THRESHOLD = 200
+
+
+#============================================
+@dataclasses.dataclass(frozen=True)
+class GroupMatch:
+	"""One functional group or ring found in a molecule.
+
+	Atom entries are positions in ``molecule.vertices``.  ``kind`` is
+	``"group"`` or ``"ring"``; ``family`` is the group family from
+	``subsearch_data`` or ``"ring"``.
+	"""
+
+	kind: str
+	name: str
+	family: str
+	atoms: tuple[int, ...]
+	attachments: tuple[int, ...] = ()
+
+
+#============================================
+@dataclasses.dataclass(frozen=True)
+class _Pattern:
+	"""One compiled table entry."""
+
+	kind: str
+	name: str
+	family: str
+	query: oasa.substructure_search.CompiledQuery
+	# heavy-atom counts the target must reach
+	elements: tuple[tuple[str, int], ...]
+	# query vertex positions reported as attachments
+	attachments: frozenset[int]
+	ring: tuple | None = None
+
+
+#============================================
+def _read_pattern(smiles: str) -> object:
+	"""Return a pattern molecule; the tables use OASA extensions such as a bare H."""
+	reader = oasa.smiles_lib.Smiles()
+	reader.read_smiles(smiles)
+	return reader.get_structure()
+
+
+#============================================
+def _ring_signature(atoms: object) -> tuple:
+	"""Return the (size, sorted element symbols) signature of a ring."""
+	symbols = sorted(a.symbol for a in atoms)
+	return (len(symbols), tuple(symbols))
+
+
+#============================================
+def _heavy_elements(mol: object) -> tuple:
+	"""Return sorted (symbol, count) pairs of the non-hydrogen atoms of ``mol``."""
+	counts = collections.Counter(v.symbol for v in mol.vertices if v.symbol != 'H')
+	return tuple(sorted(counts.items()))
+
+
+#============================================
+class GroupClassifier:
+	"""Find every functional group and ring of a pattern table in molecules.
+
+	The default tables are ``subsearch_data.structures`` and
+	``subsearch_data.rings``; other tables must use the same tuple layouts.
+	"""
+
+	#============================================
+	def __init__(self, structures: object = None, rings: object = None) -> None:
+		"""Read and compile all patterns."""
+		if structures is None:
+			structures = oasa.subsearch_data.structures
+		if rings is None:
+			rings = oasa.subsearch_data.rings
+		# kept so worker processes can compile the same tables
+		self._tables = (tuple(structures), tuple(rings))
+		self._groups = []
+		for name, family, smiles, free_sites in structures:
+			query = _read_pattern(smiles)
+			self._groups.append(_Pattern(
+				kind="group", name=name, family=family,
+				query=oasa.substructure_search.CompiledQuery(query, implicit_freesites=True),
+				elements=_heavy_elements(query),
+				attachments=frozenset(number - 1 for number in free_sites),
+			))
+		self._rings = []
+		for name, smiles, _key in rings:
+			query = _read_pattern(smiles)
+			self._rings.append(_Pattern(
+				kind="ring", name=name, family="ring",
+				query=oasa.substructure_search.CompiledQuery(query, implicit_freesites=True),
+				elements=_heavy_elements(query),
+				attachments=frozenset(),
+				ring=_ring_signature(query.vertices),
+			))
+
+	#============================================
+	def classify(self, mol: object) -> list:
+		"""Return the GroupMatch of every group and ring found in ``mol``.
+
+		Groups come first in table order, then rings in table order.
+		"""
+		target = oasa.substructure_search.SearchTarget(mol)
+		elements = collections.Counter(v.symbol for v in mol.vertices)
+		matches = []
+		for pattern in self._groups:
+			if any(elements[symbol] < count for symbol, count in pattern.elements):
+				continue
+			for image in oasa.substructure_search.iter_images(target, pattern.query):
+				atoms = []
+				attachments = []
+				for position, index in enumerate(image):
+					if index is None:
+						continue
+					if position in pattern.attachments:
+						attachments.append(index)
+					else:
+						atoms.append(index)
+				matches.append(GroupMatch(
+					"group", pattern.name, pattern.family, tuple(sorted(atoms)), tuple(sorted(attachments)),
+				))
+		if not self._rings:
+			return matches
+		positions = {v: i for i, v in enumerate(mol.vertices)}
+		rings = collections.defaultdict(set)
+		for ring in mol.get_rings("relevant"):
+			rings[_ring_signature(ring)].add(frozenset(positions[v] for v in ring))
+		for pattern in self._rings:
+			candidates = rings.get(pattern.ring)
+			if not candidates:
+				continue
+			found = set()
+			for image in oasa.substructure_search.iter_images(target, pattern.query):
+				ring = frozenset(image)
+				if ring in candidates:
+					found.add(tuple(sorted(ring)))
+			for atoms in sorted(found):
+				matches.append(GroupMatch("ring", pattern.name, "ring", atoms))
+		return matches
+
+	#============================================
+	def classify_many(self, mols: object, processes: int | None = None, chunksize: int = 16) -> list:
+		"""Return ``classify(mol)`` for each molecule, in input order.
+
+		Batches of at least 200 molecules go to a process pool of
+		``processes`` workers (default: one per CPU) in chunks of
+		``chunksize``; each worker compiles the tables once.  Molecules must
+		pickle to use the pool.  With one worker everything runs in this
+		process.
+		"""
+		mols = list(mols)
+		workers = processes or os.cpu_count() or 1
+		if workers < 2 or len(mols) < _POOL_THRESHOLD:
+			return [self.classify(mol) for mol in mols]
+		with concurrent.futures.ProcessPoolExecutor(
+			max_workers=workers, initializer=_start_worker, initargs=self._tables,
+		) as pool:
+			return list(pool.map(_classify_in_worker, mols, chunksize=chunksize))
+
+
+#============================================
+class _ClassifierHolder:
+	"""One lazily compiled classifier kept for the life of a process."""
+
+	#============================================
+	def __init__(self) -> None:
+		"""Start empty; ``compile`` or ``get`` builds the classifier."""
+		self.classifier = None
+
+	#============================================
+	def compile(self, structures: object = None, rings: object = None) -> GroupClassifier:
+		"""Compile and keep a classifier for the given tables."""
+		self.classifier = GroupClassifier(structures, rings)
+		return self.classifier
+
+	#============================================
+	def get(self) -> GroupClassifier:
+		"""Return the kept classifier, compiling the default tables on first use."""
+		if self.classifier is None:
+			return self.compile()
+		return self.classifier
+
+
+# classifier compiled by the pool initializer of each worker process
+_WORKER_STATE = _ClassifierHolder()
+# default-table classifier behind shared_group_classifier()
+_SHARED_STATE = _ClassifierHolder()
+
+
+#============================================
+def _start_worker(structures: tuple, rings: tuple) -> None:
+	"""Compile the pattern tables once in a pool worker."""
+	_WORKER_STATE.compile(structures, rings)
+
+
+#============================================
+def _classify_in_worker(mol: object) -> list:
+	"""Classify one molecule with the worker's classifier."""
+	return _WORKER_STATE.classifier.classify(mol)
+
+
+#============================================
+def shared_group_classifier() -> GroupClassifier:
+	"""Return the process-wide classifier for the ``subsearch_data`` tables."""
+	return _SHARED_STATE.get()
@@ -28,10 +28,17 @@ Bond directions align with organic chemistry convention:
   30, 90, 150, 210, 270, 330 degrees.
 Snapping is O(1) per point: invert the basis matrix, then compare the four
 lattice vertices around the fractional skew coordinates in Cartesian space.
+Whole-molecule helpers run the same arithmetic on NumPy arrays, so they give
+bit-identical results to the per-point functions.
 """
 
 from math import cos, floor, isfinite, pi, sqrt, sin
 
+import numpy
+
+# elements per array block when scoring every atom as a candidate grid origin
+_ORIGIN_BLOCK_ELEMENTS = 1 << 20
+
 
 #============================================
 def hex_basis_vectors(spacing: float) -> tuple:
@@ -342,12 +349,10 @@ def all_atoms_on_hex_grid(atom_coords: list, spacing: float,
 	Returns:
 		True if every atom is within tolerance of a grid point.
 	"""
-	for coord in atom_coords:
-		x, y = coord
-		dist = distance_to_hex_grid(x, y, spacing, origin_x, origin_y)
-		if dist > tolerance:
-			return False
-	return True
+	if not len(atom_coords):
+		return True
+	distances = hex_grid_distances(atom_coords, spacing, origin_x, origin_y)
+	return not bool((distances > tolerance).any())
 
 
 #============================================
@@ -374,6 +379,87 @@ def all_bonds_on_hex_grid(atom_coords: list, bond_pairs: list,
 	return True
 
 
+#============================================
+def _nearest_lattice_points(xs: numpy.ndarray, ys: numpy.ndarray, spacing: float,
+		origin_x: object, origin_y: object) -> tuple:
+	"""Return (px, py) arrays of the nearest lattice vertices of broadcast points.
+
+	Array form of hex_grid_index() followed by hex_grid_point(): the same
+	operations in the same order, and the same lexicographic tie policy, since
+	candidates are visited in ascending (n, m) order and only a strictly
+	smaller distance replaces the current best.
+
+	Raises:
+		ValueError: If any value is invalid, as in hex_grid_index().
+	"""
+	if not isfinite(spacing) or not all(
+			numpy.isfinite(values).all() for values in (xs, ys, origin_x, origin_y)):
+		raise ValueError("hex grid coordinates, origin, and spacing must be finite")
+	if spacing <= 0.0:
+		raise ValueError("hex grid spacing must be greater than zero")
+	dx = xs - origin_x
+	dy = ys - origin_y
+	half_sqrt3 = sqrt(3.0) / 2.0
+	n_frac = dx / (spacing * half_sqrt3)
+	m_frac = (dy - n_frac * spacing / 2.0) / spacing
+	if not (numpy.isfinite(n_frac).all() and numpy.isfinite(m_frac).all()):
+		raise ValueError("hex grid coordinate-to-spacing ratio is not representable")
+	n_floor = numpy.floor(n_frac)
+	m_floor = numpy.floor(m_frac)
+	best = None
+	for n in (n_floor, n_floor + 1):
+		for m in (m_floor, m_floor + 1):
+			delta_n = n - n_frac
+			delta_m = m - m_frac
+			distance_squared = delta_n * delta_n + delta_m * delta_m + delta_n * delta_m
+			if best is None:
+				best = (distance_squared, n, m)
+				continue
+			closer = distance_squared < best[0]
+			best = (
+				numpy.where(closer, distance_squared, best[0]),
+				numpy.where(closer, n, best[1]),
+				numpy.where(closer, m, best[2]),
+			)
+	_, n, m = best
+	px = origin_x + n * spacing * half_sqrt3
+	py = origin_y + n * spacing / 2.0 + m * spacing
+	return px, py
+
+
+#============================================
+def snap_points_to_hex_grid(points: numpy.ndarray, spacing: float,
+		origin_x: float = 0.0, origin_y: float = 0.0) -> numpy.ndarray:
+	"""Snap every row of an (n, 2) point array to its nearest hex grid point.
+
+	Args:
+		points: Array of (x, y) rows.
+		spacing: Distance between adjacent grid points.
+		origin_x: X coordinate of the grid origin.
+		origin_y: Y coordinate of the grid origin.
+
+	Returns:
+		New (n, 2) array of snapped points.
+	"""
+	points = numpy.asarray(points, dtype=float).reshape(-1, 2)
+	px, py = _nearest_lattice_points(points[:, 0], points[:, 1], spacing, origin_x, origin_y)
+	return numpy.column_stack((px, py))
+
+
+#============================================
+def hex_grid_distances(points: numpy.ndarray, spacing: float,
+		origin_x: object = 0.0, origin_y: object = 0.0) -> numpy.ndarray:
+	"""Return the distance from each (x, y) row to its nearest hex grid point.
+
+	Origins may be arrays shaped to broadcast against the point columns.
+	"""
+	points = numpy.asarray(points, dtype=float).reshape(-1, 2)
+	xs = points[:, 0]
+	ys = points[:, 1]
+	px, py = _nearest_lattice_points(xs, ys, spacing, origin_x, origin_y)
+	return numpy.sqrt((xs - px) ** 2 + (ys - py) ** 2)
+
+
 #============================================
 def snap_molecule_to_hex_grid(atom_coords: list, spacing: float,
 		origin_x: float = 0.0, origin_y: float = 0.0) -> list:
@@ -388,12 +474,10 @@ def snap_molecule_to_hex_grid(atom_coords: list, spacing: float,
 	Returns:
 		List of (x, y) tuples snapped to the hex grid.
 	"""
-	snapped = []
-	for coord in atom_coords:
-		x, y = coord
-		sx, sy = snap_to_hex_grid(x, y, spacing, origin_x, origin_y)
-		snapped.append((sx, sy))
-	return snapped
+	if not len(atom_coords):
+		return []
+	snapped = snap_points_to_hex_grid(atom_coords, spacing, origin_x, origin_y)
+	return [tuple(point) for point in snapped.tolist()]
 
 
 #============================================
@@ -411,19 +495,21 @@ def find_best_grid_origin(atom_coords: list, spacing: float) -> tuple:
 	Returns:
 		Tuple (origin_x, origin_y) for the best grid origin.
 	"""
-	if not atom_coords:
+	if not len(atom_coords):
 		return (0.0, 0.0)
-	best_origin = (0.0, 0.0)
-	best_total = None
-	# try each atom as a candidate origin
-	for candidate in atom_coords:
-		ox, oy = candidate
-		total = 0.0
-		for coord in atom_coords:
-			x, y = coord
-			dist = distance_to_hex_grid(x, y, spacing, ox, oy)
-			total += dist
-		if best_total is None or total < best_total:
-			best_total = total
-			best_origin = (ox, oy)
-	return best_origin
+	points = numpy.asarray(atom_coords, dtype=float).reshape(-1, 2)
+	count = len(points)
+	totals = numpy.empty(count)
+	# score a block of candidate origins (rows) against every atom (columns)
+	block = max(1, _ORIGIN_BLOCK_ELEMENTS // count)
+	for start in range(0, count, block):
+		candidates = points[start:start + block]
+		distances = hex_grid_distances(
+			points, spacing, candidates[:, 0:1], candidates[:, 1:2],
+		).reshape(len(candidates), count)
+		# a running sum keeps the per-atom loop order
+		totals[start:start + block] = numpy.cumsum(distances, axis=1)[:, -1]
+	# argmin keeps the first of equal totals, like the strict loop comparison
+	best = int(numpy.argmin(totals))
+	ox, oy = atom_coords[best]
+	return (ox, oy)
@@ -0,0 +1,445 @@
+#--------------------------------------------------------------------------
+#     This file is part of OASA - a free chemical python library
+#     Copyright (C) 2003-2008 Beda Kosata <beda@zirael.org>
+
+#     This program is free software; you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation; either version 2 of the License, or
+#     (at your option) any later version.
+
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+
+#     Complete text of GNU GPL can be found in the file LICENSE in the
+#     main directory of the program
+
+#--------------------------------------------------------------------------
+
+"""Memoized canonical SMILES, InChI and InChIKey generation.
+
+``IdentifierService`` keeps generated identifiers in a bounded LRU map and,
+when given a path, in an SQLite file shared between runs.  Molecules are
+looked up by ``molecule_key``: the SHA-1 digest of their canonical key
+(``canonical_ranking``: symbol, isotope, charge, hydrogen count,
+multiplicity and bond order of every atom and bond) plus their stereo.
+Stereo is the wedge and hash bonds, the angular order of the neighbors
+around the atoms those bonds touch, and the ``stereochemistry`` records, all
+written with canonical ranks.  When a molecule has stereo and refinement had
+to break ties between symmetric atoms, the key also pins the atom order, so
+such a drawing only shares entries with identical drawings.  Wedge drawings
+with missing or coinciding coordinates have no key and are generated on
+every request, so they fail exactly as the uncached generators do.
+
+The SQLite file records the key scheme and the RDKit version; a file
+written under a different one is emptied when opened.  Failed generations
+are never cached.
+"""
+
+# Standard Library
+import os
+import json
+import math
+import sqlite3
+import hashlib
+import threading
+import collections
+import dataclasses
+import concurrent.futures
+
+# PIP3 modules
+import rdkit
+import rdkit.RDLogger
+
+# local repo modules
+import oasa.canonical_ranking
+import oasa.codecs.rdkit_formats
+
+
+# Identifier entries that stay cached in memory for the life of the service.
+_CACHE_CAPACITY = 4096
+
+# Smallest number of distinct misses that goes to a process pool.
+_POOL_THRESHOLD = 500
+
+# Bumped whenever molecule_key or the cached values change meaning.
+_KEY_VERSION = 1
+
+# exceptions that mean "no identifier for this molecule" in bulk requests
+_GENERATION_ERRORS = (AttributeError, IndexError, KeyError, RuntimeError, TypeError, ValueError)
+
+
+#============================================
+@dataclasses.dataclass(frozen=True)
+class IdentifierCacheInfo:
+	"""Hit and miss counters of an identifier service."""
+	hits: int
+	disk_hits: int
+	misses: int
+	maxsize: int
+	currsize: int
+
+	@property
+	def hit_rate(self) -> float:
+		"""Return the fraction of lookups served from memory or disk."""
+		total = self.hits + self.disk_hits + self.misses
+		return (self.hits + self.disk_hits) / total if total else 0.0
+
+
+#============================================
+def _finite_coordinates(mol: object) -> bool:
+	"""Return True when every vertex has finite x, y and z coordinates."""
+	try:
+		return all(
+			math.isfinite(float(v.x)) and math.isfinite(float(v.y)) and math.isfinite(float(v.z))
+			for v in mol.vertices
+		)
+	except (AttributeError, TypeError, ValueError):
+		return False
+
+
+#============================================
+def _angular_order(atom: object, position: dict, ranks: list) -> tuple | None:
+	"""Return the neighbor ranks of ``atom`` counterclockwise, lowest rank first.
+
+	None when a neighbor lies on top of ``atom`` in the drawing plane.
+	"""
+	angles = []
+	for neighbor in atom.neighbors:
+		dx = neighbor.x - atom.x
+		dy = neighbor.y - atom.y
+		if math.hypot(dx, dy) <= 1e-9:
+			return None
+		angles.append((math.atan2(dy, dx), ranks[position[neighbor]]))
+	order = [rank for _angle, rank in sorted(angles)]
+	if not order:
+		return ()
+	first = order.index(min(order))
+	return tuple(order[first:] + order[:first])
+
+
+#============================================
+def _stereo_descriptor(mol: object, ranks: list) -> tuple | None:
+	"""Return the wedge, hash and recorded stereo of ``mol`` in canonical ranks.
+
+	None when wedge or hash bonds meet missing or degenerate coordinates.
+	"""
+	position = {v: i for i, v in enumerate(mol.vertices)}
+
+	def rank_of(item: object) -> int:
+		"""Return the rank of a vertex, -1 for anything else."""
+		index = position.get(item)
+		return -1 if index is None else ranks[index]
+
+	styled = []
+	touched = set()
+	for bond in mol.edges:
+		style = getattr(bond, "type", "n")
+		if style in ("w", "h"):
+			start, end = bond.vertices
+			styled.append((rank_of(start), rank_of(end), style))
+			touched.update((start, end))
+	if touched and not _finite_coordinates(mol):
+		return None
+	around = []
+	for atom in touched:
+		order = _angular_order(atom, position, ranks)
+		if order is None:
+			return None
+		around.append((rank_of(atom), order))
+	around.sort()
+	recorded = sorted(
+		(
+			type(item).__name__, repr(item.value), rank_of(item.center),
+			tuple(rank_of(reference) for reference in item.references),
+		)
+		for item in getattr(mol, "stereochemistry", ())
+	)
+	return (tuple(sorted(styled)), tuple(around), tuple(recorded))
+
+
+#============================================
+def molecule_key(mol: object) -> str | None:
+	"""Return the identifier cache key of ``mol`` as a hex digest.
+
+	Isomorphic molecules with the same atom and bond invariants and the same
+	stereo get equal keys; equal keys always mean equal identifiers.  None
+	for wedge drawings with missing or degenerate coordinates.
+	"""
+	key, ranks = oasa.canonical_ranking.canonical_key_and_ranks(mol)
+	stereo = _stereo_descriptor(mol, ranks)
+	if stereo is None:
+		return None
+	pinned = None
+	if any(stereo) and len(set(oasa.canonical_ranking.symmetry_classes(mol))) < len(ranks):
+		# ranks of symmetric atoms came from tie breaking; do not trust them for stereo
+		pinned = tuple(ranks)
+	text = repr((_KEY_VERSION, key, stereo, pinned))
+	return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+#============================================
+def _compute_identifiers(mol: object) -> tuple:
+	"""Return (canonical SMILES, standard InChI, InChIKey) of ``mol``."""
+	smiles = oasa.codecs.rdkit_formats.depiction_stereo_smiles_mol_to_text(mol)
+	facts = oasa.codecs.rdkit_formats.identifiers_from_smiles(smiles)
+	return (facts.smiles, facts.inchi, facts.inchikey)
+
+
+#============================================
+def _try_identifiers(mol: object) -> tuple | None:
+	"""Return ``_compute_identifiers(mol)``, or None when generation fails."""
+	try:
+		return _compute_identifiers(mol)
+	except _GENERATION_ERRORS:
+		return None
+
+
+#============================================
+def _start_worker() -> None:
+	"""Silence RDKit messages in a pool worker; failures come back as None."""
+	rdkit.RDLogger.DisableLog("rdApp.*")
+
+
+#============================================
+def _facts(value: tuple) -> oasa.codecs.rdkit_formats.MoleculeIdentifierFacts:
+	"""Return identifier facts for a cached (smiles, inchi, inchikey) value."""
+	smiles, inchi, inchikey = value
+	return oasa.codecs.rdkit_formats.MoleculeIdentifierFacts(smiles, inchi, inchikey, ())
+
+
+#============================================
+def _open_database(path: str) -> sqlite3.Connection:
+	"""Open or create the identifier file, emptying it if its scheme is stale."""
+	db = sqlite3.connect(path, check_same_thread=False)
+	db.execute("PRAGMA journal_mode=WAL")
+	with db:
+		db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+		db.execute(
+			"CREATE TABLE IF NOT EXISTS identifiers ("
+			"kind TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+			"PRIMARY KEY (kind, key))"
+		)
+		scheme = f"{_KEY_VERSION}:{rdkit.__version__}"
+		row = db.execute("SELECT value FROM meta WHERE name = 'scheme'").fetchone()
+		if row is None or row[0] != scheme:
+			db.execute("DELETE FROM identifiers")
+			db.execute("INSERT OR REPLACE INTO meta VALUES ('scheme', ?)", (scheme,))
+	return db
+
+
+#============================================
+class IdentifierService:
+	"""LRU map, and optionally an SQLite file, of generated identifiers."""
+
+	#============================================
+	def __init__(self, capacity: int = _CACHE_CAPACITY, path: str | None = None) -> None:
+		"""Create an empty memory cache, backed by the SQLite file at ``path`` if given."""
+		self._capacity = capacity
+		self._entries: collections.OrderedDict = collections.OrderedDict()
+		self._hits = 0
+		self._disk_hits = 0
+		self._misses = 0
+		self._lock = threading.Lock()
+		self._db = None if path is None else _open_database(path)
+
+	#============================================
+	def _remember(self, entry: tuple, value: tuple) -> None:
+		"""Put ``value`` in the memory map, evicting the oldest entries; lock held."""
+		self._entries[entry] = value
+		self._entries.move_to_end(entry)
+		while len(self._entries) > self._capacity:
+			self._entries.popitem(last=False)
+
+	#============================================
+	def _lookup(self, entry: tuple) -> tuple | None:
+		"""Return the cached value of ``entry`` from memory or disk, None on a miss."""
+		with self._lock:
+			value = self._entries.get(entry)
+			if value is not None:
+				self._entries.move_to_end(entry)
+				self._hits += 1
+				return value
+			if self._db is not None:
+				row = self._db.execute(
+					"SELECT value FROM identifiers WHERE kind = ? AND key = ?", entry,
+				).fetchone()
+				if row is not None:
+					value = tuple(json.loads(row[0]))
+					self._remember(entry, value)
+					self._disk_hits += 1
+					return value
+			self._misses += 1
+			return None
+
+	#============================================
+	def _store(self, items: list) -> None:
+		"""Cache (entry, value) pairs in memory and, in one transaction, on disk."""
+		with self._lock:
+			for entry, value in items:
+				self._remember(entry, value)
+			if self._db is not None and items:
+				with self._db:
+					self._db.executemany(
+						"INSERT OR REPLACE INTO identifiers VALUES (?, ?, ?)",
+						[(kind, key, json.dumps(value)) for (kind, key), value in items],
+					)
+
+	#============================================
+	def _cached(self, entry: tuple, compute: object) -> tuple:
+		"""Return the cached value of ``entry``, computing it outside the lock on a miss.
+
+		Entries without a key are computed every time and never stored.
+		"""
+		if entry[1] is None:
+			with self._lock:
+				self._misses += 1
+			return tuple(compute())
+		value = self._lookup(entry)
+		if value is None:
+			value = tuple(compute())
+			self._store([(entry, value)])
+		return value
+
+	#============================================
+	def smiles(self, mol: object) -> str:
+		"""Return canonical isomeric SMILES of ``mol``, honoring wedge and hash bonds.
+
+		Cached apart from ``identifiers``, so a SMILES query never pays for InChI.
+		"""
+
+		def compute() -> tuple:
+			return (oasa.codecs.rdkit_formats.depiction_stereo_smiles_mol_to_text(mol),)
+
+		return self._cached(("depiction-smiles", molecule_key(mol)), compute)[0]
+
+	#============================================
+	def identifiers(self, mol: object) -> oasa.codecs.rdkit_formats.MoleculeIdentifierFacts:
+		"""Return canonical SMILES, standard InChI and InChIKey of ``mol``.
+
+		Raises:
+			ValueError: If RDKit cannot generate an identifier.
+		"""
+		value = self._cached(("identifiers", molecule_key(mol)), lambda: _compute_identifiers(mol))
+		return _facts(value)
+
+	#============================================
+	def identifiers_from_smiles(self, smiles: str) -> oasa.codecs.rdkit_formats.MoleculeIdentifierFacts:
+		"""Return ``rdkit_formats.identifiers_from_smiles(smiles)``, keyed by the SMILES text."""
+
+		def compute() -> tuple:
+			facts = oasa.codecs.rdkit_formats.identifiers_from_smiles(smiles)
+			return (facts.smiles, facts.inchi, facts.inchikey)
+
+		if type(smiles) is not str:
+			# let the generator report the bad argument
+			return _facts(compute())
+		return _facts(self._cached(("smiles", smiles), compute))
+
+	#============================================
+	def inchi_and_key(self, mol: object, fixed_hs: bool = True) -> tuple:
+		"""Return ``rdkit_formats.generate_inchi_and_inchikey(mol, fixed_hs)``, cached.
+
+		Returns:
+			tuple: (inchi, inchikey, warnings); ``warnings`` is a new empty list.
+		"""
+
+		def compute() -> tuple:
+			inchi, key, _warnings = oasa.codecs.rdkit_formats.generate_inchi_and_inchikey(mol, fixed_hs=fixed_hs)
+			return (inchi, key)
+
+		kind = "inchi-fixedh" if fixed_hs else "inchi"
+		inchi, key = self._cached((kind, molecule_key(mol)), compute)
+		return inchi, key, []
+
+	#============================================
+	def identifiers_many(self, mols: object, processes: int | None = None, chunksize: int = 16) -> list:
+		"""Return ``identifiers(mol)`` for each molecule, in input order.
+
+		Molecules with equal keys are generated once.  When at least 500
+		distinct molecules miss the cache they go to a process pool of
+		``processes`` workers (default: one per CPU) in chunks of
+		``chunksize``; molecules must pickle to use the pool.  A molecule
+		whose identifiers cannot be generated gives None instead of raising,
+		and one without a key is generated on its own.
+		"""
+		mols = list(mols)
+		keys = [molecule_key(mol) for mol in mols]
+		found = {}
+		missing = {}
+		for index, (key, mol) in enumerate(zip(keys, mols)):
+			if key is None:
+				# no key: generate it on its own, never cached
+				key = keys[index] = ("unkeyed", index)
+				missing[key] = mol
+				continue
+			if key in found or key in missing:
+				continue
+			value = self._lookup(("identifiers", key))
+			if value is None:
+				missing[key] = mol
+			else:
+				found[key] = value
+		pending = list(missing.items())
+		workers = processes or os.cpu_count() or 1
+		if workers < 2 or len(pending) < _POOL_THRESHOLD:
+			computed = [_try_identifiers(mol) for _key, mol in pending]
+		else:
+			with concurrent.futures.ProcessPoolExecutor(
+				max_workers=workers, initializer=_start_worker,
+			) as pool:
+				computed = list(pool.map(_try_identifiers, [mol for _key, mol in pending], chunksize=chunksize))
+		fresh = [(key, value) for (key, _mol), value in zip(pending, computed) if value is not None]
+		self._store([(("identifiers", key), value) for key, value in fresh if type(key) is str])
+		found.update(fresh)
+		return [_facts(found[key]) if key in found else None for key in keys]
+
+	#============================================
+	def cache_info(self) -> IdentifierCacheInfo:
+		"""Return hit and miss counters and the current memory cache size."""
+		with self._lock:
+			return IdentifierCacheInfo(
+				self._hits, self._disk_hits, self._misses, self._capacity, len(self._entries),
+			)
+
+	#============================================
+	def cache_clear(self) -> None:
+		"""Drop every entry held in memory and reset the counters; the file is kept."""
+		with self._lock:
+			self._entries.clear()
+			self._hits = 0
+			self._disk_hits = 0
+			self._misses = 0
+
+	#============================================
+	def close(self) -> None:
+		"""Close the SQLite file; the memory cache stays usable."""
+		with self._lock:
+			if self._db is not None:
+				self._db.close()
+				self._db = None
+
+
+_SHARED_SERVICE = None
+
+
+#============================================
+def shared_identifier_service() -> IdentifierService:
+	"""Return the process-wide identifier service, memory-only unless configured."""
+	global _SHARED_SERVICE
+	if _SHARED_SERVICE is None:
+		_SHARED_SERVICE = IdentifierService()
+	return _SHARED_SERVICE
+
+
+#============================================
+def configure_shared_identifier_service(
+		path: str | None = None, capacity: int = _CACHE_CAPACITY,
+		) -> IdentifierService:
+	"""Replace the process-wide service, backed by the SQLite file at ``path`` if given."""
+	global _SHARED_SERVICE
+	if _SHARED_SERVICE is not None:
+		_SHARED_SERVICE.close()
+	_SHARED_SERVICE = IdentifierService(capacity=capacity, path=path)
+	return _SHARED_SERVICE
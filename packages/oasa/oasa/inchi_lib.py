@@ -769,9 +769,11 @@ def generate_inchi_and_inchikey(m: object, program: object=None, fixed_hs: objec
   """Generate InChI and InChIKey using RDKit (no external binary needed).
 
   The program parameter is accepted for backward compatibility but ignored.
+  Results are memoized by the shared identifier service.
   """
-  from oasa.codecs import rdkit_formats
-  inchi, key, warnings = rdkit_formats.generate_inchi_and_inchikey(m, fixed_hs=fixed_hs)
+  from oasa import identifier_service
+  service = identifier_service.shared_identifier_service()
+  inchi, key, warnings = service.inchi_and_key(m, fixed_hs=fixed_hs)
   if not key and not ignore_key_error:
     raise oasa_inchi_error("InChIKey could not be generated.")
   return inchi, key, warnings
@@ -20,16 +20,18 @@
 
 
 import copy
-import math
 
 from oasa import oasa_utils as misc
+from oasa.graph import longest_paths
 from oasa.graph.graph_lib import Graph as base_graph
 from oasa import common
+from oasa import canonical_ranking
+from oasa import coordinate_arrays
+from oasa import substructure_search
 from oasa import transform3d_lib as transform3d
 from oasa import periodic_table as PT
 from oasa.atom_lib import Atom as atom
 from oasa.bond_lib import Bond as bond
-from oasa.query_atom import QueryAtom as query_atom
 
 
 
@@ -518,85 +520,60 @@ class Molecule(base_graph):
         self.remove_vertex( v)
 
 
-  def _get_atom_distance_matrix( self: object, a: object) -> object:
-    self.mark_vertices_with_distance_from( a)
-    big_out = []
-    i = 0
-    while 1:
-      out = [a.symbol_number for a in self.vertices if a.properties_['d'] == i]
-      if i > 0:
-        out2 = []
-        for a in self.vertices:
-          if a.properties_['d'] == i-1:
-            out2 += a.get_hydrogen_count() * [1]
-        out += out2
-      if out:
-        big_out.append(tuple(sorted(out)))
-      else:
-        return big_out
-      i += 1
+  def get_symmetry_classes( self: object) -> object:
+    """returns the canonical symmetry class index of each atom, in the order of self.vertices"""
+    return canonical_ranking.symmetry_classes( self)
+
+
+  def get_canonical_ranks( self: object) -> object:
+    """returns a distinct canonical rank (0..n-1) for each atom, in the order of self.vertices"""
+    return canonical_ranking.canonical_ranks( self)
+
+
+  def get_canonical_hash( self: object) -> object:
+    """returns a hex digest that is the same for isomorphic molecules (no stereo);
+    see canonical_ranking for the invariants used"""
+    return canonical_ranking.canonical_hash( self)
 
 
   def get_symmetry_unique_atoms( self: object) -> object:
-    out = []
-    vs = copy.copy( self.vertices)
-    for v in vs:
-      out.append( [i for i in self._get_atom_distance_matrix( v)])
-    while out:
-      k = vs.pop( 0)
-      v = out.pop( 0)
-      o = [k]
-      proc_vs = []
-      proc_out = []
-      while out:
-        k2 = vs.pop( 0)
-        v2 = out.pop( 0)
-        if v2 == v:
-          o.append( k2)
-        else:
-          proc_vs.append( k2)
-          proc_out.append( v2)
-      yield o
-      out = proc_out
-      vs = proc_vs
+    """yields lists of symmetry equivalent atoms, in the order of their first atom"""
+    groups = {}
+    for v, c in zip( self.vertices, self.get_symmetry_classes()):
+      groups.setdefault( c, []).append( v)
+    for group in groups.values():
+      yield group
 
 
   def number_atoms_uniquely( self: object) -> object:
-    out = {}
-    for v in self.vertices:
-      out[v] = [i for i in self._get_atom_distance_matrix( v)]
-      v.properties_['distance_matrix'] = out[v]
-    ms = sorted(out.values())
-    #self.remove_all_hydrogens()
-    i = 1
-    ret = []
-    for m in ms:
-      ret.append(list(out.keys())[list(out.values()).index(m)])
-      #if ret.symbol != 'H':
-      #  print("%3d: " % i, ret, ret.free_valency)
-      i += 1
+    """returns the atoms sorted by their canonical rank"""
+    ranks = self.get_canonical_ranks()
+    ret = [None] * len( ranks)
+    for v, rank in zip( self.vertices, ranks):
+      ret[ rank] = v
     return ret
 
 
-  def find_longest_mostly_carbon_chain( self: object) -> object:
+  def find_longest_mostly_carbon_chain( self: object, hetero_weight: object=None) -> object:
+    """returns the longest chain between two atoms of degree 1, as a list of atoms
+    from one end to the other, or None when there is no such pair;
+    with hetero_weight set, non-carbon atoms count hetero_weight instead of 1
+    and the chain with the largest total wins (longer chains win ties)"""
     if len( self.vertices) < 2:
       return copy.copy( self.vertices)
-    ends = [v for v in self.vertices
-                if v.degree == 1]
-    paths = []
-    for e1 in ends:
-      for e2 in ends:
-        if e1 != e2:
-          path = self.find_path_between( e1, e2)
-          paths.append( path)  # could be optimized by not storing all the paths (once we know how to weight the chains)
-    # for now we don't take care of chain composition
-    l = 0
-    p = None
-    for path in paths:
-      if len( path) > l:
-        l = len( path)
-        p = path
-    return p
+    adjacency = self._get_index_adjacency()
+    if hetero_weight is not None:
+      weights = [1 if v.symbol == 'C' else hetero_weight for v in self.vertices]
+      path = longest_paths.heaviest_end_path( adjacency, weights)
+      return path and [self.vertices[i] for i in path]
+    pair = longest_paths.farthest_end_pair( adjacency)
+    if not pair:
+      return None
+    e1, e2, path = pair
+    if path is None:
+      # rings allow several shortest paths; keep the one find_path_between picks
+      return self.find_path_between( self.vertices[e1], self.vertices[e2])
+    return [self.vertices[i] for i in path]
 
 
   def remove_zero_order_bonds( self: object) -> object:
@@ -607,195 +584,27 @@ class Molecule(base_graph):
 
 
   # --- the fragment matching routines ---
-  def select_matching_substructures( self: object, other: object, implicit_freesites: object=False, auto_cleanup: object=True) -> object:
+  def select_matching_substructures( self: object, other: object, implicit_freesites: object=False, auto_cleanup: object=True, limit: object=None) -> object:
     """select fragments that match the complete molecule 'other' and yield them
     as lists of atoms in the order of other.vertices; however when other has
     explicit hydrogens that match implicit hydrogens on self the length of the
     returned fragment might be shorter of the matched implicit hydrogens;
 
-    IF YOU DON'T LET THE GENERATOR RUN TO THE END OR SET THE auto_cleanup TO FALSE, YOU HAVE TO
-    RUN clean_after_search MANUALLY NOT TO CLUTTER THE STRUCTURE"""
-
-    # at first decide if we need to add implicit hydrogens to self
-    add_implicit = False
-    for v in other.vertices:
-      if (isinstance( v, atom) and v.symbol == 'H') or \
-         (isinstance( v, atom) and v.explicit_hydrogens > 0) or \
-         (isinstance( v, query_atom) and ('H' in v.symbols or 'R' in v.symbols)):
-        add_implicit = True
-        break
-    if add_implicit:
-      added_hs = self.add_missing_hydrogens()
-      for h in added_hs:
-        h.properties_['implicit_hydrogen'] = True
-    # here we add explicit hydrogens to other, we call them implicit_hydrogen to make it
-    # work the same way as implicit_hydrogen
-    for v in other.vertices:
-      for i in range( v.explicit_hydrogens):
-        h = other.create_vertex()
-        other.add_vertex( h)
-        h.symbol = 'H'
-        e = other.create_edge()
-        e.order = 1
-        other.add_edge( v, h, e=e)
-        h.properties_['implicit_hydrogen'] = True
-      v.explicit_hydrogens = 0  # make it 0 and after search put it back
-    # for implicit_freesites we add the free_sites here
-    if implicit_freesites:
-      for v in other.vertices:
-        v.properties_['old_free_sites'] = v.free_sites
-        v.free_sites = v.free_valency
-
-    # then we create the dicts for storing threads in each of the atoms
-    i = 0
-    for a in other.vertices:
-      a.properties_['subsearch'] = {}
-    for e in other.edges | self.edges:
-      e.properties_['subsearch'] = {}
-    # here we select the vertex to start from
-    vs = [v for v in other.vertices if isinstance( v, atom)]
-    sym = common.least_common_item( [v.symbol for v in vs])
-    v = [v for v in vs if v.symbol == sym][0]
-    for a in self.vertices:
-      a.properties_['subsearch'] = {}
-      if v.matches( a):
-        i += 1
-        a.properties_['subsearch'][i] = v
-        v.properties_['subsearch'][i] = a
-
-    # now we can proceed with the search
-    yielded = set()
-    for thread in self._mark_matching_threads( v, other):
-      vs = [v.properties_['subsearch'][thread] for v in other.vertices]
-      # for symetrical fragments we have to get rid of copies (O1=N=O2 and O2=N=O1)
-      vsset = frozenset( vs)
-      if vsset not in yielded:
-        if self._freesites_match( other, thread):
-          yield [v for v in vs if not 'implicit_hydrogen' in list(v.properties_.keys())]
-      yielded.add( vsset)
-
-    if auto_cleanup:
-      self.clean_after_search( other)
+    neither molecule is modified, so the generator may be abandoned at any time;
+    limit stops the search after that many fragments; auto_cleanup is accepted
+    for compatibility and ignored"""
+    return substructure_search.iter_matches( self, other, implicit_freesites=implicit_freesites, limit=limit)
 
 
   def clean_after_search( self: object, other: object) -> object:
-    # for implicit_freesites we restore original free_sites here
-    for v in other.vertices:
-      if "old_free_sites" in v.properties_:
-        v.free_sites = v.properties_['old_free_sites']
-        del v.properties_['old_free_sites']
-    # finally we remove the added implicit hydrogens
-    hs = [v for v in self.vertices if 'implicit_hydrogen' in list(v.properties_.keys())]
-    for v in hs:
-      del v.properties_['implicit_hydrogen']
-      self.remove_vertex( v)
-    # we also remove implicit_hydrogen (that represent atom.explicit_hydrogens) on other
-    # and also set the explicit_hydrogens count back to the original atoms
-    for v in other.vertices:
-      if 'implicit_hydrogen' not in v.properties_:
-        v.explicit_hydrogens = len( [h for h in v.neighbors if 'implicit_hydrogen' in h.properties_])
-    hs = [v for v in other.vertices if 'implicit_hydrogen' in list(v.properties_.keys())]
-    for v in hs:
-      del v.properties_['implicit_hydrogen']
-      other.remove_vertex( v)
-    for v in self.vertices + other.vertices:
-      del v.properties_['subsearch']
-    for e in self.edges | other.edges:
-      del e.properties_['subsearch']
-
-
-  def _mark_matching_threads( self: object, v: object, other: object) -> object:
-    """v is other vertex, other is the other molecule"""
-    thread = 0
-    threads = list(v.properties_['subsearch'].keys())
-    while threads:
-      thread = min( threads)
-      threads.remove( thread)
-
-      mirror = v.properties_['subsearch'][thread]
-      for e, n in v.get_neighbor_edge_pairs():
-        if thread not in n.properties_['subsearch']:
-          candidates = set()
-          for me, mn in mirror.get_neighbor_edge_pairs():
-            if thread not in mn.properties_['subsearch'] and mn.matches( n) and me.matches( e) and thread not in e.properties_['subsearch']:
-              candidates.add( (mn, me, e))
-
-          if candidates:
-            if len( candidates) > 1:
-              new_threads = self._spawn_thread( other, thread, len( candidates)-1)
-              ths = [thread] + new_threads
-            else:
-              ths = [thread]
-            for c, me, e in candidates:
-              th = ths.pop()
-              n.properties_['subsearch'][th] = c
-              c.properties_['subsearch'][th] = n
-              e.properties_['subsearch'][th] = me
-              me.properties_['subsearch'][th] = e
-            [x for x in self._mark_matching_threads( n, other)] # just make the generator run
-            if thread not in v.properties_['subsearch']:
-              # the thread already died
-              break
-            else:
-              pass
-          else:
-            self._delete_thread( other, thread)
-            break
-        # for proper handling of rings we have to check also the ones that are in this thread already
-        elif thread not in e.properties_['subsearch']:
-          me = self.get_edge_between( mirror, n.properties_['subsearch'][thread])
-          if me and e.matches( me):
-            e.properties_['subsearch'][thread] = me
-            me.properties_['subsearch'][thread] = e
-          else:
-            self._delete_thread( other, thread)
-            break
-        else:
-          pass
-
-      threads = [i for i in list(v.properties_['subsearch'].keys()) if i >= thread]
-      if thread in threads:
-        threads.remove( thread)
-        yield thread
-
-
-  def _spawn_thread( self: object, other: object, thread: object, number: object) -> object:
-    my_vs = [v for v in self.vertices if thread in v.properties_['subsearch']]
-    my_es = [e for e in self.edges if thread in e.properties_['subsearch']]
-    other_vs = [v for v in other.vertices if thread in v.properties_['subsearch']]
-    other_es = [e for e in other.edges if thread in e.properties_['subsearch']]
-    max_thread = max( [max( v.properties_['subsearch'].keys()) for v in other.vertices if v.properties_['subsearch']])
-    for i in range( max_thread +1, max_thread +number +1, 1):
-      for v in my_vs + my_es + other_vs + other_es:
-        v.properties_['subsearch'][ i] = v.properties_['subsearch'][thread]
-    return list(range(max_thread + 1, max_thread + number + 1, 1))
-
-
-  def _delete_thread( self: object, other: object, thread: object) -> object:
-    for v in self.vertices + other.vertices:
-      try:
-        del v.properties_['subsearch'][thread]
-      except KeyError:
-        pass
-
-
-  def _freesites_match( self: object, other: object, thread: object) -> object:
-    for v in other.vertices:
-      mirror = v.properties_['subsearch'][thread]
-      unmatched_ns = [n for n in mirror.neighbors if thread not in n.properties_['subsearch']] # and not n.symbol == 'H']
-      # if there is more unmatched neighbors then free-site it does not match (Hs don't count)
-      if not len( unmatched_ns)+mirror.explicit_hydrogens <= v.free_sites:
-        return False
-    return True
+    """kept for compatibility - the search no longer leaves anything to clean"""
+    pass
 
 
   def contains_substructure( self: object, other: object, implicit_freesites: object=True) -> object:
-    found = False
-    for i in self.select_matching_substructures( other, implicit_freesites=implicit_freesites, auto_cleanup=False):
-      found = True
-      break
-    self.clean_after_search( other)
-    return found
+    for i in self.select_matching_substructures( other, implicit_freesites=implicit_freesites, limit=1):
+      return True
+    return False
 
 
   # // --- end of the fragment matching routines ---
@@ -866,21 +675,9 @@ class Molecule(base_graph):
 
 
   def mark_morgan( self: object) -> object:
-    old_morgs = 0
-    for v in self.vertices:
-      v.properties_['new_morgan'] = v.degree #sum( [n.degree for n in v.neighbors])
-    new_morgs = len( set( [v.properties_['new_morgan'] for v in self.vertices]))
-
-    while new_morgs > old_morgs:
-      for v in self.vertices:
-        v.properties_['morgan'] = v.properties_['new_morgan']
-
-      for v in self.vertices:
-        v.properties_['new_morgan'] = v.properties_['morgan'] + sum( [n.properties_['morgan'] for n in v.neighbors])
-      old_morgs = new_morgs
-      new_morgs = len( set( [v.properties_['new_morgan'] for v in self.vertices]))
-
-    print("morgan", old_morgs, [v.properties_['morgan'] for v in self.vertices])
+    """stores the symmetry class of each atom in its properties_['morgan']"""
+    for v, c in zip( self.vertices, self.get_symmetry_classes()):
+      v.properties_['morgan'] = c
 
 
   ## some geometry related things
@@ -888,31 +685,16 @@ class Molecule(base_graph):
     """make the average bond-length be bond_length by scaling the structure up"""
     if not self.edges or len( self.vertices) < 2:
       return False
-
-    minx = None
-    maxx = None
-    miny = None
-    maxy = None
-    # atoms
-    for v in self.vertices:
-      if not maxx or v.x > maxx:
-        maxx = v.x
-      if not minx or v.x < minx:
-        minx = v.x
-      if not miny or v.y < miny:
-        miny = v.y
-      if not maxy or v.y > maxy:
-        maxy = v.y
-
-    scale = bond_length / self.get_mean_bond_length()
+    coords = self.coordinates_array()
+    minx, miny, maxx, maxy = coordinate_arrays.bounds( coords)
+    scale = bond_length / coordinate_arrays.mean_bond_length( coords, self.edge_index_array())
     movex = (maxx+minx)/2
     movey = (maxy+miny)/2
     trans = transform3d.Transform3d()
     trans.set_move( -movex, -movey, 0)
     trans.set_scaling( scale)
     trans.set_move( movex, movey, 0)
-    for v in self.atoms:
-      v.x, v.y, v.z = trans.transform_xyz( v.x, v.y, v.z)
+    self.set_coordinates_array( coordinate_arrays.transform( coords, trans.mat.mat))
     return True
 
 
@@ -920,12 +702,24 @@ class Molecule(base_graph):
     """returns the mean bond length of bonds in the molecule"""
     if len( self.edges) == 0:
       return None
-    bond_length = 0.0
-    for e in self.edges:
-      v1, v2 = e.vertices
-      bond_length += math.sqrt( (v1.x-v2.x)**2 + (v1.y-v2.y)**2)
-    bl = bond_length / len( self.edges)
-    return bl
+    return coordinate_arrays.mean_bond_length( self.coordinates_array(), self.edge_index_array())
+
+
+  def coordinates_array( self: object) -> object:
+    """returns an (n, 3) numpy array of atom x, y, z in the order of self.vertices;
+    unset coordinates are NaN"""
+    return coordinate_arrays.coordinates_array( self.vertices)
+
+
+  def set_coordinates_array( self: object, coords: object) -> None:
+    """writes an (n, 2) or (n, 3) array back to the atoms in the order of self.vertices"""
+    coordinate_arrays.set_coordinates_array( self.vertices, coords)
+
+
+  def edge_index_array( self: object) -> object:
+    """returns an (m, 2) numpy array of the atom positions joined by each bond,
+    in the iteration order of self.edges"""
+    return coordinate_arrays.edge_index_array( self.vertices, self.edges)
 
 
   def create_CIP_digraph( self: object, center: object) -> object:
@@ -972,12 +766,10 @@ def equals( mol1: object, mol2: object, level: object=0) -> object:
       return False
   # level 3
   if not level or level >= 3:
-    vs1 = mol1.number_atoms_uniquely()
-    vs2 = mol2.number_atoms_uniquely()
-    for i, v1 in enumerate( vs1):
-      v2 = vs2[ i]
-      if v1.properties_['distance_matrix'] != v2.properties_['distance_matrix']:
-        return False
+    key1 = canonical_ranking.canonical_key( mol1, atom_key=canonical_ranking.connectivity_invariant, bond_key=False)
+    key2 = canonical_ranking.canonical_key( mol2, atom_key=canonical_ranking.connectivity_invariant, bond_key=False)
+    if key1 != key2:
+      return False
   return True
 
 
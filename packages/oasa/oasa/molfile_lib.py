@@ -243,7 +243,15 @@ def read_molfile_value( file: object, length: object, strip: object=1, conversio
 
 from io import StringIO
 
-from oasa.codecs import rdkit_formats
+from oasa import codec_registry
+
+# RDKit-backed callables, imported on first use
+_rdkit_codec = codec_registry.LazyCodec( name="molfile-rdkit", callables={
+  "text_to_mol": "oasa.codecs.rdkit_formats:molfile_text_to_mol",
+  "mol_to_text": "oasa.codecs.rdkit_formats:molfile_mol_to_text",
+  "file_to_mol": "oasa.codecs.rdkit_formats:molfile_file_to_mol",
+  "mol_to_file": "oasa.codecs.rdkit_formats:molfile_mol_to_file",
+})
 
 reads_text = 1
 reads_files = 1
@@ -251,16 +259,16 @@ writes_text = 1
 writes_files = 1
 
 def mol_to_text( mol: object) -> object:
-  return rdkit_formats.molfile_mol_to_text( mol)
+  return _rdkit_codec.mol_to_text( mol)
 
 def mol_to_file( mol: object, f: object) -> object:
-  rdkit_formats.molfile_mol_to_file( mol, f)
+  _rdkit_codec.mol_to_file( mol, f)
 
 def file_to_mol( f: object) -> object:
-  return rdkit_formats.molfile_file_to_mol( f)
+  return _rdkit_codec.file_to_mol( f)
 
 def text_to_mol( text: object) -> object:
-  return rdkit_formats.molfile_text_to_mol( text)
+  return _rdkit_codec.text_to_mol( text)
 
 # NEW MODULE INTERFACE
 
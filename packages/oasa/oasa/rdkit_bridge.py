@@ -3,6 +3,11 @@
 Provides functions to convert between OASA and RDKit molecule representations,
 and to generate 2D coordinates using RDKit's Compute2DCoords algorithm as an
 alternative to OASA's native coords_generator.
+
+``mirror_rdkit_mol`` keeps the converted RDKit molecule in the OASA graph
+cache, so chains of RDKit-backed calls on an unchanged molecule convert it
+once.  Topology edits clear the graph cache; atom and bond property edits
+raise the molecule's ``oasa.graph.revision.structure_revision``.
 """
 
 # Standard Library
@@ -13,6 +18,7 @@ import rdkit.Chem
 import rdkit.Chem.AllChem
 
 # local repo modules
+from oasa.graph import revision
 from oasa.atom_lib import Atom as atom
 from oasa.bond_lib import Bond as bond
 from oasa.molecule_lib import Molecule as molecule
@@ -33,6 +39,9 @@ _OASA_TO_RDKIT_BOND = {
 # RDKit bond type -> OASA bond order
 _RDKIT_TO_OASA_BOND = {v: k for k, v in _OASA_TO_RDKIT_BOND.items()}
 
+# graph cache entry holding the RDKit mirror
+_MIRROR_CACHE_KEY = "rdkit_mirror"
+
 
 #============================================
 def oasa_to_rdkit_mol(omol: object) -> tuple:
@@ -73,6 +82,85 @@ def oasa_to_rdkit_mol(omol: object) -> tuple:
 	return rmol, oatom_to_ridx
 
 
+#============================================
+class RDKitMirrorCache:
+	"""Looks up RDKit mirrors kept in molecule graph caches and counts the lookups."""
+
+	#============================================
+	def __init__(self) -> None:
+		"""Start with zero hits and misses."""
+		self.hits = 0
+		self.misses = 0
+
+	#============================================
+	def entry(self, omol: object) -> dict:
+		"""Return the cached mirror of ``omol``, converting it when stale."""
+		stamp = revision.structure_revision(omol)
+		entry = omol._get_cache(_MIRROR_CACHE_KEY)
+		if entry is not None and entry["revision"] == stamp:
+			self.hits += 1
+			return entry
+		self.misses += 1
+		rmol, oatom_to_ridx = oasa_to_rdkit_mol(omol)
+		entry = {"revision": stamp, "mol": rmol, "atom_map": oatom_to_ridx, "depiction": None}
+		omol._set_cache(_MIRROR_CACHE_KEY, entry)
+		return entry
+
+	#============================================
+	def cache_info(self) -> dict:
+		"""Return the hit and miss counts since the last reset."""
+		return {"hits": self.hits, "misses": self.misses}
+
+	#============================================
+	def reset_info(self) -> None:
+		"""Zero the hit and miss counts."""
+		self.hits = 0
+		self.misses = 0
+
+
+_MIRRORS = RDKitMirrorCache()
+
+
+#============================================
+def mirror_rdkit_mol(omol: object, depiction: bool = False) -> tuple:
+	"""Return an RDKit copy of ``omol``, converting only when it changed.
+
+	The first call converts with ``oasa_to_rdkit_mol`` and keeps the result
+	in the molecule's graph cache; later calls copy it while the topology
+	and the atom and bond revisions are unchanged. With ``depiction`` the
+	copy also carries RDKit 2D coordinates, computed once per mirror.
+
+	Args:
+		omol: OASA molecule object.
+		depiction: Whether to include a Compute2DCoords conformer.
+
+	Returns:
+		Tuple of (rdkit.Chem.RWMol the caller may modify, dict mapping
+		OASA atom -> RDKit atom index, shared and read-only).
+	"""
+	entry = _MIRRORS.entry(omol)
+	source = entry["mol"]
+	if depiction:
+		if entry["depiction"] is None:
+			laid_out = rdkit.Chem.RWMol(source)
+			rdkit.Chem.AllChem.Compute2DCoords(laid_out)
+			entry["depiction"] = laid_out
+		source = entry["depiction"]
+	return rdkit.Chem.RWMol(source), entry["atom_map"]
+
+
+#============================================
+def mirror_cache_info() -> dict:
+	"""Return the mirror hit and miss counts since the last reset."""
+	return _MIRRORS.cache_info()
+
+
+#============================================
+def reset_mirror_cache_info() -> None:
+	"""Zero the mirror hit and miss counts."""
+	_MIRRORS.reset_info()
+
+
 #============================================
 def rdkit_to_oasa_mol(rmol: object) -> tuple:
 	"""Convert an RDKit mol to an OASA molecule.
@@ -128,9 +216,8 @@ def calculate_coords_rdkit(omol: object, bond_length: float = 1.0) -> object:
 	Returns:
 		The modified OASA molecule with coordinates set.
 	"""
-	rmol, oatom_to_ridx = oasa_to_rdkit_mol(omol)
-	# compute 2D layout
-	rdkit.Chem.AllChem.Compute2DCoords(rmol)
+	# the mirror's depiction is the Compute2DCoords layout
+	rmol, oatom_to_ridx = mirror_rdkit_mol(omol, depiction=True)
 	# straighten the depiction for cleaner output
 	rdkit.Chem.AllChem.StraightenDepiction(rmol)
 
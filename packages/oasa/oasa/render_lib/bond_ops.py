@@ -607,21 +607,27 @@ def _apply_bond_length_policy(edge: object, start: object, end: object) -> objec
 
 
 #============================================
-def _avoid_cross_label_overlaps(start: object, end: object, half_width: object, own_vertices: object, label_targets: object, epsilon: object = 0.5) -> object:
+def _avoid_cross_label_overlaps(start: object, end: object, half_width: object, own_vertices: object, label_targets: object, epsilon: object = 0.5, target_index: object = None) -> object:
 	"""Retreat bond endpoints away from non-own-vertex label targets.
 
 	For each label target that is NOT owned by one of the bond's own vertices,
 	check whether the stroked bond segment (capsule) penetrates the target.  If
 	so, retreat the nearer endpoint via ``retreat_endpoint_until_legal``.
+	Retreats only shorten the segment, so when ``target_index`` (a
+	``LabelTargetIndex`` over ``label_targets``) is given, only the targets
+	near the original segment are tested, in the same order.
 
 	Returns the (possibly shortened) ``(start, end)`` pair.
 	"""
 	if not label_targets:
 		return start, end
-	cross_targets = [
-		t for v, t in label_targets.items()
-		if v not in own_vertices
-	]
+	if target_index is not None:
+		cross_targets = target_index.candidates(start, end, half_width, own_vertices, epsilon)
+	else:
+		cross_targets = [
+			t for v, t in label_targets.items()
+			if v not in own_vertices
+		]
 	if not cross_targets:
 		return start, end
 	min_length = max(half_width * 4.0, 1.0)
@@ -684,6 +690,7 @@ def build_bond_ops(edge: object, start: object, end: object, context: object) ->
 			half_width=edge_line_width / 2.0,
 			own_vertices={v1, v2},
 			label_targets=context.label_targets,
+			target_index=context.label_target_index,
 		)
 	if edge.type in ("a", "d", "o"):
 		length = geometry.point_distance(start[0], start[1], end[0], end[1])
@@ -751,6 +758,7 @@ def build_bond_ops(edge: object, start: object, end: object, context: object) ->
 				(x1, y1), (x2, y2) = _avoid_cross_label_overlaps(
 					(x1, y1), (x2, y2), half_width=edge_line_width / 2.0,
 					own_vertices={v1, v2}, label_targets=context.label_targets,
+					target_index=context.label_target_index,
 				)
 			ops.extend(_line_ops((x1, y1), (x2, y2), edge_line_width,
 					color1, color2, gradient, cap="butt"))
@@ -763,6 +771,7 @@ def build_bond_ops(edge: object, start: object, end: object, context: object) ->
 				(x1, y1), (x2, y2) = _avoid_cross_label_overlaps(
 					(x1, y1), (x2, y2), half_width=edge_line_width / 2.0,
 					own_vertices={v1, v2}, label_targets=context.label_targets,
+					target_index=context.label_target_index,
 				)
 			ops.extend(_line_ops((x1, y1), (x2, y2), edge_line_width,
 					color1, color2, gradient, cap="round"))
@@ -778,6 +787,7 @@ def build_bond_ops(edge: object, start: object, end: object, context: object) ->
 				(x1, y1), (x2, y2) = _avoid_cross_label_overlaps(
 					(x1, y1), (x2, y2), half_width=edge_line_width / 2.0,
 					own_vertices={v1, v2}, label_targets=context.label_targets,
+					target_index=context.label_target_index,
 				)
 			ops.extend(_line_ops((x1, y1), (x2, y2), edge_line_width,
 					color1, color2, gradient, cap="butt"))
@@ -155,6 +155,14 @@ class BondRenderContext:
 	label_targets: dict | None = None
 	attach_targets: dict | None = None
 	attach_constraints: 'AttachConstraints | None' = None
+	label_target_index: object | None = dataclasses.field(default=None, compare=False, repr=False)
+
+	def __post_init__(self) -> None:
+		"""Build the label-target grid once for every bond drawn with this context."""
+		if self.label_target_index is None and self.label_targets:
+			# late import to avoid circular dependency with label_target_index
+			from oasa.render_lib.label_target_index import LabelTargetIndex
+			object.__setattr__(self, "label_target_index", LabelTargetIndex(self.label_targets))
 
 
 #============================================
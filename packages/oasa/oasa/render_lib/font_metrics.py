@@ -0,0 +1,244 @@
+#--------------------------------------------------------------------------
+#     This file is part of OASA - a free chemical python library
+#     Copyright (C) 2003-2008 Beda Kosata <beda@zirael.org>
+#
+#     This program is free software; you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation; either version 2 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     Complete text of GNU GPL can be found in the file LICENSE in the
+#     main directory of the program
+#
+#--------------------------------------------------------------------------
+
+"""Process-wide, memoized cairo text metrics for label geometry.
+
+Label geometry measures the same short texts ("OH", "NH2", "CH3") thousands of
+times per document.  One shared cairo context serves every measurement, and
+per-character advances and glyph extents are kept in a bounded LRU map keyed
+by font name, font size, baseline state, and text.
+"""
+
+# Standard Library
+import threading
+import functools
+import collections
+import dataclasses
+
+# local repo modules
+from oasa import render_ops
+
+try:
+	import cairo as _cairo
+except ImportError:
+	_cairo = None
+
+# Measured texts and glyphs that stay cached for the life of the process.
+_CACHE_CAPACITY = 4096
+
+
+#============================================
+@dataclasses.dataclass(frozen=True)
+class FontMetricsCacheInfo:
+	"""Hit and miss counters of the shared font-metrics cache."""
+	hits: int
+	misses: int
+	maxsize: int
+	currsize: int
+
+	@property
+	def hit_rate(self) -> float:
+		"""Return the fraction of lookups served from the cache."""
+		total = self.hits + self.misses
+		return self.hits / total if total else 0.0
+
+
+#============================================
+@functools.lru_cache(maxsize=1024)
+def _label_segments(text: str) -> tuple[tuple[str, str], ...]:
+	"""Return ``(chunk, baseline_state)`` pairs for one formatted label text."""
+	return tuple(
+		(chunk, render_ops._segment_baseline_state(tags))
+		for chunk, tags in render_ops._text_segments(text)
+	)
+
+
+#============================================
+class FontMetrics:
+	"""Reusable cairo context plus an LRU map of measured label text."""
+
+	#============================================
+	def __init__(self, capacity: int = _CACHE_CAPACITY) -> None:
+		"""Create an empty cache; the cairo context is built on first use."""
+		self._capacity = capacity
+		self._entries: collections.OrderedDict = collections.OrderedDict()
+		self._hits = 0
+		self._misses = 0
+		self._context = None
+		self._font_name = None
+		self._lock = threading.Lock()
+
+	#============================================
+	def _font_context(self, font_name: str) -> object:
+		"""Return the shared context with ``font_name`` selected, or None."""
+		if _cairo is None:
+			return None
+		if self._context is None:
+			try:
+				self._context = _cairo.Context(_cairo.ImageSurface(_cairo.FORMAT_A8, 1, 1))
+			except _cairo.Error:
+				return None
+		if font_name != self._font_name:
+			try:
+				self._context.select_font_face(font_name, 0, 0)
+			except _cairo.Error:
+				return None
+			self._font_name = font_name
+		return self._context
+
+	#============================================
+	def _cached(self, key: tuple, measure: object) -> object:
+		"""Return the cached value for ``key``, measuring it on a miss.
+
+		A measurement of None (no usable cairo context) is returned uncached.
+		"""
+		with self._lock:
+			value = self._entries.get(key)
+			if value is not None:
+				self._entries.move_to_end(key)
+				self._hits += 1
+				return value
+			self._misses += 1
+			value = measure()
+			if value is None:
+				return None
+			self._entries[key] = value
+			while len(self._entries) > self._capacity:
+				self._entries.popitem(last=False)
+			return value
+
+	#============================================
+	def _chunk_advances(self, font_name: str, font_size: float, baseline_state: str, chunk: str) -> tuple | None:
+		"""Return per-character x advances of one same-baseline text chunk."""
+		size = render_ops._segment_font_size(font_size, baseline_state)
+
+		def measure() -> tuple | None:
+			context = self._font_context(font_name)
+			if context is None:
+				return None
+			context.set_font_size(size)
+			return _measure_advances(context, chunk)
+
+		return self._cached(("advances", font_name, font_size, baseline_state, chunk), measure)
+
+	#============================================
+	def _glyph_extents(self, font_name: str, font_size: float, baseline_state: str, glyph: str) -> tuple | None:
+		"""Return ``(x_bearing, width, x_advance)`` of one character."""
+		size = render_ops._segment_font_size(font_size, baseline_state)
+
+		def measure() -> tuple | None:
+			context = self._font_context(font_name)
+			if context is None:
+				return None
+			context.set_font_size(size)
+			extents = context.text_extents(glyph)
+			return (float(extents.x_bearing), float(extents.width), float(extents.x_advance))
+
+		return self._cached(("extents", font_name, font_size, baseline_state, glyph), measure)
+
+	#============================================
+	def char_advances(self, text: str, font_size: float, font_name: str, visible_length: int) -> list | None:
+		"""Return per-character advances across every chunk of ``text``.
+
+		Returns None when cairo is unavailable, the font cannot be selected, or
+		the measured characters do not line up with ``visible_length``.
+		"""
+		if _cairo is None:
+			return None
+		advances = []
+		for chunk, baseline_state in _label_segments(text):
+			chunk_advances = self._chunk_advances(font_name, font_size, baseline_state, chunk)
+			if chunk_advances is None:
+				return None
+			advances.extend(chunk_advances)
+		if len(advances) != visible_length:
+			return None
+		return advances
+
+	#============================================
+	def ink_bearings(self, text: str, font_size: float, font_name: str) -> tuple[float, float]:
+		"""Return (left_bearing, right_bearing) of the first and last characters."""
+		if _cairo is None:
+			return (0.0, 0.0)
+		segments = [(chunk, state) for chunk, state in _label_segments(text) if chunk]
+		if not segments:
+			return (0.0, 0.0)
+		first_chunk, first_state = segments[0]
+		first = self._glyph_extents(font_name, font_size, first_state, first_chunk[0])
+		last_chunk, last_state = segments[-1]
+		last = self._glyph_extents(font_name, font_size, last_state, last_chunk[-1])
+		if first is None or last is None:
+			return (0.0, 0.0)
+		x_bearing, _width, _advance = first
+		last_bearing, last_width, last_advance = last
+		left_bearing = max(0.0, x_bearing)
+		# right_bearing = advance - left_bearing - ink_width
+		right_bearing = max(0.0, last_advance - last_bearing - last_width)
+		return (left_bearing, right_bearing)
+
+	#============================================
+	def cache_info(self) -> FontMetricsCacheInfo:
+		"""Return hit and miss counters and the current cache size."""
+		with self._lock:
+			return FontMetricsCacheInfo(self._hits, self._misses, self._capacity, len(self._entries))
+
+	#============================================
+	def cache_clear(self) -> None:
+		"""Drop every cached measurement and reset the counters."""
+		with self._lock:
+			self._entries.clear()
+			self._hits = 0
+			self._misses = 0
+
+
+#============================================
+def _measure_advances(context: object, chunk: str) -> tuple:
+	"""Return per-character advances of ``chunk`` at the context's current font.
+
+	Glyph positions from one shaping call give every advance at once.  When
+	characters and glyphs do not map one to one, fall back to differencing the
+	advance of each growing prefix.
+	"""
+	try:
+		glyphs = context.get_scaled_font().text_to_glyphs(0, 0, chunk, False)
+	except _cairo.Error:
+		glyphs = None
+	if glyphs is not None and len(glyphs) == len(chunk):
+		positions = [float(glyph[1]) for glyph in glyphs]
+		positions.append(float(context.text_extents(chunk).x_advance))
+		return tuple(
+			max(0.0, positions[index + 1] - positions[index])
+			for index in range(len(chunk))
+		)
+	advances = []
+	previous_advance = 0.0
+	for index in range(len(chunk)):
+		extents = context.text_extents(chunk[: index + 1])
+		advances.append(max(0.0, float(extents.x_advance) - previous_advance))
+		previous_advance = float(extents.x_advance)
+	return tuple(advances)
+
+
+_FONT_METRICS = FontMetrics()
+
+
+#============================================
+def shared_font_metrics() -> FontMetrics:
+	"""Return the process-wide font-metrics service."""
+	return _FONT_METRICS
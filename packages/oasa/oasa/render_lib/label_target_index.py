@@ -0,0 +1,154 @@
+#--------------------------------------------------------------------------
+#     This file is part of OASA - a free chemical python library
+#     Copyright (C) 2003-2008 Beda Kosata <beda@zirael.org>
+#
+#     This program is free software; you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation; either version 2 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     Complete text of GNU GPL can be found in the file LICENSE in the
+#     main directory of the program
+#
+#--------------------------------------------------------------------------
+
+"""Uniform-grid index over label attach targets for bond overlap queries."""
+
+# Standard Library
+import math
+
+# local repo modules
+from oasa import oasa_utils as misc
+from oasa.render_lib.data_types import _coerce_attach_target
+
+
+# Below this many targets a linear scan is cheaper than building a grid.
+_MIN_GRID_TARGETS = 16
+_QUERY_SLACK = 1e-6
+
+
+#============================================
+def _target_bounds(target: object) -> object:
+	"""Return the closed bounding box a stroked capsule must reach to penetrate target.
+
+	Segment targets never report capsule penetration, so they have no bounds.
+	Returns ``None`` when the target cannot be hit.
+	"""
+	resolved = _coerce_attach_target(target)
+	if resolved.kind == "box":
+		return misc.normalize_coords(resolved.box)
+	if resolved.kind == "circle":
+		cx, cy = resolved.center
+		radius = max(0.0, float(resolved.radius))
+		return (cx - radius, cy - radius, cx + radius, cy + radius)
+	if resolved.kind == "segment":
+		return None
+	if resolved.kind == "composite":
+		bounds = [_target_bounds(child) for child in (resolved.targets or ())]
+		bounds = [box for box in bounds if box is not None]
+		if not bounds:
+			return None
+		return (
+			min(box[0] for box in bounds), min(box[1] for box in bounds),
+			max(box[2] for box in bounds), max(box[3] for box in bounds),
+		)
+	raise ValueError(f"Unsupported attach target kind: {resolved.kind!r}")
+
+
+#============================================
+class LabelTargetIndex:
+	"""Grid of label target bounding boxes keyed by their owning vertex.
+
+	``candidates()`` returns every target whose box the query capsule can reach,
+	in the insertion order of the source mapping, so callers that process
+	targets sequentially see the same targets in the same order as a full scan.
+	"""
+
+	#============================================
+	def __init__(self, label_targets: dict) -> None:
+		"""Bin every hittable target of ``label_targets`` into grid cells."""
+		self._entries = []
+		for vertex, target in label_targets.items():
+			bounds = _target_bounds(target)
+			if bounds is None:
+				continue
+			if not all(math.isfinite(value) for value in bounds):
+				# non-finite boxes cannot be binned; keep them in every query
+				bounds = (-math.inf, -math.inf, math.inf, math.inf)
+			self._entries.append((vertex, target, bounds))
+		self._cells = None
+		self._unbinned = ()
+		if len(self._entries) < _MIN_GRID_TARGETS:
+			return
+		finite = [entry for entry in self._entries if math.isfinite(entry[2][0])]
+		extent = sum(
+			max(bounds[2] - bounds[0], bounds[3] - bounds[1]) for _v, _t, bounds in finite
+		) / max(len(finite), 1)
+		self._cell_size = max(extent, 1.0)
+		self._cells = {}
+		unbinned = []
+		for ordinal, (_vertex, _target, bounds) in enumerate(self._entries):
+			# oversized boxes would fill many cells; scan them in every query instead
+			if not math.isfinite(bounds[0]) or self._cell_count(bounds) > len(self._entries):
+				unbinned.append(ordinal)
+				continue
+			for cell in self._cell_range(bounds):
+				self._cells.setdefault(cell, []).append(ordinal)
+		self._unbinned = tuple(unbinned)
+
+	#============================================
+	def _cell_count(self, bounds: object) -> int:
+		"""Return how many grid cells one closed bounding box touches."""
+		size = self._cell_size
+		columns = math.floor(bounds[2] / size) - math.floor(bounds[0] / size) + 1
+		rows = math.floor(bounds[3] / size) - math.floor(bounds[1] / size) + 1
+		return columns * rows
+
+	#============================================
+	def _cell_range(self, bounds: object) -> object:
+		"""Yield the grid cells that one closed bounding box touches."""
+		size = self._cell_size
+		x1 = math.floor(bounds[0] / size)
+		y1 = math.floor(bounds[1] / size)
+		x2 = math.floor(bounds[2] / size)
+		y2 = math.floor(bounds[3] / size)
+		for ix in range(x1, x2 + 1):
+			for iy in range(y1, y2 + 1):
+				yield (ix, iy)
+
+	#============================================
+	def candidates(
+			self, start: object, end: object, half_width: float,
+			own_vertices: object, epsilon: float = 0.0) -> list:
+		"""Return targets not owned by ``own_vertices`` that the capsule may reach."""
+		# a negative epsilon grows targets past their boxes; widen the query to
+		# match, plus slack for the rounding of retreated endpoints
+		pad = half_width + max(0.0, -epsilon) + _QUERY_SLACK
+		query = (
+			min(start[0], end[0]) - pad, min(start[1], end[1]) - pad,
+			max(start[0], end[0]) + pad, max(start[1], end[1]) + pad,
+		)
+		if self._cells is None or not all(math.isfinite(value) for value in query):
+			ordinals = range(len(self._entries))
+		else:
+			if self._cell_count(query) >= len(self._entries):
+				ordinals = range(len(self._entries))
+			else:
+				found = set(self._unbinned)
+				for cell in self._cell_range(query):
+					found.update(self._cells.get(cell, ()))
+				ordinals = sorted(found)
+		targets = []
+		for ordinal in ordinals:
+			vertex, target, bounds = self._entries[ordinal]
+			if vertex in own_vertices:
+				continue
+			if bounds[0] > query[2] or bounds[2] < query[0] or bounds[1] > query[3] or bounds[3] < query[1]:
+				continue
+			targets.append(target)
+		return targets
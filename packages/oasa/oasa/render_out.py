@@ -12,6 +12,7 @@ import os
 from lxml import etree
 
 # local repo modules
+from oasa import coordinate_arrays
 from oasa import molecule_utils
 from oasa import render_ops
 from oasa.render_lib.molecule_ops import molecule_to_ops
@@ -54,12 +55,7 @@ def _resolve_format(output_target: object, format_override: object) -> object:
 def _molecule_bounds(mol: object) -> object:
 	if not mol.vertices:
 		return (0.0, 0.0, 1.0, 1.0)
-	xs = [vertex.x for vertex in mol.vertices]
-	ys = [vertex.y for vertex in mol.vertices]
-	x1 = min(xs)
-	x2 = max(xs)
-	y1 = min(ys)
-	y2 = max(ys)
+	x1, y1, x2, y2 = coordinate_arrays.bounds(coordinate_arrays.coordinates_array(mol.vertices))
 	if x1 == x2:
 		x2 = x1 + 1.0
 	if y1 == y2:
@@ -81,15 +77,15 @@ def _extract_style(options: object, scaling: object) -> object:
 
 #============================================
 def _render_ops_for_mol(mol: object, *, margin: object, scaling: object, options: object) -> object:
-	x1, y1, _x2, _y2 = _molecule_bounds(mol)
+	x1, y1, x2, y2 = _molecule_bounds(mol)
 
 	def _transform_xy(x: object, y: object) -> object:
 		return ((x - x1 + margin) * scaling, (y - y1 + margin) * scaling)
 
 	style = _extract_style(options, scaling)
 	ops = molecule_to_ops(mol, style=style, transform_xy=_transform_xy)
-	width = int(round(((_molecule_bounds(mol)[2] - x1) + 2 * margin) * scaling))
-	height = int(round(((_molecule_bounds(mol)[3] - y1) + 2 * margin) * scaling))
+	width = int(round(((x2 - x1) + 2 * margin) * scaling))
+	height = int(round(((y2 - y1) + 2 * margin) * scaling))
 	return ops, max(1, width), max(1, height)
 
 
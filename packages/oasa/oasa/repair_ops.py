@@ -14,6 +14,7 @@ import collections
 
 # local repo modules
 import oasa.hex_grid
+import oasa.coordinate_arrays
 
 
 #============================================
@@ -735,15 +736,16 @@ def snap_to_hex_grid(mol: object, bond_length: float) -> None:
 		mol: An OASA-compatible molecule object.
 		bond_length: Hex grid spacing (typically the standard bond length).
 	"""
-	atom_coords = [(a.x, a.y) for a in mol.atoms]
-	if len(atom_coords) < 1:
+	atoms = list(mol.atoms)
+	if len(atoms) < 1:
 		return
+	atom_coords = oasa.coordinate_arrays.coordinates_array(atoms)[:, :2]
 	# find best grid origin for this molecule
 	origin_x, origin_y = oasa.hex_grid.find_best_grid_origin(
 		atom_coords, bond_length
 	)
 	# snap all atoms to the best-fit grid
-	snapped = oasa.hex_grid.snap_molecule_to_hex_grid(
+	snapped = oasa.hex_grid.snap_points_to_hex_grid(
 		atom_coords, bond_length, origin_x, origin_y
 	)
 	# translate so snapped coords align with the displayed (0,0) grid;
@@ -754,6 +756,4 @@ def snap_to_hex_grid(mol: object, bond_length: float) -> None:
 	)
 	shift_x = aligned_ox - origin_x
 	shift_y = aligned_oy - origin_y
-	for atom, (new_x, new_y) in zip(mol.atoms, snapped):
-		atom.x = new_x + shift_x
-		atom.y = new_y + shift_y
+	oasa.coordinate_arrays.set_coordinates_array(atoms, snapped + (shift_x, shift_y))
@@ -791,7 +791,13 @@ converter = smiles_converter
 ## MODULE INTERFACE - oldstyle -- delegates to RDKit via rdkit_formats
 
 from oasa import coords_generator
-from oasa.codecs import rdkit_formats
+from oasa import codec_registry
+
+# RDKit-backed callables, imported on first use
+_rdkit_codec = codec_registry.LazyCodec( name="smiles-rdkit", callables={
+  "text_to_mol": "oasa.codecs.rdkit_formats:smiles_text_to_mol",
+  "mol_to_text": "oasa.codecs.rdkit_formats:smiles_mol_to_text",
+})
 
 reads_text = True
 writes_text = True
@@ -799,10 +805,10 @@ reads_files = True
 writes_files = True
 
 def mol_to_text( structure: object) -> object:
-  return rdkit_formats.smiles_mol_to_text( structure)
+  return _rdkit_codec.mol_to_text( structure)
 
 def text_to_mol( text: object, calc_coords: object=1, localize_aromatic_bonds: object=True) -> object:
-  return rdkit_formats.smiles_text_to_mol(
+  return _rdkit_codec.text_to_mol(
     text, calc_coords=calc_coords,
     localize_aromatic_bonds=localize_aromatic_bonds)
 
@@ -0,0 +1,235 @@
+#--------------------------------------------------------------------------
+#     This file is part of OASA - a free chemical python library
+#     Copyright (C) 2003-2008 Beda Kosata <beda@zirael.org>
+
+#     This program is free software; you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation; either version 2 of the License, or
+#     (at your option) any later version.
+
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+
+#     Complete text of GNU GPL can be found in the file LICENSE in the
+#     main directory of the program
+
+#--------------------------------------------------------------------------
+
+"""Side-effect-free substructure search built on rustworkx VF2.
+
+The target and query molecules are copied into private rustworkx graphs
+whose node and edge payloads are the original atoms and bonds, so the
+search never touches the molecules themselves.  Hydrogens that the query
+asks for are represented by stand-alone H atoms in those graphs only:
+implicit hydrogens of the target become extra target nodes, and the
+``explicit_hydrogens`` counts of query atoms become extra query nodes.
+
+Atoms match when ``target_atom.matches(query_atom)``, so a charge set on the
+query must be present on the target; query atoms with wildcard symbols use
+their own ``matches``.  Bonds match when ``target_bond.matches(query_bond)``.
+Matching is not induced: the target may have extra bonds between matched
+atoms.  A match is kept only when no matched target atom has more unmatched
+neighbors (plus explicit hydrogens) than the free sites of its query atom.
+"""
+
+# PIP3 modules
+import rustworkx
+
+# local repo modules
+from oasa.atom_lib import Atom
+from oasa.bond_lib import Bond
+from oasa.query_atom import QueryAtom
+
+
+#============================================
+def _needs_target_hydrogens(query: object) -> bool:
+	"""Return True when the query mentions hydrogens the target may hold implicitly."""
+	for v in query.vertices:
+		if isinstance(v, Atom) and (v.symbol == 'H' or v.explicit_hydrogens > 0):
+			return True
+		if isinstance(v, QueryAtom) and ('H' in v.symbols or 'R' in v.symbols):
+			return True
+	return False
+
+
+#============================================
+def _atoms_match(target_atom: object, query_atom: object) -> bool:
+	"""Return True when ``target_atom`` may stand for ``query_atom``."""
+	if isinstance(query_atom, QueryAtom):
+		return query_atom.matches(target_atom)
+	return target_atom.matches(query_atom)
+
+
+#============================================
+def _connected_edges(mol: object) -> list:
+	"""Return the bonds of ``mol`` that are not temporarily disconnected."""
+	return [e for e in mol.edges if not e.disconnected]
+
+
+#============================================
+class _SearchGraph:
+	"""A rustworkx copy of one side of the search with hydrogen nodes appended.
+
+	Attributes:
+		rx: The rustworkx PyGraph; node payloads are atoms, edge payloads bonds.
+		vertices: Node payloads in node-index order.
+		count: Number of nodes that are real vertices of the molecule.
+		parents: Node index of the heavy atom each appended hydrogen hangs on.
+	"""
+
+	#============================================
+	def __init__(self, mol: object, hydrogen_counts: list) -> None:
+		"""Copy ``mol`` and hang ``hydrogen_counts[i]`` extra H atoms on vertex i."""
+		self.rx = rustworkx.PyGraph(multigraph=False)
+		self.vertices = list(mol.vertices)
+		self.count = len(self.vertices)
+		self.rx.add_nodes_from(self.vertices)
+		index = {v: i for i, v in enumerate(self.vertices)}
+		edges = []
+		for e in _connected_edges(mol):
+			v1, v2 = e.vertices
+			edges.append((index[v1], index[v2], e))
+		self.parents = {}
+		single = Bond(order=1)
+		for parent, number in enumerate(hydrogen_counts):
+			for _ in range(number):
+				h = self.rx.add_node(Atom(symbol='H'))
+				self.vertices.append(self.rx[h])
+				self.parents[h] = parent
+				edges.append((parent, h, single))
+		self.rx.add_edges_from(edges)
+
+
+#============================================
+class CompiledQuery:
+	"""A query molecule prepared once for repeated searches.
+
+	The query graph and free sites are read when the object is built, so
+	later edits of the query molecule are not seen.
+
+	Attributes:
+		query: The query molecule.
+		needs_hydrogens: Whether targets must show their implicit hydrogens.
+	"""
+
+	#============================================
+	def __init__(self, query: object, implicit_freesites: bool = False) -> None:
+		"""Prepare ``query``; see ``iter_matches`` for ``implicit_freesites``."""
+		self.query = query
+		self.needs_hydrogens = _needs_target_hydrogens(query)
+		self._graph = _SearchGraph(query, [getattr(v, 'explicit_hydrogens', 0) for v in query.vertices])
+		if implicit_freesites:
+			sites = [v.free_valency for v in query.vertices]
+		else:
+			sites = [v.free_sites for v in query.vertices]
+		# appended hydrogens have no free sites
+		self._sites = sites + [0] * (len(self._graph.vertices) - self._graph.count)
+
+
+#============================================
+class SearchTarget:
+	"""A target molecule prepared once for searches with many queries.
+
+	The rustworkx copies with and without implicit hydrogens are each built
+	on first use, so the target must not change while the object is in use.
+
+	Attributes:
+		target: The target molecule.
+	"""
+
+	#============================================
+	def __init__(self, target: object) -> None:
+		"""Wrap ``target`` without copying anything yet."""
+		self.target = target
+		self._prepared = {}
+
+	#============================================
+	def _prepare(self, hydrogens: bool) -> tuple:
+		"""Return the search graph, neighbor lists, and explicit hydrogen counts."""
+		try:
+			return self._prepared[hydrogens]
+		except KeyError:
+			pass
+		vertices = self.target.vertices
+		if hydrogens:
+			counts = [max(0, v.free_valency) if isinstance(v, Atom) else 0 for v in vertices]
+		else:
+			counts = [0] * len(vertices)
+		graph = _SearchGraph(self.target, counts)
+		neighbors = [graph.rx.neighbors(i) for i in range(len(graph.vertices))]
+		explicit_hs = [getattr(v, 'explicit_hydrogens', 0) for v in graph.vertices]
+		self._prepared[hydrogens] = (graph, neighbors, explicit_hs)
+		return self._prepared[hydrogens]
+
+
+#============================================
+def iter_images(target: SearchTarget, query: CompiledQuery, limit: int | None = None) -> object:
+	"""Yield the node image of every distinct match of ``query`` in ``target``.
+
+	An image has one entry per query vertex, followed by one per hydrogen
+	from the query's ``explicit_hydrogens`` counts.  Each entry is the
+	position of the matched atom in ``target.target.vertices``, or None for
+	a target hydrogen that is only implicit.
+	"""
+	if not query.query.vertices or limit == 0:
+		return
+	graph, neighbors, explicit_hs = target._prepare(query.needs_hydrogens)
+	sites = query._sites
+	mappings = rustworkx.vf2_mapping(
+		graph.rx, query._graph.rx,
+		node_matcher=_atoms_match,
+		edge_matcher=lambda te, qe: te.matches(qe),
+		id_order=False, subgraph=True, induced=False,
+	)
+	seen = set()
+	found = 0
+	for mapping in mappings:
+		image = [0] * len(sites)
+		for t, q in mapping.items():
+			image[q] = t
+		matched = set(image)
+		if not all(
+			sum(1 for n in neighbors[t] if n not in matched) + explicit_hs[t] <= sites[q]
+			for q, t in enumerate(image)
+		):
+			continue
+		# symmetric queries map the same atoms in several orders, and the
+		# appended hydrogens of one target atom are interchangeable
+		key = (
+			frozenset(t for t in image if t < graph.count),
+			tuple(sorted(graph.parents[t] for t in image if t >= graph.count)),
+		)
+		if key in seen:
+			continue
+		seen.add(key)
+		yield [t if t < graph.count else None for t in image]
+		found += 1
+		if limit is not None and found >= limit:
+			return
+
+
+#============================================
+def iter_matches(target: object, query: object, implicit_freesites: bool = False,
+		limit: int | None = None) -> object:
+	"""Yield the atom lists of ``target`` that match the whole ``query``.
+
+	Each match lists target atoms in the order of ``query.vertices``,
+	followed by the atoms matched by the query's explicit hydrogens.
+	Target hydrogens that are only implicit are left out, so such a match
+	can be shorter than the query.  Matches that cover the same target
+	atoms are yielded once.  Neither molecule is modified, so the generator
+	may be abandoned at any point.
+
+	Args:
+		target: Molecule searched in.
+		query: Molecule searched for.
+		implicit_freesites: Treat every free valency of a query atom as a
+			free site instead of using its ``free_sites`` value.
+		limit: Stop after this many matches; None yields all of them.
+	"""
+	vertices = target.vertices
+	images = iter_images(SearchTarget(target), CompiledQuery(query, implicit_freesites), limit)
+	for image in images:
+		yield [vertices[t] for t in image if t is not None]
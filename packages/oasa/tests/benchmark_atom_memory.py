@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Benchmark the memory held by OASA atoms and bonds in large molecules.
+
+Builds carbon chains and ring-fused lattices of growing size and reports the
+traced bytes per atom (bonds included) and atoms per MiB.  Atoms and bonds
+keep their fixed fields in slots and create ``properties_``, ``_cache``, and
+the instance ``__dict__`` only when something uses them.
+"""
+
+# Standard Library
+import gc
+import sys
+import argparse
+import tracemalloc
+
+# ensure OASA package is importable from the repo tree
+sys.path.insert(0, "packages/oasa")
+
+# local repo modules
+import oasa.atom_lib
+import oasa.bond_lib
+import oasa.molecule_lib
+
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""Parse command-line arguments."""
+	parser = argparse.ArgumentParser(
+		description="Benchmark the memory held by OASA atoms and bonds"
+	)
+	parser.add_argument(
+		'-s', '--sizes', dest='sizes',
+		type=int, nargs='+', default=[1000, 10000, 50000],
+		help="Atom counts to benchmark (default: 1000 10000 50000)",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+def build_chain(num_atoms: int) -> object:
+	"""Return a carbon chain of ``num_atoms`` atoms."""
+	mol = oasa.molecule_lib.Molecule()
+	atoms = mol.add_vertices(oasa.atom_lib.Atom("C") for _ in range(num_atoms))
+	mol.add_edges((atoms[i], atoms[i + 1], oasa.bond_lib.Bond()) for i in range(num_atoms - 1))
+	return mol
+
+
+#============================================
+def build_lattice(num_atoms: int) -> object:
+	"""Return a square lattice of carbon atoms, about two bonds per atom."""
+	mol = oasa.molecule_lib.Molecule()
+	columns = max(1, int(num_atoms ** 0.5))
+	atoms = mol.add_vertices(oasa.atom_lib.Atom("C") for _ in range(num_atoms))
+	pairs = []
+	for index, atom in enumerate(atoms):
+		if index % columns:
+			pairs.append((atoms[index - 1], atom, oasa.bond_lib.Bond()))
+		if index >= columns:
+			pairs.append((atoms[index - columns], atom, oasa.bond_lib.Bond()))
+	mol.add_edges(pairs)
+	return mol
+
+
+#============================================
+def traced_bytes(builder: object, num_atoms: int) -> tuple:
+	"""Return the molecule built by ``builder`` and the bytes it allocated."""
+	gc.collect()
+	tracemalloc.start()
+	mol = builder(num_atoms)
+	current, _peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	return mol, current
+
+
+#============================================
+def main() -> None:
+	"""Run the benchmark table."""
+	args = parse_args()
+	print("OASA atom and bond memory benchmark")
+	header = f"{'shape':<8} {'atoms':>7} {'bonds':>7} {'bytes/atom':>11} {'atoms/MiB':>10}"
+	print(header)
+	print("-" * len(header))
+	for builder, shape in ((build_chain, "chain"), (build_lattice, "lattice")):
+		for size in args.sizes:
+			mol, used = traced_bytes(builder, size)
+			print(
+				f"{shape:<8} {len(mol.vertices):>7} {len(mol.edges):>7}"
+				f" {used / size:>11.1f} {size / (used / 2 ** 20):>10.0f}"
+			)
+
+
+#============================================
+if __name__ == '__main__':
+	main()
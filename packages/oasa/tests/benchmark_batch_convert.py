@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Benchmark batch conversion against the one-record-at-a-time loop.
+
+The legacy path is what ``chemical_convert.py`` offered before batch mode:
+read each SMILES line with ``read_text`` and write it with ``write_file`` on
+one core, stopping at the first failure.  Batch mode streams the same lines
+in chunks through ``oasa.batch_convert.convert_batch``, in process and with a
+process pool.  All outputs must match.
+"""
+
+# Standard Library
+import io
+import sys
+import time
+import argparse
+
+# ensure OASA package is importable from the repo tree
+sys.path.insert(0, "packages/oasa")
+
+# PIP3 modules
+import rdkit.rdBase
+
+# local repo modules
+import oasa.codec_registry
+import oasa.batch_convert
+
+
+MOLECULES = (
+	"CC(=O)OC1=CC=CC=C1C(=O)O",
+	"CC(=O)NC1=CC=C(O)C=C1",
+	"CN1C=NC2=C1C(=O)N(C(=O)N2C)C",
+	"OCC(O)C(O)C(O)C(O)CO",
+	"CC(C)CCCC(C)C1CCC2C1(CCC3C2CCC4=CC(CCC34C)O)C",
+	"CC1(C)SC2C(NC(=O)CC3=CC=CC=C3)C(=O)N2C1C(=O)O",
+)
+
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""Parse command-line arguments."""
+	parser = argparse.ArgumentParser(
+		description="Benchmark batch conversion against the one-record-at-a-time loop"
+	)
+	parser.add_argument(
+		'-r', '--records', dest='num_records',
+		type=int, default=3000,
+		help="SMILES records to convert (default: 3000)",
+	)
+	parser.add_argument(
+		'-p', '--processes', dest='processes',
+		type=int, default=None,
+		help="Pool workers for the pooled run (default: one per CPU)",
+	)
+	parser.add_argument(
+		'-c', '--chunk-size', dest='chunk_size',
+		type=int, default=256,
+		help="Records per chunk (default: 256)",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+def legacy_convert(text: str) -> str:
+	"""Convert SMILES lines to InChI one at a time, as the interactive loop does."""
+	in_codec = oasa.codec_registry.get_codec("smiles")
+	out_codec = oasa.codec_registry.get_codec("inchi")
+	out = io.StringIO()
+	# batch mode keeps RDKit quiet too
+	with rdkit.rdBase.BlockLogs():
+		for line in text.splitlines():
+			if not line:
+				continue
+			mol = in_codec.read_text(line)
+			out_codec.write_file(mol, out)
+			out.write("\n")
+	return out.getvalue()
+
+
+#============================================
+def batch_convert(text: str, jobs: int | None, chunk_size: int) -> tuple:
+	"""Return (output text, stats) of a batch SMILES to InChI run."""
+	out = io.StringIO()
+	stats = oasa.batch_convert.convert_batch(
+		"smiles", "inchi", io.StringIO(text), out, io.StringIO(), jobs=jobs, chunk_size=chunk_size,
+	)
+	return out.getvalue(), stats
+
+
+#============================================
+def time_function(func: object) -> tuple:
+	"""Return (result, milliseconds) of one call."""
+	start = time.perf_counter()
+	result = func()
+	elapsed_ms = (time.perf_counter() - start) * 1000.0
+	return result, elapsed_ms
+
+
+#============================================
+def main() -> None:
+	"""Run the benchmark table."""
+	args = parse_args()
+	text = "".join(MOLECULES[i % len(MOLECULES)] + "\n" for i in range(args.num_records))
+	print(f"Batch conversion benchmark ({args.num_records} SMILES to InChI)")
+	old, old_ms = time_function(lambda: legacy_convert(text))
+	(serial, serial_stats), serial_ms = time_function(lambda: batch_convert(text, 1, args.chunk_size))
+	(pooled, pooled_stats), pool_ms = time_function(lambda: batch_convert(text, args.processes, args.chunk_size))
+	if not old == serial == pooled:
+		raise AssertionError("batch output differs from the one-record-at-a-time loop")
+	print(f"record loop:    {old_ms:9.2f} ms  {args.num_records / old_ms * 1000.0:9.1f} records/s")
+	print(f"batch, 1 job:   {serial_ms:9.2f} ms  {serial_stats.records_per_second:9.1f} records/s")
+	print(f"batch, pooled:  {pool_ms:9.2f} ms  {pooled_stats.records_per_second:9.1f} records/s  ({old_ms / pool_ms:.1f}x)")
+	print(f"pooled stages:  {pooled_stats.summary()}")
+
+
+#============================================
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Benchmark complete-CDML load, parse, and inspection cost as documents grow.
+
+Times a strict backend session load next to the hardened DOM parse and the
+node-free inspection view, and reports the traced peak memory of one session
+load.  A load used to parse and strict-check the same text twice; it now adopts
+its private parse whenever the text reads back as its own serialization.
+"""
+
+# Standard Library
+import sys
+import time
+import argparse
+import tracemalloc
+
+# ensure OASA package is importable from the repo tree
+sys.path.insert(0, "packages/oasa")
+
+# local repo modules
+import oasa.cdml_document
+import oasa.cdml_xml
+import benchmark_cdml_session_edits
+
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""Parse command-line arguments."""
+	parser = argparse.ArgumentParser(
+		description="Benchmark complete-CDML load, parse, and inspection cost"
+	)
+	parser.add_argument(
+		'-s', '--sizes', dest='sizes',
+		type=int, nargs='+', default=[100, 1000, 2000],
+		help="Direct-root molecule counts to benchmark (default: 100 1000 2000)",
+	)
+	parser.add_argument(
+		'-n', '--iterations', dest='num_iterations',
+		type=int, default=3,
+		help="Number of timing iterations per measurement (default: 3)",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+def time_function(func: object, num_iterations: int) -> float:
+	"""Return the average call time of ``func`` in milliseconds."""
+	start = time.perf_counter()
+	for _ in range(num_iterations):
+		func()
+	elapsed = time.perf_counter() - start
+	avg_ms = (elapsed / num_iterations) * 1000.0
+	return avg_ms
+
+
+#============================================
+def peak_memory_kb(func: object) -> float:
+	"""Return the traced peak allocation of one ``func`` call in KiB."""
+	tracemalloc.start()
+	func()
+	_current, peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	return peak / 1024.0
+
+
+#============================================
+def benchmark_size(num_molecules: int, num_iterations: int) -> dict:
+	"""Time loads, parses, and inspections for one document size."""
+	text = benchmark_cdml_session_edits.build_cdml(num_molecules)
+	source = text.encode("utf-8")
+
+	def load() -> None:
+		oasa.cdml_document.CDMLDocumentSession.load(text)
+
+	results = {
+		"molecules": num_molecules,
+		"load_ms": time_function(load, num_iterations),
+		"parse_ms": time_function(lambda: oasa.cdml_xml.parse_cdml_dom(source), num_iterations),
+		"inspect_ms": time_function(lambda: oasa.cdml_xml.inspect_cdml_xml(source), num_iterations),
+		"peak_kb": peak_memory_kb(load),
+		"text_kb": len(source) / 1024.0,
+	}
+	return results
+
+
+#============================================
+def print_table(all_results: list) -> None:
+	"""Print one row of average millisecond timings per document size."""
+	header = f"{'molecules':>10} {'load ms':>10} {'parse ms':>10} {'inspect ms':>11} {'load peak KiB':>14} {'text KiB':>9}"
+	print(header)
+	print("-" * len(header))
+	for row in all_results:
+		print(
+			f"{row['molecules']:>10} {row['load_ms']:>10.1f} {row['parse_ms']:>10.1f}"
+			f" {row['inspect_ms']:>11.1f} {row['peak_kb']:>14.1f} {row['text_kb']:>9.1f}"
+		)
+
+
+#============================================
+def main() -> None:
+	"""Run the load benchmark over each requested document size."""
+	args = parse_args()
+	print("Complete CDML load benchmark")
+	all_results = [
+		benchmark_size(num_molecules, args.num_iterations)
+		for num_molecules in args.sizes
+	]
+	print_table(all_results)
+
+
+#============================================
+if __name__ == '__main__':
+	main()
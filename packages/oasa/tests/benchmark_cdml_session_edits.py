@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Benchmark CDML backend session edits and snapshots as documents grow.
+
+Builds synthetic complete-CDML documents with an increasing number of small
+direct-root molecules, then times one accepted single-molecule edit, a
+snapshot, and a dirty check per revision.  A full DOM serialization is timed
+as the reference cost that uncached snapshots used to pay on every call, and
+the compressed history size is reported next to one document's text size.
+"""
+
+# Standard Library
+import sys
+import time
+import argparse
+
+# ensure OASA package is importable from the repo tree
+sys.path.insert(0, "packages/oasa")
+
+# local repo modules
+import oasa.cdml_document
+
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""Parse command-line arguments."""
+	parser = argparse.ArgumentParser(
+		description="Benchmark CDML session edit, snapshot, and dirty-check cost"
+	)
+	parser.add_argument(
+		'-s', '--sizes', dest='sizes',
+		type=int, nargs='+', default=[10, 100, 1000],
+		help="Direct-root molecule counts to benchmark (default: 10 100 1000)",
+	)
+	parser.add_argument(
+		'-n', '--iterations', dest='num_iterations',
+		type=int, default=50,
+		help="Number of timing iterations per measurement (default: 50)",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+def build_cdml(num_molecules: int) -> str:
+	"""Return complete CDML with ``num_molecules`` three-atom chain molecules."""
+	parts = ['<cdml version="26.07">']
+	for index in range(num_molecules):
+		x = 2.0 * (index % 40)
+		y = 2.0 * (index // 40)
+		parts.append(f'<molecule id="m{index}">')
+		for atom in range(3):
+			parts.append(
+				f'<atom id="a{index}_{atom}" name="C">'
+				f'<point x="{x + atom * 0.5:.3f}cm" y="{y:.3f}cm"/></atom>'
+			)
+		for bond in range(2):
+			parts.append(
+				f'<bond id="b{index}_{bond}" type="n1" '
+				f'start="a{index}_{bond}" end="a{index}_{bond + 1}"/>'
+			)
+		parts.append('</molecule>')
+	parts.append('</cdml>')
+	return "".join(parts)
+
+
+#============================================
+def time_function(func: object, num_iterations: int) -> float:
+	"""Return the average call time of ``func`` in microseconds."""
+	start = time.perf_counter()
+	for _ in range(num_iterations):
+		func()
+	elapsed = time.perf_counter() - start
+	avg_us = (elapsed / num_iterations) * 1_000_000
+	return avg_us
+
+
+#============================================
+def benchmark_size(num_molecules: int, num_iterations: int) -> dict:
+	"""Time edits, snapshots, and dirty checks for one document size."""
+	session = oasa.cdml_document.CDMLDocumentSession.load(
+		build_cdml(num_molecules), history_capacity=num_iterations + 3,
+	)
+	counter = [0]
+
+	def edit() -> None:
+		counter[0] += 1
+		session.set_molecule_name(oasa.cdml_document.CDMLMoleculeNameEditRequest(
+			session.revision, "m0", f"name{counter[0]}",
+		))
+
+	results = {
+		"molecules": num_molecules,
+		"edit_us": time_function(edit, num_iterations),
+		"snapshot_us": time_function(session.snapshot, num_iterations),
+		"dirty_us": time_function(lambda: session.is_dirty, num_iterations),
+		"serialize_us": time_function(session._document.serialize, num_iterations),
+		"text_kb": len(session.snapshot().cdml) / 1024.0,
+		"history_kb": session._history.retained_bytes / 1024.0,
+	}
+	return results
+
+
+#============================================
+def print_table(all_results: list) -> None:
+	"""Print one row of average microsecond timings per document size."""
+	header = f"{'molecules':>10} {'edit us':>12} {'snapshot us':>12} {'dirty us':>10} {'serialize us':>13} {'text KiB':>9} {'history KiB':>12}"
+	print(header)
+	print("-" * len(header))
+	for row in all_results:
+		print(
+			f"{row['molecules']:>10} {row['edit_us']:>12.1f} {row['snapshot_us']:>12.2f}"
+			f" {row['dirty_us']:>10.2f} {row['serialize_us']:>13.1f}"
+			f" {row['text_kb']:>9.1f} {row['history_kb']:>12.1f}"
+		)
+
+
+#============================================
+def main() -> None:
+	"""Run the session benchmark over each requested document size."""
+	args = parse_args()
+	print("CDML backend session edit benchmark")
+	all_results = [
+		benchmark_size(num_molecules, args.num_iterations)
+		for num_molecules in args.sizes
+	]
+	print_table(all_results)
+
+
+#============================================
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Benchmark codec registry start-up with ``python -X importtime``.
+
+The legacy path is what ``_ensure_defaults_registered`` did before lazy
+codecs: import every codec module, including the RDKit formats and the
+renderer, on the first registry call.  The lazy registry declares the same
+codecs without importing them.  Each scenario runs in a fresh interpreter;
+the table reports the cumulative import time of top-level ``oasa`` imports.
+Both registries must report the same capabilities.  The run fails when the
+metadata scenario exceeds ``--budget-ms``.
+"""
+
+# Standard Library
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+# ensure OASA package is importable from the repo tree
+sys.path.insert(0, "packages/oasa")
+
+# local repo modules
+import oasa.codec_registry
+
+
+# the modules the eager registration imported
+LEGACY_IMPORTS = (
+	"from oasa import cdml, cdml_writer, inchi_lib, molfile_lib, smiles_lib\n"
+	"from oasa.codecs import cdxml, cdsvg, cml, cml2, render, rdkit_formats\n"
+)
+
+SCENARIOS = (
+	("metadata, eager", LEGACY_IMPORTS + "import oasa.codec_registry as r\nr.list_codecs(); r.get_registry_snapshot()\n"),
+	("metadata, lazy", "import oasa.codec_registry as r\nr.list_codecs(); r.get_registry_snapshot()\n"),
+	("cdml codec, eager", LEGACY_IMPORTS + "import oasa.codec_registry as r\nr.get_codec('cdml').text_to_mol\n"),
+	("cdml codec, lazy", "import oasa.codec_registry as r\nr.get_codec('cdml').text_to_mol\n"),
+	("svg codec, eager", LEGACY_IMPORTS + "import oasa.codec_registry as r\nr.get_codec('svg').mol_to_file\n"),
+	("svg codec, lazy", "import oasa.codec_registry as r\nr.get_codec('svg').mol_to_file\n"),
+)
+
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""Parse command-line arguments."""
+	parser = argparse.ArgumentParser(
+		description="Benchmark codec registry start-up with python -X importtime"
+	)
+	parser.add_argument(
+		'-n', '--iterations', dest='num_iterations',
+		type=int, default=3,
+		help="Fresh interpreters per scenario; the fastest counts (default: 3)",
+	)
+	parser.add_argument(
+		'-b', '--budget-ms', dest='budget_ms',
+		type=float, default=50.0,
+		help="Allowed import time of the lazy metadata scenario (default: 50 ms)",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+def import_ms(code: str) -> float:
+	"""Return the cumulative import time of top-level ``oasa`` imports of ``code``."""
+	env = dict(os.environ)
+	env["PYTHONPATH"] = os.path.abspath("packages/oasa")
+	result = subprocess.run(
+		[sys.executable, "-X", "importtime", "-c", code],
+		capture_output=True, text=True, env=env, check=True,
+	)
+	total = 0
+	for line in result.stderr.splitlines():
+		if not line.startswith("import time:"):
+			continue
+		_self, cumulative, name = line.split("|")
+		if cumulative.strip().isdigit() and not name[1:].startswith(" ") and name.strip().startswith("oasa"):
+			total += int(cumulative)
+	return total / 1000.0
+
+
+#============================================
+def legacy_snapshot() -> dict:
+	"""Return the registry snapshot with every codec module imported."""
+	fields = ("text_to_mol", "mol_to_text", "file_to_mol", "mol_to_file",
+		"text_to_document", "file_to_document", "file_to_mols", "open_mol_writer")
+	snapshot = oasa.codec_registry.get_registry_snapshot()
+	eager = {}
+	for name, entry in snapshot.items():
+		codec = oasa.codec_registry.get_codec(name)
+		loaded = oasa.codec_registry.Codec(
+			name, extensions=codec.extensions,
+			read_extensions=entry["read_extensions"], write_extensions=entry["write_extensions"],
+			**{field: getattr(codec, field) for field in fields},
+		)
+		eager[name] = {key: getattr(loaded, key) for key in entry if key != "extensions"}
+		eager[name]["extensions"] = list(loaded.extensions)
+	return eager
+
+
+#============================================
+def main() -> None:
+	"""Run the benchmark table."""
+	args = parse_args()
+	lazy = json.loads(json.dumps(oasa.codec_registry.get_registry_snapshot()))
+	if lazy != json.loads(json.dumps(legacy_snapshot())):
+		raise AssertionError("lazy declarations disagree with the loaded codec callables")
+	print(f"Codec registry import benchmark (best of {args.num_iterations} interpreters)")
+	results = {}
+	for label, code in SCENARIOS:
+		results[label] = min(import_ms(code) for _ in range(args.num_iterations))
+		print(f"{label:20s} {results[label]:9.1f} ms")
+	if results["metadata, lazy"] > args.budget_ms:
+		raise SystemExit(
+			f"metadata import time {results['metadata, lazy']:.1f} ms exceeds the {args.budget_ms:.1f} ms budget"
+		)
+
+
+#============================================
+if __name__ == '__main__':
+	main()
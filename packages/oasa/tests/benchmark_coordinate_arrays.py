@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Benchmark array-backed molecule geometry against per-atom Python loops.
+
+Times hex-grid origin search, grid snapping, and bond-length normalization on
+random 2D point clouds and parsed molecules.  The loop versions are the
+per-point scalar functions the array code replaced; both must pick the same
+origin and the same snapped points.
+"""
+
+# Standard Library
+import sys
+import time
+import random
+import argparse
+
+# ensure OASA package is importable from the repo tree
+sys.path.insert(0, "packages/oasa")
+
+# local repo modules
+import oasa.hex_grid
+import oasa.smiles_lib
+
+
+SPACING = 1.0
+
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""Parse command-line arguments."""
+	parser = argparse.ArgumentParser(
+		description="Benchmark array-backed molecule geometry against per-atom loops"
+	)
+	parser.add_argument(
+		'-s', '--sizes', dest='sizes',
+		type=int, nargs='+', default=[50, 200, 800],
+		help="Point counts to benchmark (default: 50 200 800)",
+	)
+	parser.add_argument(
+		'-n', '--iterations', dest='num_iterations',
+		type=int, default=3,
+		help="Number of timing iterations per measurement (default: 3)",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+def time_function(func: object, num_iterations: int) -> float:
+	"""Return the average call time of ``func`` in milliseconds."""
+	start = time.perf_counter()
+	for _ in range(num_iterations):
+		func()
+	elapsed = time.perf_counter() - start
+	avg_ms = (elapsed / num_iterations) * 1000.0
+	return avg_ms
+
+
+#============================================
+def loop_best_origin(points: list) -> tuple:
+	"""Return the best grid origin using the scalar per-point distance."""
+	best_total = None
+	best_origin = (0.0, 0.0)
+	for ox, oy in points:
+		total = 0.0
+		for x, y in points:
+			total += oasa.hex_grid.distance_to_hex_grid(x, y, SPACING, ox, oy)
+		if best_total is None or total < best_total:
+			best_total = total
+			best_origin = (ox, oy)
+	return best_origin
+
+
+#============================================
+def loop_snap(points: list, origin: tuple) -> list:
+	"""Return every point snapped with the scalar function."""
+	return [oasa.hex_grid.snap_to_hex_grid(x, y, SPACING, *origin) for x, y in points]
+
+
+#============================================
+def benchmark_points(size: int, num_iterations: int) -> dict:
+	"""Time origin search and snapping on ``size`` random points."""
+	rng = random.Random(size)
+	points = [(rng.uniform(-20.0, 20.0), rng.uniform(-20.0, 20.0)) for _ in range(size)]
+	origin = oasa.hex_grid.find_best_grid_origin(points, SPACING)
+	if origin != loop_best_origin(points):
+		raise AssertionError(f"array origin search disagrees with the loop for {size} points")
+	if oasa.hex_grid.snap_molecule_to_hex_grid(points, SPACING, *origin) != loop_snap(points, origin):
+		raise AssertionError(f"array snapping disagrees with the loop for {size} points")
+	# the quadratic loop is slow; time it once per size
+	results = {
+		"size": size,
+		"origin_ms": time_function(lambda: oasa.hex_grid.find_best_grid_origin(points, SPACING), num_iterations),
+		"old_origin_ms": time_function(lambda: loop_best_origin(points), 1),
+		"snap_ms": time_function(
+			lambda: oasa.hex_grid.snap_molecule_to_hex_grid(points, SPACING, *origin), num_iterations,
+		),
+		"old_snap_ms": time_function(lambda: loop_snap(points, origin), num_iterations),
+	}
+	return results
+
+
+#============================================
+def benchmark_normalize(num_iterations: int) -> float:
+	"""Time normalize_bond_length on a parsed polycyclic molecule."""
+	mol = oasa.smiles_lib.text_to_mol("c1cc2ccc3ccc4ccc5ccc6ccc1c7c2c3c4c5c67", calc_coords=1)
+
+	def normalize() -> None:
+		mol.normalize_bond_length(1.0)
+		mol.normalize_bond_length(2.0)
+
+	return time_function(normalize, num_iterations * 100)
+
+
+#============================================
+def main() -> None:
+	"""Run the benchmark table."""
+	args = parse_args()
+	print("Array-backed coordinate benchmark")
+	header = (
+		f"{'points':>7} {'origin ms':>10} {'was':>10} {'speedup':>8}"
+		f" {'snap ms':>8} {'was':>8} {'speedup':>8}"
+	)
+	print(header)
+	print("-" * len(header))
+	for size in args.sizes:
+		row = benchmark_points(size, args.num_iterations)
+		origin_speedup = row["old_origin_ms"] / row["origin_ms"] if row["origin_ms"] else 0.0
+		snap_speedup = row["old_snap_ms"] / row["snap_ms"] if row["snap_ms"] else 0.0
+		print(
+			f"{row['size']:>7} {row['origin_ms']:>10.2f} {row['old_origin_ms']:>10.2f}"
+			f" {origin_speedup:>7.1f}x {row['snap_ms']:>8.2f} {row['old_snap_ms']:>8.2f}"
+			f" {snap_speedup:>7.1f}x"
+		)
+	print(f"normalize_bond_length x2 on coronene: {benchmark_normalize(args.num_iterations):.3f} ms")
+
+
+#============================================
+if __name__ == '__main__':
+	main()
@@ -3,7 +3,9 @@
 
 Runs timing comparisons on real molecule graphs parsed from SMILES strings.
 Verifies result parity between the two implementations and prints speedup
-ratios in a summary table.
+ratios in a summary table.  A mutation-heavy scenario then interleaves
+single-edge disconnects with connectivity queries, timing the incremental
+rustworkx mirror against a forced rebuild after every edit.
 """
 
 # Standard Library
@@ -19,6 +21,9 @@ import rustworkx
 sys.path.insert(0, "packages/oasa")
 
 # local repo modules
+import oasa.atom_lib
+import oasa.bond_lib
+import oasa.molecule_lib
 import oasa.smiles_lib
 
 
@@ -35,6 +40,14 @@ MOLECULES = {
 }
 
 
+# Larger graphs for the edit-then-query scenario, where rebuild cost dominates.
+MUTATION_MOLECULES = {
+	"cholesterol": MOLECULES["cholesterol"],
+	"C300 chain": "C" * 300,
+	"polyphenylene": "c1ccc(cc1)" * 40 + "C",
+}
+
+
 #============================================
 def parse_args() -> argparse.Namespace:
 	"""Parse command-line arguments."""
@@ -545,6 +558,130 @@ def print_summary(all_results: dict) -> None:
 		print("  All parity checks passed.")
 
 
+#============================================
+def edit_query_cycle(mol: object, force_rebuild: bool) -> int:
+	"""Disconnect, query, and reconnect every edge once.
+
+	Args:
+		mol: An oasa.molecule instance.
+		force_rebuild: Mark the rustworkx mirror dirty after every edit,
+			as every Graph edit did before incremental updates.
+
+	Returns:
+		Number of edges that are bridges (their removal disconnects mol).
+	"""
+	bridges = 0
+	for e in list(mol.edges):
+		mol.temporarily_disconnect_edge(e)
+		if force_rebuild:
+			mol._rx_backend.mark_dirty()
+		if not mol.is_connected():
+			bridges += 1
+		mol.reconnect_temporarily_disconnected_edge(e)
+		if force_rebuild:
+			mol._rx_backend.mark_dirty()
+	return bridges
+
+
+#============================================
+def benchmark_mutations(num_iterations: int) -> None:
+	"""Time edit-then-query loops with incremental and rebuilt mirrors.
+
+	Args:
+		num_iterations: Number of timing iterations per molecule.
+	"""
+	print(f"\n{'='*65}")
+	print("Mutation-heavy scenario: disconnect, is_connected, reconnect per edge")
+	print(f"{'='*65}")
+	header = (
+		f"{'Molecule':<16s} "
+		f"{'Edges':>6s} "
+		f"{'Incr (us)':>12s} "
+		f"{'Rebuild (us)':>13s} "
+		f"{'Speedup':>8s} "
+		f"{'Parity':>8s}"
+	)
+	print(f"\n{header}")
+	print("-" * len(header))
+	# the full cycle is heavy, so scale iterations down from the per-call count
+	cycles = max(1, num_iterations // 50)
+	for mol_name, smiles in MUTATION_MOLECULES.items():
+		mol = smiles_to_oasa_mol(smiles)
+		mol.is_connected()
+		incremental_us = time_function(lambda: edit_query_cycle(mol, False), cycles)
+		rebuild_us = time_function(lambda: edit_query_cycle(mol, True), cycles)
+		parity = "OK"
+		if edit_query_cycle(mol, False) != edit_query_cycle(mol, True):
+			parity = "MISMATCH"
+		speedup = rebuild_us / incremental_us if incremental_us > 0 else float("inf")
+		print(
+			f"{mol_name:<16s} "
+			f"{len(mol.edges):>6d} "
+			f"{incremental_us:>12.1f} "
+			f"{rebuild_us:>13.1f} "
+			f"{speedup:>7.1f}x "
+			f"{parity:>8s}"
+		)
+
+
+#============================================
+def build_chain(num_atoms: int, plain_list: bool, bulk: bool) -> object:
+	"""Build a carbon chain one vertex and edge at a time or in bulk.
+
+	Args:
+		num_atoms: Number of chain atoms.
+		plain_list: Store vertices in a plain list, as before indexed storage.
+		bulk: Use add_vertices/add_edges instead of per-item calls.
+
+	Returns:
+		The built oasa.molecule_lib.Molecule.
+	"""
+	mol = oasa.molecule_lib.Molecule()
+	if plain_list:
+		mol.vertices = []
+	atoms = [oasa.atom_lib.Atom(symbol="C") for _ in range(num_atoms)]
+	pairs = [(atoms[i], atoms[i + 1], oasa.bond_lib.Bond()) for i in range(num_atoms - 1)]
+	if bulk:
+		mol.add_vertices(atoms)
+		mol.add_edges(pairs)
+	else:
+		for atom in atoms:
+			mol.add_vertex(atom)
+		for v1, v2, bond in pairs:
+			mol.add_edge(v1, v2, bond)
+	return mol
+
+
+#============================================
+def benchmark_construction(sizes: tuple = (1000, 5000, 10000)) -> None:
+	"""Time building and deep-copying long chains with each vertex storage."""
+	print(f"\n{'='*65}")
+	print("Construction scenario: build and deep_copy a carbon chain")
+	print(f"{'='*65}")
+	header = (
+		f"{'Atoms':>6s} "
+		f"{'List (ms)':>10s} "
+		f"{'Indexed (ms)':>13s} "
+		f"{'Bulk (ms)':>10s} "
+		f"{'Copy (ms)':>10s}"
+	)
+	print(f"\n{header}")
+	print("-" * len(header))
+	for size in sizes:
+		list_ms = time_function(lambda: build_chain(size, True, False), 1) / 1000.0
+		indexed_ms = time_function(lambda: build_chain(size, False, False), 1) / 1000.0
+		bulk_ms = time_function(lambda: build_chain(size, False, True), 1) / 1000.0
+		mol = build_chain(size, False, True)
+		copy_ms = time_function(mol.deep_copy, 1) / 1000.0
+		print(
+			f"{size:>6d} "
+			f"{list_ms:>10.1f} "
+			f"{indexed_ms:>13.1f} "
+			f"{bulk_ms:>10.1f} "
+			f"{copy_ms:>10.1f}"
+		)
+
+
 #============================================
 def main() -> None:
 	"""Run graph algorithm benchmarks on test molecules."""
@@ -563,6 +700,8 @@ def main() -> None:
 
 	# final summary
 	print_summary(all_results)
+	benchmark_mutations(args.num_iterations)
+	benchmark_construction()
 
 
 #============================================
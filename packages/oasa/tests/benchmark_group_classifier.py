@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Benchmark the precompiled group classifier against per-pattern searches.
+
+The per-pattern path is what callers did before ``GroupClassifier``: read
+every ``subsearch_data.structures`` SMILES and run it through
+``select_matching_substructures`` one molecule at a time.  The classifier
+compiles the patterns once, prepares each molecule once, and skips patterns
+by element counts.  Both must find the same group atoms.  A larger batch then
+compares ``classify_many`` in one process and in a process pool.
+"""
+
+# Standard Library
+import sys
+import time
+import argparse
+
+# ensure OASA package is importable from the repo tree
+sys.path.insert(0, "packages/oasa")
+
+# local repo modules
+import oasa.smiles_lib
+import oasa.subsearch_data
+import oasa.group_classifier
+
+
+MOLECULES = (
+	"CC(=O)OC1=CC=CC=C1C(=O)O",
+	"CC(=O)NC1=CC=C(O)C=C1",
+	"CC(C)CCCC(C)C1CCC2C1(CCC3C2CCC4=CC(CCC34C)O)C",
+	"C1CN2CC3=CCOC4CC(=O)N5C6C4C3CC2C61C7=CC=CC=C75",
+	"CC1(C)SC2C(NC(=O)CC3=CC=CC=C3)C(=O)N2C1C(=O)O",
+	"CN1C=NC2=C1C(=O)N(C(=O)N2C)C",
+	"OCC(O)C(O)C(O)C(O)CO",
+	"ClC1=CC=C(C=C1)C(C1=CC=CC=C1)N1CCN(CC1)CCOCC(=O)O",
+)
+
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""Parse command-line arguments."""
+	parser = argparse.ArgumentParser(
+		description="Benchmark the precompiled group classifier against per-pattern searches"
+	)
+	parser.add_argument(
+		'-n', '--iterations', dest='num_iterations',
+		type=int, default=3,
+		help="Number of timing iterations per measurement (default: 3)",
+	)
+	parser.add_argument(
+		'-b', '--batch', dest='batch_size',
+		type=int, default=2000,
+		help="Molecules in the classify_many batch (default: 2000)",
+	)
+	parser.add_argument(
+		'-p', '--processes', dest='processes',
+		type=int, default=None,
+		help="Pool workers for the pooled batch (default: one per CPU)",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+def per_pattern_groups(mol: object) -> set:
+	"""Return (name, matched atom positions) found by parsing and searching each pattern."""
+	positions = {v: i for i, v in enumerate(mol.vertices)}
+	found = set()
+	for name, _family, smiles, _free_sites in oasa.subsearch_data.structures:
+		reader = oasa.smiles_lib.Smiles()
+		reader.read_smiles(smiles)
+		query = reader.get_structure()
+		for match in mol.select_matching_substructures(query, implicit_freesites=True):
+			found.add((name, tuple(sorted(positions[v] for v in match))))
+	return found
+
+
+#============================================
+def classifier_groups(classifier: object, mol: object) -> set:
+	"""Return (name, matched atom positions) of the classifier's group matches."""
+	return {
+		(m.name, tuple(sorted(m.atoms + m.attachments)))
+		for m in classifier.classify(mol) if m.kind == "group"
+	}
+
+
+#============================================
+def time_function(func: object, num_iterations: int) -> float:
+	"""Return the average call time of ``func`` in milliseconds."""
+	start = time.perf_counter()
+	for _ in range(num_iterations):
+		func()
+	elapsed = time.perf_counter() - start
+	avg_ms = (elapsed / num_iterations) * 1000.0
+	return avg_ms
+
+
+#============================================
+def main() -> None:
+	"""Run the benchmark table."""
+	args = parse_args()
+	start = time.perf_counter()
+	classifier = oasa.group_classifier.GroupClassifier()
+	compile_ms = (time.perf_counter() - start) * 1000.0
+	mols = [oasa.smiles_lib.text_to_mol(smiles, calc_coords=False) for smiles in MOLECULES]
+	for smiles, mol in zip(MOLECULES, mols):
+		if per_pattern_groups(mol) != classifier_groups(classifier, mol):
+			raise AssertionError(f"classifier and per-pattern search disagree on {smiles}")
+	print(f"Group classifier benchmark ({len(mols)} molecules, compile {compile_ms:.1f} ms)")
+	old_ms = time_function(lambda: [per_pattern_groups(mol) for mol in mols], args.num_iterations)
+	new_ms = time_function(lambda: [classifier.classify(mol) for mol in mols], args.num_iterations)
+	print(f"per-pattern search:  {old_ms:9.2f} ms")
+	print(f"classifier:          {new_ms:9.2f} ms  ({old_ms / new_ms:.1f}x, groups and rings)")
+	batch = [mols[i % len(mols)] for i in range(args.batch_size)]
+	serial = []
+	serial_ms = time_function(lambda: serial.append(classifier.classify_many(batch, processes=1)), 1)
+	pooled = []
+	pool_ms = time_function(lambda: pooled.append(classifier.classify_many(batch, processes=args.processes)), 1)
+	if pooled[0] != serial[0]:
+		raise AssertionError("process pool results differ from in-process results")
+	print(f"classify_many x{args.batch_size}: {serial_ms:9.2f} ms in process, {pool_ms:9.2f} ms with the pool")
+
+
+#============================================
+if __name__ == '__main__':
+	main()
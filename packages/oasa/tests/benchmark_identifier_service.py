@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Benchmark memoized identifiers against generating them on every request.
+
+The legacy path is what callers did before ``IdentifierService``: write
+depiction SMILES with RDKit and derive the standard InChI and InChIKey from
+it each time the Qt info panel or a CDML session asks.  The service keys
+each molecule by its canonical graph and stereo and generates identifiers
+once; a second service reads them back from the SQLite file.  Both must give
+the same identifiers.  A batch with repeated molecules then compares a
+generation loop with ``identifiers_many``.
+"""
+
+# Standard Library
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+# ensure OASA package is importable from the repo tree
+sys.path.insert(0, "packages/oasa")
+
+# PIP3 modules
+import rdkit.rdBase
+
+# local repo modules
+import oasa.smiles_lib
+import oasa.identifier_service
+import oasa.codecs.rdkit_formats
+
+
+MOLECULES = (
+	"CC(=O)OC1=CC=CC=C1C(=O)O",
+	"CC(=O)NC1=CC=C(O)C=C1",
+	"CN1C=NC2=C1C(=O)N(C(=O)N2C)C",
+	"OCC(O)C(O)C(O)C(O)CO",
+	"CC(C)CCCC(C)C1CCC2C1(CCC3C2CCC4=CC(CCC34C)O)C",
+	"C1CN2CC3=CCOC4CC(=O)N5C6C4C3CC2C61C7=CC=CC=C75",
+	"CC1(C)SC2C(NC(=O)CC3=CC=CC=C3)C(=O)N2C1C(=O)O",
+	"ClC1=CC=C(C=C1)C(C1=CC=CC=C1)N1CCN(CC1)CCOCC(=O)O",
+)
+
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""Parse command-line arguments."""
+	parser = argparse.ArgumentParser(
+		description="Benchmark memoized identifiers against generating them on every request"
+	)
+	parser.add_argument(
+		'-n', '--iterations', dest='num_iterations',
+		type=int, default=10,
+		help="Number of timing iterations per measurement (default: 10)",
+	)
+	parser.add_argument(
+		'-b', '--batch', dest='batch_size',
+		type=int, default=2000,
+		help="Molecules in the identifiers_many batch (default: 2000)",
+	)
+	parser.add_argument(
+		'-p', '--processes', dest='processes',
+		type=int, default=None,
+		help="Pool workers for the batch (default: one per CPU)",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+def legacy_identifiers(mol: object) -> object:
+	"""Return identifier facts generated from scratch."""
+	smiles = oasa.codecs.rdkit_formats.depiction_stereo_smiles_mol_to_text(mol)
+	return oasa.codecs.rdkit_formats.identifiers_from_smiles(smiles)
+
+
+#============================================
+def time_function(func: object, num_iterations: int) -> float:
+	"""Return the average call time of ``func`` in milliseconds."""
+	start = time.perf_counter()
+	for _ in range(num_iterations):
+		func()
+	elapsed = time.perf_counter() - start
+	avg_ms = (elapsed / num_iterations) * 1000.0
+	return avg_ms
+
+
+#============================================
+def main() -> None:
+	"""Run the benchmark table."""
+	args = parse_args()
+	# InChI generation warns about undefined stereo on every call
+	blocker = rdkit.rdBase.BlockLogs()
+	mols = [oasa.smiles_lib.text_to_mol(smiles, calc_coords=False) for smiles in MOLECULES]
+	workdir = tempfile.mkdtemp()
+	path = os.path.join(workdir, "identifiers.sqlite")
+	service = oasa.identifier_service.IdentifierService(path=path)
+	for smiles, mol in zip(MOLECULES, mols):
+		if service.identifiers(mol) != legacy_identifiers(mol):
+			raise AssertionError(f"cached and generated identifiers disagree on {smiles}")
+	print(f"Identifier service benchmark ({len(mols)} molecules, SMILES + InChI + InChIKey)")
+	old_ms = time_function(lambda: [legacy_identifiers(mol) for mol in mols], args.num_iterations)
+	key_ms = time_function(
+		lambda: [oasa.identifier_service.molecule_key(mol) for mol in mols], args.num_iterations,
+	)
+	new_ms = time_function(lambda: [service.identifiers(mol) for mol in mols], args.num_iterations)
+	service.close()
+	reopened = oasa.identifier_service.IdentifierService(path=path)
+	disk_ms = time_function(lambda: [reopened.identifiers(mol) for mol in mols], 1)
+	if reopened.cache_info().disk_hits != len(mols):
+		raise AssertionError("the reopened service did not read the SQLite file")
+	reopened.close()
+	print(f"generate every request: {old_ms:9.2f} ms")
+	print(f"molecule keys only:     {key_ms:9.2f} ms")
+	print(f"memory cache hits:      {new_ms:9.2f} ms  ({old_ms / new_ms:.1f}x)")
+	print(f"first read from SQLite: {disk_ms:9.2f} ms")
+
+	batch = [mols[i % len(mols)] for i in range(args.batch_size)]
+	looped = []
+	loop_ms = time_function(lambda: looped.append([legacy_identifiers(mol) for mol in batch]), 1)
+	bulk = []
+	bulk_service = oasa.identifier_service.IdentifierService()
+	bulk_ms = time_function(
+		lambda: bulk.append(bulk_service.identifiers_many(batch, processes=args.processes)), 1,
+	)
+	if bulk[0] != looped[0]:
+		raise AssertionError("identifiers_many differs from the generation loop")
+	print(f"batch x{args.batch_size}: {loop_ms:9.2f} ms generation loop, {bulk_ms:9.2f} ms identifiers_many")
+	del blocker
+
+
+#============================================
+if __name__ == '__main__':
+	main()
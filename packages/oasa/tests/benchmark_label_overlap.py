@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Benchmark bond/label overlap resolution in molecule_to_ops as molecules grow.
+
+Builds heteroatom-rich lattice molecules where every other atom carries a
+label, then times ``molecule_to_ops`` with the per-context label-target grid
+and with the previous every-bond-against-every-label scan.  Both paths must
+produce identical render ops.
+"""
+
+# Standard Library
+import sys
+import time
+import argparse
+import contextlib
+
+# ensure OASA package is importable from the repo tree
+sys.path.insert(0, "packages/oasa")
+
+# local repo modules
+import oasa.atom_lib
+import oasa.bond_lib
+import oasa.molecule_lib
+import oasa.render_lib.data_types
+import oasa.render_lib.molecule_ops
+
+
+_SYMBOLS = ("C", "N", "C", "O", "C", "S")
+
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""Parse command-line arguments."""
+	parser = argparse.ArgumentParser(
+		description="Benchmark bond/label overlap resolution in molecule_to_ops"
+	)
+	parser.add_argument(
+		'-s', '--sizes', dest='sizes',
+		type=int, nargs='+', default=[100, 500, 1000, 5000],
+		help="Atom counts to benchmark (default: 100 500 1000 5000)",
+	)
+	parser.add_argument(
+		'-n', '--iterations', dest='num_iterations',
+		type=int, default=1,
+		help="Number of timing iterations per measurement (default: 1)",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+def build_molecule(num_atoms: int, spacing: float = 30.0) -> object:
+	"""Return a square lattice molecule with labeled heteroatoms."""
+	mol = oasa.molecule_lib.Molecule()
+	columns = max(1, int(num_atoms ** 0.5))
+	atoms = []
+	for index in range(num_atoms):
+		atom = oasa.atom_lib.Atom(_SYMBOLS[index % len(_SYMBOLS)])
+		atom.x = (index % columns) * spacing
+		atom.y = (index // columns) * spacing
+		mol.add_vertex(atom)
+		atoms.append(atom)
+	for index, atom in enumerate(atoms):
+		if index % columns:
+			mol.add_edge(atoms[index - 1], atom, oasa.bond_lib.Bond())
+		if index >= columns and index % 3 == 0:
+			mol.add_edge(atoms[index - columns], atom, oasa.bond_lib.Bond(order=2))
+	return mol
+
+
+#============================================
+@contextlib.contextmanager
+def linear_label_scan() -> object:
+	"""Render without the label-target grid, as before the index existed."""
+	context_class = oasa.render_lib.data_types.BondRenderContext
+	post_init = context_class.__post_init__
+	context_class.__post_init__ = lambda self: None
+	try:
+		yield
+	finally:
+		context_class.__post_init__ = post_init
+
+
+#============================================
+def time_function(func: object, num_iterations: int) -> float:
+	"""Return the average call time of ``func`` in milliseconds."""
+	start = time.perf_counter()
+	for _ in range(num_iterations):
+		func()
+	elapsed = time.perf_counter() - start
+	avg_ms = (elapsed / num_iterations) * 1000.0
+	return avg_ms
+
+
+#============================================
+def benchmark_size(num_atoms: int, num_iterations: int) -> dict:
+	"""Time indexed and linear overlap resolution for one molecule size."""
+	mol = build_molecule(num_atoms)
+	render = oasa.render_lib.molecule_ops.molecule_to_ops
+	indexed_ops = render(mol)
+	with linear_label_scan():
+		linear_ops = render(mol)
+		linear_ms = time_function(lambda: render(mol), num_iterations)
+	if indexed_ops != linear_ops:
+		raise AssertionError(f"indexed ops differ from linear ops at {num_atoms} atoms")
+	results = {
+		"atoms": num_atoms,
+		"bonds": len(mol.edges),
+		"indexed_ms": time_function(lambda: render(mol), num_iterations),
+		"linear_ms": linear_ms,
+	}
+	return results
+
+
+#============================================
+def main() -> None:
+	"""Run the benchmark table."""
+	args = parse_args()
+	print("molecule_to_ops label overlap benchmark")
+	header = f"{'atoms':>7} {'bonds':>7} {'indexed ms':>12} {'linear ms':>12} {'speedup':>9}"
+	print(header)
+	print("-" * len(header))
+	for size in args.sizes:
+		row = benchmark_size(size, args.num_iterations)
+		speedup = row["linear_ms"] / row["indexed_ms"] if row["indexed_ms"] else 0.0
+		print(
+			f"{row['atoms']:>7} {row['bonds']:>7} {row['indexed_ms']:>12.1f}"
+			f" {row['linear_ms']:>12.1f} {speedup:>8.1f}x"
+		)
+
+
+#============================================
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Benchmark longest-chain and diameter queries against the pairwise searches.
+
+The legacy ``find_longest_mostly_carbon_chain`` asked ``find_path_between``
+for every ordered pair of end atoms and kept all the paths; the legacy
+diameter took the maximum of the rustworkx all-pairs distance matrix.  The
+routines in ``oasa.graph.longest_paths`` use a few breadth-first searches
+instead.  Chains must be identical and diameters equal.
+"""
+
+# Standard Library
+import sys
+import time
+import random
+import argparse
+
+# ensure OASA package is importable from the repo tree
+sys.path.insert(0, "packages/oasa")
+
+# local repo modules
+import oasa.smiles_lib
+
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""Parse command-line arguments."""
+	parser = argparse.ArgumentParser(
+		description="Benchmark longest-chain and diameter queries against the pairwise searches"
+	)
+	parser.add_argument(
+		'-n', '--iterations', dest='num_iterations',
+		type=int, default=3,
+		help="Number of timing iterations per measurement (default: 3)",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+def branched_polymer(units: int, seed: int = 3) -> str:
+	"""Return the SMILES of a randomly branched polyethylene-like chain."""
+	rng = random.Random(seed)
+	smiles = "C"
+	for _ in range(units):
+		smiles += "C(CC)" if rng.random() < 0.3 else "CC"
+	return smiles
+
+
+#============================================
+def molecules() -> dict:
+	"""Return the benchmark molecules by label."""
+	lipid = "CCCCCCCCCCCCCCCC(=O)OCC(COP(=O)(O)OCCN)OC(=O)CCCCCCCC=CCCCCCCCC"
+	return {
+		"lipid": lipid,
+		"lipid dimer": lipid + "OCCOC(=O)" + "CCCCCCCCCCCCCCC",
+		"polymer x100": branched_polymer(100),
+		"polymer x300": branched_polymer(300),
+		"ring polymer": "C1CCCCC1" + "CC(C2CCC(C)CC2)" * 60 + "C",
+	}
+
+
+#============================================
+def pairwise_chain(mol: object) -> list:
+	"""Return the longest end-to-end chain from a path search per end pair."""
+	ends = [v for v in mol.vertices if v.degree == 1]
+	paths = []
+	for e1 in ends:
+		for e2 in ends:
+			if e1 != e2:
+				paths.append(mol.find_path_between(e1, e2))
+	best = None
+	for path in paths:
+		if best is None or len(path) > len(best):
+			best = path
+	return best
+
+
+#============================================
+def matrix_diameter(mol: object) -> int:
+	"""Return the diameter from the rustworkx all-pairs distance matrix."""
+	return mol._rx_backend.get_diameter(mol)
+
+
+#============================================
+def uncached_diameter(mol: object) -> int:
+	"""Return ``mol.get_diameter()`` after dropping the cached value."""
+	mol._clean_cache()
+	return mol.get_diameter()
+
+
+#============================================
+def time_function(func: object, num_iterations: int) -> float:
+	"""Return the average call time of ``func`` in milliseconds."""
+	start = time.perf_counter()
+	for _ in range(num_iterations):
+		func()
+	elapsed = time.perf_counter() - start
+	avg_ms = (elapsed / num_iterations) * 1000.0
+	return avg_ms
+
+
+#============================================
+def main() -> None:
+	"""Run the benchmark table."""
+	args = parse_args()
+	n = args.num_iterations
+	print("Longest chain and diameter benchmark")
+	header = (
+		f"{'molecule':<13} {'atoms':>6} {'ends':>5} {'chain ms':>9} {'pairwise ms':>12}"
+		f" {'diam ms':>8} {'matrix ms':>10}"
+	)
+	print(header)
+	print("-" * len(header))
+	for label, smiles in molecules().items():
+		reader = oasa.smiles_lib.Smiles()
+		reader.read_smiles(smiles)
+		mol = reader.get_structure()
+		if mol.find_longest_mostly_carbon_chain() != pairwise_chain(mol):
+			raise AssertionError(f"longest chain differs on {label}")
+		if uncached_diameter(mol) != matrix_diameter(mol):
+			raise AssertionError(f"diameter differs on {label}")
+		chain_ms = time_function(mol.find_longest_mostly_carbon_chain, n)
+		pairwise_ms = time_function(lambda: pairwise_chain(mol), n)
+		diameter_ms = time_function(lambda: uncached_diameter(mol), n)
+		matrix_ms = time_function(lambda: matrix_diameter(mol), n)
+		ends = sum(1 for v in mol.vertices if v.degree == 1)
+		print(
+			f"{label:<13} {len(mol.vertices):>6} {ends:>5} {chain_ms:>9.2f} {pairwise_ms:>12.2f}"
+			f" {diameter_ms:>8.2f} {matrix_ms:>10.2f}"
+		)
+
+
+#============================================
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Benchmark the cached RDKit mirror against a fresh conversion per export.
+
+The legacy path is what ``rdkit_formats._oasa_to_rdkit`` did before
+``mirror_rdkit_mol``: convert the OASA molecule with ``oasa_to_rdkit_mol``
+and run Compute2DCoords for every export.  The Qt info panel asks for
+SMILES, InChI, InChIKey and a mol block of the same molecule in a row; with
+the mirror the chain converts and lays out the molecule once.  Both chains
+must give the same text.
+"""
+
+# Standard Library
+import sys
+import time
+import argparse
+
+# ensure OASA package is importable from the repo tree
+sys.path.insert(0, "packages/oasa")
+
+# PIP3 modules
+import rdkit.rdBase
+import rdkit.Chem
+import rdkit.Chem.inchi
+import rdkit.Chem.AllChem
+
+# local repo modules
+import oasa.smiles_lib
+import oasa.rdkit_bridge
+import oasa.codecs.rdkit_formats
+
+
+MOLECULES = (
+	"CC(=O)OC1=CC=CC=C1C(=O)O",
+	"CC(=O)NC1=CC=C(O)C=C1",
+	"CN1C=NC2=C1C(=O)N(C(=O)N2C)C",
+	"OCC(O)C(O)C(O)C(O)CO",
+	"CC(C)CCCC(C)C1CCC2C1(CCC3C2CCC4=CC(CCC34C)O)C",
+	"C1CN2CC3=CCOC4CC(=O)N5C6C4C3CC2C61C7=CC=CC=C75",
+)
+
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""Parse command-line arguments."""
+	parser = argparse.ArgumentParser(
+		description="Benchmark the cached RDKit mirror against a fresh conversion per export"
+	)
+	parser.add_argument(
+		'-n', '--iterations', dest='num_iterations',
+		type=int, default=20,
+		help="Number of timing iterations per measurement (default: 20)",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+def legacy_oasa_to_rdkit(mol: object) -> object:
+	"""Convert and lay out ``mol`` from scratch, as every export did before."""
+	rmol, _atom_map = oasa.rdkit_bridge.oasa_to_rdkit_mol(mol)
+	if rmol.GetNumConformers() == 0:
+		rdkit.Chem.AllChem.Compute2DCoords(rmol)
+	return rmol
+
+
+#============================================
+def legacy_chain(mol: object) -> tuple:
+	"""Return the info panel identifiers with one conversion per export."""
+	smiles = rdkit.Chem.MolToSmiles(legacy_oasa_to_rdkit(mol), canonical=True, isomericSmiles=True)
+	inchi = rdkit.Chem.inchi.MolToInchi(legacy_oasa_to_rdkit(mol))
+	fixed = rdkit.Chem.inchi.MolToInchi(legacy_oasa_to_rdkit(mol), options="/FixedH")
+	key = rdkit.Chem.inchi.InchiToInchiKey(fixed)
+	molfile = rdkit.Chem.MolToMolBlock(legacy_oasa_to_rdkit(mol))
+	return smiles, inchi, fixed, key, molfile
+
+
+#============================================
+def mirror_chain(mol: object) -> tuple:
+	"""Return the info panel identifiers through the codec functions."""
+	formats = oasa.codecs.rdkit_formats
+	smiles = formats.smiles_mol_to_text(mol)
+	inchi = formats.inchi_mol_to_text(mol)
+	fixed, key, _warnings = formats.generate_inchi_and_inchikey(mol)
+	molfile = formats.molfile_mol_to_text(mol)
+	return smiles, inchi, fixed, key, molfile
+
+
+#============================================
+def time_function(func: object, num_iterations: int) -> float:
+	"""Return the average call time of ``func`` in milliseconds."""
+	start = time.perf_counter()
+	for _ in range(num_iterations):
+		func()
+	elapsed = time.perf_counter() - start
+	avg_ms = (elapsed / num_iterations) * 1000.0
+	return avg_ms
+
+
+#============================================
+def main() -> None:
+	"""Run the benchmark table."""
+	args = parse_args()
+	# InChI generation warns about undefined stereo on every call
+	blocker = rdkit.rdBase.BlockLogs()
+	mols = [oasa.smiles_lib.text_to_mol(smiles, calc_coords=False) for smiles in MOLECULES]
+	for smiles, mol in zip(MOLECULES, mols):
+		if legacy_chain(mol) != mirror_chain(mol):
+			raise AssertionError(f"mirror and fresh conversion disagree on {smiles}")
+	print(f"RDKit mirror benchmark ({len(mols)} molecules, SMILES + InChI + InChIKey + mol block)")
+	old_ms = time_function(lambda: [legacy_chain(mol) for mol in mols], args.num_iterations)
+	oasa.rdkit_bridge.reset_mirror_cache_info()
+	new_ms = time_function(lambda: [mirror_chain(mol) for mol in mols], args.num_iterations)
+	info = oasa.rdkit_bridge.mirror_cache_info()
+	print(f"fresh conversion:  {old_ms:9.2f} ms")
+	print(f"cached mirror:     {new_ms:9.2f} ms  ({old_ms / new_ms:.1f}x, {info['hits']} hits, {info['misses']} misses)")
+
+	# an edit per round: the first export converts again, the rest hit
+	def edit_then_chain() -> None:
+		for mol in mols:
+			atom = mol.atoms[0]
+			atom.charge = 0
+			mirror_chain(mol)
+
+	oasa.rdkit_bridge.reset_mirror_cache_info()
+	edit_ms = time_function(edit_then_chain, args.num_iterations)
+	info = oasa.rdkit_bridge.mirror_cache_info()
+	print(f"edit + chain:      {edit_ms:9.2f} ms  ({info['hits']} hits, {info['misses']} misses)")
+	del blocker
+
+
+#============================================
+if __name__ == '__main__':
+	main()
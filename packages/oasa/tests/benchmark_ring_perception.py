@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Benchmark index-based ring perception against the path-graph on copies.
+
+The legacy ``get_all_cycles`` deep-copied the molecule, stripped bridges
+edge by edge, and ran the Hanser path-graph reduction with vertex sets on
+graph edges created and disconnected through the graph API.  The new engine
+in ``oasa.graph.ring_perception`` runs the same reduction on integer indices
+with bitset paths.  Both must return the same cycles.  SSSR and relevant
+cycles, which the legacy code did not offer, are timed on their own,
+together with a size-capped cycle search on C60.
+"""
+
+# Standard Library
+import sys
+import copy
+import time
+import argparse
+
+# ensure OASA package is importable from the repo tree
+sys.path.insert(0, "packages/oasa")
+
+# local repo modules
+import oasa.smiles_lib
+
+
+MOLECULES = {
+	"cholesterol": "CC(C)CCCC(C)C1CCC2C1(CCC3C2CCC4=CC(CCC34C)O)C",
+	"strychnine": "C1CN2CC3=CCOC4CC(=O)N5C6C4C3CC2C61C7=CC=CC=C75",
+	"coronene": "c1cc2ccc3ccc4ccc5ccc6ccc1c7c2c3c4c5c67",
+	"b-cyclodextrin": (
+		"OCC1OC2OC3C(CO)OC(OC4C(CO)OC(OC5C(CO)OC(OC6C(CO)OC(OC7C(CO)OC(OC8C(CO)OC("
+		"OC1C(O)C2O)C(O)C8O)C(O)C7O)C(O)C6O)C(O)C5O)C(O)C4O)C(O)C3O"
+	),
+}
+
+C60 = (
+	"c12c3c4c5c1c1c6c7c2c2c8c3c3c9c4c4c%10c5c5c1c1c6c6c%11c7c2c2c7c8c3c3c8c9c4c4c9c%10"
+	"c5c5c1c1c6c6c%11c2c2c7c3c3c8c4c4c9c5c1c1c6c2c3c41"
+)
+
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""Parse command-line arguments."""
+	parser = argparse.ArgumentParser(
+		description="Benchmark index-based ring perception against the path-graph on copies"
+	)
+	parser.add_argument(
+		'-n', '--iterations', dest='num_iterations',
+		type=int, default=5,
+		help="Number of timing iterations per measurement (default: 5)",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+def legacy_all_cycles(mol: object) -> set:
+	"""Return all cycles with the legacy path-graph on a deep copy."""
+	pgraph = mol.deep_copy()
+	pgraph.temporarily_strip_bridge_edges()
+	for i, v in enumerate(mol.vertices):
+		pgraph.vertices[i].properties_['original'] = v
+	for e in pgraph.edges:
+		e.path_ = set(e.vertices)
+	for v in [v for v in pgraph.vertices if not v.neighbors]:
+		pgraph.delete_vertex(v)
+	rings = set()
+	for pv in copy.copy(pgraph.vertices):
+		rings |= _legacy_remove(pv, pgraph)
+	return {frozenset(v.properties_['original'] for v in ring) for ring in rings}
+
+
+#============================================
+def _legacy_remove(v: object, pgraph: object) -> set:
+	"""Remove one path-graph vertex, joining the paths through it."""
+	rings = set()
+	pairs = list(v.get_neighbor_edge_pairs())
+	new_edges = []
+	for i, (ne1, nv1) in enumerate(pairs):
+		for ne2, nv2 in pairs[i + 1:]:
+			if (nv1 is nv2 and (ne1.path_ & ne2.path_ == {v, nv2})) or (ne1.path_ & ne2.path_ == {v}):
+				new_edge = pgraph.create_edge()
+				new_edge.path_ = ne1.path_ | ne2.path_
+				pgraph.add_edge(nv1, nv2, new_edge)
+				new_edges.append(new_edge)
+	for ne, _nv in pairs:
+		pgraph.disconnect_edge(ne)
+	for e in new_edges:
+		end1, end2 = e.vertices
+		if end1 is end2:
+			rings.add(frozenset(e.path_))
+			pgraph.disconnect_edge(e)
+	pgraph.remove_vertex(v)
+	return rings
+
+
+#============================================
+def uncached_rings(mol: object, kind: str, max_size: object = None) -> list:
+	"""Return ``mol.get_rings`` after dropping the memoized result."""
+	mol._clean_cache()
+	return mol.get_rings(kind, max_size)
+
+
+#============================================
+def time_function(func: object, num_iterations: int) -> float:
+	"""Return the average call time of ``func`` in milliseconds."""
+	start = time.perf_counter()
+	for _ in range(num_iterations):
+		func()
+	elapsed = time.perf_counter() - start
+	avg_ms = (elapsed / num_iterations) * 1000.0
+	return avg_ms
+
+
+#============================================
+def read(smiles: str) -> object:
+	"""Return a molecule read with the built-in SMILES parser."""
+	reader = oasa.smiles_lib.Smiles()
+	reader.read_smiles(smiles)
+	return reader.get_structure()
+
+
+#============================================
+def main() -> None:
+	"""Run the benchmark table."""
+	args = parse_args()
+	n = args.num_iterations
+	print("Ring perception benchmark (uncached calls)")
+	header = f"{'molecule':<15} {'cycles':>7} {'all ms':>8} {'legacy ms':>10} {'speedup':>8} {'sssr ms':>8} {'relevant ms':>12}"
+	print(header)
+	print("-" * len(header))
+	for name, smiles in MOLECULES.items():
+		mol = read(smiles)
+		cycles = uncached_rings(mol, "all")
+		if set(cycles) != legacy_all_cycles(mol):
+			raise AssertionError(f"cycles of {name} differ from the legacy path-graph")
+		all_ms = time_function(lambda: uncached_rings(mol, "all"), n)
+		old_ms = time_function(lambda: legacy_all_cycles(mol), n)
+		sssr_ms = time_function(lambda: uncached_rings(mol, "sssr"), n)
+		relevant_ms = time_function(lambda: uncached_rings(mol, "relevant"), n)
+		print(
+			f"{name:<15} {len(cycles):>7} {all_ms:>8.2f} {old_ms:>10.2f} {old_ms / all_ms:>7.1f}x"
+			f" {sssr_ms:>8.2f} {relevant_ms:>12.2f}"
+		)
+	mol = read(C60)
+	sssr_ms = time_function(lambda: uncached_rings(mol, 'sssr'), n)
+	relevant_ms = time_function(lambda: uncached_rings(mol, 'relevant'), n)
+	capped_ms = time_function(lambda: uncached_rings(mol, 'all', 6), n)
+	mol.get_rings('relevant')
+	print(
+		f"C60: sssr {sssr_ms:.2f} ms, relevant {relevant_ms:.2f} ms, all rings up to 6 atoms {capped_ms:.2f} ms,"
+		f" cached {time_function(lambda: mol.get_rings('relevant'), n):.4f} ms"
+	)
+
+
+#============================================
+if __name__ == '__main__':
+	main()
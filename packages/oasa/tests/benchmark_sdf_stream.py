@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Benchmark streaming SDF reading against the whole-file merging reader.
+
+The legacy path is what ``sdf_file_to_mol`` did before ``sdf_iter_file``:
+read the whole file into a string, parse every record and copy its atoms and
+bonds into one merged molecule.  The streaming path reads one record at a
+time from the file handle and drops each molecule after use.  Both must see
+the same atoms; the table reports time and peak traced memory.
+"""
+
+# Standard Library
+import io
+import os
+import sys
+import time
+import argparse
+import tempfile
+import tracemalloc
+
+# ensure OASA package is importable from the repo tree
+sys.path.insert(0, "packages/oasa")
+
+# PIP3 modules
+import rdkit.Chem
+
+# local repo modules
+import oasa.atom_lib
+import oasa.bond_lib
+import oasa.smiles_lib
+import oasa.codecs.rdkit_formats
+
+
+MOLECULES = (
+	"CC(=O)OC1=CC=CC=C1C(=O)O",
+	"CC(=O)NC1=CC=C(O)C=C1",
+	"CN1C=NC2=C1C(=O)N(C(=O)N2C)C",
+	"OCC(O)C(O)C(O)C(O)CO",
+	"CC(C)CCCC(C)C1CCC2C1(CCC3C2CCC4=CC(CCC34C)O)C",
+)
+
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""Parse command-line arguments."""
+	parser = argparse.ArgumentParser(
+		description="Benchmark streaming SDF reading against the whole-file merging reader"
+	)
+	parser.add_argument(
+		'-r', '--records', dest='num_records',
+		type=int, default=2000,
+		help="Records in the generated SDF file (default: 2000)",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+def legacy_file_to_mol(file_obj: object) -> object:
+	"""Read a whole SDF file and merge every record by copying atoms and bonds."""
+	data = file_obj.read().encode("utf-8")
+	supplier = rdkit.Chem.ForwardSDMolSupplier(io.BytesIO(data), sanitize=True, removeHs=False)
+	merged = None
+	for rmol in supplier:
+		if rmol is None:
+			continue
+		omol = oasa.codecs.rdkit_formats._rdkit_to_oasa(rmol)
+		if merged is None:
+			merged = omol
+			continue
+		atom_map = {}
+		for oatom in list(omol.atoms):
+			new_atom = oasa.atom_lib.Atom(symbol=oatom.symbol, charge=oatom.charge)
+			new_atom.x = oatom.x
+			new_atom.y = oatom.y
+			merged.add_vertex(new_atom)
+			atom_map[oatom] = new_atom
+		for obond in list(omol.bonds):
+			a1, a2 = obond.vertices
+			merged.add_edge(atom_map[a1], atom_map[a2], oasa.bond_lib.Bond(order=obond.order))
+	return merged
+
+
+#============================================
+def streamed_symbols(path: str) -> list:
+	"""Return the atom symbols of every record, read one record at a time."""
+	symbols = []
+	with open(path) as handle:
+		for mol in oasa.codecs.rdkit_formats.sdf_iter_file(handle):
+			symbols.extend(a.symbol for a in mol.atoms)
+	return symbols
+
+
+#============================================
+def legacy_symbols(path: str) -> list:
+	"""Return the atom symbols of the merged molecule."""
+	with open(path) as handle:
+		return [a.symbol for a in legacy_file_to_mol(handle).atoms]
+
+
+#============================================
+def measure(func: object) -> tuple:
+	"""Return (result, milliseconds, peak traced MiB) of one call."""
+	tracemalloc.start()
+	start = time.perf_counter()
+	result = func()
+	elapsed = (time.perf_counter() - start) * 1000.0
+	_current, peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	return result, elapsed, peak / (1 << 20)
+
+
+#============================================
+def main() -> None:
+	"""Run the benchmark table."""
+	args = parse_args()
+	mols = [oasa.smiles_lib.text_to_mol(smiles, calc_coords=False) for smiles in MOLECULES]
+	handle, path = tempfile.mkstemp(suffix=".sdf")
+	os.close(handle)
+	try:
+		with open(path, "w") as out:
+			with oasa.codecs.rdkit_formats.sdf_open_writer(out) as writer:
+				for number in range(args.num_records):
+					writer.write(mols[number % len(mols)], tags={"ID": number})
+		size_mb = os.path.getsize(path) / (1 << 20)
+		print(f"SDF streaming benchmark ({args.num_records} records, {size_mb:.1f} MiB)")
+		old, old_ms, old_mb = measure(lambda: legacy_symbols(path))
+		new, new_ms, new_mb = measure(lambda: streamed_symbols(path))
+		if old != new:
+			raise AssertionError("streaming and merging readers disagree on the atoms")
+		print(f"read + merge:  {old_ms:9.2f} ms  peak {old_mb:8.2f} MiB")
+		print(f"streaming:     {new_ms:9.2f} ms  peak {new_mb:8.2f} MiB  ({old_mb / new_mb:.1f}x less memory)")
+	finally:
+		os.remove(path)
+
+
+#============================================
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""Benchmark the VF2 substructure search against the legacy thread matcher.
+
+Searches every functional-group pattern of ``oasa.subsearch_data.structures``
+in a set of drug-like molecules, once with the rustworkx VF2 engine behind
+``Molecule.select_matching_substructures`` and once with a copy of the
+thread-spawning matcher it replaced.  The legacy copy keeps match state in
+``properties_['subsearch']`` and adds hydrogens in place, so it is kept here
+only as the reference.  Both must find the same matched atom sets.
+"""
+
+# Standard Library
+import sys
+import time
+import argparse
+
+# ensure OASA package is importable from the repo tree
+sys.path.insert(0, "packages/oasa")
+
+# local repo modules
+import oasa.common
+import oasa.smiles_lib
+import oasa.subsearch_data
+from oasa.atom_lib import Atom
+from oasa.query_atom import QueryAtom
+
+
+MOLECULES = {
+	"aspirin": "CC(=O)OC1=CC=CC=C1C(=O)O",
+	"paracetamol": "CC(=O)NC1=CC=C(O)C=C1",
+	"cholesterol": "CC(C)CCCC(C)C1CCC2C1(CCC3C2CCC4=CC(CCC34C)O)C",
+	"strychnine": "C1CN2CC3=CCOC4CC(=O)N5C6C4C3CC2C61C7=CC=CC=C75",
+	"penicillin G": "CC1(C)SC2C(NC(=O)CC3=CC=CC=C3)C(=O)N2C1C(=O)O",
+	"taxol core": "CC1=C2C(C(=O)C3(C(CC4C(C3C(C(C2(C)C)(CC1O)O)OC(=O)C5=CC=CC=C5)(CO4)OC(=O)C)O)C)OC(=O)C",
+}
+
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""Parse command-line arguments."""
+	parser = argparse.ArgumentParser(
+		description="Benchmark the VF2 substructure search against the legacy thread matcher"
+	)
+	parser.add_argument(
+		'-n', '--iterations', dest='num_iterations',
+		type=int, default=5,
+		help="Number of timing iterations per measurement (default: 5)",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+def legacy_matches(mol: object, other: object, implicit_freesites: bool = False) -> object:
+	"""Yield matches with the legacy thread matcher, cleaning up at the end."""
+	add_implicit = False
+	for v in other.vertices:
+		if (isinstance(v, Atom) and v.symbol == 'H') or \
+				(isinstance(v, Atom) and v.explicit_hydrogens > 0) or \
+				(isinstance(v, QueryAtom) and ('H' in v.symbols or 'R' in v.symbols)):
+			add_implicit = True
+			break
+	if add_implicit:
+		for h in mol.add_missing_hydrogens():
+			h.properties_['implicit_hydrogen'] = True
+	for v in other.vertices:
+		for _ in range(v.explicit_hydrogens):
+			h = other.create_vertex()
+			other.add_vertex(h)
+			h.symbol = 'H'
+			e = other.create_edge()
+			e.order = 1
+			other.add_edge(v, h, e=e)
+			h.properties_['implicit_hydrogen'] = True
+		v.explicit_hydrogens = 0
+	if implicit_freesites:
+		for v in other.vertices:
+			v.properties_['old_free_sites'] = v.free_sites
+			v.free_sites = v.free_valency
+	i = 0
+	for a in other.vertices:
+		a.properties_['subsearch'] = {}
+	for e in other.edges | mol.edges:
+		e.properties_['subsearch'] = {}
+	vs = [v for v in other.vertices if isinstance(v, Atom)]
+	sym = oasa.common.least_common_item([v.symbol for v in vs])
+	v = [v for v in vs if v.symbol == sym][0]
+	for a in mol.vertices:
+		a.properties_['subsearch'] = {}
+		if v.matches(a):
+			i += 1
+			a.properties_['subsearch'][i] = v
+			v.properties_['subsearch'][i] = a
+	yielded = set()
+	for thread in _mark_matching_threads(mol, v, other):
+		vs = [v.properties_['subsearch'][thread] for v in other.vertices]
+		vsset = frozenset(vs)
+		if vsset not in yielded:
+			if _freesites_match(other, thread):
+				yield [v for v in vs if 'implicit_hydrogen' not in v.properties_]
+		yielded.add(vsset)
+	legacy_clean(mol, other)
+
+
+#============================================
+def legacy_clean(mol: object, other: object) -> None:
+	"""Undo everything the legacy matcher added to both molecules."""
+	for v in other.vertices:
+		if "old_free_sites" in v.properties_:
+			v.free_sites = v.properties_['old_free_sites']
+			del v.properties_['old_free_sites']
+	for v in [v for v in mol.vertices if 'implicit_hydrogen' in v.properties_]:
+		del v.properties_['implicit_hydrogen']
+		mol.remove_vertex(v)
+	for v in other.vertices:
+		if 'implicit_hydrogen' not in v.properties_:
+			v.explicit_hydrogens = len([h for h in v.neighbors if 'implicit_hydrogen' in h.properties_])
+	for v in [v for v in other.vertices if 'implicit_hydrogen' in v.properties_]:
+		del v.properties_['implicit_hydrogen']
+		other.remove_vertex(v)
+	for v in mol.vertices + other.vertices:
+		del v.properties_['subsearch']
+	for e in mol.edges | other.edges:
+		del e.properties_['subsearch']
+
+
+#============================================
+def _mark_matching_threads(mol: object, v: object, other: object) -> object:
+	"""Grow every live thread from query vertex ``v``; yield threads that survive."""
+	thread = 0
+	threads = list(v.properties_['subsearch'].keys())
+	while threads:
+		thread = min(threads)
+		threads.remove(thread)
+		mirror = v.properties_['subsearch'][thread]
+		for e, n in v.get_neighbor_edge_pairs():
+			if thread not in n.properties_['subsearch']:
+				candidates = set()
+				for me, mn in mirror.get_neighbor_edge_pairs():
+					if thread not in mn.properties_['subsearch'] and mn.matches(n) and me.matches(e) \
+							and thread not in e.properties_['subsearch']:
+						candidates.add((mn, me, e))
+				if candidates:
+					if len(candidates) > 1:
+						ths = [thread] + _spawn_thread(mol, other, thread, len(candidates) - 1)
+					else:
+						ths = [thread]
+					for c, me, e in candidates:
+						th = ths.pop()
+						n.properties_['subsearch'][th] = c
+						c.properties_['subsearch'][th] = n
+						e.properties_['subsearch'][th] = me
+						me.properties_['subsearch'][th] = e
+					for _ in _mark_matching_threads(mol, n, other):
+						pass
+					if thread not in v.properties_['subsearch']:
+						break
+				else:
+					_delete_thread(mol, other, thread)
+					break
+			elif thread not in e.properties_['subsearch']:
+				me = mol.get_edge_between(mirror, n.properties_['subsearch'][thread])
+				if me and e.matches(me):
+					e.properties_['subsearch'][thread] = me
+					me.properties_['subsearch'][thread] = e
+				else:
+					_delete_thread(mol, other, thread)
+					break
+		threads = [i for i in v.properties_['subsearch'] if i >= thread]
+		if thread in threads:
+			threads.remove(thread)
+			yield thread
+
+
+#============================================
+def _spawn_thread(mol: object, other: object, thread: int, number: int) -> list:
+	"""Copy ``thread`` into ``number`` new threads and return their ids."""
+	items = [x for x in mol.vertices + list(mol.edges) + other.vertices + list(other.edges)
+		if thread in x.properties_['subsearch']]
+	max_thread = max(max(v.properties_['subsearch']) for v in other.vertices if v.properties_['subsearch'])
+	for i in range(max_thread + 1, max_thread + number + 1):
+		for x in items:
+			x.properties_['subsearch'][i] = x.properties_['subsearch'][thread]
+	return list(range(max_thread + 1, max_thread + number + 1))
+
+
+#============================================
+def _delete_thread(mol: object, other: object, thread: int) -> None:
+	"""Drop ``thread`` from every vertex of both molecules."""
+	for v in mol.vertices + other.vertices:
+		v.properties_['subsearch'].pop(thread, None)
+
+
+#============================================
+def _freesites_match(other: object, thread: int) -> bool:
+	"""Return True when no matched atom has more unmatched neighbors than free sites."""
+	for v in other.vertices:
+		mirror = v.properties_['subsearch'][thread]
+		unmatched = [n for n in mirror.neighbors if thread not in n.properties_['subsearch']]
+		if not len(unmatched) + mirror.explicit_hydrogens <= v.free_sites:
+			return False
+	return True
+
+
+#============================================
+def load_patterns() -> list:
+	"""Return (name, query) pairs with free sites set as listed in subsearch_data.
+
+	The patterns use OASA SMILES extensions such as a bare ``H``, so they are
+	read with the built-in parser rather than RDKit.
+	"""
+	patterns = []
+	for name, _group, smiles, free_sites in oasa.subsearch_data.structures:
+		reader = oasa.smiles_lib.Smiles()
+		reader.read_smiles(smiles)
+		query = reader.get_structure()
+		for number in free_sites:
+			query.vertices[number - 1].free_sites = 4
+		patterns.append((name, query))
+	return patterns
+
+
+#============================================
+def match_sets(matches: object) -> set:
+	"""Return the distinct atom sets of a stream of matches."""
+	return {frozenset(match) for match in matches}
+
+
+#============================================
+def time_function(func: object, num_iterations: int) -> float:
+	"""Return the average call time of ``func`` in milliseconds."""
+	start = time.perf_counter()
+	for _ in range(num_iterations):
+		func()
+	elapsed = time.perf_counter() - start
+	avg_ms = (elapsed / num_iterations) * 1000.0
+	return avg_ms
+
+
+#============================================
+def benchmark_molecule(name: str, smiles: str, patterns: list, num_iterations: int) -> dict:
+	"""Time all pattern searches on one molecule with both matchers."""
+	mol = oasa.smiles_lib.text_to_mol(smiles, calc_coords=False)
+	hits = 0
+	for pattern, query in patterns:
+		new = match_sets(mol.select_matching_substructures(query))
+		old = match_sets(legacy_matches(mol, query))
+		if new != old:
+			raise AssertionError(f"{pattern} in {name}: VF2 found {len(new)} matches, legacy {len(old)}")
+		hits += len(new)
+
+	def search_all() -> None:
+		for _pattern, query in patterns:
+			for _match in mol.select_matching_substructures(query):
+				pass
+
+	def legacy_all() -> None:
+		for _pattern, query in patterns:
+			for _match in legacy_matches(mol, query):
+				pass
+
+	results = {
+		"name": name,
+		"atoms": len(mol.vertices),
+		"hits": hits,
+		"search_ms": time_function(search_all, num_iterations),
+		"old_search_ms": time_function(legacy_all, num_iterations),
+	}
+	return results
+
+
+#============================================
+def main() -> None:
+	"""Run the benchmark table."""
+	args = parse_args()
+	patterns = load_patterns()
+	print(f"Substructure search benchmark ({len(patterns)} subsearch_data patterns)")
+	header = f"{'molecule':<14} {'atoms':>6} {'hits':>5} {'VF2 ms':>9} {'legacy ms':>10} {'speedup':>8}"
+	print(header)
+	print("-" * len(header))
+	for name, smiles in MOLECULES.items():
+		row = benchmark_molecule(name, smiles, patterns, args.num_iterations)
+		speedup = row["old_search_ms"] / row["search_ms"] if row["search_ms"] else 0.0
+		print(
+			f"{row['name']:<14} {row['atoms']:>6} {row['hits']:>5} {row['search_ms']:>9.2f}"
+			f" {row['old_search_ms']:>10.2f} {speedup:>7.1f}x"
+		)
+
+
+#============================================
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Benchmark cached Vertex adjacency on ring perception and substructure search.
+
+Times exhaustive ring perception (``get_all_cycles``), aromatic bond marking,
+and ``contains_substructure`` with the cached adjacency tuples and with the
+previous rebuild-on-every-access properties.  Both paths must give the same
+results.
+"""
+
+# Standard Library
+import sys
+import time
+import argparse
+import contextlib
+
+# ensure OASA package is importable from the repo tree
+sys.path.insert(0, "packages/oasa")
+
+# local repo modules
+import oasa.smiles_lib
+import oasa.graph.vertex_lib
+
+
+MOLECULES = {
+	"cholesterol": "CC(C)CCCC(C)C1CCC2C1(CCC3C2CCC4=CC(CCC34C)O)C",
+	"coronene": "c1cc2ccc3ccc4ccc5ccc6ccc1c7c2c3c4c5c67",
+	"strychnine": "C1CN2CC3=CCOC4CC(=O)N5C6C4C3CC2C61C7=CC=CC=C75",
+	"taxol core": "CC1=C2C(C(=O)C3(C(CC4C(C3C(C(C2(C)C)(CC1O)O)OC(=O)C5=CC=CC=C5)(CO4)OC(=O)C)O)C)OC(=O)C",
+}
+
+QUERIES = ("c1ccccc1", "C1CCCCC1", "C(=O)O", "CC(C)C")
+
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""Parse command-line arguments."""
+	parser = argparse.ArgumentParser(
+		description="Benchmark cached Vertex adjacency on ring perception and substructure search"
+	)
+	parser.add_argument(
+		'-n', '--iterations', dest='num_iterations',
+		type=int, default=20,
+		help="Number of timing iterations per measurement (default: 20)",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+@contextlib.contextmanager
+def uncached_adjacency() -> object:
+	"""Rebuild adjacency on every access, as before the vertex cache existed."""
+	vertex_class = oasa.graph.vertex_lib.Vertex
+	adjacency = vertex_class._adjacency
+	edge_leading_to = vertex_class.get_edge_leading_to
+
+	def rebuild(self: object) -> tuple:
+		pairs = [(e, v) for (e, v) in list(self._neighbors.items()) if not e.disconnected]
+		return (tuple(e for e, _v in pairs), tuple(v for _e, v in pairs))
+
+	def scan(self: object, a: object) -> object:
+		for b, at in list(self._neighbors.items()):
+			if a == at:
+				return b
+		return None
+
+	vertex_class._adjacency = rebuild
+	vertex_class.get_edge_leading_to = scan
+	try:
+		yield
+	finally:
+		vertex_class._adjacency = adjacency
+		vertex_class.get_edge_leading_to = edge_leading_to
+
+
+#============================================
+def time_function(func: object, num_iterations: int) -> float:
+	"""Return the average call time of ``func`` in milliseconds."""
+	start = time.perf_counter()
+	for _ in range(num_iterations):
+		func()
+	elapsed = time.perf_counter() - start
+	avg_ms = (elapsed / num_iterations) * 1000.0
+	return avg_ms
+
+
+#============================================
+def perceive_rings(smiles: str) -> tuple:
+	"""Return the ring count and aromatic bond count of one parsed molecule."""
+	mol = oasa.smiles_lib.text_to_mol(smiles, calc_coords=False)
+	rings = mol.get_all_cycles()
+	mol.mark_aromatic_bonds()
+	return (len(rings), sum(1 for bond in mol.edges if bond.aromatic))
+
+
+#============================================
+def search_substructures(mol: object, queries: list) -> tuple:
+	"""Return which query molecules ``mol`` contains."""
+	return tuple(mol.contains_substructure(query) for query in queries)
+
+
+#============================================
+def benchmark_molecule(name: str, smiles: str, num_iterations: int) -> dict:
+	"""Time ring perception and substructure search for one molecule."""
+	mol = oasa.smiles_lib.text_to_mol(smiles, calc_coords=False)
+	queries = [oasa.smiles_lib.text_to_mol(query, calc_coords=False) for query in QUERIES]
+	cached_rings = perceive_rings(smiles)
+	cached_hits = search_substructures(mol, queries)
+	ring_ms = time_function(lambda: perceive_rings(smiles), num_iterations)
+	search_ms = time_function(lambda: search_substructures(mol, queries), num_iterations)
+	with uncached_adjacency():
+		if perceive_rings(smiles) != cached_rings or search_substructures(mol, queries) != cached_hits:
+			raise AssertionError(f"cached adjacency changed results for {name}")
+		old_ring_ms = time_function(lambda: perceive_rings(smiles), num_iterations)
+		old_search_ms = time_function(lambda: search_substructures(mol, queries), num_iterations)
+	results = {
+		"name": name,
+		"atoms": len(mol.vertices),
+		"ring_ms": ring_ms,
+		"old_ring_ms": old_ring_ms,
+		"search_ms": search_ms,
+		"old_search_ms": old_search_ms,
+	}
+	return results
+
+
+#============================================
+def main() -> None:
+	"""Run the benchmark table."""
+	args = parse_args()
+	print("Vertex adjacency cache benchmark")
+	header = (
+		f"{'molecule':<12} {'atoms':>6} {'rings ms':>9} {'was':>9} {'speedup':>8}"
+		f" {'search ms':>10} {'was':>9} {'speedup':>8}"
+	)
+	print(header)
+	print("-" * len(header))
+	for name, smiles in MOLECULES.items():
+		row = benchmark_molecule(name, smiles, args.num_iterations)
+		ring_speedup = row["old_ring_ms"] / row["ring_ms"] if row["ring_ms"] else 0.0
+		search_speedup = row["old_search_ms"] / row["search_ms"] if row["search_ms"] else 0.0
+		print(
+			f"{row['name']:<12} {row['atoms']:>6} {row['ring_ms']:>9.2f} {row['old_ring_ms']:>9.2f}"
+			f" {ring_speedup:>7.1f}x {row['search_ms']:>10.2f} {row['old_search_ms']:>9.2f}"
+			f" {search_speedup:>7.1f}x"
+		)
+
+
+#============================================
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,131 @@
+"""Unit tests for record-by-record batch conversion."""
+
+# Standard Library
+import io
+
+# PIP3 modules
+import pytest
+
+# local repo modules
+import oasa.batch_convert
+
+
+SMILES_TEXT = "CCO\nC1CC\n\nc1ccccc1\nCC(=O)O\n"
+
+MIXED_SMILES = "\n".join(["CCO", "CCN", "c1ccccc1O", "C1CC", "CC(C)C(=O)O"] * 6) + "\n"
+
+
+#============================================
+def _serial_smiles() -> tuple[str, str, object]:
+	"""Convert SMILES_TEXT serially; return the output, error log, and stats."""
+	out = io.StringIO()
+	errors = io.StringIO()
+	stats = oasa.batch_convert.convert_batch(
+		"smiles", "smiles", io.StringIO(SMILES_TEXT), out, errors, jobs=1, chunk_size=2,
+	)
+	return out.getvalue(), errors.getvalue(), stats
+
+
+#============================================
+def _molfile_records() -> tuple[str, object]:
+	"""Convert MIXED_SMILES to molfile records; return the text and stats."""
+	molfiles = io.StringIO()
+	stats = oasa.batch_convert.convert_batch(
+		"smiles", "molfile", io.StringIO(MIXED_SMILES), molfiles, io.StringIO(), jobs=1,
+	)
+	return molfiles.getvalue(), stats
+
+
+#============================================
+def _unterminated_molfile_records() -> str:
+	"""Return the molfile records with the last $$$$ terminator dropped."""
+	text, _stats = _molfile_records()
+	return text[:-len("$$$$\n")]
+
+
+#============================================
+def test_serial_batch_keeps_record_order() -> None:
+	"""Converted records keep their input order and skip the failed one."""
+	out, _errors, _stats = _serial_smiles()
+	assert out.split() == ["CCO", "C1=CC=CC=C1", "CC(=O)O"]
+
+
+#============================================
+def test_serial_batch_logs_each_failure_once() -> None:
+	"""The error log gets one line naming the failed record and its error."""
+	_out, errors, _stats = _serial_smiles()
+	assert errors.startswith("2\tValueError: ")
+	assert errors.count("\n") == 1
+
+
+#============================================
+def test_serial_batch_counts_records_and_failures() -> None:
+	"""Stats count every record read and every failure."""
+	_out, _errors, stats = _serial_smiles()
+	assert (stats.records, stats.failures) == (4, 1)
+
+
+#============================================
+def test_serial_batch_reports_throughput() -> None:
+	"""Stats report a positive rate and a summary with both counts."""
+	_out, _errors, stats = _serial_smiles()
+	assert stats.records_per_second > 0
+	assert "4 records, 1 failed" in stats.summary()
+
+
+#============================================
+def test_molfile_output_terminates_every_record() -> None:
+	"""Every converted molfile record ends with a $$$$ line."""
+	text, stats = _molfile_records()
+	assert text.count("$$$$\n") == stats.records - stats.failures == 24
+
+
+#============================================
+def test_molfile_records_split_without_final_terminator() -> None:
+	"""Record splitting keeps a last record that lacks its terminator."""
+	text = _unterminated_molfile_records()
+	assert len(list(oasa.batch_convert.iter_records(io.StringIO(text), "molfile"))) == 24
+
+
+#============================================
+def test_pool_matches_serial_conversion() -> None:
+	"""A process pool writes the same SMILES as a serial run, in input order."""
+	pooled = io.StringIO()
+	oasa.batch_convert.convert_batch(
+		"molfile", "smiles", io.StringIO(_unterminated_molfile_records()), pooled,
+		io.StringIO(), jobs=2, chunk_size=5,
+	)
+	serial = io.StringIO()
+	oasa.batch_convert.convert_batch(
+		"smiles", "smiles", io.StringIO(MIXED_SMILES), serial, io.StringIO(), jobs=1,
+	)
+	assert pooled.getvalue() == serial.getvalue()
+
+
+#============================================
+def test_pool_reports_no_failures_for_valid_records() -> None:
+	"""Pooled stats count all records and the error log stays empty."""
+	errors = io.StringIO()
+	stats = oasa.batch_convert.convert_batch(
+		"molfile", "smiles", io.StringIO(_unterminated_molfile_records()), io.StringIO(),
+		errors, jobs=2, chunk_size=5,
+	)
+	assert (stats.records, stats.failures, errors.getvalue()) == (24, 0, "")
+
+
+#============================================
+def test_batch_rejects_unsplittable_codecs() -> None:
+	"""A codec without record splitting cannot be batch converted."""
+	with pytest.raises(ValueError):
+		oasa.batch_convert.convert_batch(
+			"cdml", "smiles", io.StringIO(""), io.StringIO(), io.StringIO(),
+		)
+
+
+#============================================
+def test_batch_rejects_empty_chunks() -> None:
+	"""A chunk size below one is rejected."""
+	with pytest.raises(ValueError):
+		oasa.batch_convert.convert_batch(
+			"smiles", "inchi", io.StringIO(""), io.StringIO(), io.StringIO(), chunk_size=0,
+		)
@@ -0,0 +1,186 @@
+"""Unit tests for canonical atom ranking and symmetry classes."""
+
+# Standard Library
+import random
+
+# PIP3 modules
+import pytest
+
+# local repo modules
+import oasa.atom_lib
+import oasa.bond_lib
+import oasa.smiles_lib
+import oasa.canonical_ranking
+import oasa.molecule_lib
+import oasa.query_atom
+
+
+# Cuneane bonds with atoms numbered 1-8; refinement leaves all eight tied.
+_CUNEANE_BONDS = (
+	(1, 2), (2, 3), (3, 4), (4, 5), (5, 6), (6, 7), (7, 8), (8, 1),
+	(1, 5), (2, 4), (3, 7), (6, 8),
+)
+
+
+#============================================
+def _mol(smiles: str) -> object:
+	"""Return a molecule read with the built-in SMILES parser."""
+	reader = oasa.smiles_lib.Smiles()
+	reader.read_smiles(smiles)
+	return reader.get_structure()
+
+
+#============================================
+def _cuneane(order: list) -> tuple:
+	"""Return cuneane with its atoms added in ``order`` and the atoms by number."""
+	mol = oasa.molecule_lib.Molecule()
+	atoms = {number: oasa.atom_lib.Atom("C") for number in range(1, 9)}
+	for number in order:
+		mol.add_vertex(atoms[number])
+	for first, second in _CUNEANE_BONDS:
+		mol.add_edge(atoms[first], atoms[second], oasa.bond_lib.Bond(order=1))
+	return mol, atoms
+
+
+#============================================
+def _cuneane_orders(count: int) -> list:
+	"""Return ``count`` shuffled atom orders of cuneane."""
+	rng = random.Random(11)
+	orders = []
+	for _ in range(count):
+		order = list(range(1, 9))
+		rng.shuffle(order)
+		orders.append(order)
+	return orders
+
+
+#============================================
+@pytest.mark.parametrize("smiles", [
+	"CC(=O)OC1=CC=CC=C1C(=O)O", "c1ccc2ccccc2c1", "C12C3C4C1C5C2C3C45", "OCC(O)C(O)CO",
+])
+def test_hash_ignores_atom_order(smiles: str) -> None:
+	"""Shuffling the atoms of a molecule never changes its canonical hash."""
+	rng = random.Random(7)
+	hashes = set()
+	for _ in range(10):
+		mol = _mol(smiles)
+		rng.shuffle(mol.vertices)
+		hashes.add(mol.get_canonical_hash())
+	assert hashes == {_mol(smiles).get_canonical_hash()}
+
+
+#============================================
+def test_hash_tells_isomers_apart() -> None:
+	"""Constitutional isomers and charge states get distinct hashes."""
+	hashes = {_mol(smiles).get_canonical_hash() for smiles in ("CCO", "COC", "CC=O", "C=CO", "CC[O-]")}
+	assert len(hashes) == 5
+
+
+#============================================
+def test_permuted_cuneane_has_one_hash() -> None:
+	"""Cuneane rebuilt in 30 atom orders always gets the same canonical hash."""
+	hashes = {_cuneane(order)[0].get_canonical_hash() for order in _cuneane_orders(30)}
+	assert len(hashes) == 1
+
+
+#============================================
+def test_permuted_cuneane_equals_the_original() -> None:
+	"""Level-3 equality holds between cuneane and every reordered copy."""
+	original, _atoms = _cuneane(list(range(1, 9)))
+	results = {
+		oasa.molecule_lib.equals(original, _cuneane(order)[0], level=3)
+		for order in _cuneane_orders(30)
+	}
+	assert results == {True}
+
+
+#============================================
+def test_cuneane_symmetry_classes_are_automorphism_orbits() -> None:
+	"""Cuneane's eight tied atoms fall into its three automorphism orbits."""
+	mol, atoms = _cuneane([3, 8, 1, 6, 2, 7, 4, 5])
+	numbers = {atom: number for number, atom in atoms.items()}
+	groups = {frozenset(numbers[v] for v in group) for group in mol.get_symmetry_unique_atoms()}
+	assert groups == {frozenset((1, 5)), frozenset((3, 7)), frozenset((2, 4, 6, 8))}
+
+
+#============================================
+def test_symmetry_classes_ignore_atom_order() -> None:
+	"""Each cuneane atom keeps its symmetry class index in every atom order."""
+	results = set()
+	for order in _cuneane_orders(10):
+		mol, atoms = _cuneane(order)
+		classes = mol.get_symmetry_classes()
+		results.add(tuple(classes[mol.vertices.index(atoms[n])] for n in range(1, 9)))
+	assert len(results) == 1
+
+
+#============================================
+def test_neopentane_has_two_symmetry_groups() -> None:
+	"""Neopentane's four methyls share one group apart from the center."""
+	mol = _mol("CC(C)(C)C")
+	assert [len(group) for group in mol.get_symmetry_unique_atoms()] == [4, 1]
+
+
+#============================================
+def test_naphthalene_has_three_symmetry_groups() -> None:
+	"""Naphthalene splits into its bridgehead pair and two sets of four."""
+	naphthalene = _mol("c1ccc2ccccc2c1")
+	assert sorted(len(group) for group in naphthalene.get_symmetry_unique_atoms()) == [2, 4, 4]
+
+
+#============================================
+def test_canonical_ranks_are_distinct() -> None:
+	"""Canonical ranks number the atoms 0..n-1 without repeats."""
+	ranks = _mol("c1ccc2ccccc2c1").get_canonical_ranks()
+	assert sorted(ranks) == list(range(10))
+
+
+#============================================
+def test_unique_numbering_follows_canonical_ranks() -> None:
+	"""number_atoms_uniquely lists the atoms in canonical rank order."""
+	naphthalene = _mol("c1ccc2ccccc2c1")
+	ranks = naphthalene.get_canonical_ranks()
+	numbered = naphthalene.number_atoms_uniquely()
+	assert [ranks[naphthalene.vertices.index(v)] for v in numbered] == list(range(10))
+
+
+#============================================
+def test_mark_morgan_stores_symmetry_classes() -> None:
+	"""mark_morgan writes each atom's symmetry class to its properties."""
+	naphthalene = _mol("c1ccc2ccccc2c1")
+	naphthalene.mark_morgan()
+	morgan = [v.properties_['morgan'] for v in naphthalene.vertices]
+	assert morgan == naphthalene.get_symmetry_classes()
+
+
+#============================================
+def test_equals_ignores_atom_order() -> None:
+	"""Two SMILES spellings of neopentane are equal at level 3."""
+	assert oasa.molecule_lib.equals(_mol("CC(C)(C)C"), _mol("C(C)(C)(C)C"), level=3)
+
+
+#============================================
+def test_equals_tells_skeletons_apart() -> None:
+	"""Butane and isobutane differ at level 3."""
+	assert not oasa.molecule_lib.equals(_mol("CCCC"), _mol("CC(C)C"), level=3)
+
+
+#============================================
+def test_equals_compares_hydrogen_counts() -> None:
+	"""Hydrogen counts tell ethene from ethane even though bonds are ignored."""
+	assert not oasa.molecule_lib.equals(_mol("C=C"), _mol("CC"), level=3)
+
+
+#============================================
+def test_default_key_compares_bond_orders() -> None:
+	"""The default canonical key includes bond orders; bond_key=False drops them."""
+	plain = oasa.canonical_ranking.canonical_key(_mol("C=C"), bond_key=False)
+	assert plain != oasa.canonical_ranking.canonical_key(_mol("C=C"))
+
+
+#============================================
+def test_query_atom_invariant_has_no_isotope() -> None:
+	"""Query atoms carry no isotope, so their default invariant uses 0."""
+	query = oasa.query_atom.QueryAtom()
+	query.symbol = "X"
+	assert oasa.canonical_ranking.atom_invariant(query) == ("X", 0, 0, 0, 1)
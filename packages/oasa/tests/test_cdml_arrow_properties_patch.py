@@ -6,6 +6,7 @@ import pytest
 # local repo modules
 import oasa.cdml_document
 import oasa.cdml_presentation_properties
+import oasa.cdml_xml
 import oasa.safe_xml
 
 
@@ -146,23 +147,23 @@ def test_target_and_revision_failures_leave_the_latest_snapshot_unchanged() -> N
 
 
 #============================================
-def test_unsafe_current_snapshot_is_rejected_without_a_property_commit(
+def test_patch_reparses_only_the_changed_root(
 		monkeypatch: object,
 		) -> None:
-	"""The public Arrow operation reauthorizes its detached CDML source."""
+	"""The public Arrow operation never rereads untouched document roots."""
 	session = oasa.cdml_document.CDMLDocumentSession.load(_CDML)
-	before = session.snapshot()
-	hostile = oasa.cdml_document.CDMLSnapshot(
-		before.revision,
-		'<!DOCTYPE cdml [<!ENTITY value "unsafe">]><cdml>&value;</cdml>',
-		before.is_dirty,
-	)
-	monkeypatch.setattr(session, "snapshot", lambda: hostile)
+	parsed = []
+	parse_cdml_dom = oasa.cdml_xml.parse_cdml_dom
+
+	def recording_parse(data: bytes) -> object:
+		"""Record each parsed XML payload."""
+		parsed.append(data)
+		return parse_cdml_dom(data)
+
+	monkeypatch.setattr(oasa.cdml_xml, "parse_cdml_dom", recording_parse)
 	request = oasa.cdml_presentation_properties.CDMLArrowPropertiesPatch(
-		before.revision, "arrow1", (("line_width", 2.0),),
+		session.revision, "arrow1", (("line_width", 2.0),),
 	)
-	with pytest.raises(oasa.cdml_presentation_properties.CDMLArrowPropertiesPatchError):
-		oasa.cdml_presentation_properties.patch_arrow_properties(session, request)
-	monkeypatch.undo()
-
-	assert session.snapshot() == before
+	result = oasa.cdml_presentation_properties.patch_arrow_properties(session, request)
+	assert result.changed
+	assert parsed and not any(b'id="before"' in data for data in parsed)
@@ -596,3 +596,37 @@ def test_mark_saved_resets_baseline_and_old_content_becomes_dirty() -> None:
 	assert marked.is_dirty is False and marked == session.snapshot()
 	restored = session.restore(target_revision=original.revision, expected_revision=marked.revision)
 	assert restored.snapshot.is_dirty
+
+
+# MIXED_CDML with a newline character reference inside one attribute value
+REFERENCED_CDML = MIXED_CDML.replace('marker="__bkchem_new__arrow"', 'marker="a&#10;b"')
+
+
+#============================================
+@pytest.mark.parametrize("text", [MIXED_CDML, REFERENCED_CDML], ids=["plain", "referenced"])
+def test_loaded_snapshot_reloads_as_itself(text: str) -> None:
+	"""A loaded snapshot reloads to byte-identical CDML."""
+	snapshot = cdml_document.CDMLDocumentSession.load(text).snapshot()
+	assert cdml_document.CDMLDocumentSession.load(snapshot.cdml).snapshot().cdml == snapshot.cdml
+
+
+#============================================
+def test_load_keeps_the_reread_form_of_referenced_whitespace() -> None:
+	"""An attribute newline reference is accepted as the space a saved copy reads back as."""
+	snapshot = cdml_document.CDMLDocumentSession.load(REFERENCED_CDML).snapshot()
+	assert 'marker="a b"' in snapshot.cdml
+
+
+#============================================
+@pytest.mark.parametrize(("text", "expected"), [
+	(MIXED_CDML, True),
+	(MIXED_CDML.replace("before", "bef&#111;re &amp;"), True),
+	(REFERENCED_CDML, False),
+	(MIXED_CDML.replace("before", "be&#13;fore"), False),
+], ids=["plain", "stable-references", "attribute-newline", "text-return"])
+def test_reread_is_needed_only_for_values_serialization_changes(
+		text: str, expected: bool,
+		) -> None:
+	"""Only decoded whitespace that minidom writes raw forces a second parse."""
+	dom_document = oasa.cdml_xml.parse_cdml_dom(text.encode("utf-8"))
+	assert cdml_document._serialization_rereads_exactly(dom_document) is expected
@@ -0,0 +1,33 @@
+"""Behavioral tests for the compact CDML session revision history."""
+
+# local repo modules
+import oasa.cdml_document
+import oasa.cdml_history
+
+
+_CDML = """\
+<cdml version="26.07"><molecule id="m1"><atom id="a1" name="C"><point x="1cm" y="1cm"/></atom></molecule><molecule id="m2"><atom id="a2" name="N"><point x="3cm" y="3cm"/></atom></molecule></cdml>
+"""
+
+
+#============================================
+def test_history_splices_return_exact_text_after_keyframe_is_discarded() -> None:
+	"""Splice revisions keep their keyframe alive after its own entry goes."""
+	history = oasa.cdml_history.CDMLRevisionHistory()
+	texts = {0: "<a>" + "x" * 200 + "</a>", 1: "<a>" + "x" * 100 + "y" + "x" * 99 + "</a>"}
+	texts[2] = texts[1].replace("y", "zz")
+	for revision, text in texts.items():
+		history.add(revision, text)
+	history.discard(0)
+	assert dict(history) == {1: texts[1], 2: texts[2]} and tuple(history) == (1, 2)
+
+
+#============================================
+def test_session_byte_budget_keeps_only_protected_revisions() -> None:
+	"""A tiny budget evicts history but never the current or saved revision."""
+	session = oasa.cdml_document.CDMLDocumentSession.load(_CDML, history_budget_bytes=1)
+	for name in ("one", "two", "three"):
+		session.set_molecule_name(oasa.cdml_document.CDMLMoleculeNameEditRequest(
+			session.revision, "m1", name,
+		))
+	assert tuple(session._history) == (0, 3) and session._history[0] == session._saved_cdml
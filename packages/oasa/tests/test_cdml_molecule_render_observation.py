@@ -1,8 +1,11 @@
 """Behavior tests for revision-bound portable molecule render batches."""
 
+# PIP3 modules
 import pytest
 
+# local repo modules
 from oasa import cdml_document
+from oasa import cdml_molecule_render
 from oasa import render_ops
 
 
@@ -125,3 +128,58 @@ def test_render_observation_rejects_stale_query_without_mutation() -> None:
 	with pytest.raises(cdml_document.CDMLRevisionConflictError):
 		session.molecule_render_observation(cdml_document.CDMLMoleculeRenderObservationQuery(1))
 	assert session.revision == 0
+
+
+#============================================
+def test_render_observation_repaints_only_the_changed_molecule(
+		monkeypatch: pytest.MonkeyPatch,
+		) -> None:
+	"""An unchanged molecule reuses its batches across accepted revisions."""
+	painted = []
+	original = cdml_molecule_render._paint_molecule
+	monkeypatch.setattr(
+		cdml_molecule_render, "_paint_molecule",
+		lambda molecule, *args: painted.append(molecule.getAttribute("id")) or original(molecule, *args),
+	)
+	session = cdml_document.CDMLDocumentSession.load(
+		"<cdml version='26.07'>"
+		"<molecule id='m1'><atom id='a1' name='O'><point x='0cm' y='0cm'/></atom></molecule>"
+		"<molecule id='m2'><atom id='a2' name='N'><point x='2cm' y='0cm'/></atom></molecule></cdml>",
+	)
+	query = cdml_document.CDMLMoleculeRenderObservationQuery
+	before = session.molecule_render_observation(query(0)).batches
+	session.set_molecule_name(cdml_document.CDMLMoleculeNameEditRequest(0, "m1", "water"))
+	after = session.molecule_render_observation(query(1)).batches
+	assert painted == ["m1", "m2", "m1"]
+	assert after[1] is before[1] and after == before
+
+
+#============================================
+def test_render_batches_are_not_shared_between_sessions() -> None:
+	"""Each session paints with its own batch cache."""
+	text = "<cdml version='26.07'><molecule id='m1'><atom id='a1' name='O'><point x='0cm' y='0cm'/></atom></molecule></cdml>"
+	query = cdml_document.CDMLMoleculeRenderObservationQuery(0)
+	first = cdml_document.CDMLDocumentSession.load(text).molecule_render_observation(query).batches
+	second = cdml_document.CDMLDocumentSession.load(text).molecule_render_observation(query).batches
+	assert second[0] is not first[0] and second == first
+
+
+#============================================
+def test_batch_cache_keeps_only_its_capacity(monkeypatch: pytest.MonkeyPatch) -> None:
+	"""A batch cache repaints the least recently used molecule past its capacity."""
+	painted = []
+	original = cdml_molecule_render._paint_molecule
+	monkeypatch.setattr(
+		cdml_molecule_render, "_paint_molecule",
+		lambda molecule, *args: painted.append(molecule.getAttribute("id")) or original(molecule, *args),
+	)
+	session = cdml_document.CDMLDocumentSession.load(
+		"<cdml version='26.07'>"
+		"<molecule id='m1'><atom id='a1' name='O'><point x='0cm' y='0cm'/></atom></molecule>"
+		"<molecule id='m2'><atom id='a2' name='N'><point x='2cm' y='0cm'/></atom></molecule></cdml>",
+	)
+	monkeypatch.setattr(session, "_render_batches", cdml_molecule_render.CDMLMoleculeBatchCache(capacity=1))
+	session.molecule_render_observation(cdml_document.CDMLMoleculeRenderObservationQuery(0))
+	session.set_molecule_name(cdml_document.CDMLMoleculeNameEditRequest(0, "m1", "water"))
+	session.molecule_render_observation(cdml_document.CDMLMoleculeRenderObservationQuery(1))
+	assert painted == ["m1", "m2", "m1", "m2"]
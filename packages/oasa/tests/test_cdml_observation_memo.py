@@ -0,0 +1,65 @@
+"""Behavioral tests for revision-scoped CDML observation memoization."""
+
+# PIP3 modules
+import pytest
+
+# local repo modules
+import oasa.cdml_document
+import oasa.cdml_observation_memo
+
+
+_CDML = """\
+<cdml version="26.07"><molecule id="m1"><atom id="a1" name="C"><point x="1cm" y="1cm"/></atom><atom id="a2" name="O"><point x="2cm" y="1cm"/></atom><bond id="b1" type="n1" start="a1" end="a2"/></molecule></cdml>
+"""
+
+
+#============================================
+def test_projection_and_queries_share_one_core_walk_per_revision(
+		monkeypatch: pytest.MonkeyPatch,
+		) -> None:
+	"""The plan, render, chemistry, and core queries walk molecules once per revision."""
+	calls = []
+	original = oasa.cdml_document._molecule_core_observation
+	monkeypatch.setattr(
+		oasa.cdml_document, "_molecule_core_observation",
+		lambda document, revision: calls.append(revision) or original(document, revision),
+	)
+	session = oasa.cdml_document.CDMLDocumentSession.load(_CDML)
+	plan = session.projection_snapshot().plan
+	core = session.molecule_core_observation(oasa.cdml_document.CDMLMoleculeCoreObservationQuery(0))
+	session.atom_chemistry_facts(oasa.cdml_document.CDMLAtomChemistryFactsQuery(0))
+	assert calls == [0] and core is plan.molecule_core_observation
+	session.set_molecule_name(oasa.cdml_document.CDMLMoleculeNameEditRequest(0, "m1", "ethanol"))
+	session.molecule_render_observation(oasa.cdml_document.CDMLMoleculeRenderObservationQuery(1))
+	assert calls == [0, 1] and session.projection_snapshot().plan.revision == 1
+
+
+#============================================
+def test_snapshot_projection_reuses_the_plan_of_an_equal_snapshot() -> None:
+	"""Projecting an exact snapshot twice through one plan cache parses it only once."""
+	snapshot = oasa.cdml_document.CDMLDocumentSession.load(_CDML).snapshot()
+	plans = oasa.cdml_observation_memo.CDMLSnapshotPlanCache()
+	first = oasa.cdml_document.CDMLDocument.projection_snapshot(snapshot, plans)
+	second = oasa.cdml_document.CDMLDocument.projection_snapshot(snapshot, plans)
+	assert second.plan is first.plan and first.plan.revision == snapshot.revision
+
+
+#============================================
+def test_snapshot_projection_without_a_plan_cache_keeps_no_state() -> None:
+	"""Without a caller-owned plan cache each projection builds its own plan."""
+	snapshot = oasa.cdml_document.CDMLDocumentSession.load(_CDML).snapshot()
+	first = oasa.cdml_document.CDMLDocument.projection_snapshot(snapshot)
+	second = oasa.cdml_document.CDMLDocument.projection_snapshot(snapshot)
+	assert second.plan is not first.plan and second.plan == first.plan
+
+
+#============================================
+def test_snapshot_plan_cache_keeps_only_its_capacity() -> None:
+	"""A plan cache evicts the least recently used snapshot past its capacity."""
+	session = oasa.cdml_document.CDMLDocumentSession.load(_CDML)
+	first = session.snapshot()
+	session.set_molecule_name(oasa.cdml_document.CDMLMoleculeNameEditRequest(0, "m1", "ethanol"))
+	plans = oasa.cdml_observation_memo.CDMLSnapshotPlanCache(capacity=1)
+	plan = plans.plan(first)
+	plans.plan(session.snapshot())
+	assert plans.plan(first) is not plan
@@ -0,0 +1,100 @@
+"""Behavioral tests for copy-on-write CDML session edit transactions."""
+
+# PIP3 modules
+import pytest
+
+# local repo modules
+import oasa.cdml_document
+import oasa.cdml_transaction
+
+
+_CDML = """\
+<cdml xmlns:v="urn:vendor" version="26.07"><molecule id="m1" name="first"><atom id="a1" name="C"><point x="1cm" y="1cm"/></atom></molecule><v:opaque id="opaque1" marker="keep"/><molecule id="m2"><atom id="a2" name="N"><point x="3cm" y="3cm"/></atom></molecule></cdml>
+"""
+
+
+#============================================
+def test_transaction_rollback_restores_original_roots_after_failed_edit() -> None:
+	"""An exception inside the block swaps accepted roots back unchanged."""
+	document = oasa.cdml_document.CDMLDocument.parse(_CDML, validation="strict")
+	root = document._dom_document.documentElement
+	before = document.serialize()
+	original = root.firstChild
+	with pytest.raises(RuntimeError):
+		with oasa.cdml_transaction.CDMLTransaction(root) as transaction:
+			transaction.writable(original).setAttribute("name", "changed")
+			root.removeChild(root.lastChild)
+			raise RuntimeError("edit failed")
+	assert document.serialize() == before and root.firstChild is original
+
+
+#============================================
+def test_session_edit_leaves_untouched_roots_shared_and_history_exact() -> None:
+	"""Only the edited root is copied and accepted text reparses to itself."""
+	session = oasa.cdml_document.CDMLDocumentSession.load(_CDML)
+	root = session._document._dom_document.documentElement
+	untouched = root.lastChild
+	commit = session.set_molecule_name(oasa.cdml_document.CDMLMoleculeNameEditRequest(
+		0, "m1", "line\nbreak",
+	))
+	reparsed = oasa.cdml_document.CDMLDocument.parse(commit.snapshot.cdml, validation="strict")
+	assert root.lastChild is untouched and reparsed.serialize() == commit.snapshot.cdml
+
+
+#============================================
+def test_session_edit_rejection_keeps_revision_and_content() -> None:
+	"""A strict failure in a changed root rolls the authoritative tree back."""
+	session = oasa.cdml_document.CDMLDocumentSession.load(_CDML)
+	before = session.snapshot()
+	with pytest.raises(oasa.cdml_document.CDMLValidationError):
+		with session._edit(("m2",)) as transaction:
+			molecule = oasa.cdml_document._direct_root_molecule(session._document, "m2")
+			molecule.firstChild.setAttribute("id", "a1")
+			session._commit_transaction(transaction, before.revision)
+	assert session.snapshot() == before
+
+
+#============================================
+def test_durable_id_index_reuses_released_serials_and_follows_edits() -> None:
+	"""Deleted root IDs are allocated again lowest-first and lookups track them."""
+	session = oasa.cdml_document.CDMLDocumentSession.load(_CDML)
+	session.delete_top_level(oasa.cdml_document.CDMLTopLevelDeleteRequest(
+		session.revision, ("m1",),
+	))
+	assert session._document.find_by_id("a1") is None
+	fragment = '<cdml><molecule id="x"><atom id="y" name="O"><point x="0cm" y="0cm"/></atom></molecule></cdml>'
+	session.insert_top_level(oasa.cdml_document.CDMLTopLevelInsertionRequest(
+		session.revision, fragment, (0.0, 0.0),
+	))
+	document = session._document
+	record = document.find_by_id("a1")
+	assert (
+		document.find_by_id("m1") is not None and record is not None
+		and document.validation_issues() == ()
+	)
+
+
+#============================================
+def test_durable_id_set_follows_open_transaction_edits() -> None:
+	"""The ID set counts copied, edited, and removed roots of an open edit."""
+	session = oasa.cdml_document.CDMLDocumentSession.load(_CDML)
+	with session._edit(("m1",)) as transaction:
+		transaction.root.firstChild.firstChild.setAttribute("id", "a9")
+		transaction.root.removeChild(transaction.root.lastChild)
+		used_ids = session._document._id_index().durable_ids()
+		used_ids.add("x1")
+		assert sorted(used_ids) == ["a9", "m1", "opaque1", "x1"] and len(used_ids) == 4
+
+
+#============================================
+def test_find_by_id_reuses_root_positions_between_edits(monkeypatch: object) -> None:
+	"""Repeated lookups on an accepted tree do not rescan its direct roots."""
+	document = oasa.cdml_document.CDMLDocument.parse(_CDML, validation="strict")
+	first = document.find_by_id("a2")
+
+	def forbidden_scan(root: object) -> list:
+		"""Fail if a lookup walks the direct roots again."""
+		raise AssertionError("accepted lookups must reuse root positions")
+
+	monkeypatch.setattr(oasa.cdml_document, "_element_children", forbidden_scan)
+	assert document.find_by_id("a2") == first
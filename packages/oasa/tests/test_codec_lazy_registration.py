@@ -0,0 +1,161 @@
+"""Unit tests for lazy codec registration."""
+
+# Standard Library
+import sys
+import importlib
+
+# PIP3 modules
+import pytest
+
+# local repo modules
+import oasa.codecs.cml
+import oasa.codec_registry
+
+
+CALLABLE_FIELDS = (
+	"text_to_mol", "mol_to_text", "file_to_mol", "mol_to_file",
+	"text_to_document", "file_to_document", "file_to_mols", "open_mol_writer",
+)
+
+CAPABILITY_FLAGS = (
+	"reads_text", "writes_text", "reads_files", "writes_files",
+	"reads_documents", "reads_records", "writes_records", "write_extensions",
+)
+
+
+#============================================
+def _loaded_codecs() -> list[str]:
+	"""Return the names of registered codecs whose modules are imported."""
+	names = oasa.codec_registry.list_codecs()
+	return [name for name in names if oasa.codec_registry.get_codec(name).loaded]
+
+
+#============================================
+def _metadata_query_imports() -> tuple[set, list[str]]:
+	"""Query a fresh registry; return new oasa modules and loaded codecs."""
+	oasa.codec_registry.reset_registry()
+	before = set(sys.modules)
+	oasa.codec_registry.list_codecs()
+	oasa.codec_registry.get_registry_snapshot()
+	oasa.codec_registry.get_import_codec_by_extension(".sdf")
+	oasa.codec_registry.get_export_codec_by_extension(".svg")
+	imported = {name for name in set(sys.modules) - before if name.startswith("oasa")}
+	return imported, _loaded_codecs()
+
+
+#============================================
+def _probe_codec() -> oasa.codec_registry.LazyCodec:
+	"""Return an unregistered lazy codec backed by the CML reader."""
+	return oasa.codec_registry.LazyCodec(
+		name="lazy_probe",
+		callables={
+			"text_to_mol": "oasa.codecs.cml:text_to_mol",
+			"file_to_mol": "oasa.codecs.cml:file_to_mol",
+		},
+		extensions=[".probe"],
+	)
+
+
+#============================================
+def test_metadata_queries_import_no_oasa_modules() -> None:
+	"""Listing, snapshots, and extension lookups add no oasa module."""
+	imported, _loaded = _metadata_query_imports()
+	assert imported == set()
+
+
+#============================================
+def test_metadata_queries_load_no_codec() -> None:
+	"""Listing, snapshots, and extension lookups leave every codec unloaded."""
+	_imported, loaded = _metadata_query_imports()
+	assert loaded == []
+
+
+#============================================
+@pytest.mark.parametrize(("name", "field"), [("svg", "mol_to_file"), ("cdml", "text_to_mol")])
+def test_first_use_loads_only_that_codec(name: str, field: str) -> None:
+	"""Using one codec callable loads that codec and no other."""
+	oasa.codec_registry.reset_registry()
+	getattr(oasa.codec_registry.get_codec(name), field)
+	assert _loaded_codecs() == [name]
+
+
+#============================================
+def test_declared_capabilities_need_no_import() -> None:
+	"""Capability flags and extensions come from the declaration."""
+	codec = _probe_codec()
+	flags = (codec.reads_files, codec.writes_files, codec.read_extensions)
+	assert flags == (True, False, [".probe"])
+	assert not codec.loaded
+
+
+#============================================
+def test_module_access_loads_the_codec() -> None:
+	"""Reading ``module`` imports the targets even without a module name."""
+	codec = _probe_codec()
+	assert codec.module is None
+	assert codec.loaded
+
+
+#============================================
+def test_first_use_resolves_declared_callables() -> None:
+	"""A declared callable resolves to its target attribute."""
+	codec = _probe_codec()
+	assert codec.text_to_mol is oasa.codecs.cml.text_to_mol
+
+
+#============================================
+def test_undeclared_callables_stay_none() -> None:
+	"""A callable the declaration omits is None after loading."""
+	codec = _probe_codec()
+	assert codec.mol_to_text is None
+
+
+#============================================
+def test_undeclared_direction_raises() -> None:
+	"""Writing through a read-only lazy codec raises ValueError."""
+	codec = _probe_codec()
+	with pytest.raises(ValueError):
+		codec.write_text(None)
+
+
+#============================================
+def test_unknown_callable_is_rejected() -> None:
+	"""Declaring a callable outside the codec fields raises ValueError."""
+	with pytest.raises(ValueError):
+		oasa.codec_registry.LazyCodec(name="bad", callables={"to_pdf": "x:y"})
+
+
+#============================================
+@pytest.mark.parametrize("name", oasa.codec_registry.list_codecs())
+def test_declared_flags_match_loaded_callables(name: str) -> None:
+	"""Declared flags equal those of an eager codec built from the loaded callables."""
+	snapshot = oasa.codec_registry.get_registry_snapshot()[name]
+	codec = oasa.codec_registry.get_codec(name)
+	eager = oasa.codec_registry.Codec(
+		name, extensions=codec.extensions,
+		read_extensions=snapshot["read_extensions"],
+		**{field: getattr(codec, field) for field in CALLABLE_FIELDS},
+	)
+	assert {key: getattr(eager, key) for key in CAPABILITY_FLAGS} == {
+		key: snapshot[key] for key in CAPABILITY_FLAGS
+	}
+
+
+#============================================
+def test_module_codecs_keep_their_module() -> None:
+	"""A codec declared with a module name exposes that module once loaded."""
+	assert oasa.codec_registry.get_codec("smiles").module.__name__ == "oasa.smiles_lib"
+
+
+#============================================
+@pytest.mark.parametrize(("module_name", "field", "target"), [
+	("oasa.smiles_lib", "text_to_mol", "smiles_text_to_mol"),
+	("oasa.molfile_lib", "mol_to_file", "molfile_mol_to_file"),
+])
+def test_legacy_modules_delegate_through_lazy_codecs(
+		module_name: str, field: str, target: str,
+		) -> None:
+	"""The SMILES and Molfile interfaces reach RDKit through one lazy codec."""
+	codec = importlib.import_module(module_name)._rdkit_codec
+	rdkit_formats = importlib.import_module("oasa.codecs.rdkit_formats")
+	assert getattr(codec, field) is getattr(rdkit_formats, target)
@@ -0,0 +1,97 @@
+"""Unit tests for the slot-based Atom and Bond storage."""
+
+# Standard Library
+import copy
+import pickle
+
+# PIP3 modules
+import pytest
+
+# local repo modules
+import oasa.atom_lib
+import oasa.bond_lib
+
+
+#============================================
+def _chlorine() -> oasa.atom_lib.Atom:
+	"""Return a chlorine atom with slot fields, a property, and an ad hoc label."""
+	atom = oasa.atom_lib.Atom("Cl", coords=(0.5, 1.5, 0.0))
+	atom.isotope = 37
+	atom.properties_["tag"] = "x"
+	atom.label = "chloro"
+	return atom
+
+
+#============================================
+@pytest.mark.parametrize("obj", [
+	oasa.atom_lib.Atom("N", charge=1, coords=(1.0, 2.0, 0.0)),
+	oasa.bond_lib.Bond(order=2),
+])
+def test_fixed_fields_need_no_instance_dicts(obj: object) -> None:
+	"""Fresh atoms and bonds allocate neither a properties dict nor a __dict__."""
+	assert not hasattr(obj, "_properties")
+	assert object.__getattribute__(obj, "__dict__") == {}
+
+
+#============================================
+def test_fixed_fields_keep_constructor_values() -> None:
+	"""Slot-backed fields return the values given to the constructors."""
+	atom = oasa.atom_lib.Atom("N", charge=1, coords=(1.0, 2.0, 0.0))
+	bond = oasa.bond_lib.Bond(order=2)
+	assert (atom.symbol, atom.charge, atom.coords, bond.order) == ("N", 1, (1.0, 2.0, 0.0), 2)
+
+
+#============================================
+def test_cache_store_is_allocated_lazily() -> None:
+	"""A fresh atom has no cache dictionary until one is requested."""
+	atom = oasa.atom_lib.Atom("N")
+	assert atom._cache_store is None
+
+
+#============================================
+def test_ad_hoc_atom_attributes_keep_working() -> None:
+	"""Lazy properties and ad hoc attributes are stored on demand."""
+	atom = oasa.atom_lib.Atom("O")
+	atom.properties_["d"] = 3
+	atom.molecule = "owner"
+	assert atom.properties_ == {"d": 3}
+	assert atom.molecule == "owner"
+
+
+#============================================
+def test_atom_cache_clears_when_a_field_changes() -> None:
+	"""Changing a chemical field drops values cached for the old state."""
+	atom = oasa.atom_lib.Atom("O")
+	atom._cache["free_valency"] = 5
+	atom.charge = -1
+	assert atom._cache == {}
+
+
+#============================================
+def test_ad_hoc_bond_attributes_keep_working() -> None:
+	"""Bonds accept the ad hoc attributes ring and path helpers assign."""
+	atom = oasa.atom_lib.Atom("O")
+	bond = oasa.bond_lib.Bond()
+	bond.properties_ = {"original": bond}
+	bond.path_ = {atom}
+	assert bond.properties_["original"] is bond
+	assert bond.path_ == {atom}
+
+
+#============================================
+@pytest.mark.parametrize("clone_atom", [
+	copy.copy, copy.deepcopy, lambda atom: pickle.loads(pickle.dumps(atom)),
+])
+def test_copy_deepcopy_and_pickle_keep_fields(clone_atom: object) -> None:
+	"""Copies and pickles keep slot fields, properties, and ad hoc attributes."""
+	clone = clone_atom(_chlorine())
+	assert (clone.symbol, clone.isotope, clone.coords) == ("Cl", 37, (0.5, 1.5, 0.0))
+	assert (clone.properties_, clone.label) == ({"tag": "x"}, "chloro")
+
+
+#============================================
+def test_chemical_copy_keeps_only_chemical_fields() -> None:
+	"""Atom.copy keeps the element and isotope but drops properties and labels."""
+	copied = _chlorine().copy()
+	assert (copied.symbol, copied.isotope) == ("Cl", 37)
+	assert (copied.properties_, hasattr(copied, "label")) == ({}, False)
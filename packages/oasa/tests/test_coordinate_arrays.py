@@ -0,0 +1,110 @@
+"""Unit tests for the array-backed coordinate snapshots."""
+
+# Standard Library
+import math
+
+# PIP3 modules
+import numpy
+import pytest
+
+# local repo modules
+import oasa.coordinate_arrays
+import oasa.smiles_lib
+
+
+#============================================
+def _mol_with_coords(smiles: str) -> object:
+	"""Return a parsed molecule with 2D coordinates."""
+	return oasa.smiles_lib.text_to_mol(smiles, calc_coords=1)
+
+
+#============================================
+def _acetic_acid_with_one_z() -> object:
+	"""Return acetic acid with a set z on its first atom and none on its second."""
+	mol = _mol_with_coords("CC(=O)O")
+	mol.vertices[0].z = 1.5
+	mol.vertices[1].z = None
+	return mol
+
+
+#============================================
+def test_snapshot_marks_unset_z_as_nan() -> None:
+	"""The coordinate snapshot has one row per atom and NaN for unset z."""
+	coords = _acetic_acid_with_one_z().coordinates_array()
+	assert coords.shape == (4, 3)
+	assert math.isnan(coords[1, 2])
+
+
+#============================================
+def test_round_trip_keeps_unset_z() -> None:
+	"""Writing a snapshot back restores every coordinate, including None z."""
+	mol = _acetic_acid_with_one_z()
+	before = [(a.x, a.y, a.z) for a in mol.vertices]
+	mol.set_coordinates_array(mol.coordinates_array())
+	assert [(a.x, a.y, a.z) for a in mol.vertices] == before
+
+
+#============================================
+def test_round_trip_stores_python_floats() -> None:
+	"""Written-back coordinates are plain floats rather than numpy scalars."""
+	mol = _acetic_acid_with_one_z()
+	mol.set_coordinates_array(mol.coordinates_array())
+	assert all(type(a.x) is float for a in mol.vertices)
+
+
+#============================================
+def test_wrong_row_count_is_rejected() -> None:
+	"""A snapshot with fewer rows than atoms raises ValueError."""
+	mol = _acetic_acid_with_one_z()
+	coords = mol.coordinates_array()
+	with pytest.raises(ValueError):
+		mol.set_coordinates_array(coords[:2])
+
+
+#============================================
+def test_two_columns_leave_z_untouched() -> None:
+	"""A two-column array sets x and y, and NaN x becomes None."""
+	mol = _mol_with_coords("CCO")
+	for z, atom in enumerate(mol.vertices):
+		atom.z = float(z)
+	mol.set_coordinates_array(numpy.array([[1.0, 2.0], [3.0, 4.0], [numpy.nan, 6.0]]))
+	expected = [(1.0, 2.0, 0.0), (3.0, 4.0, 1.0), (None, 6.0, 2.0)]
+	assert [(a.x, a.y, a.z) for a in mol.vertices] == expected
+
+
+#============================================
+def test_edge_index_lists_atom_positions_per_bond() -> None:
+	"""Each edge-index row holds the atom positions of one bond in edge order."""
+	mol = _mol_with_coords("c1ccccc1CC(=O)N")
+	pairs = [tuple(mol.vertices.index(v) for v in e.vertices) for e in mol.edges]
+	assert [tuple(row) for row in mol.edge_index_array().tolist()] == pairs
+
+
+#============================================
+def test_mean_bond_length_matches_loop() -> None:
+	"""The vectorized mean bond length equals the per-bond Python loop."""
+	mol = _mol_with_coords("c1ccccc1CC(=O)N")
+	total = 0.0
+	for e in mol.edges:
+		v1, v2 = e.vertices
+		total += math.sqrt((v1.x - v2.x) ** 2 + (v1.y - v2.y) ** 2)
+	assert mol.get_mean_bond_length() == pytest.approx(total / len(mol.edges), rel=1e-12)
+
+
+#============================================
+def test_normalize_bond_length_reaches_target() -> None:
+	"""Normalizing reports a change and sets the mean bond length."""
+	mol = _mol_with_coords("c1ccccc1C(C)(C)C")
+	assert mol.normalize_bond_length(2.5)
+	assert mol.get_mean_bond_length() == pytest.approx(2.5)
+
+
+#============================================
+def test_normalize_bond_length_scales_about_center() -> None:
+	"""Normalizing keeps the drawing's horizontal center in place."""
+	mol = _mol_with_coords("c1ccccc1C(C)(C)C")
+	xs = [a.x for a in mol.vertices]
+	center = (min(xs) + max(xs)) / 2.0
+	mol.normalize_bond_length(2.5)
+	xs = [a.x for a in mol.vertices]
+	assert (min(xs) + max(xs)) / 2.0 == pytest.approx(center)
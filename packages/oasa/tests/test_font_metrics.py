@@ -0,0 +1,208 @@
+"""Unit tests for the shared, memoized label font-metrics service."""
+
+# Standard Library
+import collections
+
+# Third Party
+import pytest
+
+# local repo modules
+from oasa.render_lib import font_metrics
+from oasa.render_lib import label_geometry
+
+
+_Extents = collections.namedtuple(
+	"_Extents", "x_bearing y_bearing width height x_advance y_advance",
+)
+_Glyph = collections.namedtuple("_Glyph", "index x y")
+_WIDTHS = {"C": 0.7, "H": 0.72, "O": 0.78, "N": 0.72, "2": 0.55, "3": 0.55}
+
+
+#============================================
+class _FakeScaledFont:
+	"""Scaled font that places glyphs at their running advance."""
+
+	def __init__(self, context: object) -> None:
+		self._context = context
+
+	def text_to_glyphs(self, x: float, y: float, text: str, with_clusters: bool) -> list:
+		glyphs = []
+		for char in text:
+			glyphs.append(_Glyph(0, x, y))
+			x += _WIDTHS.get(char, 0.6) * self._context.size
+		return glyphs
+
+
+#============================================
+class _FakeContext:
+	"""Cairo context stand-in that counts every extents query."""
+
+	def __init__(self, _surface: object) -> None:
+		self.size = 1.0
+		self.queries = 0
+
+	def select_font_face(self, _name: str, _slant: int, _weight: int) -> None:
+		pass
+
+	def set_font_size(self, size: float) -> None:
+		self.size = size
+
+	def get_scaled_font(self) -> _FakeScaledFont:
+		return _FakeScaledFont(self)
+
+	def text_extents(self, text: str) -> _Extents:
+		self.queries += 1
+		advance = sum(_WIDTHS.get(char, 0.6) for char in text) * self.size
+		return _Extents(0.05 * self.size, 0.0, advance - 0.1 * self.size, self.size, advance, 0.0)
+
+
+#============================================
+class _FakeCairoError(Exception):
+	"""Stand-in for the cairo backend error."""
+
+
+#============================================
+class _FakeCairo:
+	"""Module stand-in exposing the surface and context constructors."""
+	FORMAT_A8 = 2
+	Error = _FakeCairoError
+
+	@staticmethod
+	def ImageSurface(_format: int, _width: int, _height: int) -> object:
+		return object()
+
+	Context = _FakeContext
+
+
+#============================================
+def _install_fake_metrics(monkeypatch: pytest.MonkeyPatch) -> font_metrics.FontMetrics:
+	"""Install a fresh shared service measuring through a fake cairo."""
+	monkeypatch.setattr(font_metrics, "_cairo", _FakeCairo)
+	metrics = font_metrics.FontMetrics()
+	monkeypatch.setattr(font_metrics, "_FONT_METRICS", metrics)
+	return metrics
+
+
+#============================================
+def _measure_repeatedly(metrics: font_metrics.FontMetrics) -> tuple[list, object, int]:
+	"""Measure one label 51 times; return its advances and the first context state."""
+	first = label_geometry._text_char_advances("CH<sub>3</sub>", 16.0, "Arial")
+	context = metrics._context
+	queries = context.queries
+	for _ in range(50):
+		label_geometry._text_char_advances("CH<sub>3</sub>", 16.0, "Arial")
+	return first, context, queries
+
+
+#============================================
+def test_repeated_labels_reuse_one_measuring_context(monkeypatch: pytest.MonkeyPatch) -> None:
+	"""Repeated labels reuse the first context without new extents queries."""
+	metrics = _install_fake_metrics(monkeypatch)
+	_first, context, queries = _measure_repeatedly(metrics)
+	assert metrics._context is context
+	assert context.queries == queries
+
+
+#============================================
+def test_repeated_labels_hit_the_advance_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+	"""Two label parts miss once each and every repeat is a cache hit."""
+	metrics = _install_fake_metrics(monkeypatch)
+	_measure_repeatedly(metrics)
+	info = metrics.cache_info()
+	assert (info.misses, info.hits) == (2, 100)
+
+
+#============================================
+def test_subscript_advances_use_the_reduced_font_size(monkeypatch: pytest.MonkeyPatch) -> None:
+	"""Subscript characters advance by the scaled-down subscript size."""
+	_install_fake_metrics(monkeypatch)
+	advances = label_geometry._text_char_advances("CH<sub>3</sub>", 16.0, "Arial")
+	assert advances == pytest.approx([0.7 * 16.0, 0.72 * 16.0, 0.55 * 16.0 * 0.65])
+
+
+#============================================
+def test_one_pass_advances_match_prefix_differences() -> None:
+	"""One glyph pass yields the same advances as prefix-width differences."""
+	context = _FakeContext(None)
+	context.set_font_size(12.0)
+	text = "NH2OC"
+	expected = []
+	previous = 0.0
+	for index in range(len(text)):
+		advance = context.text_extents(text[: index + 1]).x_advance
+		expected.append(advance - previous)
+		previous = advance
+	assert font_metrics._measure_advances(context, text) == pytest.approx(expected)
+
+
+#============================================
+def test_ink_bearings_use_first_and_last_glyph(monkeypatch: pytest.MonkeyPatch) -> None:
+	"""Ink bearings come from the first glyph's left and last glyph's right edge."""
+	_install_fake_metrics(monkeypatch)
+	bearings = label_geometry._text_ink_bearing_correction("OH", 10.0, "Arial")
+	assert bearings == pytest.approx((0.5, 0.5))
+
+
+#============================================
+def test_repeated_ink_bearings_are_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+	"""A second bearing query for the same label is answered from the cache."""
+	metrics = _install_fake_metrics(monkeypatch)
+	label_geometry._text_ink_bearing_correction("OH", 10.0, "Arial")
+	label_geometry._text_ink_bearing_correction("OH", 10.0, "Arial")
+	assert metrics.cache_info().hits == 2
+
+
+#============================================
+def test_missing_cairo_keeps_uniform_advances(monkeypatch: pytest.MonkeyPatch) -> None:
+	"""Without cairo every character advances by the uniform fallback width."""
+	monkeypatch.setattr(font_metrics, "_cairo", None)
+	assert label_geometry._text_char_advances("OH", 10.0, "Arial") == [6.0, 6.0]
+
+
+#============================================
+def test_missing_cairo_keeps_zero_ink_bearings(monkeypatch: pytest.MonkeyPatch) -> None:
+	"""Without cairo the ink-bearing correction is zero on both sides."""
+	monkeypatch.setattr(font_metrics, "_cairo", None)
+	assert label_geometry._text_ink_bearing_correction("OH", 10.0, "Arial") == (0.0, 0.0)
+
+
+#============================================
+class _UnselectableContext(_FakeContext):
+	"""Context whose font selection fails in the backend."""
+
+	def select_font_face(self, _name: str, _slant: int, _weight: int) -> None:
+		raise _FakeCairoError("no such font")
+
+
+#============================================
+def _install_unselectable_metrics(monkeypatch: pytest.MonkeyPatch) -> font_metrics.FontMetrics:
+	"""Install a shared service whose cairo cannot select any font."""
+	metrics = _install_fake_metrics(monkeypatch)
+	monkeypatch.setattr(_FakeCairo, "Context", _UnselectableContext)
+	return metrics
+
+
+#============================================
+def test_font_selection_error_falls_back_to_uniform_advances(
+	monkeypatch: pytest.MonkeyPatch,
+) -> None:
+	"""A cairo error selecting the font keeps the uniform fallback advances."""
+	_install_unselectable_metrics(monkeypatch)
+	assert label_geometry._text_char_advances("OH", 10.0, "Arial") == [6.0, 6.0]
+
+
+#============================================
+def test_font_selection_error_is_not_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+	"""Measurements that failed in cairo leave the cache empty."""
+	metrics = _install_unselectable_metrics(monkeypatch)
+	label_geometry._text_ink_bearing_correction("OH", 10.0, "Arial")
+	assert metrics.cache_info().currsize == 0
+
+
+#============================================
+def test_logic_errors_are_not_swallowed(monkeypatch: pytest.MonkeyPatch) -> None:
+	"""Errors outside the cairo backend call propagate to the caller."""
+	metrics = _install_fake_metrics(monkeypatch)
+	monkeypatch.setattr(metrics, "_entries", None)
+	with pytest.raises(AttributeError):
+		metrics.char_advances("OH", 10.0, "Arial", 2)
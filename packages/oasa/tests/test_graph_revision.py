@@ -0,0 +1,41 @@
+"""Unit tests for atom and bond structure revisions."""
+
+# local repo modules
+import oasa.graph.graph_lib
+import oasa.graph.revision
+import oasa.smiles_lib
+
+
+#============================================
+def _ethanol() -> object:
+	"""Return a parsed ethanol molecule."""
+	return oasa.smiles_lib.text_to_mol("CCO", calc_coords=False)
+
+
+#============================================
+def test_plain_graph_items_start_at_revision_zero() -> None:
+	"""A graph of never-edited plain vertices and edges has revision 0."""
+	graph = oasa.graph.graph_lib.Graph()
+	first = graph.add_vertex()
+	second = graph.add_vertex()
+	graph.add_edge(first, second)
+	assert oasa.graph.revision.structure_revision(graph) == 0
+
+
+#============================================
+def test_property_edit_raises_the_structure_revision() -> None:
+	"""Changing an atom's charge gives the molecule a newer revision."""
+	mol = _ethanol()
+	before = oasa.graph.revision.structure_revision(mol)
+	mol.atoms[2].charge = -1
+	assert oasa.graph.revision.structure_revision(mol) > before
+
+
+#============================================
+def test_unchanged_lookup_does_not_revisit_the_atoms() -> None:
+	"""Without a new revision issued, the cached answer is returned as is."""
+	mol = _ethanol()
+	before = oasa.graph.revision.structure_revision(mol)
+	# bypass the setters, which would issue a new revision
+	mol.atoms[0]._revision = before + 1000
+	assert oasa.graph.revision.structure_revision(mol) == before
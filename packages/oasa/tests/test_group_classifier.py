@@ -0,0 +1,97 @@
+"""Unit tests for the precompiled functional-group classifier."""
+
+# PIP3 modules
+import pytest
+
+# local repo modules
+import oasa.smiles_lib
+import oasa.group_classifier
+
+
+#============================================
+def _found(mol: object) -> set:
+	"""Return (name, atoms, attachments) of every match in ``mol``."""
+	matches = oasa.group_classifier.shared_group_classifier().classify(mol)
+	return {(m.name, m.atoms, m.attachments) for m in matches}
+
+
+#============================================
+def _found_in(smiles: str) -> set:
+	"""Return the classified groups of one SMILES string."""
+	return _found(oasa.smiles_lib.text_to_mol(smiles, calc_coords=False))
+
+
+#============================================
+def _classified_batch() -> tuple[object, list, list]:
+	"""Return a classifier, five molecules, and their one-by-one classifications."""
+	classifier = oasa.group_classifier.GroupClassifier()
+	smiles = ["CCO", "CC(=O)N", "c1ccncc1", "CC#N", "OC(=O)CCl"]
+	mols = [oasa.smiles_lib.text_to_mol(text, calc_coords=False) for text in smiles]
+	return classifier, mols, [classifier.classify(mol) for mol in mols]
+
+
+#============================================
+@pytest.mark.parametrize("expected", [
+	("ester", (1, 2, 3), (4,)),
+	("carboxylic acid", (10, 11, 12), ()),
+	("benzene", (4, 5, 6, 7, 8, 9), ()),
+])
+def test_groups_report_atoms_apart_from_attachments(expected: tuple) -> None:
+	"""Aspirin's groups list their own atoms separately from attachment atoms."""
+	assert expected in _found_in("CC(=O)OC1=CC=CC=C1C(=O)O")
+
+
+#============================================
+def test_ester_carbonyl_is_not_a_ketone_amide_or_aldehyde() -> None:
+	"""An ester or acid carbonyl is not also reported as a simpler carbonyl group."""
+	names = {name for name, _a, _b in _found_in("CC(=O)OC1=CC=CC=C1C(=O)O")}
+	assert names.isdisjoint({"ketone", "amide", "aldehyde"})
+
+
+#============================================
+def test_classification_adds_no_hydrogen_atoms() -> None:
+	"""Classifying aspirin leaves its implicit hydrogens implicit."""
+	aspirin = oasa.smiles_lib.text_to_mol("CC(=O)OC1=CC=CC=C1C(=O)O", calc_coords=False)
+	_found(aspirin)
+	assert len(aspirin.vertices) == 13
+
+
+#============================================
+def test_bridged_rings_do_not_depend_on_the_sssr_choice() -> None:
+	"""Bicyclo[2.2.2]octane reports all three cyclohexanes, not two SSSR picks."""
+	found = _found_in("C1CC2CCC1CC2")
+	assert found == {
+		("cyclohexane", (0, 1, 2, 3, 4, 5), ()),
+		("cyclohexane", (0, 1, 2, 5, 6, 7), ()),
+		("cyclohexane", (2, 3, 4, 5, 6, 7), ()),
+	}
+
+
+#============================================
+def test_rings_must_cover_a_relevant_ring() -> None:
+	"""Norbornane's six-membered envelope sums two cyclopentanes and is not a ring group."""
+	names = [name for name, _a, _b in _found_in("C1CC2CCC1C2")]
+	assert sorted(names) == ["cyclopentane", "cyclopentane"]
+
+
+#============================================
+def test_heteroatom_ring_is_not_a_carbocycle() -> None:
+	"""Piperidine is reported under its own name and not as cyclohexane."""
+	found = _found_in("C1CCNCC1")
+	assert ("piperidine", (0, 1, 2, 3, 4, 5), ()) in found
+	assert "cyclohexane" not in {name for name, _a, _b in found}
+
+
+#============================================
+def test_classify_many_matches_classify() -> None:
+	"""Serial batch classification equals classifying one molecule at a time."""
+	classifier, mols, expected = _classified_batch()
+	assert classifier.classify_many(mols) == expected
+
+
+#============================================
+def test_pooled_classify_many_matches_classify(monkeypatch: pytest.MonkeyPatch) -> None:
+	"""Pooled batch classification returns results in input order."""
+	classifier, mols, expected = _classified_batch()
+	monkeypatch.setattr(oasa.group_classifier, "_POOL_THRESHOLD", 2)
+	assert classifier.classify_many(mols, processes=2, chunksize=2) == expected
@@ -0,0 +1,208 @@
+"""Unit tests for the memoized identifier service."""
+
+# PIP3 modules
+import pytest
+
+# local repo modules
+import oasa.smiles_lib
+import oasa.molecule_lib
+import oasa.identifier_service
+import oasa.codecs.rdkit_formats
+
+
+ASPIRIN = "CC(=O)Oc1ccccc1C(=O)O"
+
+# the same molecule written from the other end
+ASPIRIN_REORDERED = "OC(=O)c1ccccc1OC(C)=O"
+
+
+#============================================
+def _parse(smiles: str) -> object:
+	"""Return a molecule parsed from ``smiles`` without coordinates."""
+	return oasa.smiles_lib.text_to_mol(smiles, calc_coords=False)
+
+
+#============================================
+def _key(mol: object) -> object:
+	"""Return the identifier cache key of ``mol``."""
+	return oasa.identifier_service.molecule_key(mol)
+
+
+#============================================
+def _wedged_center(mol: object) -> object:
+	"""Return the single-bonded stereocenter carbon of alanine."""
+	return next(
+		a for a in mol.atoms
+		if a.symbol == "C" and a.degree == 3 and all(b.order == 1 for b in a.neighbor_edges)
+	)
+
+
+#============================================
+def _alanine_with_wedge() -> object:
+	"""Return alanine with 2D coordinates and a wedge from the stereocenter to N."""
+	mol = oasa.smiles_lib.text_to_mol("CC(N)C(=O)O")
+	center = _wedged_center(mol)
+	nitrogen = next(a for a in center.neighbors if a.symbol == "N")
+	bond = center.get_edge_leading_to(nitrogen)
+	bond.type = "w"
+	bond.vertices = [center, nitrogen]
+	return mol
+
+
+#============================================
+def _mirror(mol: object) -> object:
+	"""Reflect ``mol`` through the y axis and return it."""
+	for atom in mol.atoms:
+		atom.x = -atom.x
+	return mol
+
+
+#============================================
+def _alanine_with_degenerate_wedge() -> object:
+	"""Return wedged alanine with N moved onto the stereocenter."""
+	mol = _alanine_with_wedge()
+	center = _wedged_center(mol)
+	nitrogen = next(a for a in center.neighbors if a.symbol == "N")
+	nitrogen.x, nitrogen.y = center.x, center.y
+	return mol
+
+
+#============================================
+def _bulk_molecules() -> list:
+	"""Return ethanol twice in two spellings, plus benzene."""
+	return [_parse(smiles) for smiles in ("CCO", "OCC", "c1ccccc1", "CCO")]
+
+
+#============================================
+def test_equal_molecules_share_a_key() -> None:
+	"""Two spellings of one molecule give the same key."""
+	assert _key(_parse(ASPIRIN)) == _key(_parse(ASPIRIN_REORDERED))
+
+
+#============================================
+def test_equal_molecules_share_entries() -> None:
+	"""The second spelling is served from the first one's entry."""
+	service = oasa.identifier_service.IdentifierService()
+	facts = service.identifiers(_parse(ASPIRIN))
+	assert service.identifiers(_parse(ASPIRIN_REORDERED)) == facts
+	assert facts.inchikey == "BSYNRYMUTXBXSQ-UHFFFAOYSA-N"
+
+
+#============================================
+def test_inchi_and_key_match_direct_generation() -> None:
+	"""Cached InChI and key equal a direct RDKit generation."""
+	service = oasa.identifier_service.IdentifierService()
+	service.identifiers(_parse(ASPIRIN))
+	expected = oasa.codecs.rdkit_formats.generate_inchi_and_inchikey(_parse(ASPIRIN))
+	assert service.inchi_and_key(_parse(ASPIRIN_REORDERED)) == expected
+
+
+#============================================
+def test_cache_info_counts_hits_and_misses() -> None:
+	"""Cache info counts one hit and a miss per identifier kind."""
+	service = oasa.identifier_service.IdentifierService()
+	service.identifiers(_parse(ASPIRIN))
+	service.identifiers(_parse(ASPIRIN_REORDERED))
+	service.inchi_and_key(_parse(ASPIRIN))
+	info = service.cache_info()
+	assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+
+#============================================
+def test_charges_and_isotopes_are_part_of_the_key() -> None:
+	"""A charged or isotope-labeled variant gets its own key."""
+	charged = _parse("CC(=O)Oc1ccccc1C(=O)[O-]")
+	labeled = _parse(ASPIRIN)
+	labeled.atoms[0].isotope = 13
+	assert len({_key(m) for m in (_parse(ASPIRIN), charged, labeled)}) == 3
+
+
+#============================================
+def test_wedge_stereo_reaches_the_smiles() -> None:
+	"""A wedged center gives the depiction-stereo SMILES with a chirality mark."""
+	mol = _alanine_with_wedge()
+	smiles = oasa.identifier_service.IdentifierService().smiles(mol)
+	assert smiles == oasa.codecs.rdkit_formats.depiction_stereo_smiles_mol_to_text(mol)
+	assert "@" in smiles
+
+
+#============================================
+def test_mirror_drawing_is_part_of_the_key() -> None:
+	"""Reflecting a wedged drawing changes its key."""
+	mol = _alanine_with_wedge()
+	key = _key(mol)
+	assert _key(_mirror(mol)) != key
+
+
+#============================================
+def test_mirror_drawing_is_the_other_enantiomer() -> None:
+	"""The reflected drawing gives the same SMILES with inverted chirality."""
+	service = oasa.identifier_service.IdentifierService()
+	mol = _alanine_with_wedge()
+	smiles = service.smiles(mol)
+	mirrored = service.smiles(_mirror(mol))
+	assert mirrored != smiles
+	assert mirrored.replace("@@", "@") == smiles.replace("@@", "@")
+
+
+#============================================
+def test_mirror_drawing_misses_the_cache() -> None:
+	"""Each enantiomer drawing is a separate cache miss."""
+	service = oasa.identifier_service.IdentifierService()
+	mol = _alanine_with_wedge()
+	service.smiles(mol)
+	service.smiles(_mirror(mol))
+	assert service.cache_info().misses == 2
+
+
+#============================================
+def test_degenerate_wedge_has_no_key() -> None:
+	"""A wedge drawn onto its own center gives no key."""
+	assert _key(_alanine_with_degenerate_wedge()) is None
+
+
+#============================================
+def test_degenerate_wedge_fails_uncached() -> None:
+	"""An unkeyable molecule still raises the conversion error."""
+	service = oasa.identifier_service.IdentifierService()
+	with pytest.raises(ValueError):
+		service.smiles(_alanine_with_degenerate_wedge())
+
+
+#============================================
+def test_bulk_requests_deduplicate_equal_molecules() -> None:
+	"""Equal molecules in a bulk request share one result and one miss."""
+	service = oasa.identifier_service.IdentifierService()
+	results = service.identifiers_many(_bulk_molecules(), processes=1)
+	assert results[0] == results[1] == results[3]
+	assert service.cache_info().misses == 2
+
+
+#============================================
+def test_bulk_requests_keep_input_order() -> None:
+	"""Bulk results line up with the input molecules."""
+	service = oasa.identifier_service.IdentifierService()
+	results = service.identifiers_many(_bulk_molecules(), processes=1)
+	assert results[2].inchikey == "UHOVQNZJYSORNB-UHFFFAOYSA-N"
+
+
+#============================================
+def test_disk_cache_survives_reopening(tmp_path: object) -> None:
+	"""A reopened disk cache serves earlier results as disk hits."""
+	path = str(tmp_path / "identifiers.sqlite")
+	mols = _bulk_molecules()
+	service = oasa.identifier_service.IdentifierService(path=path)
+	results = service.identifiers_many(mols, processes=1)
+	service.close()
+	reopened = oasa.identifier_service.IdentifierService(path=path)
+	assert reopened.identifiers(mols[2]) == results[2]
+	info = reopened.cache_info()
+	reopened.close()
+	assert (info.hits, info.disk_hits, info.misses) == (0, 1, 0)
+
+
+#============================================
+def test_bulk_requests_report_none_for_empty_molecules() -> None:
+	"""An empty molecule has no identifiers and gives None in bulk."""
+	service = oasa.identifier_service.IdentifierService()
+	assert service.identifiers_many([oasa.molecule_lib.Molecule()], processes=1) == [None]
@@ -0,0 +1,145 @@
+"""Unit tests for indexed vertex storage and bulk construction in Graph."""
+
+# Standard Library
+import copy
+import pickle
+
+# PIP3 modules
+import pytest
+
+# local repo modules
+from oasa.graph.graph_lib import Graph
+from oasa.graph.vertex_lib import Vertex
+from oasa.graph.indexed_vertices import IndexedVertexList
+import graph_test_fixtures
+
+
+#============================================
+def _edited_container(vertices: list) -> IndexedVertexList:
+	"""Return a container built from four vertices, then appended, removed, inserted."""
+	container = IndexedVertexList(vertices[:4])
+	container.append(vertices[4])
+	container.remove(vertices[0])
+	container.insert(1, vertices[5])
+	return container
+
+
+#============================================
+def test_list_edits_keep_list_order() -> None:
+	"""Append, remove, and insert leave the same order as a plain list."""
+	vertices = [Vertex() for _ in range(6)]
+	container = _edited_container(vertices)
+	assert container == [vertices[1], vertices[5], vertices[2], vertices[3], vertices[4]]
+
+
+#============================================
+def test_index_follows_list_edits() -> None:
+	"""Every member's indexed position matches its list position after edits."""
+	vertices = [Vertex() for _ in range(6)]
+	container = _edited_container(vertices)
+	assert [container.index(vertex) for vertex in container] == [0, 1, 2, 3, 4]
+
+
+#============================================
+def test_removed_vertex_is_not_contained() -> None:
+	"""Membership drops a vertex as soon as it is removed."""
+	vertices = [Vertex() for _ in range(6)]
+	container = _edited_container(vertices)
+	assert vertices[0] not in container
+
+
+#============================================
+def test_index_follows_delete_and_sort() -> None:
+	"""Item deletion and in-place sorting both refresh stored positions."""
+	vertices = [Vertex() for _ in range(6)]
+	container = _edited_container(vertices)
+	del container[0]
+	container.sort(key=lambda v: vertices.index(v), reverse=True)
+	assert [container.index(v) for v in vertices[2:]] == [3, 2, 1, 0]
+
+
+#============================================
+@pytest.mark.parametrize("copier", [copy.copy, copy.deepcopy])
+def test_copies_index_their_own_members(copier: object) -> None:
+	"""A copied container stays indexed and tracks its own appends."""
+	vertices = [Vertex() for _ in range(3)]
+	duplicate = copier(IndexedVertexList(vertices[:2]))
+	duplicate.append(vertices[2])
+	assert type(duplicate) is IndexedVertexList
+	assert duplicate.index(duplicate[2]) == 2
+
+
+#============================================
+def test_copies_do_not_share_positions() -> None:
+	"""Appending to a shallow copy leaves the original's members unchanged."""
+	vertices = [Vertex() for _ in range(3)]
+	container = IndexedVertexList(vertices[:2])
+	copy.copy(container).append(vertices[2])
+	assert vertices[2] not in container
+
+
+#============================================
+def test_pickled_list_keeps_first_positions() -> None:
+	"""Unpickling rebuilds the index with each value's first position."""
+	restored = pickle.loads(pickle.dumps(IndexedVertexList([1, 2, 2])))
+	assert restored.index(2) == 1
+
+
+#============================================
+def test_bulk_edges_connect_the_chain() -> None:
+	"""Bulk edge construction returns every new edge of a connected chain."""
+	graph = Graph()
+	vertices = graph.add_vertices(Vertex() for _ in range(5))
+	edges = graph.add_edges(zip(vertices, vertices[1:]))
+	assert len(edges) == 4
+	assert graph.is_connected()
+
+
+#============================================
+def test_bulk_construction_flushes_once() -> None:
+	"""Bulk edge construction rebuilds the rustworkx backend only once."""
+	graph = Graph()
+	vertices = graph.add_vertices(Vertex() for _ in range(5))
+	rebuilds = graph._rx_backend.rebuild_count
+	graph.add_edges(zip(vertices, vertices[1:]))
+	# The first backend query after the bulk call performs the deferred rebuild.
+	graph.is_connected()
+	assert graph._rx_backend.rebuild_count == rebuilds + 1
+
+
+#============================================
+def test_bulk_vertices_skip_existing_members() -> None:
+	"""Adding an existing vertex warns and adds nothing."""
+	graph = Graph()
+	vertices = graph.add_vertices([Vertex()])
+	with pytest.warns(UserWarning):
+		added = graph.add_vertices([vertices[0]])
+	assert added == []
+
+
+#============================================
+def test_bulk_edges_skip_foreign_vertices() -> None:
+	"""An edge to a vertex outside the graph warns and adds nothing."""
+	graph = Graph()
+	vertices = graph.add_vertices([Vertex()])
+	with pytest.warns(UserWarning):
+		added = graph.add_edges([(vertices[0], Vertex())])
+	assert added == []
+
+
+#============================================
+def test_deep_copy_keeps_vertex_order() -> None:
+	"""A deep-copied molecule lists its atoms in the original order."""
+	mol = graph_test_fixtures.make_cholesterol()["oasa_mol"]
+	clone = mol.deep_copy()
+	assert [v.symbol for v in clone.vertices] == [v.symbol for v in mol.vertices]
+
+
+#============================================
+def test_deep_copy_keeps_bonds() -> None:
+	"""Each deep-copied atom has the same neighbor positions as its original."""
+	mol = graph_test_fixtures.make_cholesterol()["oasa_mol"]
+	clone = mol.deep_copy()
+	original = [sorted(mol.vertices.index(n) for n in v.neighbors) for v in mol.vertices]
+	copied = [sorted(clone.vertices.index(n) for n in v.neighbors) for v in clone.vertices]
+	assert (copied, len(clone.edges)) == (original, len(mol.edges))
@@ -0,0 +1,83 @@
+"""Unit tests for the label-target grid used by bond overlap resolution."""
+
+# local repo modules
+from oasa.render_lib.bond_ops import _avoid_cross_label_overlaps
+from oasa.render_lib.data_types import BondRenderContext
+from oasa.render_lib.data_types import make_box_target
+from oasa.render_lib.data_types import make_circle_target
+from oasa.render_lib.data_types import make_segment_target
+from oasa.render_lib.label_target_index import LabelTargetIndex
+
+
+#============================================
+class _FakeVertex:
+	"""Minimal vertex stand-in for dict-key identity in label_targets."""
+	def __init__(self, name: object) -> None:
+		self.name = name
+
+
+#============================================
+def test_cross_label_grid_matches_full_scan() -> None:
+	"""The label-target grid resolves every bond exactly like the full scan."""
+	vertices = [_FakeVertex(index) for index in range(64)]
+	label_targets = {}
+	for index, vertex in enumerate(vertices):
+		x = (index % 8) * 10.0
+		y = (index // 8) * 10.0
+		if index % 5 == 0:
+			label_targets[vertex] = make_circle_target((x, y), 3.0)
+		else:
+			label_targets[vertex] = make_box_target((x - 3.0, y - 2.0, x + 4.0, y + 2.0))
+	target_index = LabelTargetIndex(label_targets)
+	mismatches = []
+	for index in range(63):
+		start = ((index % 8) * 10.0, (index // 8) * 10.0)
+		end = (start[0] + 25.0, start[1] + 1.0 + (index % 3))
+		own_vertices = {vertices[index], vertices[index + 1]}
+		expected = _avoid_cross_label_overlaps(
+			start, end, half_width=0.5,
+			own_vertices=own_vertices, label_targets=label_targets,
+		)
+		result = _avoid_cross_label_overlaps(
+			start, end, half_width=0.5,
+			own_vertices=own_vertices, label_targets=label_targets,
+			target_index=target_index,
+		)
+		if result != expected:
+			mismatches.append(index)
+	assert mismatches == []
+
+
+#============================================
+def test_grid_skips_segments_and_keeps_far_targets_out() -> None:
+	"""Candidates exclude segment targets, owned labels, and distant boxes."""
+	vertices = [_FakeVertex(index) for index in range(40)]
+	label_targets = {
+		vertex: make_box_target((index * 10.0, 0.0, index * 10.0 + 4.0, 4.0))
+		for index, vertex in enumerate(vertices)
+	}
+	label_targets[_FakeVertex("segment")] = make_segment_target((0.0, 0.0), (400.0, 0.0))
+	target_index = LabelTargetIndex(label_targets)
+	found = target_index.candidates((0.0, 2.0), (25.0, 2.0), 0.5, {vertices[0]})
+	assert found == [label_targets[vertices[1]], label_targets[vertices[2]]]
+
+
+#============================================
+def test_bond_render_context_builds_index_for_label_targets() -> None:
+	"""A render context with label targets carries a prebuilt grid."""
+	label_targets = {_FakeVertex("A"): make_box_target((0.0, 0.0, 4.0, 4.0))}
+	context = BondRenderContext(
+		molecule=None, line_width=1.0, bond_width=6.0, wedge_width=4.0,
+		bold_line_width_multiplier=1.2, label_targets=label_targets,
+	)
+	assert isinstance(context.label_target_index, LabelTargetIndex)
+
+
+#============================================
+def test_bond_render_context_without_label_targets_has_no_index() -> None:
+	"""A render context without label targets skips building the grid."""
+	context = BondRenderContext(
+		molecule=None, line_width=1.0, bond_width=6.0, wedge_width=4.0,
+		bold_line_width_multiplier=1.2,
+	)
+	assert context.label_target_index is None
@@ -0,0 +1,101 @@
+"""Unit tests for longest end-to-end chains and graph diameter."""
+
+# PIP3 modules
+import pytest
+
+# local repo modules
+import oasa.smiles_lib
+import oasa.graph.longest_paths
+
+
+#============================================
+def _mol(smiles: str) -> object:
+	"""Return a molecule read with the built-in SMILES parser."""
+	reader = oasa.smiles_lib.Smiles()
+	reader.read_smiles(smiles)
+	return reader.get_structure()
+
+
+#============================================
+def _pairwise_chain(mol: object) -> object:
+	"""Return the chain found by searching a path for every pair of end atoms."""
+	ends = [v for v in mol.vertices if v.degree == 1]
+	best = None
+	for e1 in ends:
+		for e2 in ends:
+			if e1 is not e2:
+				path = mol.find_path_between(e1, e2)
+				if best is None or len(path) > len(best):
+					best = path
+	return best
+
+
+#============================================
+@pytest.mark.parametrize("smiles", [
+	"CCCCCCCCCCCCCCCC(=O)OCC(COP(=O)(O)OCCN)OC(=O)CCCCCCCC=CCCCCCCCC",
+	"CC(C)CCCC(C)C1CCC2C1(CCC3C2CCC4=CC(CCC34C)O)C",
+	"CN1C=NC2=C1C(=O)N(C(=O)N2C)C",
+	"CC(C)(C)C",
+])
+def test_longest_chain_matches_pairwise_search(smiles: str) -> None:
+	"""The two-sweep chain equals the best chain over every pair of end atoms."""
+	mol = _mol(smiles)
+	assert mol.find_longest_mostly_carbon_chain() == _pairwise_chain(mol)
+
+
+#============================================
+def test_ring_without_ends_has_no_chain() -> None:
+	"""A ring with no end atoms has no end-to-end chain."""
+	assert _mol("C1CCCCC1").find_longest_mostly_carbon_chain() is None
+
+
+#============================================
+def test_separate_pieces_are_searched_one_by_one() -> None:
+	"""A two-piece molecule returns the longer piece's chain."""
+	mol = oasa.smiles_lib.text_to_mol("CCC.CCCCC", calc_coords=False)
+	assert len(mol.find_longest_mostly_carbon_chain()) == 5
+
+
+#============================================
+@pytest.mark.parametrize("hetero_weight", [None, 0])
+def test_hetero_weight_keeps_the_longest_chain(hetero_weight: int | None) -> None:
+	"""The default and a zero hetero weight keep the nine-atom chain through nitrogen."""
+	chain = _mol("NCCCC(CCCC)CC").find_longest_mostly_carbon_chain(hetero_weight=hetero_weight)
+	assert len(chain) == 9
+
+
+#============================================
+def test_negative_hetero_weight_prefers_carbon_chains() -> None:
+	"""A negative hetero weight picks the all-carbon chain over a longer one."""
+	chain = _mol("NCCCC(CCCC)CC").find_longest_mostly_carbon_chain(hetero_weight=-2)
+	assert [v.symbol for v in chain] == ['C'] * 7
+
+
+#============================================
+def test_ring_systems_use_the_heaviest_short_path() -> None:
+	"""Among equally short paths through a ring, the heaviest one is used."""
+	chain = _mol("OC1COC(C)CC1").find_longest_mostly_carbon_chain(hetero_weight=0)
+	assert sorted(v.symbol for v in chain) == ['C'] * 5 + ['O']
+
+
+#============================================
+@pytest.mark.parametrize(("smiles", "expected"), [
+	("CCCCCC", 5), ("C1CCCCC1", 3), ("C", 0),
+])
+def test_diameter_on_trees_and_rings(smiles: str, expected: int) -> None:
+	"""Molecule diameters count bonds along the longest shortest path."""
+	assert _mol(smiles).get_diameter() == expected
+
+
+#============================================
+def test_diameter_takes_the_widest_piece() -> None:
+	"""A two-piece molecule reports the larger diameter of its pieces."""
+	mol = oasa.smiles_lib.text_to_mol("CCC.C1CCCCCCCC1", calc_coords=False)
+	assert mol.get_diameter() == 4
+
+
+#============================================
+def test_diameter_on_adjacency_lists() -> None:
+	"""The index-based diameter handles a triangle with a two-atom tail."""
+	adjacency = [[1, 2], [0, 2], [0, 1, 3], [2, 4], [3]]
+	assert oasa.graph.longest_paths.diameter(adjacency) == 3
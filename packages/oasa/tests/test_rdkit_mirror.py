@@ -0,0 +1,138 @@
+"""Unit tests for the cached RDKit mirror of OASA molecules."""
+
+# PIP3 modules
+import pytest
+import rdkit.Chem
+import rdkit.Chem.AllChem
+
+# local repo modules
+import oasa.atom_lib
+import oasa.bond_lib
+import oasa.smiles_lib
+import oasa.rdkit_bridge
+import oasa.codecs.rdkit_formats
+
+
+ASPIRIN = "CC(=O)OC1=CC=CC=C1C(=O)O"
+
+
+#============================================
+def _mol(smiles: str) -> object:
+	"""Return a parsed molecule with a current mirror and zeroed counts."""
+	mol = oasa.smiles_lib.text_to_mol(smiles, calc_coords=False)
+	oasa.rdkit_bridge.mirror_rdkit_mol(mol)
+	oasa.rdkit_bridge.reset_mirror_cache_info()
+	return mol
+
+
+#============================================
+def _fresh_depiction(mol: object) -> object:
+	"""Return an uncached RDKit copy of ``mol`` with 2D coordinates."""
+	fresh, _atom_map = oasa.rdkit_bridge.oasa_to_rdkit_mol(mol)
+	rdkit.Chem.AllChem.Compute2DCoords(fresh)
+	return fresh
+
+
+#============================================
+def _oxygen(mol: object) -> object:
+	"""Return the first oxygen atom of ``mol``."""
+	return next(a for a in mol.atoms if a.symbol == "O")
+
+
+#============================================
+def _extend_ethanol() -> tuple[object, object]:
+	"""Return ethanol grown by one carbon on the oxygen, and that carbon."""
+	mol = _mol("CCO")
+	carbon = oasa.atom_lib.Atom(symbol="C")
+	mol.add_vertex(carbon)
+	mol.add_edge(_oxygen(mol), carbon, oasa.bond_lib.Bond(order=1))
+	return mol, carbon
+
+
+#============================================
+def test_repeated_exports_convert_once() -> None:
+	"""SMILES, InChI, and molfile exports all reuse one cached mirror."""
+	mol = _mol(ASPIRIN)
+	oasa.codecs.rdkit_formats.smiles_mol_to_text(mol)
+	oasa.codecs.rdkit_formats.inchi_mol_to_text(mol)
+	oasa.codecs.rdkit_formats.molfile_mol_to_text(mol)
+	assert oasa.rdkit_bridge.mirror_cache_info() == {"hits": 3, "misses": 0}
+
+
+#============================================
+@pytest.mark.parametrize(("export", "reference"), [
+	(oasa.codecs.rdkit_formats.smiles_mol_to_text, rdkit.Chem.MolToSmiles),
+	(oasa.codecs.rdkit_formats.molfile_mol_to_text, rdkit.Chem.MolToMolBlock),
+])
+def test_cached_export_matches_fresh_conversion(export: object, reference: object) -> None:
+	"""A cached export gives what a fresh conversion gives."""
+	mol = _mol(ASPIRIN)
+	assert export(mol) == reference(_fresh_depiction(mol))
+
+
+#============================================
+def test_cached_inchi_is_stable() -> None:
+	"""Repeated InChI exports from the cache agree."""
+	mol = _mol(ASPIRIN)
+	first = oasa.codecs.rdkit_formats.inchi_mol_to_text(mol)
+	assert oasa.codecs.rdkit_formats.inchi_mol_to_text(mol) == first
+
+
+#============================================
+def test_charge_edit_invalidates_the_mirror() -> None:
+	"""An atom charge change reaches the next mirror."""
+	mol = _mol("CCO")
+	oxygen = _oxygen(mol)
+	oxygen.charge = -1
+	rmol, atom_map = oasa.rdkit_bridge.mirror_rdkit_mol(mol)
+	assert rmol.GetAtomWithIdx(atom_map[oxygen]).GetFormalCharge() == -1
+	assert oasa.rdkit_bridge.mirror_cache_info() == {"hits": 0, "misses": 1}
+
+
+#============================================
+def test_bond_order_edit_invalidates_the_mirror() -> None:
+	"""A bond order change rebuilds the mirror."""
+	mol = _mol("CCO")
+	next(iter(mol.bonds)).order = 2
+	oasa.rdkit_bridge.mirror_rdkit_mol(mol)
+	assert oasa.rdkit_bridge.mirror_cache_info() == {"hits": 0, "misses": 1}
+
+
+#============================================
+def test_added_atom_invalidates_the_mirror() -> None:
+	"""A new atom and bond appear in the next mirror."""
+	mol, _carbon = _extend_ethanol()
+	rmol, _atom_map = oasa.rdkit_bridge.mirror_rdkit_mol(mol)
+	assert rmol.GetNumAtoms() == 4
+	assert oasa.rdkit_bridge.mirror_cache_info() == {"hits": 0, "misses": 1}
+
+
+#============================================
+def test_coordinate_edit_keeps_the_mirror() -> None:
+	"""Moving an atom is not a structure change and hits the cache."""
+	mol, carbon = _extend_ethanol()
+	oasa.rdkit_bridge.mirror_rdkit_mol(mol)
+	carbon.x = 5.0
+	oasa.rdkit_bridge.mirror_rdkit_mol(mol)
+	assert oasa.rdkit_bridge.mirror_cache_info() == {"hits": 1, "misses": 1}
+
+
+#============================================
+def test_edits_to_a_returned_copy_stay_local() -> None:
+	"""Changing a returned copy leaves later copies untouched."""
+	mol = _mol("c1ccccc1")
+	first, _atom_map = oasa.rdkit_bridge.mirror_rdkit_mol(mol, depiction=True)
+	first.GetAtomWithIdx(0).SetFormalCharge(1)
+	first.RemoveAllConformers()
+	second, _atom_map = oasa.rdkit_bridge.mirror_rdkit_mol(mol, depiction=True)
+	assert second.GetAtomWithIdx(0).GetFormalCharge() == 0
+	assert second.GetNumConformers() == 1
+
+
+#============================================
+def test_plain_mirror_has_no_conformer() -> None:
+	"""A mirror requested without depiction carries no coordinates."""
+	mol = _mol("c1ccccc1")
+	oasa.rdkit_bridge.mirror_rdkit_mol(mol, depiction=True)
+	plain, _atom_map = oasa.rdkit_bridge.mirror_rdkit_mol(mol)
+	assert plain.GetNumConformers() == 0
@@ -0,0 +1,121 @@
+"""Unit tests for index-based ring perception."""
+
+# PIP3 modules
+import pytest
+
+# local repo modules
+import oasa.smiles_lib
+import oasa.graph.ring_perception
+
+
+#============================================
+def _mol(smiles: str) -> object:
+	"""Return a molecule read with the built-in SMILES parser."""
+	reader = oasa.smiles_lib.Smiles()
+	reader.read_smiles(smiles)
+	return reader.get_structure()
+
+
+#============================================
+def _sizes(rings: list) -> list:
+	"""Return the ring sizes in result order."""
+	return [len(ring) for ring in rings]
+
+
+#============================================
+def _cyclodextrin() -> object:
+	"""Return alpha-cyclodextrin's seven-sugar skeleton, a 35-atom macrocycle."""
+	return _mol(
+		"OCC1OC2OC3C(CO)OC(OC4C(CO)OC(OC5C(CO)OC(OC6C(CO)OC(OC7C(CO)OC(OC8C(CO)OC("
+		"OC1C(O)C2O)C(O)C8O)C(O)C7O)C(O)C6O)C(O)C5O)C(O)C4O)C(O)C3O"
+	)
+
+
+#============================================
+@pytest.mark.parametrize(("smiles", "kind", "sizes"), [
+	("C1CC2CCC1C2", "sssr", [5, 5]),
+	("C1CC2CCC1C2", "all", [5, 5, 6]),
+	("C1CC2CCC1CC2", "sssr", [6, 6]),
+	("C12C3C4C1C5C2C3C45", "sssr", [4] * 5),
+	("C12C3C4C1C5C2C3C45", "relevant", [4] * 6),
+])
+def test_ring_kinds_on_cages(smiles: str, kind: str, sizes: list) -> None:
+	"""Cage compounds give the expected ring sizes for each ring kind."""
+	assert _sizes(_mol(smiles).get_rings(kind)) == sizes
+
+
+#============================================
+def test_relevant_rings_include_every_minimum_basis_ring() -> None:
+	"""Every six-membered ring of bicyclo[2.2.2]octane is relevant."""
+	assert _sizes(_mol("C1CC2CCC1CC2").get_rings("relevant")) == [6, 6, 6]
+
+
+#============================================
+def test_all_cycles_are_distinct_vertex_sets() -> None:
+	"""Cubane's six Hamiltonian cycles share one vertex set and count once."""
+	cubane = _mol("C12C3C4C1C5C2C3C45")
+	assert _sizes(cubane.get_rings("all")) == [4] * 6 + [6] * 16 + [8]
+
+
+#============================================
+def test_acyclic_molecule_has_no_rings() -> None:
+	"""A chain has no relevant rings."""
+	assert _mol("CCCC").get_rings("relevant") == []
+
+
+#============================================
+def test_vertex_and_edge_cycles_agree() -> None:
+	"""Vertex and edge cycle enumerations find the same three cycles of decalin."""
+	mol = _mol("C1CCC2CCCCC2C1")
+	assert len(mol.get_all_cycles()) == 3
+	assert len(mol.get_all_cycles_e()) == 3
+
+
+#============================================
+def test_size_cap_skips_larger_cycles() -> None:
+	"""A size cap drops decalin's ten-membered envelope cycle."""
+	mol = _mol("C1CCC2CCCCC2C1")
+	assert _sizes(mol.get_rings("all", max_size=6)) == [6, 6]
+
+
+#============================================
+def test_returned_rings_do_not_alias_the_cache() -> None:
+	"""Clearing a returned ring list leaves the cached rings intact."""
+	mol = _mol("C1CCC2CCCCC2C1")
+	mol.get_rings("sssr").clear()
+	assert len(mol.get_rings("sssr")) == 2
+
+
+#============================================
+def test_ring_cache_follows_graph_edits() -> None:
+	"""Adding a bond after a query invalidates the cached rings."""
+	mol = _mol("C1CCC2CCCCC2C1")
+	mol.get_rings("sssr")
+	mol.add_edge(mol.vertices[0], mol.vertices[5])
+	assert len(mol.get_rings("sssr")) == 3
+
+
+#============================================
+def test_unknown_ring_kind_is_rejected() -> None:
+	"""An unknown ring kind raises ValueError."""
+	with pytest.raises(ValueError):
+		_mol("C1CCCCC1").get_rings("smallest")
+
+
+#============================================
+def test_bridges_are_reported_by_edge_index() -> None:
+	"""Two triangles joined by one bond have that bond as their only bridge."""
+	edges = [(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 5), (5, 3)]
+	assert oasa.graph.ring_perception.bridges(6, edges) == {3}
+
+
+#============================================
+def test_macrocycle_paths_pass_either_side_of_each_ring() -> None:
+	"""The cyclodextrin macrocycle passes either side of its seven pyranoses."""
+	assert _sizes(_cyclodextrin().get_rings("all")) == [6] * 7 + [35] * 128
+
+
+#============================================
+def test_macrocycle_sssr_keeps_one_macrocycle() -> None:
+	"""The cyclodextrin smallest set holds the seven sugars and one macrocycle."""
+	assert _sizes(_cyclodextrin().get_rings("sssr")) == [6] * 7 + [35]
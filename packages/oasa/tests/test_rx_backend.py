@@ -533,3 +533,58 @@ class TestRxBackendIndexConversion:
 		backend.rebuild_from_graph(g)
 		ei = backend.edge_to_index(e)
 		assert backend.index_to_edge(ei) is e
+
+
+#============================================
+class TestRxBackendIncremental:
+	"""Test in-place mirror updates for single graph edits."""
+
+	#============================================
+	def _ring(self, size: int) -> tuple:
+		"""Build a ring graph and sync its backend once."""
+		g = Graph()
+		vertices = [g.add_vertex(Vertex()) for _ in range(size)]
+		edges = [g.add_edge(vertices[i], vertices[(i + 1) % size]) for i in range(size)]
+		g.is_connected()
+		return g, vertices, edges
+
+	#============================================
+	def test_single_edits_do_not_rebuild(self) -> None:
+		"""Interleaved edits and queries should reuse one mirror."""
+		g, vertices, edges = self._ring(6)
+		backend = g._rx_backend
+		for e in edges:
+			g.temporarily_disconnect_edge(e)
+			assert g.is_connected()
+			g.reconnect_temporarily_disconnected_edge(e)
+		tail = g.add_vertex(Vertex())
+		g.add_edge(vertices[0], tail)
+		assert g.is_edge_a_bridge(g.get_edge_between(vertices[0], tail))
+		g.disconnect(vertices[0], tail)
+		g.delete_vertex(tail)
+		assert backend.rebuild_count == 1
+		assert len(backend.rx) == 6 and backend.rx.num_edges() == 6
+
+	#============================================
+	def test_incremental_mirror_matches_rebuild(self) -> None:
+		"""Results after in-place edits should match a fresh rebuild."""
+		g, vertices, edges = self._ring(8)
+		g.disconnect_edge(edges[3])
+		g.temporarily_disconnect_edge(edges[6])
+		extra = g.add_vertex(Vertex())
+		g.add_edge(extra, vertices[2])
+		g.add_edge(vertices[0], vertices[4])
+		fresh = RxBackend()
+		assert g._rx_backend.rebuild_count == 1
+		assert g.get_connected_components() == fresh.get_connected_components(g)
+		assert g._rx_backend.bridges(g) == fresh.bridges(g)
+		assert len(g.get_smallest_independent_cycles()) == len(fresh.cycle_basis(g))
+
+	#============================================
+	def test_bulk_insert_falls_back_to_rebuild(self) -> None:
+		"""insert_a_graph should leave the mirror for a full rebuild."""
+		g, _vertices, _edges = self._ring(4)
+		other, _other_vertices, _other_edges = self._ring(3)
+		g.insert_a_graph(other)
+		assert len(g.get_connected_components()) == 2
+		assert g._rx_backend.rebuild_count == 2
@@ -0,0 +1,124 @@
+"""Unit tests for streaming multi-record SDF reading and writing."""
+
+# Standard Library
+import io
+
+# local repo modules
+import oasa.smiles_lib
+import oasa.codec_registry
+import oasa.codecs.rdkit_formats
+
+
+SMILES = ("CCO", "c1ccccc1", "CC(=O)O")
+
+
+#============================================
+def _write_records(file_obj: object) -> int:
+	"""Write the SMILES molecules as titled records with an ID field; return the count."""
+	codec = oasa.codec_registry.get_codec("sdf")
+	with codec.open_writer(file_obj) as writer:
+		for number, smiles in enumerate(SMILES):
+			mol = oasa.smiles_lib.text_to_mol(smiles, calc_coords=False)
+			mol.name = f"record {number}"
+			mol.sd_tags = {"SMILES": smiles}
+			writer.write(mol, tags={"ID": number})
+	return writer.count
+
+
+#============================================
+def _read_back() -> list:
+	"""Write the records to text and stream them back as molecules."""
+	out = io.StringIO()
+	_write_records(out)
+	codec = oasa.codec_registry.get_codec("sdf")
+	return list(codec.iter_file(io.StringIO(out.getvalue())))
+
+
+#============================================
+def _binary_records() -> bytes:
+	"""Return the records written through a binary handle."""
+	out = io.BytesIO()
+	_write_records(out)
+	return out.getvalue()
+
+
+#============================================
+def _v3000_records() -> str:
+	"""Return one propylamine record written by the V3000 record writer."""
+	out = io.StringIO()
+	with oasa.codec_registry.get_codec("sdf_v3000").open_writer(out) as writer:
+		writer.write(oasa.smiles_lib.text_to_mol("CCN", calc_coords=False))
+	return out.getvalue()
+
+
+#============================================
+def test_writer_counts_and_terminates_every_record() -> None:
+	"""The record writer counts each record and ends each with $$$$."""
+	out = io.StringIO()
+	count = _write_records(out)
+	assert count == len(SMILES)
+	assert out.getvalue().count("$$$$") == len(SMILES)
+
+
+#============================================
+def test_records_round_trip_with_titles() -> None:
+	"""Streamed records keep their titles as molecule names."""
+	assert [m.name for m in _read_back()] == ["record 0", "record 1", "record 2"]
+
+
+#============================================
+def test_records_round_trip_with_tags() -> None:
+	"""Streamed records merge molecule tags with per-record writer tags."""
+	expected = [{"SMILES": smiles, "ID": str(number)} for number, smiles in enumerate(SMILES)]
+	assert [m.sd_tags for m in _read_back()] == expected
+
+
+#============================================
+def test_records_round_trip_their_atoms() -> None:
+	"""Each streamed record holds its own molecule's heavy atoms."""
+	assert [len(m.atoms) for m in _read_back()] == [3, 6, 4]
+
+
+#============================================
+def test_merged_reader_agrees_with_streamed_records() -> None:
+	"""The merged reader holds every streamed atom as separate fragments."""
+	data = _binary_records()
+	streamed = list(oasa.codecs.rdkit_formats.sdf_iter_file(io.BytesIO(data)))
+	merged = oasa.codecs.rdkit_formats.sdf_file_to_mol(io.BytesIO(data))
+	assert len(merged.atoms) == sum(len(m.atoms) for m in streamed)
+	assert len(merged.get_disconnected_subgraphs()) == len(SMILES)
+
+
+#============================================
+def test_text_reader_merges_every_record() -> None:
+	"""Reading decoded multi-record text gives all thirteen atoms."""
+	text = _binary_records().decode("utf-8")
+	assert len(oasa.codecs.rdkit_formats.sdf_text_to_mol(text).atoms) == 13
+
+
+#============================================
+def test_registry_advertises_record_streaming() -> None:
+	"""Registry metadata flags which codecs read and write record streams."""
+	snapshot = oasa.codec_registry.get_registry_snapshot()
+	flags = (
+		snapshot["sdf"]["reads_records"], snapshot["sdf"]["writes_records"],
+		snapshot["sdf_v3000"]["writes_records"], snapshot["smiles"]["reads_records"],
+	)
+	assert flags == (True, True, True, False)
+
+
+#============================================
+def test_v3000_writer_streams_v3000_records() -> None:
+	"""The V3000 record writer emits V3000 blocks that read back one by one."""
+	text = _v3000_records()
+	mols = list(oasa.codec_registry.get_codec("sdf_v3000").iter_file(io.StringIO(text)))
+	assert "V3000" in text
+	assert [len(m.atoms) for m in mols] == [3]
+
+
+#============================================
+def test_untitled_records_get_no_name() -> None:
+	"""A record with an empty title line reads back without a name."""
+	text = _v3000_records()
+	mol = next(oasa.codec_registry.get_codec("sdf_v3000").iter_file(io.StringIO(text)))
+	assert not hasattr(mol, "name")
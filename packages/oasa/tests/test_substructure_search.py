@@ -0,0 +1,105 @@
+"""Unit tests for the VF2 substructure search behind Molecule."""
+
+# local repo modules
+import oasa.smiles_lib
+
+
+#============================================
+def _mol(smiles: str) -> object:
+	"""Return a molecule read with the built-in SMILES parser."""
+	reader = oasa.smiles_lib.Smiles()
+	reader.read_smiles(smiles)
+	return reader.get_structure()
+
+
+#============================================
+def _snapshot(mol: object) -> tuple:
+	"""Return the atoms, bonds, and per-atom state a search must not change."""
+	atoms = [
+		(a, a.symbol, a.explicit_hydrogens, a.free_sites, dict(a.properties_))
+		for a in mol.vertices
+	]
+	return (atoms, set(mol.edges), [dict(e.properties_) for e in mol.edges])
+
+
+#============================================
+def _neopentane_matches(limit: int | None = None) -> list:
+	"""Return the C-C matches of a saturated ethane query in neopentane."""
+	methyl_pair = _mol("CC")
+	for v in methyl_pair.vertices:
+		v.free_sites = 4
+	return list(_mol("CC(C)(C)C").select_matching_substructures(methyl_pair, limit=limit))
+
+
+#============================================
+def test_search_leaves_both_molecules_untouched() -> None:
+	"""A started search changes no atom, bond, or property of either molecule."""
+	target = _mol("OC(=O)CC(=O)O")
+	query = _mol("C(=O)[OH]")
+	before = (_snapshot(target), _snapshot(query))
+	search = target.select_matching_substructures(query, implicit_freesites=True)
+	next(search)
+	assert (_snapshot(target), _snapshot(query)) == before
+
+
+#============================================
+def test_interleaved_searches_are_independent() -> None:
+	"""Two searches over the same molecules can run interleaved."""
+	target = _mol("OC(=O)CC(=O)O")
+	query = _mol("C(=O)[OH]")
+	first = target.select_matching_substructures(query, implicit_freesites=True)
+	second = target.select_matching_substructures(query, implicit_freesites=True)
+	assert next(first) and next(second)
+	assert len(list(first)) == 1
+
+
+#============================================
+def test_finished_search_leaves_both_molecules_untouched() -> None:
+	"""Exhausting a search also leaves both molecules unchanged."""
+	target = _mol("OC(=O)CC(=O)O")
+	query = _mol("C(=O)[OH]")
+	before = (_snapshot(target), _snapshot(query))
+	list(target.select_matching_substructures(query, implicit_freesites=True))
+	assert (_snapshot(target), _snapshot(query)) == before
+
+
+#============================================
+def test_matches_are_distinct_atom_sets() -> None:
+	"""Each of neopentane's four C-C bonds is reported once."""
+	matches = _neopentane_matches()
+	assert len(matches) == 4
+	assert len({frozenset(m) for m in matches}) == 4
+
+
+#============================================
+def test_limit_stops_the_search_early() -> None:
+	"""A limit caps the number of reported matches."""
+	assert len(_neopentane_matches(limit=2)) == 2
+
+
+#============================================
+def test_implicit_hydrogens_are_interchangeable() -> None:
+	"""Formaldehyde's two implicit hydrogens give a single HC=O match."""
+	search = _mol("C=O").select_matching_substructures(_mol("HC=O"), implicit_freesites=True)
+	assert len(list(search)) == 1
+
+
+#============================================
+def test_ring_query_needs_a_ring() -> None:
+	"""A cyclohexane query matches decalin but not an open hexane chain."""
+	assert _mol("C1CCC2CCCCC2C1").contains_substructure(_mol("C1CCCCC1"))
+	assert not _mol("CCCCCC").contains_substructure(_mol("C1CCCCC1"))
+
+
+#============================================
+def test_query_charge_must_be_present_on_target() -> None:
+	"""An uncharged query matches a carboxylate, but a charged one needs the charge."""
+	assert _mol("CC(=O)[O-]").contains_substructure(_mol("C(=O)O"))
+	assert not _mol("CC(=O)O").contains_substructure(_mol("C(=O)[O-]"))
+
+
+#============================================
+def test_without_implicit_free_sites_query_atoms_are_saturated() -> None:
+	"""Query atoms allow no extra target neighbors without implicit free sites."""
+	assert not _mol("CCO").contains_substructure(_mol("CO"), implicit_freesites=False)
+	assert _mol("CO").contains_substructure(_mol("CO"), implicit_freesites=False)
@@ -0,0 +1,101 @@
+"""Unit tests for the cached adjacency views on graph vertices."""
+
+# local repo modules
+from oasa.graph.graph_lib import Graph
+from oasa.graph.vertex_lib import Vertex
+
+
+#============================================
+def _star(num_leaves: int) -> tuple:
+	"""Return a graph, its center vertex, and the leaves around it."""
+	graph = Graph()
+	center = graph.add_vertex(Vertex())
+	leaves = graph.add_vertices(Vertex() for _ in range(num_leaves))
+	graph.add_edges((center, leaf) for leaf in leaves)
+	return graph, center, leaves
+
+
+#============================================
+def test_neighbors_follow_edge_order() -> None:
+	"""A vertex lists its neighbors in the order their edges were added."""
+	_graph, center, leaves = _star(3)
+	assert center.neighbors == tuple(leaves)
+
+
+#============================================
+def test_views_are_cached_between_edits() -> None:
+	"""Repeated neighbor reads return the same cached tuple."""
+	_graph, center, _leaves = _star(3)
+	assert center.neighbors is center.neighbors
+
+
+#============================================
+def test_degree_and_edges_agree_with_neighbors() -> None:
+	"""Degree and the neighbor-edge view both count every incident edge."""
+	_graph, center, _leaves = _star(3)
+	assert center.degree == 3
+	assert len(center.neighbor_edges) == 3
+
+
+#============================================
+def test_added_edge_refreshes_cached_views() -> None:
+	"""A new edge appears in the neighbor view and the edge lookup."""
+	graph, center, leaves = _star(3)
+	# Read the view first so the edit has a cached tuple to invalidate.
+	center.neighbors
+	extra = graph.add_vertex(Vertex())
+	edge = graph.add_edge(center, extra)
+	assert center.neighbors == tuple(leaves) + (extra,)
+	assert center.get_edge_leading_to(extra) is edge
+
+
+#============================================
+def test_disconnect_refreshes_cached_views() -> None:
+	"""Disconnecting a neighbor drops it from the view and the edge lookup."""
+	graph, center, leaves = _star(3)
+	# Read the view first so the edit has a cached tuple to invalidate.
+	center.neighbors
+	graph.disconnect(center, leaves[0])
+	assert center.neighbors == (leaves[1], leaves[2])
+	assert center.get_edge_leading_to(leaves[0]) is None
+
+
+#============================================
+def test_disconnected_toggle_refreshes_both_endpoints() -> None:
+	"""Temporarily disconnecting an edge updates the views of both endpoints."""
+	graph, center, leaves = _star(2)
+	edge = center.get_edge_leading_to(leaves[0])
+	# Read the view first so the edit has a cached tuple to invalidate.
+	leaves[0].degree
+	graph.temporarily_disconnect_edge(edge)
+	assert center.neighbors == (leaves[1],)
+	assert leaves[0].degree == 0
+
+
+#============================================
+def test_disconnected_edge_stays_reachable_by_lookup() -> None:
+	"""A temporarily disconnected edge leaves the edge view but not the lookup."""
+	graph, center, leaves = _star(2)
+	edge = center.get_edge_leading_to(leaves[0])
+	graph.temporarily_disconnect_edge(edge)
+	assert edge not in center.neighbor_edges
+	assert center.get_edge_leading_to(leaves[0]) is edge
+
+
+#============================================
+def test_reconnected_edge_restores_both_endpoints() -> None:
+	"""Reconnecting a temporarily disconnected edge restores both neighbor views."""
+	graph, center, leaves = _star(2)
+	edge = center.get_edge_leading_to(leaves[0])
+	graph.temporarily_disconnect_edge(edge)
+	graph.reconnect_temporarily_disconnected_edge(edge)
+	assert center.neighbors == tuple(leaves)
+	assert leaves[0].neighbors == (center,)
+
+
+#============================================
+def test_neighbor_edge_pairs_match_the_cached_views() -> None:
+	"""Neighbor-edge pairs zip the cached edge and neighbor views."""
+	_graph, center, _leaves = _star(2)
+	pairs = list(center.get_neighbor_edge_pairs())
+	assert pairs == list(zip(center.neighbor_edges, center.neighbors))
@@ -401,3 +401,39 @@ def test_honeycomb_cutoff() -> None:
 		0, 0, 100000, 100000, spacing
 	)
 	assert result is None
+
+
+#============================================
+def _array_points() -> list:
+	"""Return scattered points plus exact lattice ties for the array functions."""
+	half_sqrt3 = math.sqrt(3.0) / 2.0
+	points = [(0.1 * i - 2.0, 0.37 * i % 3.1 - 1.0) for i in range(40)]
+	# exact ties between lattice vertices exercise the lexicographic policy
+	points += [(half_sqrt3 / 2.0, 0.25), (0.0, 0.5), (-half_sqrt3 / 2.0, -0.25)]
+	return points
+
+
+#============================================
+def test_array_snapping_matches_per_point_snapping() -> None:
+	"""Snapping a point array gives the same points as snap_to_hex_grid."""
+	points = _array_points()
+	snapped = oasa.hex_grid.snap_points_to_hex_grid(points, SPACING, 0.3, -0.2)
+	expected = [list(oasa.hex_grid.snap_to_hex_grid(x, y, SPACING, 0.3, -0.2)) for x, y in points]
+	assert snapped.tolist() == expected
+
+
+#============================================
+def test_array_distances_match_per_point_distances() -> None:
+	"""Array distances match distance_to_hex_grid for every point."""
+	points = _array_points()
+	distances = oasa.hex_grid.hex_grid_distances(points, SPACING, 0.3, -0.2).tolist()
+	expected = [oasa.hex_grid.distance_to_hex_grid(x, y, SPACING, 0.3, -0.2) for x, y in points]
+	# libm pow() may round x**2 one ulp away from numpy's exact square
+	assert distances == pytest.approx(expected, rel=1e-12, abs=1e-15)
+
+
+#============================================
+def test_array_snapping_rejects_non_finite_points() -> None:
+	"""A NaN coordinate in the point array raises ValueError."""
+	with pytest.raises(ValueError):
+		oasa.hex_grid.snap_points_to_hex_grid([(math.nan, 0.0)], SPACING)